@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Micro-benchmarks for the software mixer's DSP kernels.
+
+Run from the repository root:
+
+    PYTHONPATH=src python scripts/bench_mixer_kernels.py [--block 1024] [--repeat 2000]
+
+Each line reports the median time per call and per frame, so regressions in a
+kernel show up independently of the rest of the mixer.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+
+import numpy as np
+
+from sara.audio.mixer.kernels import (
+    FADE_EQUAL_POWER,
+    FADE_LINEAR,
+    apply_gain,
+    fade_gains,
+    map_channels,
+    nearest_zero_crossing,
+)
+
+
+def _bench(name: str, func, *, frames: int, repeat: int) -> None:
+    for _ in range(min(repeat, 50)):
+        func()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter_ns()
+        func()
+        samples.append(time.perf_counter_ns() - started)
+    median = statistics.median(samples)
+    print(f"{name:<28} {median / 1000.0:9.2f} us/call {median / frames:8.2f} ns/frame")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--block", type=int, default=1024, help="frames per block")
+    parser.add_argument("--repeat", type=int, default=2000, help="timed calls per kernel")
+    args = parser.parse_args()
+    block, repeat = args.block, args.repeat
+
+    rng = np.random.default_rng(0)
+    # okno zero-crossing: 2 x 5 ms przy 48 kHz
+    window = (rng.normal(size=480) + 1.5).astype(np.float32)
+    gains = np.zeros(block, dtype=np.float32)
+    indices = np.zeros(block, dtype=np.intp)
+    mono = rng.normal(size=(block, 1)).astype(np.float32)
+    stereo = np.zeros((block, 2), dtype=np.float32)
+
+    _bench("nearest_zero_crossing", lambda: nearest_zero_crossing(window, 240), frames=len(window), repeat=repeat)
+    _bench(
+        "fade_gains linear",
+        lambda: fade_gains(gains, indices, done=block, length=8 * block, curve=FADE_LINEAR, rising=False),
+        frames=block,
+        repeat=repeat,
+    )
+    _bench(
+        "fade_gains equal_power",
+        lambda: fade_gains(gains, indices, done=block, length=8 * block, curve=FADE_EQUAL_POWER, rising=False),
+        frames=block,
+        repeat=repeat,
+    )
+    _bench("map_channels mono->stereo", lambda: map_channels(stereo, mono), frames=block, repeat=repeat)
+    # -1 zamiast np. 0.7: powtarzane mnożenie nie schodzi do liczb subnormalnych
+    _bench("apply_gain", lambda: apply_gain(stereo, -1.0), frames=block, repeat=repeat)
+
+
+if __name__ == "__main__":
+    main()
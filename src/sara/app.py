@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import multiprocessing
 import os
 import sys
 import tempfile
@@ -127,4 +128,6 @@ def run() -> None:
 
 
 if __name__ == "__main__":
+    # Wymagane przez ekstrakcję metadanych w puli procesów w buildach PyInstaller.
+    multiprocessing.freeze_support()
     run()
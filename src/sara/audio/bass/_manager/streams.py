@@ -63,9 +63,51 @@ def stream_create_file(
     return stream
 
 
+def stream_create_memory(
+    manager: "BassManager",
+    index: int,
+    data: bytearray,
+    *,
+    allow_loop: bool = False,
+    decode: bool = False,
+    set_device: bool = True,
+) -> int:
+    """Create a stream from an in-memory copy of the file (``BASS_StreamCreateFile`` with mem=TRUE).
+
+    BASS reads straight from `data`, so the buffer is kept in
+    ``manager._memory_streams`` until `stream_free` releases the stream.
+    """
+    if set_device:
+        manager._set_device(index)
+    if manager._stream_create_file is None:
+        raise BassNotAvailable("BASS_StreamCreateFile not available")
+    flags = _BassConstants.SAMPLE_FLOAT | _BassConstants.STREAM_PRESCAN
+    if allow_loop:
+        flags |= _BassConstants.SAMPLE_LOOP
+    if decode:
+        flags |= _BassConstants.STREAM_DECODE
+    buffer = (ctypes.c_char * len(data)).from_buffer(data)
+    stream = 0
+    try:
+        stream = manager._stream_create_file(True, ctypes.addressof(buffer), 0, len(data), flags)
+    except Exception as exc:  # pylint: disable=broad-except
+        logger.debug("BASS memory stream create error: %s", exc)
+    if not stream:
+        last_code = manager._lib.BASS_ErrorGetCode()
+        raise BassNotAvailable(f"BASS_StreamCreateFile (pamięć) nie powiodło się (kod {last_code})")
+    with manager._global_lock:
+        manager._memory_streams[stream] = buffer
+    return stream
+
+
 def stream_free(manager: "BassManager", stream: int) -> None:
     if stream:
         manager._lib.BASS_StreamFree(stream)
+        memory_streams = getattr(manager, "_memory_streams", None)
+        if memory_streams is not None:
+            # bufor zwalniamy dopiero po BASS_StreamFree - wcześniej BASS może jeszcze z niego czytać
+            with manager._global_lock:
+                memory_streams.pop(stream, None)
 
 
 def channel_play(manager: "BassManager", stream: int, restart: bool = False) -> None:
@@ -108,6 +150,19 @@ def channel_set_volume(manager: "BassManager", stream: int, volume: float) -> No
     manager._lib.BASS_ChannelSetAttribute(stream, _BassConstants.ATTRIB_VOL, ctypes.c_float(volume))
 
 
+def channel_slide_volume(
+    manager: "BassManager",
+    stream: int,
+    volume: float,
+    duration_seconds: float,
+) -> None:
+    # BASS przesuwa głośność sam, co próbkę - bez schodków i bez wątku w Pythonie
+    duration_ms = max(1, int(round(float(duration_seconds) * 1000.0)))
+    if not manager._lib.BASS_ChannelSlideAttribute(stream, _BassConstants.ATTRIB_VOL, ctypes.c_float(max(0.0, float(volume))), duration_ms):
+        code = manager._lib.BASS_ErrorGetCode()
+        raise BassNotAvailable(f"BASS_ChannelSlideAttribute nie powiodło się (kod {code})")
+
+
 def seconds_to_bytes(manager: "BassManager", stream: int, seconds: float) -> int:
     return int(manager._lib.BASS_ChannelSeconds2Bytes(stream, ctypes.c_double(seconds)))
 
@@ -143,10 +198,13 @@ def channel_remove_sync(manager: "BassManager", stream: int, sync_handle: int) -
         manager._lib.BASS_ChannelRemoveSync(stream, sync_handle)
 
 
-def channel_set_sync_end(manager: "BassManager", stream: int, proc) -> int:
+def channel_set_sync_end(manager: "BassManager", stream: int, proc, *, mix_time: bool = True) -> int:
+    flags = _BassConstants.SYNC_END
+    if mix_time:
+        flags |= _BassConstants.SYNC_MIXTIME
     handle = manager._lib.BASS_ChannelSetSync(
         stream,
-        _BassConstants.SYNC_END | _BassConstants.SYNC_MIXTIME,
+        flags,
         0,
         proc,
         None,
@@ -155,3 +213,11 @@ def channel_set_sync_end(manager: "BassManager", stream: int, proc) -> int:
         code = manager._lib.BASS_ErrorGetCode()
         raise BassNotAvailable(f"BASS_ChannelSetSync (END) nie powiodło się (kod {code})")
     return handle
+
+
+def channel_set_sync_slide(manager: "BassManager", stream: int, proc) -> int:
+    handle = manager._lib.BASS_ChannelSetSync(stream, _BassConstants.SYNC_SLIDE, 0, proc, None)
+    if not handle:
+        code = manager._lib.BASS_ErrorGetCode()
+        raise BassNotAvailable(f"BASS_ChannelSetSync (SLIDE) nie powiodło się (kod {code})")
+    return handle
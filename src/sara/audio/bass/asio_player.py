@@ -51,6 +51,10 @@ class BassAsioPlayer(BassPlayer):
         except Exception:
             return 0.0
 
+    def preload(self, source_path: str, *, start_seconds: float = 0.0, allow_loop: bool = False) -> bool:
+        # play() tworzy własny kanał decode, więc przygotowany strumień i tak by się nie przydał
+        return False
+
     def play(
         self,
         playlist_item_id: str,
@@ -185,27 +189,6 @@ class BassAsioPlayer(BassPlayer):
         self._fade_thread = threading.Thread(target=_runner, daemon=True)
         self._fade_thread.start()
 
-    def set_loop(self, start_seconds: Optional[float], end_seconds: Optional[float]) -> None:
-        if start_seconds is None or end_seconds is None or end_seconds <= start_seconds:
-            self._loop_start = None
-            self._loop_end = None
-            self._loop_active = False
-            self._last_loop_jump_ts = 0.0
-            self._loop_iteration = 0
-            self._loop_guard_armed = False
-            if self._loop_sync_handle and self._stream:
-                self._manager.channel_remove_sync(self._stream, self._loop_sync_handle)
-            self._loop_sync_handle = 0
-            self._loop_sync_proc = None
-            return
-        self._loop_start = start_seconds
-        self._loop_end = end_seconds
-        self._loop_active = True
-        self._last_loop_jump_ts = 0.0
-        self._loop_iteration = 0
-        self._loop_guard_armed = False
-        self._apply_loop_settings()
-
     def _apply_loop_settings(self) -> None:
         if not self._stream:
             return
@@ -54,12 +54,14 @@ class BassManager:
     channel_is_active = _streams_ops.channel_is_active
     channel_get_length_seconds = _streams_ops.channel_get_length_seconds
     channel_set_volume = _streams_ops.channel_set_volume
+    channel_slide_volume = _streams_ops.channel_slide_volume
     seconds_to_bytes = _streams_ops.seconds_to_bytes
     channel_set_position_bytes = _streams_ops.channel_set_position_bytes
     make_sync_proc = _streams_ops.make_sync_proc
     channel_set_sync_pos = _streams_ops.channel_set_sync_pos
     channel_remove_sync = _streams_ops.channel_remove_sync
     channel_set_sync_end = _streams_ops.channel_set_sync_end
+    channel_set_sync_slide = _streams_ops.channel_set_sync_slide
 
     def __init__(self) -> None:
         lib_wrapper = _BassLibrary()
@@ -70,6 +72,7 @@ class BassManager:
         self._devices: dict[int, dict[str, Any]] = {}
         self._global_lock = threading.Lock()
         self._transcoded_streams: dict[int, Path] = {}
+        self._memory_streams: dict[int, Any] = {}
         # Zmniejsz bufor wyjściowy – duże wartości powodują „poczucie laga” oraz rozjazdy
         # między pozycją z `ChannelGetPosition` a wyzwalaczami typu SYNC_MIXTIME.
         buffer_ms_raw = os.environ.get("SARA_BASS_BUFFER_MS", "250")
@@ -135,6 +138,24 @@ class BassManager:
                 self._transcoded_streams[stream] = wav_path
             return stream
 
+    def stream_create_memory(
+        self,
+        index: int,
+        data: bytearray,
+        *,
+        allow_loop: bool = False,
+        decode: bool = False,
+        set_device: bool = True,
+    ) -> int:
+        return _streams_ops.stream_create_memory(
+            self,
+            index,
+            data,
+            allow_loop=allow_loop,
+            decode=decode,
+            set_device=set_device,
+        )
+
     def stream_free(self, stream: int) -> None:
         _streams_ops.stream_free(self, stream)
         wav_path: Path | None = None
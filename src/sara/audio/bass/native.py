@@ -40,6 +40,7 @@ class _BassConstants:
     SYNC_ONETIME = 0x20000000
     POS_BYTES = 0
     SYNC_END = 0x00000002
+    SYNC_SLIDE = 5
 
 
 class _BASS_DEVICEINFO(ctypes.Structure):
@@ -176,6 +177,9 @@ class _BassLibrary:
         lib.BASS_ChannelGetAttribute.argtypes = [DWORD, DWORD, ctypes.POINTER(ctypes.c_float)]
         lib.BASS_ChannelGetAttribute.restype = BOOL
 
+        lib.BASS_ChannelSlideAttribute.argtypes = [DWORD, DWORD, ctypes.c_float, DWORD]
+        lib.BASS_ChannelSlideAttribute.restype = BOOL
+
         lib.BASS_PluginLoad.argtypes = [ctypes.c_char_p, DWORD]
         lib.BASS_PluginLoad.restype = ctypes.c_void_p
 
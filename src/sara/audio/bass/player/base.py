@@ -6,10 +6,16 @@ import logging
 import os
 import threading
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Iterable, Optional
 
 from sara.audio.bass.manager import BassManager, _DeviceContext
+from sara.audio.bass.player_monitor import BassMonitor
+from sara.audio.bass.preload_cache import PreloadedStream, preload_cache
 from sara.audio.bass.player_monitor import start_monitor as _start_monitor_impl
+from sara.audio.bass.player_monitor import stop_monitor as _stop_monitor_impl
+from sara.audio.types import FADE_CURVES, FADE_LINEAR
+from sara.core.env import preload_memory_max_bytes
+from sara.core.file_prefetch import read_file
 
 from . import flow as _flow
 from . import mix_trigger as _mix_trigger
@@ -19,13 +25,22 @@ logger = logging.getLogger("sara.audio.bass.player_base")
 _DEBUG_LOOP = bool(os.environ.get("SARA_DEBUG_LOOP"))
 _LOOP_GUARD_BASE_SLACK = 0.001
 _LOOP_GUARD_FALLBACK_SLACK = 0.001
+# pliki do tego rozmiaru preload wczytuje w całości do RAM (0 wyłącza)
+_MEMORY_PRELOAD_MAX_BYTES = preload_memory_max_bytes()
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return int(path.stat().st_size)
+    except OSError:
+        return 0
 
 
 class BassPlayer:
     """Implementacja Player korzystająca z BASS."""
 
-    # Bardzo mały interwał, żeby zdarzenia miksu/pętli były możliwie precyzyjne.
-    _MONITOR_INTERVAL = 0.001
+    # Zdarzenia miksu/pętli/końca obsługują synci BASS; monitor raportuje postęp w tym rytmie.
+    _progress_interval = 0.05
 
     play = _flow.play
     pause = _flow.pause
@@ -40,16 +55,12 @@ class BassPlayer:
         self._manager = manager
         self._device_index = device_index
         self._device_context: Optional[_DeviceContext] = None
-        self._preloaded_stream: int = 0
-        self._preloaded_device_context: Optional[_DeviceContext] = None
-        self._preloaded_path: Path | None = None
-        self._preloaded_start_seconds: float = 0.0
-        self._preloaded_allow_loop: bool = False
         self._preload_lock = threading.Lock()
         self._preload_generation: int = 0
         self._stream: int = 0
         self._current_item_id: Optional[str] = None
         self._gain_factor: float = 1.0
+        self._fade_curve: str = FADE_LINEAR
         self._loop_start: Optional[float] = None
         self._loop_end: Optional[float] = None
         self._loop_active: bool = False
@@ -67,40 +78,27 @@ class BassPlayer:
         self._mix_callback: Optional[Callable[[], None]] = None
         self._finished_callback: Optional[Callable[[str], None]] = None
         self._progress_callback: Optional[Callable[[str, float], None]] = None
-        self._monitor_thread: Optional[threading.Thread] = None
-        self._monitor_stop = threading.Event()
         self._fade_thread: Optional[threading.Thread] = None
+        self._fade_stream: int = 0
+        self._fade_sync_handle: int = 0
+        self._fade_sync_proc = None
         self._start_offset: float = 0.0
         # zachowujemy schowany timer z dawnych implementacji, żeby unikać attribute error
         self._loop_fake_timer = None
         self._last_loop_jump_ts: float = 0.0
         self._loop_guard_enabled: bool = True
         self._last_loop_debug_log: float = 0.0
-        self._last_progress_ts: float = 0.0
         self._loop_iteration: int = 0
         self._loop_guard_armed: bool = False
-        # zapewnij kompatybilność, nawet jeśli stary obiekt był zcache'owany
-        if not hasattr(self, "_apply_loop_settings"):
-            self._apply_loop_settings = lambda: None  # type: ignore[attr-defined]
-        if not hasattr(self, "set_loop"):
-            # minimalny set_loop dla starych instancji
-            def _compat_set_loop(start_seconds, end_seconds):
-                self._loop_start = start_seconds
-                self._loop_end = end_seconds
-                self._loop_active = bool(
-                    start_seconds is not None
-                    and end_seconds is not None
-                    and end_seconds > start_seconds
-                )
-
-            self.set_loop = _compat_set_loop  # type: ignore[attr-defined]
 
     def preload(self, source_path: str, *, start_seconds: float = 0.0, allow_loop: bool = False) -> bool:
         """Prepare a stream for `play()` to start with minimal I/O latency.
 
-        This is best-effort and backend-specific: it creates and keeps an additional
-        BASS stream handle around (without starting playback) so that `play()` can
-        reuse it later if the same path/start/loop values are requested.
+        This is best-effort: the stream is opened (without starting playback)
+        and kept in the manager-wide `preload_cache`, so whichever player
+        instance later plays the same path/start/loop on this device reuses it.
+        Files up to ``SARA_PRELOAD_MEMORY_MAX_BYTES`` are read into memory
+        first, so starting and seeking them does not touch the disk/network.
         """
         path = Path(source_path)
         if not path.exists():
@@ -108,16 +106,18 @@ class BassPlayer:
 
         start_seconds = max(0.0, float(start_seconds or 0.0))
         allow_loop = bool(allow_loop)
+        cache = preload_cache(self._manager)
+        if cache.contains(self._device_index, path, start_seconds=start_seconds, allow_loop=allow_loop):
+            return True
 
         with self._preload_lock:
-            self._preload_generation += 1
             generation = self._preload_generation
 
         device_context: _DeviceContext | None = None
         stream: int = 0
         try:
             device_context = self._manager.acquire_device(self._device_index)
-            stream = self._manager.stream_create_file(self._device_index, path, allow_loop=allow_loop)
+            stream = self._create_preload_stream(path, allow_loop=allow_loop)
             if start_seconds > 0.0:
                 self._manager.channel_set_position(stream, start_seconds)
             try:
@@ -137,33 +137,42 @@ class BassPlayer:
                     pass
             return False
 
+        entry = PreloadedStream(
+            device_index=self._device_index,
+            path=path,
+            start_seconds=start_seconds,
+            allow_loop=allow_loop,
+            stream=stream,
+            device_context=device_context,
+            size_bytes=_file_size(path),
+        )
         with self._preload_lock:
-            if generation != self._preload_generation:
-                stale_stream = stream
-                stale_context = device_context
-                stream = 0
-                device_context = None
-            else:
-                stale_stream, stale_context = self._preloaded_stream, self._preloaded_device_context
-                self._preloaded_stream = stream
-                self._preloaded_device_context = device_context
-                self._preloaded_path = path
-                self._preloaded_start_seconds = start_seconds
-                self._preloaded_allow_loop = allow_loop
-                stream = 0
-                device_context = None
-
-        if stale_stream:
-            try:
-                self._manager.stream_free(stale_stream)
-            except Exception:
-                pass
-        if stale_context:
+            stale = generation != self._preload_generation
+        if stale:
+            # play()/stop() tego playera wystartowały w trakcie - wynik jest już nieaktualny
             try:
-                stale_context.release()
+                self._manager.stream_free(stream)
             except Exception:
                 pass
-        return True
+            if device_context:
+                try:
+                    device_context.release()
+                except Exception:
+                    pass
+            return False
+        return cache.put(entry)
+
+    def _create_preload_stream(self, path: Path, *, allow_loop: bool) -> int:
+        create_memory = getattr(self._manager, "stream_create_memory", None)
+        if _MEMORY_PRELOAD_MAX_BYTES > 0 and callable(create_memory):
+            data = read_file(path, max_bytes=_MEMORY_PRELOAD_MAX_BYTES)
+            if data is not None:
+                try:
+                    return create_memory(self._device_index, data, allow_loop=allow_loop)
+                except Exception as exc:  # pylint: disable=broad-except
+                    # np. format obsługiwany tylko przez transkodowanie - zostaje strumień z pliku
+                    logger.debug("BASS preload: memory stream failed for %s: %s", path, exc)
+        return self._manager.stream_create_file(self._device_index, path, allow_loop=allow_loop)
 
     def _consume_preloaded(
         self,
@@ -173,80 +182,112 @@ class BassPlayer:
         allow_loop: bool,
         tolerance: float = 0.001,
     ) -> tuple[int, _DeviceContext | None] | None:
-        """Return the prepared stream when it matches, otherwise clear stale preload.
+        """Take a matching prepared stream from the shared cache.
 
-        Always invalidates any in-flight `preload()` calls so late results get dropped.
+        Also invalidates this player's in-flight `preload()` calls so late results get dropped.
         """
-        stale_stream: int = 0
-        stale_context: _DeviceContext | None = None
-        consumed: tuple[int, _DeviceContext | None] | None = None
         with self._preload_lock:
             self._preload_generation += 1
-            if (
-                self._preloaded_stream
-                and self._preloaded_path == path
-                and self._preloaded_allow_loop == bool(allow_loop)
-                and abs(float(start_seconds) - float(self._preloaded_start_seconds)) <= tolerance
-            ):
-                consumed = (self._preloaded_stream, self._preloaded_device_context)
-                self._preloaded_stream = 0
-                self._preloaded_device_context = None
-                self._preloaded_path = None
-                self._preloaded_start_seconds = 0.0
-                self._preloaded_allow_loop = False
-            elif self._preloaded_stream:
-                stale_stream, stale_context = self._preloaded_stream, self._preloaded_device_context
-                self._preloaded_stream = 0
-                self._preloaded_device_context = None
-                self._preloaded_path = None
-                self._preloaded_start_seconds = 0.0
-                self._preloaded_allow_loop = False
-
-        if stale_stream:
-            try:
-                self._manager.stream_free(stale_stream)
-            except Exception:
-                pass
-        if stale_context:
-            try:
-                stale_context.release()
-            except Exception:
-                pass
-        return consumed
+        entry = preload_cache(self._manager).take(
+            self._device_index,
+            path,
+            start_seconds=start_seconds,
+            allow_loop=allow_loop,
+            tolerance=tolerance,
+        )
+        if entry is None:
+            return None
+        return entry.stream, entry.device_context
 
     def _drop_preloaded(self) -> None:
-        """Release any prepared stream and cancel in-flight preload requests."""
-        stale_stream: int = 0
-        stale_context: _DeviceContext | None = None
+        """Cancel this player's in-flight preload requests.
+
+        Streams already in the shared cache stay there for other players; the
+        preload pool releases them with `retain_preloaded`.
+        """
         with self._preload_lock:
             self._preload_generation += 1
-            if self._preloaded_stream:
-                stale_stream, stale_context = self._preloaded_stream, self._preloaded_device_context
-                self._preloaded_stream = 0
-                self._preloaded_device_context = None
-                self._preloaded_path = None
-                self._preloaded_start_seconds = 0.0
-                self._preloaded_allow_loop = False
-        if stale_stream:
-            try:
-                self._manager.stream_free(stale_stream)
-            except Exception:
-                pass
-        if stale_context:
-            try:
-                stale_context.release()
-            except Exception:
-                pass
+
+    def retain_preloaded(self, keep: Iterable[tuple[str, float, bool]]) -> int:
+        """Release prepared streams on this device except ``(path, start_seconds, allow_loop)`` in `keep`."""
+
+        wanted = {(Path(path), round(float(start), 3), bool(loop)) for path, start, loop in keep}
+        device_index = self._device_index
+        return preload_cache(self._manager).retain(
+            lambda entry: entry.device_index != device_index
+            or (entry.path, round(entry.start_seconds, 3), entry.allow_loop) in wanted
+        )
 
     def _start_monitor(self) -> None:
         _start_monitor_impl(
             self,
-            monitor_interval=self._MONITOR_INTERVAL,
             loop_guard_base_slack=_LOOP_GUARD_BASE_SLACK,
             loop_guard_fallback_slack=_LOOP_GUARD_FALLBACK_SLACK,
             logger=logger,
         )
 
+    def _stop_monitor(self) -> None:
+        _stop_monitor_impl(self)
+
+    def set_loop(self, start_seconds: Optional[float], end_seconds: Optional[float]) -> None:
+        if start_seconds is None or end_seconds is None or end_seconds <= start_seconds:
+            self._loop_start = None
+            self._loop_end = None
+            self._loop_active = False
+            self._last_loop_jump_ts = 0.0
+            self._loop_iteration = 0
+            self._loop_guard_armed = False
+            if self._loop_sync_handle and self._stream:
+                self._manager.channel_remove_sync(self._stream, self._loop_sync_handle)
+            self._loop_sync_handle = 0
+            self._loop_sync_proc = None
+            BassMonitor.instance().loop_changed(self)
+            return
+        self._loop_start = start_seconds
+        self._loop_end = end_seconds
+        self._loop_active = True
+        self._last_loop_jump_ts = 0.0
+        self._loop_iteration = 0
+        self._loop_guard_armed = False
+        self._apply_loop_settings()
+        BassMonitor.instance().loop_changed(self)
+
+    def _apply_loop_settings(self) -> None:
+        if not self._stream:
+            return
+        if self._loop_sync_handle:
+            self._manager.channel_remove_sync(self._stream, self._loop_sync_handle)
+            self._loop_sync_handle = 0
+            self._loop_sync_proc = None
+        if not self._loop_active or self._loop_end is None or self._loop_start is None:
+            return
+
+        start = max(0.0, self._loop_start)
+        end = max(start + 0.001, self._loop_end)
+        self._loop_iteration = 0
+        self._loop_start_bytes = self._manager.seconds_to_bytes(self._stream, start)
+        self._loop_end_bytes = self._manager.seconds_to_bytes(self._stream, end)
+
+        def _sync_cb(handle, channel, data, user):
+            try:
+                self._jump_to_loop_start("sync")
+            except Exception as exc:
+                if self._debug_loop:
+                    logger.debug("Loop debug: sync jump failed: %s", exc)
+
+        # tylko MIXTIME: skok w chwili dekodowania daje pętlę bez przerwy; zwykły sync
+        # przyszedłby dopiero po buforze urządzenia i skoczyłby drugi raz
+        try:
+            self._loop_sync_proc = self._manager.make_sync_proc(_sync_cb)
+            self._loop_sync_handle = self._manager.channel_set_sync_pos(
+                self._stream, self._loop_end_bytes, self._loop_sync_proc, is_bytes=True, mix_time=True
+            )
+        except Exception as exc:
+            self._loop_sync_proc = None
+            self._loop_sync_handle = 0
+            if self._debug_loop:
+                logger.debug("Loop debug: failed to set sync pos: %s", exc)
+
     def set_finished_callback(self, callback: Optional[Callable[[str], None]]) -> None:
         self._finished_callback = callback
 
@@ -262,6 +303,13 @@ class BassPlayer:
         except Exception:
             return 0.0
 
+    def set_fade_curve(self, curve: str) -> None:
+        """Curve used by `fade_out` when the caller does not pass one."""
+
+        if curve not in FADE_CURVES:
+            raise ValueError(f"Unknown fade curve: {curve}")
+        self._fade_curve = curve
+
     def set_gain_db(self, gain_db: Optional[float]) -> None:
         if gain_db is None:
             self._gain_factor = 1.0
@@ -274,7 +322,8 @@ class BassPlayer:
         self._apply_gain()
 
     def _apply_gain(self) -> None:
-        if self._stream:
+        # ustawienie głośności przerwałoby trwający slide i wygaszanie nigdy by się nie skończyło
+        if self._stream and self._fade_stream != self._stream:
             self._manager.channel_set_volume(self._stream, self._gain_factor)
 
     def _is_active(self) -> bool:
@@ -3,11 +3,16 @@
 from __future__ import annotations
 
 import logging
+import math
 import threading
 import time
+from collections import deque
 from pathlib import Path
 from typing import Callable, Optional
 
+from sara.audio.bass.player_monitor import BassMonitor
+from sara.audio.types import FADE_CURVES, FADE_EQUAL_POWER, FADE_LINEAR
+
 # Keep the historical logger name for backwards-compatible filtering.
 logger = logging.getLogger("sara.audio.bass.player_base")
 
@@ -62,7 +67,7 @@ def pause(player) -> None:
 
 
 def stop(player, *, _from_fade: bool = False) -> None:
-    player._monitor_stop.set()
+    player._stop_monitor()
     if player._fade_thread and player._fade_thread.is_alive() and not _from_fade:
         player._fade_thread.join(timeout=0.5)
     if not _from_fade:
@@ -74,6 +79,7 @@ def stop(player, *, _from_fade: bool = False) -> None:
         except Exception:
             pass
         player._manager.channel_stop(player._stream)
+        _clear_fade_sync(player, player._stream)
         if player._loop_sync_handle:
             player._manager.channel_remove_sync(player._stream, player._loop_sync_handle)
             player._loop_sync_handle = 0
@@ -108,10 +114,6 @@ def stop(player, *, _from_fade: bool = False) -> None:
     player._current_item_id = None
     player._loop_active = False
     player._start_offset = 0.0
-    if player._monitor_thread and player._monitor_thread.is_alive() and not _from_fade:
-        player._monitor_thread.join(timeout=0.5)
-    player._monitor_thread = None
-    player._monitor_stop.clear()
     if _from_fade:
         player._fade_thread = None
     if not _from_fade:
@@ -160,12 +162,103 @@ def jump_to_loop_start(player, reason: str, pos: Optional[float] = None) -> None
         player._loop_guard_armed = True
 
 
-def fade_out(player, duration: float) -> None:
+# krzywa equal-power jako łamana z tylu odcinków liniowych (błąd < 2% wzmocnienia)
+_EQUAL_POWER_SEGMENTS = 8
+
+
+def fade_segments(initial: float, duration: float, curve: str = FADE_LINEAR) -> list[tuple[float, float]]:
+    """Split a fade to silence into BASS volume slides: ``(target gain, seconds)``."""
+
+    if curve not in FADE_CURVES:
+        raise ValueError(f"Unknown fade curve: {curve}")
+    if curve == FADE_EQUAL_POWER:
+        step = duration / _EQUAL_POWER_SEGMENTS
+        return [
+            (initial * math.cos(0.5 * math.pi * (index + 1) / _EQUAL_POWER_SEGMENTS), step)
+            for index in range(_EQUAL_POWER_SEGMENTS)
+        ]
+    return [(0.0, duration)]
+
+
+def _clear_fade_sync(player, stream: int) -> None:
+    handle = getattr(player, "_fade_sync_handle", 0)
+    if handle and stream:
+        try:
+            player._manager.channel_remove_sync(stream, handle)
+        except Exception:
+            pass
+    player._fade_sync_handle = 0
+    player._fade_sync_proc = None
+    player._fade_stream = 0
+
+
+def fade_out(player, duration: float, *, curve: str | None = None) -> None:
+    """Fade to silence with native slides; `curve` defaults to the one set by `set_fade_curve`."""
+
     if duration <= 0 or not player._stream:
         player.stop()
         return
 
+    curve = curve or player._fade_curve
     target_stream = player._stream
+    finished_item_id = player._current_item_id
+    segments = deque(fade_segments(player._gain_factor, duration, curve))
+    start_ts = time.perf_counter()
+    _clear_fade_sync(player, target_stream)
+
+    def _complete() -> None:
+        # wątek monitora - tu wolno zwolnić strumień
+        if player._stream != target_stream:
+            return
+        logger.debug(
+            "BASS fade done stream=%s requested=%.3f elapsed=%.3f",
+            target_stream,
+            duration,
+            time.perf_counter() - start_ts,
+        )
+        player.stop(_from_fade=True)
+        if player._finished_callback and finished_item_id:
+            try:
+                player._finished_callback(finished_item_id)
+            except Exception:
+                pass
+
+    def _next_segment() -> bool:
+        if not segments:
+            return False
+        target, seconds = segments.popleft()
+        player._manager.channel_slide_volume(target_stream, target, seconds)
+        return True
+
+    def _slide_sync(handle, channel, data, user):  # pragma: no cover - C callback
+        if player._stream != target_stream or player._fade_stream != target_stream:
+            return
+        try:
+            if _next_segment():
+                return
+        except Exception as exc:
+            logger.debug("BASS fade slide failed: %s", exc)
+        BassMonitor.instance().call_soon(_complete)
+
+    try:
+        player._fade_sync_proc = player._manager.make_sync_proc(_slide_sync)
+        player._fade_sync_handle = player._manager.channel_set_sync_slide(target_stream, player._fade_sync_proc)
+        player._fade_stream = target_stream
+        logger.debug(
+            "BASS fade start stream=%s duration=%.3f gain=%.3f curve=%s",
+            target_stream,
+            duration,
+            player._gain_factor,
+            curve,
+        )
+        _next_segment()
+    except Exception as exc:
+        logger.debug("BASS slide unavailable, stepped fade: %s", exc)
+        _clear_fade_sync(player, target_stream)
+        _fade_out_stepped(player, duration, target_stream)
+
+
+def _fade_out_stepped(player, duration: float, target_stream: int) -> None:
     start_ts = time.perf_counter()
 
     def _runner(target: int) -> None:
@@ -173,13 +266,6 @@ def fade_out(player, duration: float) -> None:
         interrupted = False
         try:
             initial = player._gain_factor
-            logger.debug(
-                "BASS fade start stream=%s duration=%.3f gain=%.3f steps=%d",
-                target,
-                duration,
-                initial,
-                steps,
-            )
             for i in range(steps):
                 if player._stream != target:
                     interrupted = True
@@ -193,14 +279,12 @@ def fade_out(player, duration: float) -> None:
                     break
                 time.sleep(duration / steps)
         finally:
-            elapsed = time.perf_counter() - start_ts
-            completed = not interrupted and player._stream == target
             logger.debug(
                 "BASS fade done stream=%s requested=%.3f elapsed=%.3f completed=%s",
                 target,
                 duration,
-                elapsed,
-                completed,
+                time.perf_counter() - start_ts,
+                not interrupted and player._stream == target,
             )
             if interrupted or player._stream != target:
                 try:
@@ -1,6 +1,17 @@
-"""BassPlayer monitor thread helper.
+"""Shared playback monitor for all `BassPlayer` instances.
 
-Kept as a separate module to keep `player_base.py` smaller and focused.
+One `BassMonitor` thread serves every playing BASS stream. It does not poll
+at a fixed rate. Instead it sleeps until the earliest deadline among its
+subscriptions:
+
+- the next progress report (only for players with a progress callback),
+- the predicted moment a loop should have wrapped (backup for the loop sync),
+- a slow liveness check.
+
+End of track is signalled by a BASS ``SYNC_END`` callback, which wakes the
+monitor at once. The monitor then polls briefly until the channel has
+drained. Callbacks and `stop()` run on the monitor thread, never inside the
+BASS sync callback; other sync handlers hand work over with `call_soon`.
 """
 
 from __future__ import annotations
@@ -8,111 +19,300 @@ from __future__ import annotations
 import logging
 import threading
 import time
-from typing import TYPE_CHECKING
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, Optional
 
 if TYPE_CHECKING:
     from .player_base import BassPlayer
 
+logger = logging.getLogger(__name__)
+
+# domyślna częstotliwość raportów postępu (gracz może ją nadpisać `_progress_interval`)
+PROGRESS_INTERVAL = 0.05
+# rzadkie sprawdzenie, czy kanał gra - na wypadek pominiętego SYNC_END
+ACTIVE_CHECK_INTERVAL = 0.25
+# po SYNC_END czekamy, aż bufor urządzenia się opróżni
+END_POLL_INTERVAL = 0.01
+# najkrótsza przerwa strażnika pętli (pozycja nie rośnie szybciej niż czas)
+MIN_GUARD_INTERVAL = 0.002
+
+
+@dataclass(eq=False)
+class _Subscription:
+    player: "BassPlayer"
+    stream: int
+    loop_guard_base_slack: float
+    loop_guard_fallback_slack: float
+    logger: logging.Logger
+    next_progress: float = 0.0
+    next_active_check: float = 0.0
+    next_guard: Optional[float] = None
+    end_signalled: bool = False
+    active: bool = True
+    end_sync_proc: object = field(default=None, repr=False)
+    end_sync_handle: int = 0
+
+    def next_due(self) -> float:
+        due = self.next_active_check
+        if self.player._progress_callback is not None:
+            due = min(due, self.next_progress)
+        if self.next_guard is not None:
+            due = min(due, self.next_guard)
+        return due
+
+
+class BassMonitor:
+    """Single thread that services every registered BassPlayer."""
+
+    _instance_lock = threading.Lock()
+    _instance: Optional["BassMonitor"] = None
+
+    def __init__(self) -> None:
+        self._wake = threading.Condition()
+        self._subscriptions: dict[int, _Subscription] = {}
+        self._calls: deque[Callable[[], None]] = deque()
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def instance(cls) -> "BassMonitor":
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+        return cls._instance
+
+    def register(
+        self,
+        player: "BassPlayer",
+        *,
+        loop_guard_base_slack: float,
+        loop_guard_fallback_slack: float,
+        logger: logging.Logger,
+    ) -> None:
+        self.unregister(player)
+        now = time.monotonic()
+        subscription = _Subscription(
+            player=player,
+            stream=player._stream,
+            loop_guard_base_slack=loop_guard_base_slack,
+            loop_guard_fallback_slack=loop_guard_fallback_slack,
+            logger=logger,
+            next_progress=now,
+            next_active_check=now + ACTIVE_CHECK_INTERVAL,
+            next_guard=now if self._loop_guarded(player) else None,
+        )
+        self._set_end_sync(subscription)
+        with self._wake:
+            self._subscriptions[id(player)] = subscription
+            self._ensure_thread()
+            self._wake.notify()
+
+    def call_soon(self, callback: Callable[[], None]) -> None:
+        """Run `callback` on the monitor thread (safe to call from a BASS sync)."""
+
+        with self._wake:
+            self._calls.append(callback)
+            self._ensure_thread()
+            self._wake.notify()
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, daemon=True, name="bass-monitor")
+            self._thread.start()
+
+    def unregister(self, player: "BassPlayer") -> None:
+        with self._wake:
+            subscription = self._subscriptions.pop(id(player), None)
+        if subscription is None:
+            return
+        subscription.active = False
+        if subscription.end_sync_handle:
+            try:
+                player._manager.channel_remove_sync(subscription.stream, subscription.end_sync_handle)
+            except Exception:
+                pass
+            subscription.end_sync_handle = 0
+
+    def loop_changed(self, player: "BassPlayer") -> None:
+        """Re-plan the loop guard after the player's loop points changed."""
+
+        with self._wake:
+            subscription = self._subscriptions.get(id(player))
+            if subscription is None:
+                return
+            subscription.next_guard = time.monotonic() if self._loop_guarded(player) else None
+            self._wake.notify()
+
+    def subscription_count(self) -> int:
+        with self._wake:
+            return len(self._subscriptions)
+
+    def _signal_end(self, subscription: _Subscription) -> None:
+        with self._wake:
+            subscription.end_signalled = True
+            subscription.next_active_check = time.monotonic()
+            self._wake.notify()
+
+    def _set_end_sync(self, subscription: _Subscription) -> None:
+        player = subscription.player
+
+        def _end_sync(handle, channel, data, user):  # pragma: no cover - C callback
+            self._signal_end(subscription)
+
+        try:
+            subscription.end_sync_proc = player._manager.make_sync_proc(_end_sync)
+            # bez MIXTIME: sync przychodzi, gdy koniec jest słyszalny, a nie gdy dekoder go osiągnie
+            subscription.end_sync_handle = player._manager.channel_set_sync_end(
+                subscription.stream,
+                subscription.end_sync_proc,
+                mix_time=False,
+            )
+        except Exception as exc:
+            subscription.end_sync_proc = None
+            subscription.end_sync_handle = 0
+            subscription.logger.debug("BASS monitor: SYNC_END unavailable, polling end: %s", exc)
+
+    @staticmethod
+    def _loop_guarded(player: "BassPlayer") -> bool:
+        return bool(
+            player._loop_guard_enabled
+            and player._loop_active
+            and player._loop_end is not None
+            and player._loop_start is not None
+        )
+
+    def _run(self) -> None:
+        while True:
+            with self._wake:
+                while True:
+                    calls = list(self._calls)
+                    self._calls.clear()
+                    now = time.monotonic()
+                    due = [sub for sub in self._subscriptions.values() if sub.next_due() <= now]
+                    if due or calls:
+                        break
+                    if not self._subscriptions:
+                        # nic nie gra - wątek kończy się, `register` uruchomi nowy
+                        self._thread = None
+                        return
+                    self._wake.wait(min(sub.next_due() for sub in self._subscriptions.values()) - now)
+            for callback in calls:
+                try:
+                    callback()
+                except Exception as exc:  # pylint: disable=broad-except
+                    logger.debug("BASS monitor: deferred call failed: %s", exc)
+            for subscription in due:
+                try:
+                    self._service(subscription, time.monotonic())
+                except Exception as exc:  # pylint: disable=broad-except
+                    subscription.logger.debug("BASS monitor: player check failed: %s", exc)
+                    self.unregister(subscription.player)
+
+    def _service(self, subscription: _Subscription, now: float) -> None:
+        player = subscription.player
+        if not subscription.active:
+            return
+        if player._stream != subscription.stream:
+            self.unregister(player)
+            return
+
+        if player._progress_callback is not None and now >= subscription.next_progress:
+            subscription.next_progress = now + getattr(player, "_progress_interval", PROGRESS_INTERVAL)
+            item_id = player._current_item_id
+            if item_id:
+                try:
+                    pos = player._manager.channel_get_seconds(player._stream)
+                    player._progress_callback(item_id, pos)
+                except Exception:
+                    pass
+
+        if subscription.next_guard is not None and now >= subscription.next_guard:
+            subscription.next_guard = self._check_loop(subscription)
+
+        if now >= subscription.next_active_check:
+            if player._is_active():
+                subscription.next_active_check = now + (
+                    END_POLL_INTERVAL if subscription.end_signalled else ACTIVE_CHECK_INTERVAL
+                )
+            else:
+                self._handle_inactive(subscription, now)
+
+    def _check_loop(self, subscription: _Subscription) -> Optional[float]:
+        """Backup for the loop sync; returns when the loop should be checked again."""
+
+        player = subscription.player
+        if not self._loop_guarded(player):
+            return None
+        logger = subscription.logger
+        pos = player._manager.channel_get_seconds(player._stream)
+        now = time.time()
+        if player._debug_loop and (now - player._last_loop_debug_log) > 0.5:
+            logger.debug(
+                "Loop debug: pos=%.6f start=%.6f end=%.6f stream=%s",
+                pos,
+                player._loop_start,
+                player._loop_end,
+                player._stream,
+            )
+            player._last_loop_debug_log = now
+        guard_slack = (
+            subscription.loop_guard_base_slack
+            if player._loop_guard_armed
+            else subscription.loop_guard_fallback_slack
+        )
+        # strażnik awaryjny: pozwól syncowi zadziałać, a reaguj dopiero PO końcu
+        if (now - player._last_loop_jump_ts) > 0.004 and (
+            pos > (player._loop_end + guard_slack) or pos > (player._loop_end + 0.05)
+        ):
+            player._jump_to_loop_start("guard", pos)
+            pos = player._loop_start
+        # obudź się dopiero wtedy, gdy pozycja powinna minąć koniec pętli
+        return time.monotonic() + max(MIN_GUARD_INTERVAL, player._loop_end + guard_slack - pos)
+
+    def _handle_inactive(self, subscription: _Subscription, now: float) -> None:
+        player = subscription.player
+        if player._loop_active and player._stream:
+            # pętla ma trwać - wznawiamy bez zgłaszania zakończenia i próbujemy ponownie
+            try:
+                if player._loop_start_bytes:
+                    player._manager.channel_set_position_bytes(player._stream, player._loop_start_bytes)
+                try:
+                    player._manager.channel_play(player._stream, False)
+                except Exception:
+                    pass
+            except Exception as exc:
+                if player._debug_loop:
+                    subscription.logger.debug("Loop debug: monitor restart failed: %s", exc)
+            subscription.end_signalled = False
+            subscription.next_active_check = now + END_POLL_INTERVAL
+            return
+        self.unregister(player)
+        if player._finished_callback and player._current_item_id:
+            try:
+                player._finished_callback(player._current_item_id)
+            except Exception:
+                pass
+        # zwolnij zasoby po naturalnym zakończeniu
+        try:
+            player.stop(_from_fade=True)
+        except Exception:
+            pass
+
 
 def start_monitor(
     player: "BassPlayer",
     *,
-    monitor_interval: float,
     loop_guard_base_slack: float,
     loop_guard_fallback_slack: float,
     logger: logging.Logger,
 ) -> None:
-    if player._monitor_thread and player._monitor_thread.is_alive():
-        return
-    player._monitor_stop.clear()
-
-    def _runner() -> None:
-        while not player._monitor_stop.is_set():
-            try:
-                if player._stream:
-                    now = time.time()
-                    if (
-                        player._progress_callback
-                        and player._current_item_id
-                        and (now - player._last_progress_ts) >= 0.05
-                    ):
-                        try:
-                            pos = player._manager.channel_get_seconds(player._stream)
-                            player._progress_callback(player._current_item_id, pos)
-                        except Exception:
-                            pass
-                        player._last_progress_ts = now
-                    # nadzoruj pętlę również po stronie Python, żeby uniknąć pominiętych synców
-                    if (
-                        player._loop_guard_enabled
-                        and player._loop_active
-                        and player._loop_end is not None
-                        and player._loop_start is not None
-                    ):
-                        try:
-                            pos = player._manager.channel_get_seconds(player._stream)
-                            now = time.time()
-                            if player._debug_loop and (now - player._last_loop_debug_log) > 0.5:
-                                logger.debug(
-                                    "Loop debug: pos=%.6f start=%.6f end=%.6f stream=%s",
-                                    pos,
-                                    player._loop_start,
-                                    player._loop_end,
-                                    player._stream,
-                                )
-                                player._last_loop_debug_log = now
-                            # strażnik awaryjny: pozwól syncowi zadziałać, a reaguj dopiero PO końcu
-                            if (now - player._last_loop_jump_ts) > 0.004:
-                                guard_slack = (
-                                    loop_guard_base_slack
-                                    if player._loop_guard_armed
-                                    else loop_guard_fallback_slack
-                                )
-                                if pos > (player._loop_end + guard_slack):
-                                    player._jump_to_loop_start("guard", pos)
-                                    continue
-                                # twardy clamp tylko przy dużym odjechaniu
-                                if pos > (player._loop_end + 0.05):
-                                    player._jump_to_loop_start("clamp", pos)
-                                    continue
-                        except Exception as exc:
-                            if player._debug_loop:
-                                logger.debug("Loop debug: guard check failed: %s", exc)
-                    active = player._is_active()
-                    if not active:
-                        # Jeśli pętla ma być aktywna, próbujemy wznowić bez wyzwalania zakończenia
-                        if player._loop_active and player._stream:
-                            try:
-                                if player._loop_start_bytes:
-                                    player._manager.channel_set_position_bytes(
-                                        player._stream, player._loop_start_bytes
-                                    )
-                                # jeśli strumień nie gra, wznów go
-                                try:
-                                    player._manager.channel_play(player._stream, False)
-                                except Exception:
-                                    pass
-                            except Exception as exc:
-                                if player._debug_loop:
-                                    logger.debug("Loop debug: monitor restart failed: %s", exc)
-                            # nawet jeśli się nie udało, nie zgłaszaj zakończenia – próbuj ponownie
-                            time.sleep(monitor_interval)
-                            continue
-                        if player._finished_callback and player._current_item_id:
-                            try:
-                                player._finished_callback(player._current_item_id)
-                            except Exception:
-                                pass
-                        # zwolnij zasoby po naturalnym zakończeniu
-                        try:
-                            player.stop(_from_fade=True)
-                        except Exception:
-                            pass
-                        break
-                time.sleep(monitor_interval)
-            except Exception:
-                break
+    BassMonitor.instance().register(
+        player,
+        loop_guard_base_slack=loop_guard_base_slack,
+        loop_guard_fallback_slack=loop_guard_fallback_slack,
+        logger=logger,
+    )
 
-    player._monitor_thread = threading.Thread(target=_runner, daemon=True, name="bass-monitor")
-    player._monitor_thread.start()
 
+def stop_monitor(player: "BassPlayer") -> None:
+    BassMonitor.instance().unregister(player)
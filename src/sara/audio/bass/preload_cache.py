@@ -0,0 +1,160 @@
+"""Shared cache of BASS streams opened ahead of playback.
+
+The UI creates a new `BassPlayer` for every start, so a stream prepared by one
+player instance must be usable by another. Entries are therefore keyed by
+device, path, start position and loop flag, not by player. Hard limits on
+open streams and on file bytes evict the oldest entries. They come from the
+same ``SARA_PRELOAD_MAX_STREAMS`` / ``SARA_PRELOAD_MAX_BYTES`` settings as the
+UI preload pool, which normally stays below them and prunes entries itself
+with `retain`.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Optional
+
+from sara.core.env import (
+    DEFAULT_PRELOAD_MAX_BYTES,
+    DEFAULT_PRELOAD_MAX_STREAMS,
+    preload_max_bytes,
+    preload_max_streams,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from sara.audio.bass.manager import BassManager, _DeviceContext
+
+logger = logging.getLogger(__name__)
+
+PreloadKey = tuple[int, Path, float, bool]
+
+
+@dataclass
+class PreloadedStream:
+    device_index: int
+    path: Path
+    start_seconds: float
+    allow_loop: bool
+    stream: int
+    device_context: Optional["_DeviceContext"] = None
+    size_bytes: int = 0
+
+    @property
+    def key(self) -> PreloadKey:
+        return (self.device_index, self.path, round(self.start_seconds, 3), self.allow_loop)
+
+
+class BassPreloadCache:
+    """Thread-safe store of prepared streams, oldest first."""
+
+    def __init__(
+        self,
+        manager: "BassManager",
+        *,
+        max_streams: int = DEFAULT_PRELOAD_MAX_STREAMS,
+        max_bytes: int = DEFAULT_PRELOAD_MAX_BYTES,
+    ) -> None:
+        self._manager = manager
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[PreloadKey, PreloadedStream] = OrderedDict()
+        self._max_streams = max(0, int(max_streams))
+        self._max_bytes = max(0, int(max_bytes))
+
+    def put(self, entry: PreloadedStream) -> bool:
+        """Store `entry`; returns False when the limits evicted it straight away."""
+
+        with self._lock:
+            replaced = self._entries.pop(entry.key, None)
+            self._entries[entry.key] = entry
+            evicted = self._evict_locked()
+        if replaced is not None:
+            evicted.insert(0, replaced)
+        self._release_all(evicted)
+        return not any(dropped is entry for dropped in evicted)
+
+    def contains(self, device_index: int, path: Path, *, start_seconds: float, allow_loop: bool) -> bool:
+        with self._lock:
+            return (device_index, Path(path), round(float(start_seconds), 3), bool(allow_loop)) in self._entries
+
+    def take(
+        self,
+        device_index: int,
+        path: Path,
+        *,
+        start_seconds: float,
+        allow_loop: bool,
+        tolerance: float = 0.001,
+    ) -> Optional[PreloadedStream]:
+        """Remove and return a matching stream; the caller owns it afterwards."""
+
+        path = Path(path)
+        with self._lock:
+            for key, entry in self._entries.items():
+                if (
+                    entry.device_index == device_index
+                    and entry.path == path
+                    and entry.allow_loop == bool(allow_loop)
+                    and abs(float(start_seconds) - entry.start_seconds) <= tolerance
+                ):
+                    del self._entries[key]
+                    return entry
+        return None
+
+    def retain(self, keep: Callable[[PreloadedStream], bool]) -> int:
+        """Release every entry for which `keep` returns False; returns how many were released."""
+
+        with self._lock:
+            dropped = [entry for entry in self._entries.values() if not keep(entry)]
+            for entry in dropped:
+                del self._entries[entry.key]
+        self._release_all(dropped)
+        return len(dropped)
+
+    def clear(self) -> None:
+        self.retain(lambda _entry: False)
+
+    def usage(self) -> tuple[int, int]:
+        """Open streams and file bytes currently held."""
+
+        with self._lock:
+            return len(self._entries), sum(entry.size_bytes for entry in self._entries.values())
+
+    def _evict_locked(self) -> list[PreloadedStream]:
+        evicted: list[PreloadedStream] = []
+        total_bytes = sum(entry.size_bytes for entry in self._entries.values())
+        while self._entries and (len(self._entries) > self._max_streams or total_bytes > self._max_bytes):
+            _key, entry = self._entries.popitem(last=False)
+            total_bytes -= entry.size_bytes
+            evicted.append(entry)
+        return evicted
+
+    def _release_all(self, entries: list[PreloadedStream]) -> None:
+        for entry in entries:
+            if entry.stream:
+                try:
+                    self._manager.stream_free(entry.stream)
+                except Exception as exc:  # pylint: disable=broad-except
+                    logger.debug("BASS preload: stream_free failed for %s: %s", entry.path, exc)
+            if entry.device_context is not None:
+                try:
+                    entry.device_context.release()
+                except Exception:
+                    pass
+
+
+_cache_lock = threading.Lock()
+
+
+def preload_cache(manager: "BassManager") -> BassPreloadCache:
+    """Cache shared by every player of `manager` (created on first use)."""
+
+    with _cache_lock:
+        cache = getattr(manager, "_preload_cache", None)
+        if cache is None:
+            cache = BassPreloadCache(manager, max_streams=preload_max_streams(), max_bytes=preload_max_bytes())
+            manager._preload_cache = cache
+        return cache
@@ -4,11 +4,13 @@ Public surface:
 - `DeviceMixer`
 - `MixerPlayer`
 - `NullOutputStream`
+- `OfflineMixer` / `RenderStats`
 """
 
 from __future__ import annotations
 
 from sara.audio.mixer.device_mixer import DeviceMixer
+from sara.audio.mixer.offline import OfflineMixer, RenderStats
 from sara.audio.mixer.player import MixerPlayer
 from sara.audio.mixer.types import NullOutputStream
 
@@ -16,4 +18,6 @@ __all__ = [
     "DeviceMixer",
     "MixerPlayer",
     "NullOutputStream",
+    "OfflineMixer",
+    "RenderStats",
 ]
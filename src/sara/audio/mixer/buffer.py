@@ -0,0 +1,119 @@
+"""Preallocated per-source sample buffers for the software mixer.
+
+The mixer thread must not allocate per block. Every source therefore owns
+(through its `SourceDecoder`) a ring buffer of decoded, channel-mapped frames
+and a decode scratch array.
+Both grow only when a larger block is requested than ever before, which in
+practice means once, when the source starts.
+"""
+
+from __future__ import annotations
+
+from sara.audio.mixer.kernels import map_channels
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy should be available with soundfile
+    np = None
+
+
+class SourceRingBuffer:
+    """FIFO of float32 frames with a fixed channel count.
+
+    The ring itself is not thread-safe; `SourceDecoder` guards it with its
+    lock when a decode thread fills it.
+    """
+
+    def __init__(self, channels: int, capacity: int = 0) -> None:
+        self.channels = int(channels)
+        self._data = np.zeros((max(0, int(capacity)), self.channels), dtype=np.float32)
+        self._start = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def capacity(self) -> int:
+        return len(self._data)
+
+    @property
+    def free(self) -> int:
+        return len(self._data) - self._count
+
+    def clear(self) -> None:
+        self._start = 0
+        self._count = 0
+
+    def truncate(self, frames: int) -> None:
+        """Drop everything after the first `frames` buffered frames."""
+
+        self._count = max(0, min(self._count, int(frames)))
+        if self._count == 0:
+            self._start = 0
+
+    def reserve(self, frames: int) -> None:
+        """Make room for at least `frames` buffered frames, keeping the content."""
+
+        if frames <= len(self._data):
+            return
+        capacity = max(int(frames), 2 * len(self._data), 64)
+        data = np.zeros((capacity, self.channels), dtype=np.float32)
+        self.read_into(data[: self._count], consume=False)
+        self._data = data
+        self._start = 0
+
+    def write(self, frames) -> int:
+        """Append `frames` (any channel count), mapping channels with `map_channels`."""
+
+        count = len(frames)
+        if count == 0:
+            return 0
+        if count > self.free:
+            self.reserve(self._count + count)
+        capacity = len(self._data)
+        end = (self._start + self._count) % capacity
+        first = min(count, capacity - end)
+        map_channels(self._data[end : end + first], frames[:first])
+        if first < count:
+            map_channels(self._data[: count - first], frames[first:])
+        self._count += count
+        return count
+
+    def read_into(self, out, *, consume: bool = True) -> int:
+        """Copy up to ``len(out)`` frames into `out`; returns the number copied."""
+
+        count = min(len(out), self._count)
+        if count == 0:
+            return 0
+        capacity = len(self._data)
+        first = min(count, capacity - self._start)
+        out[:first] = self._data[self._start : self._start + first]
+        if first < count:
+            out[first:count] = self._data[: count - first]
+        if consume:
+            self._start = (self._start + count) % capacity
+            self._count -= count
+            if self._count == 0:
+                self._start = 0
+        return count
+
+
+def read_frames(source, frames: int):
+    """Decode up to `frames` frames into the source's scratch array and return a view.
+
+    Sound files that do not accept ``out=`` (e.g. test doubles) fall back to
+    an allocating read.
+    """
+
+    sound_file = source.sound_file
+    if source.read_into_supported:
+        scratch = source.read_scratch
+        if scratch is None or len(scratch) < frames:
+            scratch = np.zeros((frames, max(1, int(source.channels))), dtype=np.float32)
+            source.read_scratch = scratch
+        try:
+            return sound_file.read(frames, dtype="float32", always_2d=True, out=scratch[:frames])
+        except TypeError:
+            source.read_into_supported = False
+    return sound_file.read(frames, dtype="float32", always_2d=True)
@@ -0,0 +1,368 @@
+"""Read-ahead decoding for mixer sources.
+
+Reading and resampling a file (a slow network share, an MP3 seek) must not
+stall the device stream. Each source therefore gets a `SourceDecoder` that
+keeps a few hundred milliseconds of output-rate PCM ready in its ring buffer.
+The mixer thread only copies ready frames. When they are late, it plays
+silence and counts an underrun.
+
+Sources whose rate differs from the device go through a `StreamingResampler`
+that runs continuously across chunks and loop wraps. It is reset only when
+decoding jumps (a re-planned loop).
+
+Decoded audio is queued as segments that remember which file frames they
+came from. Playback position and loop restarts therefore follow the frames
+actually played, not the frames decoded ahead. Loop wraps are decided by the
+decoder and reported to the mixer at the exact output frame where the new
+pass begins.
+
+With ``read_ahead_frames=0`` the decoder runs without a thread and decodes
+on demand in the caller's thread, as the mixer did before (useful for tests
+and offline rendering).
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+from threading import Condition, Lock, Thread, current_thread
+from typing import Callable, Optional
+
+from sara.audio.mixer.buffer import SourceRingBuffer, read_frames
+from sara.audio.resampling import DEFAULT_RESAMPLER_QUALITY, StreamingResampler
+
+logger = logging.getLogger(__name__)
+
+READ_AHEAD_SECONDS = 0.5
+DECODE_CHUNK_SECONDS = 0.05
+
+
+@dataclass
+class _Segment:
+    file_start: int
+    file_frames: int
+    out_frames: int
+    loop_restart: bool = False
+    consumed: int = 0
+
+    def file_position(self, out_frames: int) -> int:
+        if self.out_frames <= 0:
+            return self.file_start
+        return self.file_start + (out_frames * self.file_frames) // self.out_frames
+
+    def out_position(self, file_frames: int) -> int:
+        if self.file_frames <= 0:
+            return 0
+        return int(round(file_frames * self.out_frames / self.file_frames))
+
+
+class SourceDecoder:
+    """Decode one mixer source ahead of playback into a bounded ring buffer."""
+
+    def __init__(
+        self,
+        source,
+        *,
+        output_channels: int,
+        read_ahead_frames: int,
+        chunk_frames: int,
+        on_release: Optional[Callable[[], None]] = None,
+        resampler_quality: str = DEFAULT_RESAMPLER_QUALITY,
+    ) -> None:
+        self._source = source
+        self._read_ahead = max(0, int(read_ahead_frames))
+        self._chunk = max(1, int(chunk_frames))
+        self._chunk_out = int(math.ceil(self._chunk * max(source.resample_ratio, 1e-6))) + 1
+        self._ring = SourceRingBuffer(output_channels)
+        self._resampler: StreamingResampler | None = None
+        if abs(source.resample_ratio - 1.0) > 1e-6:
+            self._resampler = StreamingResampler(
+                source.samplerate,
+                source.samplerate * source.resample_ratio,
+                max(1, int(source.channels)),
+                quality=resampler_quality,
+            )
+        if self._read_ahead:
+            # stała pojemność: wątek dekodera dopisuje tylko, gdy zmieści cały fragment
+            self._ring.reserve(self._read_ahead + self._chunk_out)
+        self._segments: deque[_Segment] = deque()
+        self._lock = Lock()
+        self._wake = Condition(self._lock)
+        self._file_position = int(source.position_frames)
+        self._seek_to: Optional[int] = None
+        self._restart_next = False
+        self._generation = 0
+        self._eof = False
+        self._closed = False
+        self._released = False
+        self._on_release = on_release
+        self._thread: Thread | None = None
+        self.position = int(source.position_frames)
+        self.underruns = 0
+        # czas odczytów pliku (zapisuje tylko wątek dekodujący)
+        self.reads = 0
+        self.read_ns = 0
+        self.read_max_ns = 0
+
+    @property
+    def threaded(self) -> bool:
+        return self._read_ahead > 0
+
+    @property
+    def read_ahead_frames(self) -> int:
+        return self._read_ahead
+
+    @property
+    def available(self) -> int:
+        with self._lock:
+            return len(self._ring)
+
+    @property
+    def exhausted(self) -> bool:
+        """True once the file is fully decoded and every decoded frame was played."""
+
+        with self._lock:
+            return self._eof and not self._segments
+
+    def start(self, *, prime_frames: int = 0) -> None:
+        """Decode `prime_frames` in the calling thread, then start the read-ahead thread."""
+
+        self._fill(max(0, int(prime_frames)))
+        if not self.threaded or self._thread is not None:
+            return
+        self._thread = Thread(target=self._run, name=f"sara-mixer-decode-{self._source.source_id}", daemon=True)
+        self._thread.start()
+
+    def prepare(self, frames: int) -> None:
+        """Make `frames` frames ready; decodes synchronously only without a read-ahead thread."""
+
+        if not self.threaded:
+            self._fill(frames)
+
+    def read_into(self, out) -> tuple[int, bool]:
+        """Copy ready frames into `out`, stopping before a loop restart.
+
+        Returns ``(frames, restarted)``; `restarted` means the copied frames
+        begin a new pass of the loop.
+        """
+
+        wanted = len(out)
+        copied = 0
+        restarted = False
+        with self._lock:
+            segments = self._segments
+            while copied < wanted and segments:
+                segment = segments[0]
+                if segment.loop_restart and segment.consumed == 0:
+                    if copied:
+                        break
+                    restarted = True
+                # wyjście resamplera może jeszcze nie dogonić opisu segmentu
+                take = min(wanted - copied, segment.out_frames - segment.consumed, len(self._ring))
+                if take <= 0:
+                    break
+                self._ring.read_into(out[copied : copied + take])
+                segment.consumed += take
+                copied += take
+                self.position = segment.file_position(segment.consumed)
+                if segment.consumed >= segment.out_frames:
+                    segments.popleft()
+            if self.threaded and len(self._ring) < self._read_ahead:
+                self._wake.notify()
+        return copied, restarted
+
+    def discard(self) -> None:
+        """Drop decoded frames that will not be played (the source is stopping)."""
+
+        with self._lock:
+            self._ring.clear()
+            self._segments.clear()
+            self._eof = True
+            self._generation += 1
+
+    def loop_changed(self) -> None:
+        """Re-plan read-ahead after ``source.loop_range`` changed.
+
+        Frames decoded for the old loop (past the new loop end, or after a wrap
+        the new loop no longer makes) are dropped and decoding resumes right
+        after the last frame that is still valid.
+        """
+
+        with self._lock:
+            loop_range = self._source.loop_range
+            loop_end = loop_range[1] if loop_range else None
+            budget = len(self._ring)
+            kept: deque[_Segment] = deque()
+            resume = self.position
+            for index, segment in enumerate(self._segments):
+                if index and segment.loop_restart:
+                    break
+                end_out = segment.consumed + min(segment.out_frames - segment.consumed, budget)
+                file_end = segment.file_position(end_out)
+                if end_out == segment.out_frames:
+                    file_end = segment.file_start + segment.file_frames
+                if loop_end is not None and loop_end < file_end:
+                    loop_out = max(segment.consumed, segment.out_position(loop_end - segment.file_start))
+                    if loop_out < end_out:
+                        end_out = loop_out
+                        file_end = max(loop_end, segment.file_position(segment.consumed))
+                resume = file_end
+                if end_out > segment.consumed:
+                    budget -= end_out - segment.consumed
+                    truncated = end_out < segment.out_frames
+                    segment.out_frames = end_out
+                    segment.file_frames = file_end - segment.file_start
+                    kept.append(segment)
+                    if truncated:
+                        break
+                elif end_out < segment.out_frames:
+                    break
+            self._segments = kept
+            self._ring.truncate(len(self._ring) - budget)
+            self._file_position = resume
+            self._seek_to = resume
+            self._restart_next = False
+            self._eof = False
+            self._generation += 1
+            self._wake.notify()
+
+    def close(self, timeout: float | None = None) -> None:
+        """Stop decoding and release the sound file.
+
+        With a running thread the file is released by that thread as soon as
+        any read in progress returns; `timeout` optionally waits for it.
+        """
+
+        with self._lock:
+            self._closed = True
+            self._wake.notify_all()
+            thread = self._thread
+        if thread is None or not thread.is_alive():
+            self._release()
+            return
+        if timeout is not None and thread is not current_thread():
+            thread.join(timeout)
+
+    def _run(self) -> None:
+        try:
+            while True:
+                with self._lock:
+                    while not self._closed and not self._wants_data():
+                        self._wake.wait()
+                    if self._closed:
+                        return
+                self._decode_step()
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.error("Błąd wątku dekodera %s: %s", self._source.path, exc)
+        finally:
+            self._release()
+
+    def _wants_data(self) -> bool:
+        if self._eof and self._seek_to is None:
+            return False
+        return len(self._ring) < self._read_ahead
+
+    def _fill(self, frames: int) -> None:
+        while True:
+            with self._lock:
+                if self._closed or (self._eof and self._seek_to is None) or len(self._ring) >= frames:
+                    return
+            self._decode_step()
+
+    def _decode_step(self) -> None:
+        """Decode one chunk outside the lock and queue it if nothing changed meanwhile."""
+
+        source = self._source
+        with self._lock:
+            generation = self._generation
+            seek_to = self._seek_to
+            self._seek_to = None
+            position = self._file_position
+            loop_range = source.loop_range
+        sound_file = source.sound_file
+
+        data = None
+        frames_read = 0
+        next_position = position
+        wrapped = False
+        eof = False
+        try:
+            if seek_to is not None:
+                sound_file.seek(seek_to)
+            request = self._chunk
+            if loop_range and position < loop_range[1]:
+                request = min(request, loop_range[1] - position)
+            if not loop_range or position < loop_range[1]:
+                started = time.perf_counter_ns()
+                data = read_frames(source, request)
+                elapsed = time.perf_counter_ns() - started
+                self.reads += 1
+                self.read_ns += elapsed
+                if elapsed > self.read_max_ns:
+                    self.read_max_ns = elapsed
+                frames_read = len(data)
+                eof = frames_read == 0
+            next_position = position + frames_read
+            if loop_range and not eof and next_position >= loop_range[1]:
+                try:
+                    sound_file.seek(loop_range[0])
+                except Exception as exc:  # pylint: disable=broad-except
+                    logger.error("Błąd ustawienia pętli: %s", exc)
+                    source.loop_range = None
+                else:
+                    wrapped = True
+                    next_position = loop_range[0]
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.error("Błąd odczytu pliku %s: %s", source.path, exc)
+            eof = True
+            frames_read = 0
+
+        out_frames = frames_read
+        resampler = self._resampler
+        if resampler is not None:
+            if seek_to is not None:
+                resampler.reset()
+            # segment opisuje dokładną oś czasu wyjścia; ramki dotrą do bufora z opóźnieniem filtra
+            before = resampler.input_frames
+            out_frames = resampler.expected_output(before + frames_read) - resampler.expected_output(before)
+            if frames_read:
+                data = resampler.process(data)
+            elif eof:
+                data = resampler.flush()
+
+        with self._lock:
+            if generation != self._generation or self._closed:
+                return
+            if data is not None and len(data):
+                self._ring.write(data)
+            if frames_read:
+                self._segments.append(
+                    _Segment(
+                        file_start=position,
+                        file_frames=frames_read,
+                        out_frames=out_frames,
+                        loop_restart=self._restart_next,
+                    )
+                )
+                self._restart_next = False
+            if wrapped:
+                self._restart_next = True
+            if eof:
+                self._eof = True
+            self._file_position = next_position
+
+    def _release(self) -> None:
+        with self._lock:
+            if self._released:
+                return
+            self._released = True
+            self._ring.clear()
+            self._segments.clear()
+        if self._on_release is not None:
+            try:
+                self._on_release()
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.warning("Błąd zwalniania źródła %s: %s", self._source.path, exc)
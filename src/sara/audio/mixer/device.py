@@ -43,7 +43,10 @@ def default_stream_factory(
     block_size: int,
     samplerate: float,
     channels: int,
+    callback=None,
 ):
+    """Open the device stream; with `callback` it is a low-latency pull stream."""
+
     if sd is None:
         return NullOutputStream(samplerate, channels)
     kwargs = {
@@ -53,4 +56,7 @@ def default_stream_factory(
         "dtype": "float32",
         "blocksize": block_size,
     }
+    if callback is not None:
+        kwargs["callback"] = callback
+        kwargs["latency"] = "low"
     return sd.OutputStream(**kwargs)
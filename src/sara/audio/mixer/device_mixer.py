@@ -3,12 +3,18 @@
 from __future__ import annotations
 
 import logging
+import math
+import time
 from threading import Event, Thread
 from typing import Callable, Optional
 
+from sara.audio.mixer.decoder import DECODE_CHUNK_SECONDS, READ_AHEAD_SECONDS
 from sara.audio.mixer.device import default_stream_factory, detect_device_format
+from sara.audio.mixer.dsp import start_fade_out
+from sara.audio.mixer.kernels import FADE_CURVES, FADE_LINEAR
 from sara.audio.mixer.render import render_source
 from sara.audio.mixer.source_lifecycle import (
+    close_source,
     create_source,
     dispose_replaced_source,
     get_sound_file_format,
@@ -16,11 +22,18 @@ from sara.audio.mixer.source_lifecycle import (
     resolve_output_samplerate,
 )
 from sara.audio.mixer.source_manager import MixerSourceManager
-from sara.audio.mixer.thread import run_mixer_loop
+from sara.audio.mixer.thread import run_mixer_loop, run_pull_mixer_loop
+from sara.audio.mixer.timing import TIMING_DUMP_SECONDS, MixerTimingReport, MixerTimings, SourceTiming
 from sara.audio.mixer.types import (
     MICRO_FADE_SECONDS,
+    MIX_TRIGGER_LEAD_SECONDS,
+    OUTPUT_MODE_PULL,
+    OUTPUT_MODE_PUSH,
+    OUTPUT_MODES,
     ZERO_CROSS_WINDOW_SECONDS,
+    MixerSource,
 )
+from sara.audio.resampling import DEFAULT_RESAMPLER_QUALITY
 from sara.audio.types import AudioDevice
 
 logger = logging.getLogger(__name__)
@@ -49,8 +62,19 @@ class DeviceMixer:
         device: AudioDevice,
         *,
         block_size: int = 1024,
-        stream_factory: Optional[Callable[[float, int], object]] = None,
+        stream_factory: Optional[Callable[..., object]] = None,
+        read_ahead_seconds: float = READ_AHEAD_SECONDS,
+        resampler_quality: str = DEFAULT_RESAMPLER_QUALITY,
+        output_mode: str = OUTPUT_MODE_PUSH,
     ) -> None:
+        """`read_ahead_seconds` of audio is decoded ahead per source; 0 decodes in the mixer thread.
+
+        `resampler_quality` (see `RESAMPLER_QUALITIES`) applies to files whose
+        rate differs from the device. With `output_mode` ``"pull"`` the device
+        callback mixes each period itself; `stream_factory` is then called
+        with a ``callback`` keyword argument.
+        """
+
         if np is None:
             raise RuntimeError("numpy is required for DeviceMixer")
         if sf is None:
@@ -58,23 +82,45 @@ class DeviceMixer:
 
         self.device = device
         self._block_size = block_size
+        self._read_ahead_seconds = max(0.0, float(read_ahead_seconds))
+        self._underruns = 0
+        self._resampler_quality = resampler_quality
+        if output_mode not in OUTPUT_MODES:
+            raise ValueError(f"Unknown mixer output mode: {output_mode}")
+        if output_mode == OUTPUT_MODE_PULL and stream_factory is None and sd is None:
+            logger.warning("Tryb callback wymaga sounddevice - %s używa zapisu blokowego", device.name)
+            output_mode = OUTPUT_MODE_PUSH
+        self._output_mode = output_mode
+        self._stream_latency: float | None = None
+        # punkty miksu, których wyzwalacz już zadziałał: source_id -> (ramka pliku, czy start już go zajął)
+        self._pending_mix_points: dict[str, tuple[int, bool]] = {}
         self._source_manager = MixerSourceManager()
         self._active_event = Event()
         self._stop_event = Event()
         self._thread: Thread | None = None
         self._stream_factory = stream_factory
-        self._samplerate, self._channels = detect_device_format(sd=sd, device=device, logger=logger)
-        self._micro_fade_frames = max(1, int(self._samplerate * MICRO_FADE_SECONDS))
-        self._zero_cross_frames = max(1, int(self._samplerate * ZERO_CROSS_WINDOW_SECONDS))
+        self._configure_format(*detect_device_format(sd=sd, device=device, logger=logger))
         if self._stream_factory is None:
-            self._stream_factory = lambda samplerate, channels: default_stream_factory(
+            self._stream_factory = lambda samplerate, channels, callback=None: default_stream_factory(
                 sd=sd,
                 device=self.device,
                 block_size=self._block_size,
                 samplerate=samplerate,
                 channels=channels,
+                callback=callback,
             )
 
+    def _configure_format(self, samplerate: int, channels: int) -> None:
+        self._samplerate = int(samplerate)
+        self._channels = max(1, int(channels))
+        self._micro_fade_frames = max(1, int(self._samplerate * MICRO_FADE_SECONDS))
+        self._zero_cross_frames = max(1, int(self._samplerate * ZERO_CROSS_WINDOW_SECONDS))
+        self._timings = MixerTimings(self._block_size / float(self._samplerate or 1))
+        self._last_timing_dump = time.monotonic()
+        # bloki wielokrotnego użytku - wątek miksera nie alokuje pamięci co blok
+        self._mix_block = np.zeros((self._block_size, self._channels), dtype=np.float32)
+        self._source_block = np.zeros((self._block_size, self._channels), dtype=np.float32)
+
     def _ensure_thread(self) -> None:
         if self._thread and self._thread.is_alive():
             return
@@ -88,19 +134,58 @@ class DeviceMixer:
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=1.5)
         self._thread = None
+        self._stream_latency = None
         sources = self._source_manager.clear()
         for source in sources:
-            try:
-                source.sound_file.close()
-            except Exception:  # pylint: disable=broad-except
-                pass
-            if source.transcoded_path is not None:
-                try:
-                    source.transcoded_path.unlink(missing_ok=True)
-                except Exception:  # pragma: no cover - best-effort cleanup
-                    pass
+            close_source(source, timeout=0.5)
             source.finished_event.set()
 
+    @property
+    def output_mode(self) -> str:
+        return self._output_mode
+
+    @property
+    def output_latency(self) -> float | None:
+        """Seconds from mixing a block to hearing it; None until the stream is open.
+
+        This is the latency PortAudio reports for the stream. In push mode it
+        also includes the one block the mixer thread writes ahead.
+        """
+
+        latency = self._stream_latency
+        if latency is None:
+            return None
+        if self._output_mode == OUTPUT_MODE_PUSH:
+            latency += self._block_size / float(self._samplerate or 1)
+        return latency
+
+    @property
+    def underrun_count(self) -> int:
+        """Blocks in which a source's decoder had not delivered its audio in time."""
+
+        return self._underruns
+
+    def timing_report(self) -> MixerTimingReport:
+        """Render/write timing, xruns, underruns and per-source read-ahead state since the last reset."""
+
+        sources = tuple(
+            SourceTiming(
+                source_id=source.source_id,
+                buffered_frames=source.decoder.available,
+                read_ahead_frames=source.decoder.read_ahead_frames,
+                underruns=source.decoder.underruns,
+                reads=source.decoder.reads,
+                read_seconds=source.decoder.read_ns / 1e9,
+                read_max_ms=source.decoder.read_max_ns / 1e6,
+            )
+            for source in self._source_manager.snapshot()
+        )
+        return self._timings.report(underruns=self._underruns, sources=sources)
+
+    def reset_timing_stats(self) -> None:
+        self._timings.reset()
+        self._underruns = 0
+
     def start_source(
         self,
         source_id: str,
@@ -111,7 +196,16 @@ class DeviceMixer:
         loop: Optional[tuple[float, float]] = None,
         on_progress: Optional[Callable[[str, float], None]] = None,
         on_finished: Optional[Callable[[str], None]] = None,
+        start_after: Optional[tuple[str, float]] = None,
     ) -> Event:
+        """Start playing `path` as `source_id` (replacing a source with that id).
+
+        With ``start_after=(anchor_id, seconds)`` the source is prepared now but
+        becomes audible at the exact output frame where `anchor_id` reaches
+        `seconds` of its file. It starts immediately if the anchor is gone or
+        already past that point.
+        """
+
         sound_file, transcoded_path = open_sound_file(path, sf=sf)
         samplerate, channels = get_sound_file_format(
             sound_file,
@@ -131,6 +225,7 @@ class DeviceMixer:
             self._samplerate = desired_samplerate
             self._micro_fade_frames = max(1, int(self._samplerate * MICRO_FADE_SECONDS))
             self._zero_cross_frames = max(1, int(self._samplerate * ZERO_CROSS_WINDOW_SECONDS))
+            self._timings.block_seconds = self._block_size / float(self._samplerate or 1)
 
         source = create_source(
             source_id=source_id,
@@ -148,8 +243,19 @@ class DeviceMixer:
             on_progress=on_progress,
             on_finished=on_finished,
             transcoded_path=transcoded_path,
+            read_ahead_frames=int(self._read_ahead_seconds * self._samplerate),
+            decode_chunk_frames=max(self._block_size, int(DECODE_CHUNK_SECONDS * samplerate)),
+            resampler_quality=self._resampler_quality,
         )
+        # pierwsze bloki dekodujemy od razu, żeby start nie zaczynał się od niedoboru
+        source.decoder.start(prime_frames=2 * self._block_size)
+        if start_after is not None:
+            anchor_id, anchor_seconds = start_after
+            anchor = self._source_manager.get(anchor_id)
+            if anchor is not None and anchor_id != source_id:
+                source.start_anchor = (anchor_id, max(0, int(anchor_seconds * (anchor.samplerate or 1))))
 
+        self._pending_mix_points.pop(source_id, None)
         old = self._source_manager.replace(source)
         if old:
             dispose_replaced_source(old)
@@ -171,28 +277,81 @@ class DeviceMixer:
         if self._source_manager.resume(source_id):
             self._active_event.set()
 
-    def fade_out_source(self, source_id: str, duration: float) -> None:
+    def fade_out_source(
+        self,
+        source_id: str,
+        duration: float,
+        *,
+        at_seconds: Optional[float] = None,
+        curve: str = FADE_LINEAR,
+    ) -> None:
+        """Fade `source_id` out over `duration` seconds, now or from file position `at_seconds`.
+
+        `curve` is one of `FADE_CURVES`; ``"equal_power"`` keeps the loudness of
+        a crossfade even.
+        """
+
+        if curve not in FADE_CURVES:
+            raise ValueError(f"Unknown fade curve: {curve}")
         if self._source_manager.fade_out(
             source_id,
             duration,
             samplerate=self._samplerate,
             channels=self._channels,
+            at_seconds=at_seconds,
+            curve=curve,
         ):
             self._active_event.set()
 
+    def set_mix_trigger(
+        self,
+        source_id: str,
+        seconds: Optional[float],
+        callback: Optional[Callable[[], None]],
+        *,
+        lead_seconds: float = MIX_TRIGGER_LEAD_SECONDS,
+    ) -> None:
+        """Call `callback` from the mixer thread `lead_seconds` before `source_id` reaches `seconds`.
+
+        Until the source reaches that point, `claim_mix_point` hands it to the
+        start of the next source and `pending_mix_point` reports it for this
+        source's fade. None clears the trigger.
+        """
+
+        self._source_manager.set_mix_trigger(source_id, seconds, callback, lead_seconds=lead_seconds)
+
+    def pending_mix_point(self, source_id: str) -> Optional[float]:
+        """File position (seconds) of `source_id`'s mix point if its trigger fired and the point is still ahead."""
+
+        point = self._pending_mix_points.get(source_id)
+        if point is None:
+            return None
+        source = self._source_manager.get(source_id)
+        if source is None or source.position_frames >= point[0]:
+            self._pending_mix_points.pop(source_id, None)
+            return None
+        return point[0] / float(source.samplerate or 1)
+
+    def claim_mix_point(self, source_id: str) -> Optional[tuple[str, float]]:
+        """Take `source_id`'s pending mix point as a `start_after` anchor.
+
+        Each mix point is handed out once, to the start that answers its
+        trigger; later calls return None. `pending_mix_point` keeps reporting
+        it so the fade of `source_id` can still be scheduled onto it.
+        """
+
+        seconds = self.pending_mix_point(source_id)
+        point = self._pending_mix_points.get(source_id)
+        if seconds is None or point is None or point[1]:
+            return None
+        self._pending_mix_points[source_id] = (point[0], True)
+        return source_id, seconds
+
     def stop_source(self, source_id: str) -> None:
         source = self._source_manager.pop(source_id)
         if not source:
             return
-        try:
-            source.sound_file.close()
-        except Exception:  # pylint: disable=broad-except
-            pass
-        if source.transcoded_path is not None:
-            try:
-                source.transcoded_path.unlink(missing_ok=True)
-            except Exception:  # pragma: no cover - best-effort cleanup
-                pass
+        close_source(source)
         if source.on_finished:
             try:
                 source.on_finished(source_id)
@@ -209,8 +368,23 @@ class DeviceMixer:
     ) -> None:
         self._source_manager.update_callbacks(source_id, on_progress=on_progress, on_finished=on_finished)
 
+    def _on_stream_open(self, stream) -> None:
+        try:
+            latency = getattr(stream, "latency", None)
+            self._stream_latency = float(latency) if latency is not None else 0.0
+        except (TypeError, ValueError):
+            # strumień dupleksowy raportuje parę (wejście, wyjście)
+            self._stream_latency = float(latency[-1])
+        logger.info(
+            "Mikser %s: tryb %s, opóźnienie wyjścia %.1f ms",
+            self.device.name,
+            self._output_mode,
+            (self.output_latency or 0.0) * 1000.0,
+        )
+
     def _run(self) -> None:
-        run_mixer_loop(
+        loop = run_pull_mixer_loop if self._output_mode == OUTPUT_MODE_PULL else run_mixer_loop
+        loop(
             stream_factory=self._stream_factory,
             samplerate=float(self._samplerate),
             channels=self._channels,
@@ -218,50 +392,126 @@ class DeviceMixer:
             active_event=self._active_event,
             mix_once=self._mix_once,
             finalize_source=self._finalize_source,
+            on_stream_open=self._on_stream_open,
+            timings=self._timings,
+            on_tick=self._dump_timings,
             logger=logger,
         )
 
-    def _mix_once(self):
+    def _dump_timings(self) -> None:
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        now = time.monotonic()
+        if now - self._last_timing_dump < TIMING_DUMP_SECONDS:
+            return
+        self._last_timing_dump = now
+        if self._timings.blocks:
+            logger.debug("Mikser %s - czasy przetwarzania:\n%s", self.device.name, self.timing_report().format())
+
+    def _mix_once(self, frames: Optional[int] = None):
+        """Mix the next block (`frames` long, at most the block size) of all sources."""
+
         sources = self._source_manager.snapshot()
         if not sources:
             return None, [], []
 
-        block = np.zeros((self._block_size, self._channels), dtype=np.float32)
+        started = time.perf_counter_ns()
+        block = self._mix_block if frames is None else self._mix_block[:frames]
+        block.fill(0.0)
+        block_size = len(block)
         progresses: list[tuple[str, float, Callable[[str, float], None]]] = []
         finished_ids: list[str] = []
 
+        # źródła czekające na kotwicę startują w ramce liczonej od pozycji kotwicy na początku bloku
+        scheduled: list[tuple[int, MixerSource]] = []
         for source in sources:
-            data, frames_out, finished = render_source(
-                source,
-                block_size=self._block_size,
-                channels=self._channels,
-                micro_fade_frames=self._micro_fade_frames,
-            )
-            if frames_out:
-                block[:frames_out] += data[:frames_out]
-            if finished:
-                finished_ids.append(source.source_id)
-            if source.on_progress and frames_out:
-                seconds = source.position_frames / float(source.samplerate or 1)
-                progresses.append((source.source_id, seconds, source.on_progress))
-
-        if not finished_ids and not progresses and not block.any():
+            anchor_point = source.start_anchor
+            if anchor_point is None:
+                continue
+            anchor = next((item for item in sources if item.source_id == anchor_point[0]), None)
+            offset: Optional[int] = 0
+            if anchor is not None:
+                offset = None if anchor.start_anchor is not None else self._frames_until(anchor, anchor_point[1])
+            if offset is not None and offset < block_size:
+                scheduled.append((offset, source))
+
+        for source in sources:
+            if source.start_anchor is None:
+                self._render_into(block, source, 0, progresses, finished_ids)
+        for offset, source in scheduled:
+            source.start_anchor = None
+            self._render_into(block, source, offset, progresses, finished_ids)
+
+        # źródło grające ciszę z powodu niedoboru dekodera musi dalej być mieszane, aż dane dotrą
+        pending = any(
+            not source.paused and source.start_anchor is None and source.source_id not in finished_ids
+            for source in sources
+        )
+        if not pending and not finished_ids and not progresses and not block.any():
             self._active_event.clear()
+        self._timings.record_render(time.perf_counter_ns() - started)
         return block, progresses, finished_ids
 
+    @staticmethod
+    def _frames_until(source: MixerSource, file_frame: int) -> Optional[int]:
+        """Output frames until `source` plays `file_frame`; None while it is paused."""
+
+        if source.paused:
+            return None
+        remaining = file_frame - source.position_frames
+        if remaining <= 0:
+            return 0
+        return int(math.ceil(remaining * source.resample_ratio))
+
+    def _render_into(
+        self,
+        block,
+        source: MixerSource,
+        offset: int,
+        progresses: list[tuple[str, float, Callable[[str, float], None]]],
+        finished_ids: list[str],
+    ) -> None:
+        """Render `source` into ``block[offset:]``, starting a scheduled fade at its exact frame."""
+
+        out = self._source_block[offset : len(block)]
+        split = len(out)
+        fade = source.scheduled_fade
+        if fade is not None:
+            until = self._frames_until(source, fade[0])
+            if until is not None and until < split:
+                split = until
+        underruns = source.decoder.underruns
+        frames_out, finished = (0, False)
+        if split:
+            frames_out, finished = render_source(source, out[:split], micro_fade_frames=self._micro_fade_frames)
+        if split < len(out) and not finished:
+            source.scheduled_fade = None
+            start_fade_out(source, fade[1], curve=fade[2])
+            tail_frames, finished = render_source(source, out[split:], micro_fade_frames=self._micro_fade_frames)
+            if tail_frames:
+                frames_out = split + tail_frames
+        if source.decoder.underruns != underruns:
+            self._underruns += 1
+        if frames_out:
+            block[offset : offset + frames_out] += out[:frames_out]
+        if finished:
+            finished_ids.append(source.source_id)
+        if not frames_out:
+            return
+        seconds = source.position_frames / float(source.samplerate or 1)
+        trigger = source.mix_trigger
+        if trigger is not None and source.position_frames >= trigger[1]:
+            source.mix_trigger = None
+            self._pending_mix_points[source.source_id] = (trigger[0], False)
+            progresses.append((source.source_id, seconds, trigger[2]))
+        if source.on_progress:
+            progresses.append((source.source_id, seconds, source.on_progress))
+
     def _finalize_source(self, source_id: str) -> None:
         source = self._source_manager.pop(source_id)
         if not source:
             return
-        try:
-            source.sound_file.close()
-        except Exception:  # pylint: disable=broad-except
-            pass
-        if source.transcoded_path is not None:
-            try:
-                source.transcoded_path.unlink(missing_ok=True)
-            except Exception:  # pragma: no cover - best-effort cleanup
-                pass
+        close_source(source)
         if source.on_progress:
             try:
                 source.on_progress(source_id, source.position_frames / float(source.samplerate or 1))
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 
+from sara.audio.mixer.kernels import FADE_LINEAR, fade_gains, map_channels, nearest_zero_crossing
 from sara.audio.mixer.types import MixerSource
 
 logger = logging.getLogger(__name__)
@@ -17,11 +18,9 @@ except ImportError:  # pragma: no cover - numpy should be available with soundfi
 def match_channels(data, channels: int):
     if data.shape[1] == channels:
         return data
-    if data.shape[1] > channels:
-        return data[:, :channels]
-    pad_count = channels - data.shape[1]
-    pad = np.repeat(data[:, -1:], pad_count, axis=1)
-    return np.concatenate([data, pad], axis=1)
+    mapped = np.empty((len(data), channels), dtype=data.dtype)
+    map_channels(mapped, data)
+    return mapped
 
 
 def snap_to_zero_crossing(sound_file, target_frame: int, *, window_frames: int) -> int:
@@ -37,43 +36,90 @@ def snap_to_zero_crossing(sound_file, target_frame: int, *, window_frames: int)
         return max(0, target_frame)
     if data.size == 0:
         return max(0, target_frame)
-    values = data[:, 0]
-    crossings = [
-        idx for idx in range(1, len(values)) if values[idx - 1] == 0 or values[idx - 1] * values[idx] <= 0
-    ]
-    if not crossings:
+    idx = nearest_zero_crossing(data[:, 0], target_frame - start)
+    if idx is None:
         return max(0, target_frame)
-    desired = target_frame - start
-    idx = min(crossings, key=lambda i: abs(i - desired))
     return start + idx
 
 
-def apply_fades(source: MixerSource, data, frames_out: int, *, channels: int):
+def start_fade_out(source: MixerSource, frames: int, *, curve: str = FADE_LINEAR) -> None:
+    """Begin a `frames`-long fade-out of `source` that ends the source."""
+
+    # długość i krzywa przed licznikiem - wątek miksera czyta je bez blokady
+    source.fade_out_length = max(0, int(frames))
+    source.fade_out_curve = curve
+    source.fade_out_remaining = source.fade_out_length
+    source.stop_requested = True
+
+
+def start_restart_fade(source: MixerSource, frames: int) -> None:
+    """Begin the micro fade-in that masks a loop restart."""
+
+    if frames > source.pending_fade_in:
+        source.pending_fade_in = frames
+        source.pending_fade_length = frames
+
+
+def _fade_gains(source: MixerSource, frames: int, *, remaining: int, length: int, curve: str, rising: bool):
+    scratch = source.fade_scratch
+    if scratch is None or len(scratch) < frames:
+        scratch = np.zeros(frames, dtype=np.float32)
+        source.fade_scratch = scratch
+        source.fade_index_scratch = np.zeros(frames, dtype=np.intp)
+    length = max(length, remaining)
+    return fade_gains(
+        scratch[:frames],
+        source.fade_index_scratch,
+        done=length - remaining,
+        length=length,
+        curve=curve,
+        rising=rising,
+    )
+
+
+def apply_fades(source: MixerSource, block, frames_out: int, *, restart_offset: int = 0) -> None:
+    """Apply pending micro, fade-in and fade-out ramps to `block` in place.
+
+    Each fade continues from where the previous block left it. The micro fade
+    after a loop restart starts at `restart_offset`, the frame where the new
+    loop pass begins.
+    """
+
     if frames_out == 0:
-        return data
-    result = data
+        return
 
-    if source.pending_fade_in > 0:
-        frames = min(frames_out, source.pending_fade_in)
-        fade = np.linspace(0.0, 1.0, frames, endpoint=False, dtype=result.dtype)
-        result = result.copy()
-        result[:frames] *= fade[:, None]
+    if source.pending_fade_in > 0 and restart_offset < frames_out:
+        frames = min(frames_out - restart_offset, source.pending_fade_in)
+        block[restart_offset : restart_offset + frames] *= _fade_gains(
+            source,
+            frames,
+            remaining=source.pending_fade_in,
+            length=source.pending_fade_length,
+            curve=FADE_LINEAR,
+            rising=True,
+        )[:, None]
         source.pending_fade_in = max(0, source.pending_fade_in - frames)
 
     if source.fade_in_remaining > 0:
         frames = min(frames_out, source.fade_in_remaining)
-        fade = np.linspace(0.0, 1.0, frames, endpoint=False, dtype=result.dtype)
-        result = result.copy()
-        result[:frames] *= fade[:, None]
+        block[:frames] *= _fade_gains(
+            source,
+            frames,
+            remaining=source.fade_in_remaining,
+            length=source.fade_in_length,
+            curve=FADE_LINEAR,
+            rising=True,
+        )[:, None]
         source.fade_in_remaining = max(0, source.fade_in_remaining - frames)
 
     if source.fade_out_remaining > 0:
         frames = min(frames_out, source.fade_out_remaining)
-        fade = np.linspace(1.0, 0.0, frames, endpoint=False, dtype=result.dtype)
-        result = result.copy()
-        result[-frames:] *= fade[:, None]
+        block[frames_out - frames : frames_out] *= _fade_gains(
+            source,
+            frames,
+            remaining=source.fade_out_remaining,
+            length=source.fade_out_length,
+            curve=source.fade_out_curve,
+            rising=False,
+        )[:, None]
         source.fade_out_remaining = max(0, source.fade_out_remaining - frames)
-        if source.fade_out_remaining == 0:
-            source.buffer = np.zeros((0, channels), dtype=np.float32)
-
-    return result
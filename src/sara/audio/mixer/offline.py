@@ -0,0 +1,178 @@
+"""Faster-than-realtime rendering with the software mixer.
+
+`OfflineMixer` is a `DeviceMixer` without a device: there is no output stream
+and no mixer thread, and sources are decoded synchronously. `render` runs the
+same mix loop as fast as the CPU allows. It follows a script of timed cues
+(starts, fades, loops, triggers), so transitions can be previewed, checked
+in tests and benchmarked.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional
+
+from sara.audio.mixer.device_mixer import DeviceMixer
+from sara.audio.mixer.thread import dispatch_mixer_events
+from sara.audio.mixer.types import NullOutputStream
+from sara.audio.resampling import DEFAULT_RESAMPLER_QUALITY
+from sara.audio.types import AudioDevice, BackendType
+
+logger = logging.getLogger(__name__)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy should be available with soundfile
+    np = None
+
+try:
+    import soundfile as sf
+except ImportError:  # pragma: no cover - soundfile opcjonalne
+    sf = None
+
+
+# (sekunda wyjścia, akcja wywoływana z mikserem)
+RenderCue = tuple[float, Callable[["OfflineMixer"], None]]
+
+
+@dataclass(frozen=True)
+class RenderStats:
+    frames: int
+    blocks: int
+    source_blocks: int
+    elapsed_seconds: float
+    samplerate: int
+
+    @property
+    def audio_seconds(self) -> float:
+        return self.frames / float(self.samplerate or 1)
+
+    @property
+    def realtime_factor(self) -> float:
+        """Seconds of audio rendered per second of wall-clock time."""
+
+        return self.audio_seconds / max(self.elapsed_seconds, 1e-9)
+
+    @property
+    def source_blocks_per_second(self) -> float:
+        """Mixer throughput: sum over blocks of the sources mixed, per wall-clock second."""
+
+        return self.source_blocks / max(self.elapsed_seconds, 1e-9)
+
+
+class OfflineMixer(DeviceMixer):
+    """DeviceMixer that renders into memory or a file instead of a device."""
+
+    def __init__(
+        self,
+        *,
+        samplerate: int = 48000,
+        channels: int = 2,
+        block_size: int = 1024,
+        resampler_quality: str = DEFAULT_RESAMPLER_QUALITY,
+    ) -> None:
+        super().__init__(
+            AudioDevice(id="offline", name="Offline render", backend=BackendType.WASAPI),
+            block_size=block_size,
+            stream_factory=lambda samplerate, channels, callback=None: NullOutputStream(samplerate, channels),
+            read_ahead_seconds=0.0,
+            resampler_quality=resampler_quality,
+        )
+        self._configure_format(samplerate, channels)
+        self.last_stats: Optional[RenderStats] = None
+
+    @property
+    def samplerate(self) -> int:
+        return self._samplerate
+
+    @property
+    def channels(self) -> int:
+        return self._channels
+
+    def _ensure_thread(self) -> None:
+        # bloki renderuje `render` w wątku wywołującym
+        return
+
+    def iter_blocks(self, cues: Iterable[RenderCue] = (), *, duration: Optional[float] = None) -> Iterator[object]:
+        """Yield consecutive mixed blocks (views valid until the next block).
+
+        Each cue runs at its exact output frame: blocks are cut short so that
+        a cue always falls on a block boundary. Progress, trigger and finish
+        callbacks run synchronously between blocks. Without `duration`
+        rendering stops once every cue has run and every source has finished
+        (a looping source therefore needs a `duration`).
+        """
+
+        samplerate = self._samplerate
+        pending = deque(
+            (max(0, int(round(at_seconds * samplerate))), index, action)
+            for index, (at_seconds, action) in sorted(enumerate(cues), key=lambda entry: (entry[1][0], entry[0]))
+        )
+        limit = None if duration is None else max(0, int(round(duration * samplerate)))
+        position = 0
+        blocks = 0
+        source_blocks = 0
+        started = time.perf_counter()
+        try:
+            while limit is None or position < limit:
+                while pending and pending[0][0] <= position:
+                    pending.popleft()[2](self)
+                if limit is None and not pending and self._source_manager.is_empty():
+                    break
+                frames = self._block_size
+                if pending:
+                    frames = min(frames, pending[0][0] - position)
+                if limit is not None:
+                    frames = min(frames, limit - position)
+                source_blocks += len(self._source_manager.snapshot())
+                block, progresses, finished_ids = self._mix_once(frames)
+                if block is None:
+                    block = self._mix_block[:frames]
+                    block.fill(0.0)
+                dispatch_mixer_events(progresses, finished_ids, self._finalize_source, logger)
+                yield block
+                position += frames
+                blocks += 1
+        finally:
+            self.last_stats = RenderStats(
+                frames=position,
+                blocks=blocks,
+                source_blocks=source_blocks,
+                elapsed_seconds=time.perf_counter() - started,
+                samplerate=samplerate,
+            )
+
+    def render(self, cues: Iterable[RenderCue] = (), *, duration: Optional[float] = None):
+        """Render the script and return the mix as a ``(frames, channels)`` float32 array."""
+
+        chunks = [block.copy() for block in self.iter_blocks(cues, duration=duration)]
+        if not chunks:
+            return np.zeros((0, self._channels), dtype=np.float32)
+        return np.concatenate(chunks)
+
+    def render_to_file(
+        self,
+        path: Path | str,
+        cues: Iterable[RenderCue] = (),
+        *,
+        duration: Optional[float] = None,
+        subtype: Optional[str] = None,
+    ) -> RenderStats:
+        """Render the script into a sound file; the format follows the extension (``.wav``, ``.flac``)."""
+
+        if sf is None:
+            raise RuntimeError("soundfile is required to write rendered audio")
+        with sf.SoundFile(
+            str(path),
+            mode="w",
+            samplerate=self._samplerate,
+            channels=self._channels,
+            subtype=subtype,
+        ) as target:
+            for block in self.iter_blocks(cues, duration=duration):
+                target.write(block)
+        return self.last_stats
@@ -6,16 +6,25 @@ from threading import Event
 from typing import Callable, Optional
 
 from sara.audio.mixer.device_mixer import DeviceMixer
+from sara.audio.types import FADE_CURVES, FADE_LINEAR
 
 
 class MixerPlayer:
-    """Player-compatible adapter around DeviceMixer."""
+    """Player-compatible adapter around DeviceMixer.
+
+    Mix triggers are native: the mixer calls them slightly ahead of the mix
+    point. A track started with `set_mix_anchor` naming the item that fired the
+    trigger, and that item's own fade, are scheduled onto the mix point
+    sample-accurately. Other starts on the same mixer play immediately.
+    """
 
     def __init__(self, mixer: DeviceMixer):
         self._mixer = mixer
         self._source_id: Optional[str] = None
         self._finished_cb: Optional[Callable[[str], None]] = None
         self._progress_cb: Optional[Callable[[str, float], None]] = None
+        self._mix_anchor: Optional[str] = None
+        self._fade_curve = FADE_LINEAR
 
     def play(
         self,
@@ -23,17 +32,24 @@ class MixerPlayer:
         source_path: str,
         *,
         start_seconds: float = 0.0,
+        allow_loop: bool = True,
         mix_trigger_seconds: float | None = None,
         on_mix_trigger: Callable[[], None] | None = None,
     ) -> Event:
+        del allow_loop  # pętle ustawia set_loop
         self._source_id = playlist_item_id
-        return self._mixer.start_source(
+        anchor_id, self._mix_anchor = self._mix_anchor, None
+        event = self._mixer.start_source(
             playlist_item_id,
             source_path,
             start_seconds=start_seconds,
             on_progress=self._progress_cb,
             on_finished=self._finished_cb,
+            start_after=self._mixer.claim_mix_point(anchor_id) if anchor_id else None,
         )
+        if mix_trigger_seconds is not None and on_mix_trigger is not None:
+            self._mixer.set_mix_trigger(playlist_item_id, mix_trigger_seconds, on_mix_trigger)
+        return event
 
     def pause(self) -> None:
         if self._source_id:
@@ -45,8 +61,24 @@ class MixerPlayer:
             self._source_id = None
 
     def fade_out(self, duration: float) -> None:
-        if self._source_id:
-            self._mixer.fade_out_source(self._source_id, duration)
+        if not self._source_id:
+            return
+        mix_point = self._mixer.pending_mix_point(self._source_id)
+        if mix_point is not None:
+            # miks tego utworu jest już w drodze - fade rusza w punkcie miksu, razem ze startem następnego
+            self._mixer.fade_out_source(self._source_id, duration, at_seconds=mix_point, curve=self._fade_curve)
+            return
+        self._mixer.fade_out_source(self._source_id, duration, curve=self._fade_curve)
+
+    def set_fade_curve(self, curve: str) -> None:
+        if curve not in FADE_CURVES:
+            raise ValueError(f"Unknown fade curve: {curve}")
+        self._fade_curve = curve
+
+    def set_mix_anchor(self, item_id: Optional[str]) -> None:
+        """Make the next `play` start at the pending mix point of `item_id` (one play only)."""
+
+        self._mix_anchor = item_id
 
     def set_finished_callback(self, callback: Optional[Callable[[str], None]]) -> None:
         self._finished_cb = callback
@@ -63,8 +95,8 @@ class MixerPlayer:
         mix_trigger_seconds: float | None,
         on_mix_trigger: Callable[[], None] | None,
     ) -> None:
-        # DeviceMixer nie obsługuje hardware'owego triggera miksu – metoda dla kompatybilności.
-        return
+        if self._source_id:
+            self._mixer.set_mix_trigger(self._source_id, mix_trigger_seconds, on_mix_trigger)
 
     def set_gain_db(self, gain_db: Optional[float]) -> None:
         if self._source_id:
@@ -79,4 +111,4 @@ class MixerPlayer:
         self._mixer.set_loop(self._source_id, (start_seconds, end_seconds))
 
     def supports_mix_trigger(self) -> bool:
-        return False
+        return True
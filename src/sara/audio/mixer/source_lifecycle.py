@@ -11,18 +11,15 @@ import math
 from pathlib import Path
 from typing import Callable, Optional
 
+from sara.audio.resampling import DEFAULT_RESAMPLER_QUALITY
 from sara.audio.transcoding import open_audio_file_with_transcoding
+from sara.audio.mixer.decoder import SourceDecoder
 from sara.audio.mixer.dsp import snap_to_zero_crossing
 from sara.audio.mixer.types import MixerSource
 from sara.audio.types import AudioDevice
 
 logger = logging.getLogger(__name__)
 
-try:
-    import numpy as np
-except ImportError:  # pragma: no cover - numpy should be available with soundfile
-    np = None
-
 
 def open_sound_file(path: str, *, sf) -> tuple[object, Path | None]:
     if sf is None:
@@ -118,7 +115,12 @@ def create_source(
     on_progress: Optional[Callable[[str, float], None]],
     on_finished: Optional[Callable[[str], None]],
     transcoded_path: Path | None = None,
+    read_ahead_frames: int = 0,
+    decode_chunk_frames: int = 1024,
+    resampler_quality: str = DEFAULT_RESAMPLER_QUALITY,
 ) -> MixerSource:
+    """Build a source positioned at `start_seconds`; its decoder is not started yet."""
+
     start_frame = prepare_start_frame(
         sound_file,
         start_seconds=start_seconds,
@@ -129,26 +131,35 @@ def create_source(
     gain = compute_gain_factor(gain_db)
     loop_range = compute_loop_frames(loop, samplerate=file_samplerate)
 
-    return MixerSource(
+    source = MixerSource(
         source_id=source_id,
         path=Path(path),
         sound_file=sound_file,
         samplerate=file_samplerate,
         channels=file_channels,
         resample_ratio=resample_ratio,
-        buffer=np.zeros((0, output_channels), dtype=np.float32),
         gain=gain,
         loop_range=loop_range,
         fade_in_remaining=micro_fade_frames,
+        fade_in_length=micro_fade_frames,
         stop_requested=False,
         on_progress=on_progress,
         on_finished=on_finished,
         position_frames=start_frame,
         transcoded_path=transcoded_path,
     )
+    source.decoder = SourceDecoder(
+        source,
+        output_channels=output_channels,
+        read_ahead_frames=read_ahead_frames,
+        chunk_frames=decode_chunk_frames,
+        on_release=lambda: release_sound_file(source),
+        resampler_quality=resampler_quality,
+    )
+    return source
 
 
-def dispose_replaced_source(source: MixerSource) -> None:
+def release_sound_file(source: MixerSource) -> None:
     try:
         source.sound_file.close()
     except Exception:  # pylint: disable=broad-except
@@ -158,4 +169,17 @@ def dispose_replaced_source(source: MixerSource) -> None:
             source.transcoded_path.unlink(missing_ok=True)
         except Exception:  # pragma: no cover - best-effort cleanup
             pass
+
+
+def close_source(source: MixerSource, *, timeout: float | None = None) -> None:
+    """Stop the source's decoder; it releases the sound file once no read is in progress."""
+
+    if source.decoder is None:
+        release_sound_file(source)
+        return
+    source.decoder.close(timeout)
+
+
+def dispose_replaced_source(source: MixerSource) -> None:
+    close_source(source)
     source.finished_event.set()
@@ -6,39 +6,48 @@ import math
 from threading import Lock
 from typing import Callable, Dict, Optional
 
+from sara.audio.mixer.dsp import start_fade_out
+from sara.audio.mixer.kernels import FADE_LINEAR
 from sara.audio.mixer.types import MixerSource
 
-try:
-    import numpy as np
-except ImportError:  # pragma: no cover - numpy should be available with soundfile
-    np = None
-
 
 class MixerSourceManager:
     def __init__(self) -> None:
         self._sources: Dict[str, MixerSource] = {}
         self._lock = Lock()
+        # niezmienna kopia listy dla wątku miksera/callbacku urządzenia - odczyt bez blokady
+        self._snapshot: tuple[MixerSource, ...] = ()
 
-    def snapshot(self) -> list[MixerSource]:
-        with self._lock:
-            return list(self._sources.values())
+    def snapshot(self) -> tuple[MixerSource, ...]:
+        return self._snapshot
+
+    def _publish(self) -> None:
+        self._snapshot = tuple(self._sources.values())
 
     def replace(self, source: MixerSource) -> Optional[MixerSource]:
         with self._lock:
             old = self._sources.pop(source.source_id, None)
             self._sources[source.source_id] = source
+            self._publish()
             return old
 
     def pop(self, source_id: str) -> Optional[MixerSource]:
         with self._lock:
-            return self._sources.pop(source_id, None)
+            source = self._sources.pop(source_id, None)
+            self._publish()
+            return source
 
     def clear(self) -> list[MixerSource]:
         with self._lock:
             sources = list(self._sources.values())
             self._sources.clear()
+            self._publish()
             return sources
 
+    def get(self, source_id: str) -> Optional[MixerSource]:
+        with self._lock:
+            return self._sources.get(source_id)
+
     def is_empty(self) -> bool:
         with self._lock:
             return not self._sources
@@ -63,12 +72,15 @@ class MixerSourceManager:
                 return
             if loop is None:
                 source.loop_range = None
-                return
-            start, end = loop
-            samplerate = source.samplerate or 1
-            start_frame = max(0, int(start * samplerate))
-            end_frame = max(start_frame + 1, int(end * samplerate))
-            source.loop_range = (start_frame, end_frame)
+            else:
+                start, end = loop
+                samplerate = source.samplerate or 1
+                start_frame = max(0, int(start * samplerate))
+                end_frame = max(start_frame + 1, int(end * samplerate))
+                source.loop_range = (start_frame, end_frame)
+            if source.decoder is not None:
+                # dekoder mógł już przeczytać dane za nowym końcem pętli
+                source.decoder.loop_changed()
 
     def pause(self, source_id: str) -> None:
         with self._lock:
@@ -85,23 +97,53 @@ class MixerSourceManager:
             source.paused = False
             return was_paused
 
-    def fade_out(self, source_id: str, duration: float, *, samplerate: int, channels: int) -> bool:
+    def fade_out(
+        self,
+        source_id: str,
+        duration: float,
+        *,
+        samplerate: int,
+        channels: int,
+        at_seconds: Optional[float] = None,
+        curve: str = FADE_LINEAR,
+    ) -> bool:
         with self._lock:
             source = self._sources.get(source_id)
             if not source:
                 return False
+            if at_seconds is not None:
+                # wątek miksera rozpocznie fade dokładnie w tej ramce pliku
+                frames = max(0, int(samplerate * duration))
+                source.scheduled_fade = (max(0, int(at_seconds * (source.samplerate or 1))), frames, curve)
+                return True
             if duration <= 0.0:
-                source.fade_out_remaining = 0
-                if np is not None:
-                    source.buffer = np.zeros((0, channels), dtype=np.float32)
+                # render kończy źródło w następnym bloku i odrzuca zdekodowane dane
                 source.paused = False
-                source.stop_requested = True
+                start_fade_out(source, 0)
                 return False
-            frames = max(1, int(samplerate * duration))
-            source.fade_out_remaining = frames
-            source.stop_requested = True
+            start_fade_out(source, max(1, int(samplerate * duration)), curve=curve)
             return True
 
+    def set_mix_trigger(
+        self,
+        source_id: str,
+        seconds: Optional[float],
+        callback: Optional[Callable[[], None]],
+        *,
+        lead_seconds: float,
+    ) -> None:
+        with self._lock:
+            source = self._sources.get(source_id)
+            if not source:
+                return
+            if seconds is None or callback is None:
+                source.mix_trigger = None
+                return
+            samplerate = source.samplerate or 1
+            frame = max(0, int(seconds * samplerate))
+            fire_frame = max(0, frame - int(max(0.0, lead_seconds) * samplerate))
+            source.mix_trigger = (frame, fire_frame, lambda _source_id, _seconds: callback())
+
     def update_callbacks(
         self,
         source_id: str,
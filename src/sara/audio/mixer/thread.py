@@ -6,6 +6,9 @@ This module keeps the mixing thread orchestration separate from the core
 
 from __future__ import annotations
 
+import time
+from collections import deque
+from threading import Event
 from typing import Callable, Iterable, Optional, Protocol, Tuple
 
 
@@ -17,6 +20,21 @@ class _StreamFactory(Protocol):
     def __call__(self, samplerate: float, channels: int): ...
 
 
+def dispatch_mixer_events(
+    progresses: Iterable[tuple[str, float, Callable[[str, float], None]]],
+    finished_ids: Iterable[str],
+    finalize_source: Callable[[str], None],
+    logger,
+) -> None:
+    for source_id, seconds, callback in progresses:
+        try:
+            callback(source_id, seconds)
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.error("Błąd callbacku postępu mixer: %s", exc)
+    for source_id in finished_ids:
+        finalize_source(source_id)
+
+
 def run_mixer_loop(
     *,
     stream_factory: _StreamFactory,
@@ -26,12 +44,17 @@ def run_mixer_loop(
     active_event,
     mix_once: Callable[[], Tuple[object, list[tuple[str, float, Callable[[str, float], None]]], list[str]]],
     finalize_source: Callable[[str], None],
+    on_stream_open: Optional[Callable[[object], None]] = None,
+    timings=None,
+    on_tick: Optional[Callable[[], None]] = None,
     logger=None,
 ) -> None:
     """Run the mixer loop until `stop_event` is set.
 
     The function is intentionally dependency-light: it receives all required
-    callables and events from the owning `DeviceMixer` instance.
+    callables and events from the owning `DeviceMixer` instance. Stream write
+    times and reported underflows go to `timings` (a `MixerTimings`);
+    `on_tick` runs once per loop pass.
     """
 
     if logger is None:  # pragma: no cover - defensive fallback
@@ -42,7 +65,11 @@ def run_mixer_loop(
     try:
         with stream_factory(float(samplerate), int(channels)) as stream:  # type: ignore[assignment]
             stream = stream  # keep a local name for clarity
+            if on_stream_open is not None:
+                on_stream_open(stream)
             while not stop_event.is_set():
+                if on_tick is not None:
+                    on_tick()
                 if not active_event.wait(timeout=0.05):
                     continue
                 block, progresses, finished_ids = mix_once()
@@ -50,19 +77,115 @@ def run_mixer_loop(
                     active_event.clear()
                     continue
                 try:
-                    stream.write(block)
+                    started = time.perf_counter_ns()
+                    # sounddevice zwraca True, gdy urządzenie zgłosiło niedobór danych
+                    underflowed = stream.write(block)
                 except Exception as exc:  # pylint: disable=broad-except
                     logger.error("Błąd zapisu do strumienia mixer: %s", exc)
                     break
-                for source_id, seconds, callback in progresses:
-                    try:
-                        callback(source_id, seconds)
-                    except Exception as exc:  # pylint: disable=broad-except
-                        logger.error("Błąd callbacku postępu mixer: %s", exc)
-                for source_id in finished_ids:
-                    finalize_source(source_id)
+                if timings is not None:
+                    timings.record_write(time.perf_counter_ns() - started)
+                    if underflowed is True:
+                        timings.record_xrun()
+                dispatch_mixer_events(progresses, finished_ids, finalize_source, logger)
     except Exception as exc:  # pylint: disable=broad-except
         logger.error("Błąd wątku DeviceMixer: %s", exc)
     finally:
         active_event.clear()
 
+
+class _CallbackFeeder:
+    """PortAudio callback that mixes on demand and hands events to the mixer thread.
+
+    The callback never waits on I/O or on the mixer thread. Sources are fed
+    by their decoder threads, the source list is an immutable snapshot, and
+    events go through a deque (atomic ``append``/``popleft``). Progress and finish callbacks, which may
+    touch the UI, run on the mixer thread instead.
+    """
+
+    def __init__(self, *, active_event, mix_once, logger, timings=None) -> None:
+        self._active_event = active_event
+        self._mix_once = mix_once
+        self._logger = logger
+        self._timings = timings
+        self.events: deque = deque()
+        self.wake = Event()
+        self._pending = None
+        self._pending_offset = 0
+
+    def __call__(self, outdata, frames, time_info, status) -> None:  # noqa: ARG002 - sygnatura PortAudio
+        if self._timings is not None and status and getattr(status, "output_underflow", False):
+            self._timings.record_xrun()
+        written = 0
+        try:
+            while written < frames:
+                pending = self._pending
+                if pending is None:
+                    if not self._active_event.is_set():
+                        break
+                    block, progresses, finished_ids = self._mix_once()
+                    if progresses or finished_ids:
+                        self.events.append((progresses, finished_ids))
+                        self.wake.set()
+                    if block is None:
+                        self._active_event.clear()
+                        break
+                    pending = block
+                    self._pending = block
+                    self._pending_offset = 0
+                count = min(frames - written, len(pending) - self._pending_offset)
+                outdata[written : written + count] = pending[self._pending_offset : self._pending_offset + count]
+                written += count
+                self._pending_offset += count
+                if self._pending_offset >= len(pending):
+                    self._pending = None
+        except Exception as exc:  # pylint: disable=broad-except
+            self._pending = None
+            self._logger.error("Błąd callbacku strumienia mixer: %s", exc)
+        if written < frames:
+            outdata[written:] = 0.0
+
+
+def run_pull_mixer_loop(
+    *,
+    stream_factory,
+    samplerate: float,
+    channels: int,
+    stop_event,
+    active_event,
+    mix_once: Callable[[], Tuple[object, list[tuple[str, float, Callable[[str, float], None]]], list[str]]],
+    finalize_source: Callable[[str], None],
+    on_stream_open: Optional[Callable[[object], None]] = None,
+    timings=None,
+    on_tick: Optional[Callable[[], None]] = None,
+    logger=None,
+) -> None:
+    """Run a callback (pull) stream until `stop_event` is set.
+
+    The device callback mixes each period itself. A source that was started
+    is therefore heard in the next callback, one buffer period at most. This
+    thread only keeps the stream open and delivers the callback's events.
+    """
+
+    if logger is None:  # pragma: no cover - defensive fallback
+        import logging
+
+        logger = logging.getLogger(__name__)
+
+    feeder = _CallbackFeeder(active_event=active_event, mix_once=mix_once, logger=logger, timings=timings)
+    try:
+        with stream_factory(float(samplerate), int(channels), callback=feeder) as stream:
+            if on_stream_open is not None:
+                on_stream_open(stream)
+            while not stop_event.is_set():
+                feeder.wake.wait(timeout=0.05)
+                feeder.wake.clear()
+                while feeder.events:
+                    progresses, finished_ids = feeder.events.popleft()
+                    dispatch_mixer_events(progresses, finished_ids, finalize_source, logger)
+                if on_tick is not None:
+                    on_tick()
+    except Exception as exc:  # pylint: disable=broad-except
+        logger.error("Błąd wątku DeviceMixer (callback): %s", exc)
+    finally:
+        active_event.clear()
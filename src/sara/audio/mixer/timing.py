@@ -0,0 +1,132 @@
+"""Low-overhead timing instrumentation for the software mixer.
+
+The mixer thread (or device callback) records how long each block took to
+render and how long the stream write blocked. It also counts device xruns.
+Decoders count their own file reads and underruns. Recording is a few
+integer updates per block and takes no locks. A reader may see
+a block counted in one field and not yet in another, which is fine for
+diagnostics. `report` assembles everything into an immutable `MixerTimingReport`.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass
+
+# górne granice kubełków histogramu czasu renderu (ms); ostatni kubełek to "więcej"
+RENDER_BUCKETS_MS = (0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 50.0)
+# co ile sekund mikser zrzuca statystyki do logu (tylko na poziomie DEBUG)
+TIMING_DUMP_SECONDS = 60.0
+
+_BUCKET_EDGES_NS = tuple(int(edge * 1_000_000) for edge in RENDER_BUCKETS_MS)
+
+
+@dataclass(frozen=True)
+class SourceTiming:
+    source_id: str
+    buffered_frames: int
+    read_ahead_frames: int
+    underruns: int
+    reads: int
+    read_seconds: float
+    read_max_ms: float
+
+    @property
+    def fill(self) -> float:
+        """Fraction of the read-ahead currently decoded (1.0 for sources decoded on demand)."""
+
+        if self.read_ahead_frames <= 0:
+            return 1.0
+        return min(1.0, self.buffered_frames / float(self.read_ahead_frames))
+
+
+@dataclass(frozen=True)
+class MixerTimingReport:
+    block_seconds: float
+    blocks: int
+    render_histogram: tuple[tuple[float | None, int], ...]
+    render_mean_ms: float
+    render_max_ms: float
+    late_blocks: int
+    writes: int
+    write_mean_ms: float
+    write_max_ms: float
+    xruns: int
+    underruns: int
+    sources: tuple[SourceTiming, ...]
+
+    def format(self) -> str:
+        labels = [f"<={edge:g}" for edge in RENDER_BUCKETS_MS] + [f">{RENDER_BUCKETS_MS[-1]:g}"]
+        histogram = " ".join(
+            f"{label}:{count}" for label, (_edge, count) in zip(labels, self.render_histogram) if count
+        )
+        lines = [
+            f"blocks={self.blocks} block={self.block_seconds * 1000.0:.1f}ms "
+            f"render mean={self.render_mean_ms:.3f}ms max={self.render_max_ms:.3f}ms late={self.late_blocks}",
+            f"render histogram (ms) {histogram or '-'}",
+            f"write mean={self.write_mean_ms:.3f}ms max={self.write_max_ms:.3f}ms "
+            f"xruns={self.xruns} underruns={self.underruns}",
+        ]
+        for source in self.sources:
+            lines.append(
+                f"source {source.source_id}: fill={source.fill:.0%} ({source.buffered_frames}/{source.read_ahead_frames}) "
+                f"underruns={source.underruns} reads={source.reads} "
+                f"read total={source.read_seconds * 1000.0:.1f}ms max={source.read_max_ms:.3f}ms"
+            )
+        return "\n".join(lines)
+
+
+class MixerTimings:
+    """Counters updated by the mixer thread; see `DeviceMixer.timing_report`."""
+
+    def __init__(self, block_seconds: float) -> None:
+        self.block_seconds = block_seconds
+        self.reset()
+
+    def reset(self) -> None:
+        self.render_histogram = [0] * (len(_BUCKET_EDGES_NS) + 1)
+        self.blocks = 0
+        self.render_total_ns = 0
+        self.render_max_ns = 0
+        self.late_blocks = 0
+        self.writes = 0
+        self.write_total_ns = 0
+        self.write_max_ns = 0
+        self.xruns = 0
+
+    def record_render(self, elapsed_ns: int) -> None:
+        self.render_histogram[bisect_left(_BUCKET_EDGES_NS, elapsed_ns)] += 1
+        self.blocks += 1
+        self.render_total_ns += elapsed_ns
+        if elapsed_ns > self.render_max_ns:
+            self.render_max_ns = elapsed_ns
+        if elapsed_ns > self.block_seconds * 1e9:
+            self.late_blocks += 1
+
+    def record_write(self, elapsed_ns: int) -> None:
+        self.writes += 1
+        self.write_total_ns += elapsed_ns
+        if elapsed_ns > self.write_max_ns:
+            self.write_max_ns = elapsed_ns
+
+    def record_xrun(self) -> None:
+        self.xruns += 1
+
+    def report(self, *, underruns: int, sources: tuple[SourceTiming, ...]) -> MixerTimingReport:
+        blocks = self.blocks
+        writes = self.writes
+        edges: tuple[float | None, ...] = RENDER_BUCKETS_MS + (None,)
+        return MixerTimingReport(
+            block_seconds=self.block_seconds,
+            blocks=blocks,
+            render_histogram=tuple(zip(edges, self.render_histogram)),
+            render_mean_ms=(self.render_total_ns / blocks / 1e6) if blocks else 0.0,
+            render_max_ms=self.render_max_ns / 1e6,
+            late_blocks=self.late_blocks,
+            writes=writes,
+            write_mean_ms=(self.write_total_ns / writes / 1e6) if writes else 0.0,
+            write_max_ms=self.write_max_ns / 1e6,
+            xruns=self.xruns,
+            underruns=underruns,
+            sources=sources,
+        )
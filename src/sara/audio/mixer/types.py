@@ -7,6 +7,8 @@ from pathlib import Path
 from threading import Event
 from typing import Callable, Optional
 
+from sara.audio.mixer.kernels import FADE_LINEAR
+
 try:
     import numpy as np
 except ImportError:  # pragma: no cover - numpy should be available with soundfile
@@ -16,6 +18,12 @@ except ImportError:  # pragma: no cover - numpy should be available with soundfi
 MICRO_FADE_SECONDS = 0.004
 # Window to look for a nearby zero-crossing when starting playback
 ZERO_CROSS_WINDOW_SECONDS = 0.005
+# Push: the mixer thread writes blocks to the stream; pull: the device callback requests them
+OUTPUT_MODE_PUSH = "push"
+OUTPUT_MODE_PULL = "pull"
+OUTPUT_MODES = (OUTPUT_MODE_PUSH, OUTPUT_MODE_PULL)
+# Mix triggers fire this early so the next track can be scheduled at the exact mix frame
+MIX_TRIGGER_LEAD_SECONDS = 0.3
 
 
 class NullOutputStream:
@@ -45,12 +53,17 @@ class MixerSource:
     samplerate: int
     channels: int
     resample_ratio: float
-    buffer: object
+    decoder: object = None
     gain: float = 1.0
     loop_range: Optional[tuple[int, int]] = None
+    # fade = (pozostałe ramki, długość całego fade'u) - rampa ciągła między blokami
     fade_in_remaining: int = 0
+    fade_in_length: int = 0
     fade_out_remaining: int = 0
+    fade_out_length: int = 0
+    fade_out_curve: str = FADE_LINEAR
     pending_fade_in: int = 0
+    pending_fade_length: int = 0
     paused: bool = False
     stop_requested: bool = False
     position_frames: int = 0
@@ -58,3 +71,15 @@ class MixerSource:
     on_progress: Optional[Callable[[str, float], None]] = None
     on_finished: Optional[Callable[[str], None]] = None
     transcoded_path: Path | None = None
+    # bufor odczytu dekodera (alokowany raz, używany przy każdym odczycie)
+    read_scratch: object = None
+    read_into_supported: bool = True
+    # bufory rampy wątku miksera (wzmocnienia i indeksy tablicy krzywej)
+    fade_scratch: object = None
+    fade_index_scratch: object = None
+    # start czeka, aż źródło kotwicy dojdzie do ramki pliku: (source_id, ramka)
+    start_anchor: Optional[tuple[str, int]] = None
+    # wyzwalacz miksu: (ramka miksu, ramka wywołania, callback(source_id, sekundy))
+    mix_trigger: Optional[tuple[int, int, Callable[[str, float], None]]] = None
+    # fade-out zaplanowany na ramkę pliku: (ramka, długość fade'u w ramkach wyjścia, krzywa)
+    scheduled_fade: Optional[tuple[int, int, str]] = None
@@ -11,7 +11,7 @@ from pathlib import Path
 from threading import Event, Thread
 from typing import TYPE_CHECKING, Callable, Dict, Optional
 
-from sara.audio.resampling import _resample_to_length
+from sara.audio.resampling import StreamingResampler
 
 if TYPE_CHECKING:
     from .player_base import SoundDevicePlayer
@@ -50,7 +50,6 @@ def play_impl(  # noqa: PLR0915
         stream_kwargs = dict(player._stream_kwargs)
         output_samplerate = float(samplerate)
         resample_ratio = 1.0
-        resample_state = {"src_pos": 0.0, "dst_pos": 0.0}
         device_info: Dict[str, object] = {}
         if sd is not None and player.device.raw_index is not None:
             try:
@@ -100,6 +99,9 @@ def play_impl(  # noqa: PLR0915
                         ) from exc
                 else:
                     raise RuntimeError("Urządzenie PFL nie obsługuje częstotliwości próbkowania pliku")
+        resampler: StreamingResampler | None = None
+        if abs(resample_ratio - 1.0) > 1e-6:
+            resampler = StreamingResampler(samplerate, output_samplerate, channels)
         player._stop_event = Event()
         player._pause_event = Event()
         player._finished_event = Event()
@@ -151,6 +153,10 @@ def play_impl(  # noqa: PLR0915
                                         sound_file.seek(loop_start_frame)
                                         player._position = loop_start_frame
                                         continue
+                                    if resampler is not None:
+                                        tail = resampler.flush()
+                                        if len(tail):
+                                            stream.write(tail)
                                     break
                                 with player._lock:
                                     gain_factor = player._gain_factor
@@ -160,13 +166,8 @@ def play_impl(  # noqa: PLR0915
                                 output_block = data
                                 if gain_factor != 1.0:
                                     output_block = output_block * gain_factor
-                                if frames_read and abs(resample_ratio - 1.0) > 1e-6:
-                                    resample_state["src_pos"] += frames_read
-                                    expected_total = resample_state["src_pos"] * resample_ratio
-                                    target_frames = int(round(expected_total - resample_state["dst_pos"]))
-                                    target_frames = max(1, target_frames)
-                                    output_block = _resample_to_length(output_block, target_frames)
-                                    resample_state["dst_pos"] += len(output_block)
+                                if frames_read and resampler is not None:
+                                    output_block = resampler.process(output_block)
                                 if np is not None and player._pending_fade_in > 0 and len(output_block):
                                     frames = min(len(output_block), player._pending_fade_in)
                                     fade = np.linspace(0.0, 1.0, frames, endpoint=False, dtype=output_block.dtype)
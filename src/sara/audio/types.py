@@ -12,6 +12,12 @@ from threading import Event
 from typing import Callable, List, Optional, Protocol
 
 
+# krzywe wygaszania wspólne dla backendów (ustawienie playback.fade_curve)
+FADE_LINEAR = "linear"
+FADE_EQUAL_POWER = "equal_power"
+FADE_CURVES = (FADE_LINEAR, FADE_EQUAL_POWER)
+
+
 class BackendType(Enum):
     WASAPI = "wasapi"
     ASIO = "asio"
@@ -25,6 +25,7 @@ ANNOUNCEMENT_CATEGORIES: tuple[AnnouncementCategory, ...] = (
     AnnouncementCategory("clipboard", "Clipboard and move operations"),
     AnnouncementCategory("undo_redo", "Undo/redo notifications"),
     AnnouncementCategory("pfl", "PFL and preview warnings"),
+    AnnouncementCategory("mix_points", "Mix point detection"),
     AnnouncementCategory("device", "Device availability warnings"),
     AnnouncementCategory("intro_alert", "Intro alert notifications"),
     AnnouncementCategory("track_end_alert", "Track end alert notifications"),
@@ -58,14 +58,36 @@ DEFAULT_CONFIG: Dict[str, Any] = {
         "intro_alert_seconds": 5.0,
         "track_end_alert_seconds": 10.0,
         "swap_play_select": False,
+        "resampler_quality": "medium",
+        "fade_curve": "linear",
     },
     "startup": {
         "playlists": [],
     },
+    "metadata": {
+        "process_pool": False,
+        "process_workers": 0,
+        "lazy_import": True,
+    },
+    "loudness": {
+        "background_scan": True,
+        "write_tags": False,
+        "standard": "ebu",
+    },
+    "mix_detection": {
+        "write_tags": False,
+        "silence_threshold_db": -48.0,
+        "fade_drop_db": 8.0,
+    },
+    "folders": {
+        "watch": True,
+        "watch_poll_seconds": 5.0,
+    },
     "devices": {
         "playlists": {},
         "pfl": None,
         "jingles": None,
+        "output_modes": {},
     },
     "accessibility": {
         "announcements": {},
@@ -117,6 +117,30 @@ class SettingsManager:
         playback = self._data.setdefault("playback", {})
         playback["swap_play_select"] = bool(enabled)
 
+    def get_resampler_quality(self) -> str:
+        playback = self._data.get("playback", {})
+        value = str(playback.get("resampler_quality", DEFAULT_CONFIG["playback"]["resampler_quality"])).lower()
+        return value if value in ("low", "medium", "high") else DEFAULT_CONFIG["playback"]["resampler_quality"]
+
+    def set_resampler_quality(self, quality: str) -> None:
+        value = str(quality).lower()
+        if value not in ("low", "medium", "high"):
+            raise ValueError(f"Unknown resampler quality: {quality}")
+        playback = self._data.setdefault("playback", {})
+        playback["resampler_quality"] = value
+
+    def get_fade_curve(self) -> str:
+        playback = self._data.get("playback", {})
+        value = str(playback.get("fade_curve", DEFAULT_CONFIG["playback"]["fade_curve"])).lower()
+        return value if value in ("linear", "equal_power") else DEFAULT_CONFIG["playback"]["fade_curve"]
+
+    def set_fade_curve(self, curve: str) -> None:
+        value = str(curve).lower()
+        if value not in ("linear", "equal_power"):
+            raise ValueError(f"Unknown fade curve: {curve}")
+        playback = self._data.setdefault("playback", {})
+        playback["fade_curve"] = value
+
     def get_focus_playing_track(self) -> bool:
         accessibility_raw = self._user_config.get("accessibility", {}) if isinstance(self._user_config, dict) else {}
         if isinstance(accessibility_raw, dict) and "follow_playing_selection" in accessibility_raw:
@@ -143,6 +167,120 @@ class SettingsManager:
             if isinstance(playback_raw, dict):
                 playback_raw.pop("focus_playing_track", None)
 
+    # --- metadata extraction ---
+    def get_metadata_process_pool(self) -> bool:
+        metadata = self._data.get("metadata", {})
+        return bool(metadata.get("process_pool", DEFAULT_CONFIG["metadata"]["process_pool"]))
+
+    def set_metadata_process_pool(self, enabled: bool) -> None:
+        metadata = self._data.setdefault("metadata", {})
+        metadata["process_pool"] = bool(enabled)
+
+    def get_metadata_process_workers(self) -> int:
+        metadata = self._data.get("metadata", {})
+        value = metadata.get("process_workers", DEFAULT_CONFIG["metadata"]["process_workers"])
+        try:
+            return max(0, int(value))
+        except (TypeError, ValueError):
+            return DEFAULT_CONFIG["metadata"]["process_workers"]
+
+    def set_metadata_process_workers(self, workers: int) -> None:
+        metadata = self._data.setdefault("metadata", {})
+        metadata["process_workers"] = max(0, int(workers))
+
+    def get_metadata_lazy_import(self) -> bool:
+        metadata = self._data.get("metadata", {})
+        return bool(metadata.get("lazy_import", DEFAULT_CONFIG["metadata"]["lazy_import"]))
+
+    def set_metadata_lazy_import(self, enabled: bool) -> None:
+        metadata = self._data.setdefault("metadata", {})
+        metadata["lazy_import"] = bool(enabled)
+
+    # --- loudness scan ---
+    def get_loudness_background_scan(self) -> bool:
+        loudness = self._data.get("loudness", {})
+        return bool(loudness.get("background_scan", DEFAULT_CONFIG["loudness"]["background_scan"]))
+
+    def set_loudness_background_scan(self, enabled: bool) -> None:
+        loudness = self._data.setdefault("loudness", {})
+        loudness["background_scan"] = bool(enabled)
+
+    def get_loudness_write_tags(self) -> bool:
+        loudness = self._data.get("loudness", {})
+        return bool(loudness.get("write_tags", DEFAULT_CONFIG["loudness"]["write_tags"]))
+
+    def set_loudness_write_tags(self, enabled: bool) -> None:
+        loudness = self._data.setdefault("loudness", {})
+        loudness["write_tags"] = bool(enabled)
+
+    def get_loudness_standard(self) -> str:
+        loudness = self._data.get("loudness", {})
+        value = str(loudness.get("standard", DEFAULT_CONFIG["loudness"]["standard"])).lower()
+        return value if value in ("ebu", "atsc") else DEFAULT_CONFIG["loudness"]["standard"]
+
+    def set_loudness_standard(self, standard: str) -> None:
+        value = str(standard).lower()
+        if value not in ("ebu", "atsc"):
+            raise ValueError(f"Unknown loudness standard: {standard}")
+        loudness = self._data.setdefault("loudness", {})
+        loudness["standard"] = value
+
+    # --- mix point detection ---
+    def get_mix_detection_write_tags(self) -> bool:
+        detection = self._data.get("mix_detection", {})
+        return bool(detection.get("write_tags", DEFAULT_CONFIG["mix_detection"]["write_tags"]))
+
+    def set_mix_detection_write_tags(self, enabled: bool) -> None:
+        detection = self._data.setdefault("mix_detection", {})
+        detection["write_tags"] = bool(enabled)
+
+    def get_mix_detection_silence_threshold_db(self) -> float:
+        detection = self._data.get("mix_detection", {})
+        default = DEFAULT_CONFIG["mix_detection"]["silence_threshold_db"]
+        try:
+            value = float(detection.get("silence_threshold_db", default))
+        except (TypeError, ValueError):
+            return default
+        return min(-20.0, max(-90.0, value))
+
+    def set_mix_detection_silence_threshold_db(self, value: float) -> None:
+        detection = self._data.setdefault("mix_detection", {})
+        detection["silence_threshold_db"] = min(-20.0, max(-90.0, float(value)))
+
+    def get_mix_detection_fade_drop_db(self) -> float:
+        detection = self._data.get("mix_detection", {})
+        default = DEFAULT_CONFIG["mix_detection"]["fade_drop_db"]
+        try:
+            value = float(detection.get("fade_drop_db", default))
+        except (TypeError, ValueError):
+            return default
+        return min(30.0, max(1.0, value))
+
+    def set_mix_detection_fade_drop_db(self, value: float) -> None:
+        detection = self._data.setdefault("mix_detection", {})
+        detection["fade_drop_db"] = min(30.0, max(1.0, float(value)))
+
+    # --- folder playlists ---
+    def get_folder_watch_enabled(self) -> bool:
+        folders = self._data.get("folders", {})
+        return bool(folders.get("watch", DEFAULT_CONFIG["folders"]["watch"]))
+
+    def set_folder_watch_enabled(self, enabled: bool) -> None:
+        folders = self._data.setdefault("folders", {})
+        folders["watch"] = bool(enabled)
+
+    def get_folder_watch_poll_seconds(self) -> float:
+        folders = self._data.get("folders", {})
+        value = folders.get("watch_poll_seconds", DEFAULT_CONFIG["folders"]["watch_poll_seconds"])
+        try:
+            return max(0.5, float(value))
+        except (TypeError, ValueError):
+            return DEFAULT_CONFIG["folders"]["watch_poll_seconds"]
+
+    def set_folder_watch_poll_seconds(self, seconds: float) -> None:
+        folders = self._data.setdefault("folders", {})
+        folders["watch_poll_seconds"] = max(0.5, float(seconds))
+
     # --- diagnostics ---
     def get_diagnostics_faulthandler(self) -> bool:
         diagnostics = self._data.get("diagnostics", {})
@@ -473,3 +611,21 @@ class SettingsManager:
     def set_pfl_device(self, device_id: Optional[str]) -> None:
         devices = self._data.setdefault("devices", {})
         devices["pfl"] = str(device_id) if device_id else None
+
+    def get_device_output_mode(self, device_id: str) -> str:
+        """Mixer output mode of a device: push (the mixer thread writes) or pull (the device callback requests)."""
+
+        devices = self._data.get("devices", {})
+        modes = devices.get("output_modes") if isinstance(devices, dict) else None
+        value = str((modes or {}).get(str(device_id), "push")).lower()
+        return value if value in ("push", "pull") else "push"
+
+    def set_device_output_mode(self, device_id: str, mode: str) -> None:
+        value = str(mode).lower()
+        if value not in ("push", "pull"):
+            raise ValueError(f"Unknown output mode: {mode}")
+        modes = self._data.setdefault("devices", {}).setdefault("output_modes", {})
+        if value == "push":
+            modes.pop(str(device_id), None)
+        else:
+            modes[str(device_id)] = value
@@ -34,3 +34,26 @@ def resolve_output_dir(default_path: Path | None = None) -> Path:
     if default_path is not None:
         return default_path
     return Path.cwd() / "output"
+
+
+DEFAULT_PRELOAD_MAX_STREAMS = 6
+DEFAULT_PRELOAD_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_PRELOAD_MEMORY_MAX_BYTES = 64 * 1024 * 1024
+
+
+def preload_max_streams() -> int:
+    """Streams kept open ahead of playback (``SARA_PRELOAD_MAX_STREAMS``)."""
+
+    return max(0, int(os.environ.get("SARA_PRELOAD_MAX_STREAMS", str(DEFAULT_PRELOAD_MAX_STREAMS))))
+
+
+def preload_max_bytes() -> int:
+    """File bytes held by preloaded streams (``SARA_PRELOAD_MAX_BYTES``)."""
+
+    return max(0, int(os.environ.get("SARA_PRELOAD_MAX_BYTES", str(DEFAULT_PRELOAD_MAX_BYTES))))
+
+
+def preload_memory_max_bytes() -> int:
+    """Largest file a preload reads whole into memory (``SARA_PRELOAD_MEMORY_MAX_BYTES``, 0 disables)."""
+
+    return max(0, int(os.environ.get("SARA_PRELOAD_MEMORY_MAX_BYTES", str(DEFAULT_PRELOAD_MEMORY_MAX_BYTES))))
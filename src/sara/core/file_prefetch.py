@@ -1,8 +1,9 @@
 """Best-effort filesystem warm-up helpers.
 
 These helpers are used to reduce start latency when audio files live on slow
-storage (HDD/NAS/network). They do not decode audio; they just read file data
-so the OS can keep it in the page cache.
+storage (HDD/NAS/network). They do not decode audio: `warm_file` reads data
+so the OS can keep it in the page cache, `read_file` loads a whole file into
+memory for backends that can play from a buffer.
 """
 
 from __future__ import annotations
@@ -42,3 +43,34 @@ def warm_file(path: Path, *, max_bytes: int, chunk_bytes: int = 1024 * 1024) ->
         return 0
     return read_total
 
+
+def read_file(path: Path, *, max_bytes: int, chunk_bytes: int = 4 * 1024 * 1024) -> bytearray | None:
+    """Load the whole of `path` into memory.
+
+    Returns None when the file is larger than `max_bytes` or cannot be read.
+    """
+    max_bytes = int(max_bytes)
+    if max_bytes <= 0:
+        return None
+    chunk_bytes = max(1, int(chunk_bytes))
+    path = Path(path)
+    try:
+        size = path.stat().st_size
+        if size <= 0 or size > max_bytes:
+            return None
+        buffer = bytearray(size)
+        view = memoryview(buffer)
+        filled = 0
+        with path.open("rb") as handle:
+            while filled < size:
+                count = handle.readinto(view[filled : filled + chunk_bytes])
+                if not count:
+                    break
+                filled += count
+    except Exception as exc:  # pylint: disable=broad-except
+        logger.debug("File read failed for %s: %s", path, exc)
+        return None
+    if filled != size:
+        logger.debug("File read incomplete for %s: %s/%s bytes", path, filled, size)
+        return None
+    return buffer
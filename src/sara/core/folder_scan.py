@@ -0,0 +1,165 @@
+"""Directory snapshots and incremental diffs for folder playlists."""
+
+from __future__ import annotations
+
+import logging
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Mapping, Tuple
+
+from sara.core.media_metadata import is_supported_audio_file
+from sara.core.playlist import PlaylistItem, PlaylistModel
+
+
+logger = logging.getLogger(__name__)
+
+# Pola odświeżane przy zmianie pliku; id, status i pozycja odtwarzania zostają bez zmian.
+_METADATA_FIELDS = (
+    "title",
+    "artist",
+    "duration_seconds",
+    "replay_gain_db",
+    "cue_in_seconds",
+    "segue_seconds",
+    "segue_fade_seconds",
+    "overlap_seconds",
+    "intro_seconds",
+    "outro_seconds",
+    "loop_start_seconds",
+    "loop_end_seconds",
+    "loop_auto_enabled",
+    "loop_enabled",
+)
+
+
+@dataclass(frozen=True)
+class FolderSnapshot:
+    """Supported audio files under `root` with their `(size, mtime_ns)` signature."""
+
+    root: Path
+    entries: Dict[Path, Tuple[int, int]] = field(default_factory=dict)
+    skipped: int = 0
+    directories: FrozenSet[Path] = frozenset()
+
+    def sorted_paths(self) -> List[Path]:
+        return sorted(self.entries)
+
+
+@dataclass(frozen=True)
+class FolderDiff:
+    added: List[Path] = field(default_factory=list)
+    removed: List[Path] = field(default_factory=list)
+    changed: List[Path] = field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.added or self.removed or self.changed)
+
+    def paths_to_load(self) -> List[Path]:
+        return sorted([*self.added, *self.changed])
+
+
+def scan_directory(directory: Path) -> tuple[Dict[Path, Tuple[int, int]], List[Path], int]:
+    """Scan a single directory level: `(audio entries, subdirectories, skipped count)`."""
+
+    entries: Dict[Path, Tuple[int, int]] = {}
+    subdirectories: List[Path] = []
+    skipped = 0
+    try:
+        with os.scandir(directory) as iterator:
+            for entry in iterator:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirectories.append(Path(entry.path))
+                        continue
+                    if not entry.is_file():
+                        continue
+                    path = Path(entry.path)
+                    if not is_supported_audio_file(path):
+                        skipped += 1
+                        continue
+                    stat = entry.stat()
+                except OSError as exc:
+                    logger.debug("Skipping %s during folder scan: %s", entry.path, exc)
+                    continue
+                entries[path] = (int(stat.st_size), int(stat.st_mtime_ns))
+    except OSError as exc:
+        logger.warning("Failed to enumerate %s: %s", directory, exc)
+    return entries, subdirectories, skipped
+
+
+def scan_folder(root: Path) -> FolderSnapshot:
+    """Walk `root` recursively with `os.scandir` (one stat per entry, cached on Windows)."""
+
+    entries: Dict[Path, Tuple[int, int]] = {}
+    directories: List[Path] = []
+    skipped = 0
+    pending = [Path(root)]
+    while pending:
+        directory = pending.pop()
+        directories.append(directory)
+        found, subdirectories, skipped_here = scan_directory(directory)
+        entries.update(found)
+        pending.extend(subdirectories)
+        skipped += skipped_here
+    return FolderSnapshot(root=Path(root), entries=entries, skipped=skipped, directories=frozenset(directories))
+
+
+def diff_snapshots(previous: FolderSnapshot | None, current: FolderSnapshot) -> FolderDiff:
+    old_entries = previous.entries if previous is not None else {}
+    new_entries = current.entries
+    added = sorted(path for path in new_entries if path not in old_entries)
+    removed = sorted(path for path in old_entries if path not in new_entries)
+    changed = sorted(
+        path for path, signature in new_entries.items() if path in old_entries and old_entries[path] != signature
+    )
+    return FolderDiff(added=added, removed=removed, changed=changed)
+
+
+def refresh_item_metadata(target: PlaylistItem, source: PlaylistItem) -> None:
+    for name in _METADATA_FIELDS:
+        setattr(target, name, getattr(source, name))
+
+
+def apply_folder_diff(
+    playlist: PlaylistModel,
+    diff: FolderDiff,
+    fresh_items: Mapping[Path, PlaylistItem],
+) -> List[int]:
+    """Patch `playlist.items` in place and return indices of inserted items.
+
+    Existing items keep their ids and statuses; changed files only get their
+    metadata refreshed. New items are merged in path order.
+    """
+
+    removed = set(diff.removed)
+    kept: List[PlaylistItem] = []
+    known_paths: set[Path] = set()
+    for item in playlist.items:
+        if item.path in removed:
+            continue
+        fresh = fresh_items.get(item.path)
+        if fresh is not None:
+            refresh_item_metadata(item, fresh)
+        kept.append(item)
+        known_paths.add(item.path)
+
+    additions = sorted(
+        (fresh_items[path] for path in diff.added if path in fresh_items and path not in known_paths),
+        key=lambda item: item.path,
+    )
+    merged: List[PlaylistItem] = []
+    inserted: List[int] = []
+    cursor = 0
+    for item in kept:
+        while cursor < len(additions) and additions[cursor].path < item.path:
+            inserted.append(len(merged))
+            merged.append(additions[cursor])
+            cursor += 1
+        merged.append(item)
+    for addition in additions[cursor:]:
+        inserted.append(len(merged))
+        merged.append(addition)
+    playlist.items[:] = merged
+    return inserted
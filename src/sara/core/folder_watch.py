@@ -0,0 +1,308 @@
+"""Background watching of folder playlist directories.
+
+`FolderWatcher` batches filesystem changes under a folder and reports them as
+`FolderDiff` objects. On Linux it waits for inotify events and rescans only the
+directories that changed; elsewhere it falls back to periodic `os.scandir`
+polling. New or growing files are reported only once their size and mtime
+stop changing, so clips still being copied are not imported half-written.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Set, Tuple
+
+from sara.core.folder_scan import FolderDiff, FolderSnapshot, diff_snapshots, scan_directory, scan_folder
+
+
+logger = logging.getLogger(__name__)
+
+FolderChangeCallback = Callable[[FolderDiff, FolderSnapshot], None]
+
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_WATCH_MASK = (
+    _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+    | _IN_MOVE_SELF
+    | _IN_ONLYDIR
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class _Inotify:
+    """Minimal ctypes binding for Linux inotify directory watches."""
+
+    def __init__(self) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._add_watch.restype = ctypes.c_int
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self.fd = fd
+        self._dirs_by_wd: Dict[int, Path] = {}
+        self._watched: Set[Path] = set()
+
+    def watch(self, directories: Iterable[Path]) -> None:
+        for directory in directories:
+            if directory in self._watched:
+                continue
+            wd = self._add_watch(self.fd, os.fsencode(directory), _WATCH_MASK)
+            if wd < 0:
+                logger.debug("inotify_add_watch failed for %s: %s", directory, os.strerror(ctypes.get_errno()))
+                continue
+            self._dirs_by_wd[wd] = directory
+            self._watched.add(directory)
+
+    def read(self, timeout: float) -> Optional[Set[Path]]:
+        """Return directories with pending events; ``None`` means the queue overflowed."""
+
+        ready, _write, _error = select.select([self.fd], [], [], max(0.0, timeout))
+        if not ready:
+            return set()
+        dirty: Set[Path] = set()
+        while True:
+            try:
+                buffer = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            if not buffer:
+                break
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(buffer):
+                wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(buffer, offset)
+                offset += _EVENT_HEADER.size + length
+                if mask & _IN_Q_OVERFLOW:
+                    return None
+                directory = self._dirs_by_wd.get(wd)
+                if directory is None:
+                    continue
+                if mask & _IN_IGNORED:
+                    self._dirs_by_wd.pop(wd, None)
+                    self._watched.discard(directory)
+                    dirty.add(directory.parent)
+                    continue
+                if mask & (_IN_DELETE_SELF | _IN_MOVE_SELF):
+                    dirty.add(directory.parent)
+                dirty.add(directory)
+        return dirty
+
+    def close(self) -> None:
+        try:
+            os.close(self.fd)
+        except OSError:
+            pass
+
+
+def _within(path: Path, directory: Path) -> bool:
+    return path == directory or directory in path.parents
+
+
+def rescan_directories(snapshot: FolderSnapshot, dirty: Iterable[Path]) -> FolderSnapshot:
+    """Return `snapshot` updated by re-listing only the `dirty` directories."""
+
+    entries = dict(snapshot.entries)
+    directories = set(snapshot.directories)
+    root = snapshot.root
+
+    def _drop_subtree(directory: Path) -> None:
+        for path in [path for path in entries if directory in path.parents]:
+            del entries[path]
+        for known in [known for known in directories if _within(known, directory)]:
+            directories.discard(known)
+
+    for directory in sorted(set(dirty)):
+        if not _within(directory, root):
+            continue
+        for path in [path for path in entries if path.parent == directory]:
+            del entries[path]
+        if not directory.is_dir():
+            _drop_subtree(directory)
+            continue
+        found, subdirectories, _skipped = scan_directory(directory)
+        entries.update(found)
+        directories.add(directory)
+        current = set(subdirectories)
+        for known in [known for known in directories if known.parent == directory and known not in current]:
+            _drop_subtree(known)
+        for subdirectory in subdirectories:
+            if subdirectory in directories:
+                continue
+            nested = scan_folder(subdirectory)
+            entries.update(nested.entries)
+            directories.update(nested.directories)
+    return FolderSnapshot(
+        root=root,
+        entries=entries,
+        skipped=snapshot.skipped,
+        directories=frozenset(directories),
+    )
+
+
+class FolderWatcher:
+    """Report settled changes under a folder to `on_change` from a background thread."""
+
+    def __init__(
+        self,
+        snapshot: FolderSnapshot,
+        on_change: FolderChangeCallback,
+        *,
+        poll_interval: float = 5.0,
+        settle_seconds: float = 1.0,
+        use_native: bool = True,
+    ) -> None:
+        self.root = snapshot.root
+        self._snapshot = snapshot
+        self._on_change = on_change
+        self._poll_interval = max(0.1, float(poll_interval))
+        self._settle_seconds = max(0.05, float(settle_seconds))
+        self._use_native = use_native
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._unsettled: Dict[Path, Tuple[int, int]] = {}
+        self.mode = "stopped"
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        inotify: _Inotify | None = None
+        if self._use_native and sys.platform.startswith("linux"):
+            try:
+                inotify = _Inotify()
+                inotify.watch(self._snapshot.directories or (self.root,))
+            except (OSError, AttributeError) as exc:
+                logger.debug("inotify unavailable, falling back to polling: %s", exc)
+                inotify = None
+        self.mode = "inotify" if inotify is not None else "polling"
+        target = self._run_inotify if inotify is not None else self._run_polling
+        args = (inotify,) if inotify is not None else ()
+        self._thread = threading.Thread(target=target, args=args, name="sara-folder-watch", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = 1.0) -> None:
+        self._stop_event.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        self._thread = None
+        self.mode = "stopped"
+
+    def update_snapshot(self, snapshot: FolderSnapshot) -> None:
+        """Reset the baseline after the playlist was reloaded by other means."""
+
+        with self._lock:
+            self._snapshot = snapshot
+            self._unsettled.clear()
+
+    def check_now(self) -> None:
+        """Run one full polling pass synchronously (used by tests and manual triggers)."""
+
+        self._process(scan_folder(self.root))
+
+    def _run_polling(self) -> None:
+        while not self._stop_event.wait(self._poll_interval):
+            self._safe_process(lambda: scan_folder(self.root))
+
+    def _run_inotify(self, inotify: _Inotify) -> None:
+        try:
+            batch: Set[Path] = set()
+            overflow = False
+            batch_started = 0.0
+            while not self._stop_event.is_set():
+                waiting = bool(batch or overflow or self._unsettled)
+                dirty = inotify.read(self._settle_seconds if waiting else 0.5)
+                now = time.monotonic()
+                if dirty is None:
+                    overflow = True
+                elif dirty:
+                    if not batch:
+                        batch_started = now
+                    batch |= dirty
+                    # Czekamy na chwilę ciszy, ale nie dłużej niż kilka okresów ustalania.
+                    if now - batch_started < self._settle_seconds * 5:
+                        continue
+                if not (batch or overflow or self._unsettled):
+                    continue
+                dirty_dirs = None if overflow else batch | {path.parent for path in self._unsettled}
+                batch = set()
+                overflow = False
+                snapshot = self._safe_process(lambda dirs=dirty_dirs: self._collect(dirs))
+                if snapshot is not None:
+                    inotify.watch(snapshot.directories)
+        finally:
+            inotify.close()
+
+    def _collect(self, dirty: Set[Path] | None) -> FolderSnapshot:
+        if dirty is None:
+            return scan_folder(self.root)
+        with self._lock:
+            baseline = self._snapshot
+        return rescan_directories(baseline, dirty)
+
+    def _safe_process(self, collect: Callable[[], FolderSnapshot]) -> FolderSnapshot | None:
+        try:
+            observed = collect()
+            self._process(observed)
+            return observed
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.warning("Folder watch update failed for %s: %s", self.root, exc)
+            return None
+
+    def _process(self, observed: FolderSnapshot) -> None:
+        with self._lock:
+            previous = self._snapshot
+            raw = diff_snapshots(previous, observed)
+            accepted = dict(observed.entries)
+            for path in [*raw.added, *raw.changed]:
+                signature = observed.entries[path]
+                if self._unsettled.get(path) == signature:
+                    self._unsettled.pop(path, None)
+                    continue
+                self._unsettled[path] = signature
+                if path in previous.entries:
+                    accepted[path] = previous.entries[path]
+                else:
+                    accepted.pop(path, None)
+            for path in raw.removed:
+                self._unsettled.pop(path, None)
+            settled = FolderSnapshot(
+                root=observed.root,
+                entries=accepted,
+                skipped=observed.skipped,
+                directories=observed.directories,
+            )
+            diff = diff_snapshots(previous, settled)
+            self._snapshot = settled
+        if diff.is_empty or self._stop_event.is_set():
+            return
+        try:
+            self._on_change(diff, settled)
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.warning("Folder watch callback failed for %s: %s", self.root, exc)
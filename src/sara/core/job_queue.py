@@ -0,0 +1,102 @@
+"""Keyed priority queue shared by the background metadata services."""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import threading
+import time
+from typing import Callable, Dict, Generic, Hashable, List, Optional, Sequence, Tuple, TypeVar
+
+
+K = TypeVar("K", bound=Hashable)
+J = TypeVar("J")
+
+PRIORITY_URGENT = 0
+PRIORITY_NORMAL = 1
+
+
+class PriorityJobQueue(Generic[K, J]):
+    """Thread-safe queue of jobs keyed by identity.
+
+    Normal jobs run in submission order. `prioritise` moves queued keys to the
+    front; the most recent call wins over earlier urgent requests. Superseded
+    heap entries are skipped lazily.
+    """
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._heap: List[Tuple[int, Tuple[int, int], K]] = []
+        self._queued: Dict[K, Tuple[int, Tuple[int, int]]] = {}
+        self._jobs: Dict[K, J] = {}
+        self._counter = itertools.count()
+        self._urgent_batches = itertools.count(1)
+        self._closed = False
+
+    def push(self, key: K, job: J) -> bool:
+        with self._condition:
+            if self._closed or key in self._queued:
+                return False
+            self._jobs[key] = job
+            self._push(key, PRIORITY_NORMAL, (0, next(self._counter)))
+            self._condition.notify()
+            return True
+
+    def prioritise(self, keys: Sequence[K]) -> None:
+        with self._condition:
+            batch = -next(self._urgent_batches)
+            for offset, key in enumerate(keys):
+                if key in self._queued:
+                    self._push(key, PRIORITY_URGENT, (batch, offset))
+            self._condition.notify()
+
+    def discard(self, predicate: Callable[[K], bool]) -> None:
+        with self._condition:
+            for key in [key for key in self._queued if predicate(key)]:
+                self._queued.pop(key, None)
+                self._jobs.pop(key, None)
+
+    def __contains__(self, key: object) -> bool:
+        with self._condition:
+            return key in self._queued
+
+    def __len__(self) -> int:
+        with self._condition:
+            return len(self._queued)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._heap.clear()
+            self._queued.clear()
+            self._jobs.clear()
+            self._condition.notify_all()
+
+    def pop(self, timeout: float | None = None) -> Tuple[Optional[J], int]:
+        """Return ``(job, priority)``; ``job`` is ``None`` on timeout or once closed."""
+
+        with self._condition:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while not self._closed:
+                while self._heap:
+                    priority, rank, key = heapq.heappop(self._heap)
+                    if self._queued.get(key) != (priority, rank):
+                        continue
+                    del self._queued[key]
+                    return self._jobs.pop(key), priority
+                if deadline is None:
+                    self._condition.wait()
+                    continue
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+            return None, PRIORITY_NORMAL
+
+    def _push(self, key: K, priority: int, rank: Tuple[int, int]) -> None:
+        self._queued[key] = (priority, rank)
+        heapq.heappush(self._heap, (priority, rank, key))
@@ -1,4 +1,4 @@
-"""Helpers for invoking bs1770gain loudness analyzer."""
+"""Loudness analysis: in-process BS.1770 meter with bs1770gain as a fallback."""
 
 from __future__ import annotations
 
@@ -8,10 +8,15 @@ import shutil
 import subprocess
 import sys
 import tempfile
+import threading
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
+from typing import Iterator, Optional, Sequence
+
+from sara.core import r128
+from sara.core.process_pool import iter_process_batch
 
 logger = logging.getLogger(__name__)
 
@@ -29,9 +34,16 @@ class LoudnessStandard(Enum):
     ATSC = "atsc"  # -24 LUFS
 
 
+TARGET_LUFS = {
+    LoudnessStandard.EBU: -23.0,
+    LoudnessStandard.ATSC: -24.0,
+}
+
+
 @dataclass
 class LoudnessMeasurement:
     integrated_lufs: float
+    true_peak_dbtp: float | None = None
 
 
 def _candidate_paths() -> list[Path]:
@@ -61,11 +73,38 @@ def find_bs1770gain() -> Path | None:
     return None
 
 
-def analyze_loudness(path: Path, *, standard: LoudnessStandard) -> LoudnessMeasurement:
+def loudness_analyzer_available() -> bool:
+    return r128.is_available() or find_bs1770gain() is not None
+
+
+def analyze_loudness(path: Path, *, standard: LoudnessStandard, use_native: bool = True) -> LoudnessMeasurement:
+    """Measure integrated loudness of `path`.
+
+    Both standards share the BS.1770 measurement; they differ only in target
+    level. Files soundfile cannot decode (or silent ones) go to bs1770gain.
+    """
+
+    native_error: Exception | None = None
+    if use_native and r128.is_available():
+        try:
+            result = r128.measure_file(path)
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.debug("Native loudness analysis failed for %s: %s", path, exc)
+            native_error = exc
+        else:
+            return LoudnessMeasurement(
+                integrated_lufs=result.integrated_lufs,
+                true_peak_dbtp=result.true_peak_dbtp,
+            )
     executable = find_bs1770gain()
     if executable is None:
+        if native_error is not None:
+            raise RuntimeError(f"Loudness analysis failed: {native_error}") from native_error
         raise FileNotFoundError("bs1770gain was not found on PATH or bundled resources")
+    return _analyze_with_bs1770gain(executable, path, standard)
+
 
+def _analyze_with_bs1770gain(executable: Path, path: Path, standard: LoudnessStandard) -> LoudnessMeasurement:
     def _run_for(target: Path) -> LoudnessMeasurement:
         completed = _run_bs1770gain(executable, target, standard)
         used_temp_copy = False
@@ -125,6 +164,65 @@ def analyze_loudness(path: Path, *, standard: LoudnessStandard) -> LoudnessMeasu
                 pass
 
 
+def _analyze_for_batch(raw_path: str, standard_value: str) -> tuple[float | None, float | None, str | None]:
+    try:
+        measurement = analyze_loudness(Path(raw_path), standard=LoudnessStandard(standard_value))
+    except Exception as exc:  # pylint: disable=broad-except
+        return None, None, str(exc) or exc.__class__.__name__
+    return measurement.integrated_lufs, measurement.true_peak_dbtp, None
+
+
+def iter_analyze_loudness_batch(
+    paths: Sequence[Path],
+    *,
+    standard: LoudnessStandard,
+    workers: int = 0,
+    cancel_event: threading.Event | None = None,
+) -> Iterator[tuple[int, Optional[LoudnessMeasurement], Optional[str]]]:
+    """Analyze `paths` across a process pool, yielding ``(index, measurement, error)``.
+
+    Results arrive in completion order; `index` refers to `paths`. Pending
+    files are dropped once `cancel_event` is set.
+    """
+
+    for index, result, error in iter_process_batch(
+        _analyze_for_batch,
+        [(str(path), standard.value) for path in paths],
+        workers=workers,
+        cancel_event=cancel_event,
+    ):
+        lufs, peak, error = result if result is not None else (None, None, error)
+        yield index, _batch_measurement(lufs, peak), error
+
+
+def analyze_loudness_batch(
+    paths: Sequence[Path],
+    *,
+    standard: LoudnessStandard,
+    workers: int = 0,
+    cancel_event: threading.Event | None = None,
+) -> list[Optional[LoudnessMeasurement]]:
+    """Analyze a whole playlist in worker processes; failed entries are ``None``."""
+
+    results: list[Optional[LoudnessMeasurement]] = [None] * len(paths)
+    for index, measurement, error in iter_analyze_loudness_batch(
+        paths,
+        standard=standard,
+        workers=workers,
+        cancel_event=cancel_event,
+    ):
+        if error:
+            logger.warning("Loudness analysis failed for %s: %s", paths[index], error)
+        results[index] = measurement
+    return results
+
+
+def _batch_measurement(lufs: float | None, peak: float | None) -> LoudnessMeasurement | None:
+    if lufs is None:
+        return None
+    return LoudnessMeasurement(integrated_lufs=lufs, true_peak_dbtp=peak)
+
+
 def _extract_xml(output: str | None, stderr: str | None = None) -> str:
     output_text = output or ""
     stderr_text = stderr or ""
@@ -0,0 +1,186 @@
+"""Low-priority background loudness analysis for playlist items.
+
+`LoudnessScanner` measures items that have no ReplayGain yet, one file at a
+time on a single thread. Queued items can jump ahead when they are close to
+the play cursor. The scanner stays out of the way of playback: it idles for a
+multiple of the time each analysis took, and `hold()` pauses it entirely,
+e.g. while a track is starting and its file is being opened and buffered.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Callable, Iterable, Optional, Sequence, Tuple
+
+from sara.core.job_queue import PriorityJobQueue
+from sara.core.loudness import TARGET_LUFS, LoudnessMeasurement, LoudnessStandard, analyze_loudness
+from sara.core.media_metadata import TagWriter, save_replay_gain_metadata
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_IDLE_FACTOR = 1.0
+MIN_IDLE_SECONDS = 0.2
+
+
+@dataclass(frozen=True)
+class LoudnessScanJob:
+    playlist_id: str
+    item_id: str
+    path: Path
+
+
+@dataclass(frozen=True)
+class LoudnessScanResult:
+    job: LoudnessScanJob
+    gain_db: Optional[float]
+    measurement: Optional[LoudnessMeasurement] = None
+    error: Optional[str] = None
+    tags_written: bool = False
+
+
+ScanCallback = Callable[[LoudnessScanResult], None]
+
+
+class LoudnessScanner:
+    """Measure queued items in the background and report ReplayGain results.
+
+    `on_result` runs on the scanner thread. When `write_tags` is set, the gain
+    is also stored in the file's APE tags, synchronously before the result is
+    reported, or through `tag_writer` when given. In that case the result is
+    reported from the tag writer's thread once the write has finished, so
+    `tags_written` is always the real outcome.
+    """
+
+    def __init__(
+        self,
+        on_result: ScanCallback,
+        *,
+        standard: LoudnessStandard = LoudnessStandard.EBU,
+        write_tags: bool = False,
+        idle_factor: float = DEFAULT_IDLE_FACTOR,
+        analyze: Callable[[Path, LoudnessStandard], LoudnessMeasurement] | None = None,
+        tag_writer: TagWriter | None = None,
+    ) -> None:
+        self._on_result = on_result
+        self.standard = standard
+        self.write_tags = write_tags
+        self._tag_writer = tag_writer
+        self._idle_factor = max(0.0, float(idle_factor))
+        self._analyze = analyze or (lambda path, standard: analyze_loudness(path, standard=standard))
+        self._queue: PriorityJobQueue[Tuple[str, str], LoudnessScanJob] = PriorityJobQueue()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._hold_until = 0.0
+        # ścieżki już zmierzone w tej sesji: kopie tego samego pliku nie są analizowane ponownie
+        self._measured: dict[Path, Optional[float]] = {}
+        self._thread: threading.Thread | None = None
+
+    def submit(self, jobs: Iterable[LoudnessScanJob]) -> int:
+        """Queue items for analysis; returns how many were newly queued."""
+
+        added = 0
+        for job in jobs:
+            if self._queue.push((job.playlist_id, job.item_id), job):
+                added += 1
+        if added:
+            self._ensure_thread()
+        return added
+
+    def prioritise(self, playlist_id: str, item_ids: Sequence[str]) -> None:
+        self._queue.prioritise([(playlist_id, item_id) for item_id in item_ids])
+
+    def is_queued(self, playlist_id: str, item_id: str) -> bool:
+        return (playlist_id, item_id) in self._queue
+
+    def measured_gain(self, path: Path) -> tuple[bool, Optional[float]]:
+        """Return ``(known, gain_db)`` for a path analyzed earlier in this session."""
+
+        with self._lock:
+            if path in self._measured:
+                return True, self._measured[path]
+        return False, None
+
+    def discard_playlist(self, playlist_id: str) -> None:
+        self._queue.discard(lambda key: key[0] == playlist_id)
+
+    def pending_count(self) -> int:
+        return len(self._queue)
+
+    def hold(self, seconds: float) -> None:
+        """Pause analysis for at least `seconds` (extends an active hold)."""
+
+        with self._lock:
+            self._hold_until = max(self._hold_until, time.monotonic() + max(0.0, seconds))
+
+    def stop(self, timeout: float | None = 1.0) -> None:
+        self._queue.close()
+        self._wake.set()
+        with self._lock:
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def _ensure_thread(self) -> None:
+        with self._lock:
+            if self._queue.closed or (self._thread is not None and self._thread.is_alive()):
+                return
+            self._thread = threading.Thread(target=self._run, name="sara-loudness-scan", daemon=True)
+            self._thread.start()
+
+    def _wait_for_hold(self) -> None:
+        while not self._queue.closed:
+            with self._lock:
+                remaining = self._hold_until - time.monotonic()
+            if remaining <= 0:
+                return
+            self._wake.wait(remaining)
+
+    def _measure(self, job: LoudnessScanJob) -> LoudnessScanResult:
+        known, gain = self.measured_gain(job.path)
+        if known:
+            return LoudnessScanResult(job=job, gain_db=gain)
+        try:
+            measurement = self._analyze(job.path, self.standard)
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.debug("Background loudness analysis failed for %s: %s", job.path, exc)
+            with self._lock:
+                self._measured[job.path] = None
+            return LoudnessScanResult(job=job, gain_db=None, error=str(exc) or exc.__class__.__name__)
+        gain = TARGET_LUFS[self.standard] - measurement.integrated_lufs
+        with self._lock:
+            self._measured[job.path] = gain
+        tags_written = False
+        if self.write_tags and self._tag_writer is None:
+            tags_written = save_replay_gain_metadata(job.path, gain)
+        return LoudnessScanResult(job=job, gain_db=gain, measurement=measurement, tags_written=tags_written)
+
+    def _report(self, result: LoudnessScanResult) -> None:
+        try:
+            self._on_result(result)
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.warning("Loudness scan callback failed for %s: %s", result.job.path, exc)
+
+    def _run(self) -> None:
+        while not self._queue.closed:
+            self._wait_for_hold()
+            job, _priority = self._queue.pop()
+            if job is None:
+                return
+            started = time.monotonic()
+            result = self._measure(job)
+            elapsed = time.monotonic() - started
+            if result.measurement is not None and self.write_tags and self._tag_writer is not None:
+                self._tag_writer.submit_replay_gain(
+                    job.path,
+                    result.gain_db,
+                    on_done=lambda written, result=result: self._report(replace(result, tags_written=written)),
+                )
+            else:
+                self._report(result)
+            if result.measurement is not None:
+                self.hold(max(MIN_IDLE_SECONDS, elapsed * self._idle_factor))
@@ -6,6 +6,13 @@ splitting implementation across focused modules.
 
 from __future__ import annotations
 
+from sara.core.media_metadata.batch import extract_metadata_batch
+from sara.core.media_metadata.cache import (
+    MetadataCache,
+    configure_metadata_cache,
+    get_metadata_cache,
+    invalidate_cached_metadata,
+)
 from sara.core.media_metadata.constants import (
     CUE_IN_TAG,
     INTRO_TAG,
@@ -24,6 +31,7 @@ from sara.core.media_metadata.extract import extract_metadata
 from sara.core.media_metadata.models import AudioMetadata
 from sara.core.media_metadata.save import save_loop_metadata, save_mix_metadata, save_replay_gain_metadata
 from sara.core.media_metadata.support import is_supported_audio_file
+from sara.core.media_metadata.tag_writer import TagWriteFailure, TagWriter
 
 __all__ = [
     "AudioMetadata",
@@ -33,13 +41,20 @@ __all__ = [
     "LOOP_ENABLED_TAG",
     "LOOP_END_TAG",
     "LOOP_START_TAG",
+    "MetadataCache",
     "OUTRO_TAG",
     "OVERLAP_TAG",
     "REPLAYGAIN_TRACK_GAIN_TAG",
     "SEGUE_FADE_TAG",
     "SEGUE_TAG",
     "SUPPORTED_AUDIO_EXTENSIONS",
+    "TagWriteFailure",
+    "TagWriter",
+    "configure_metadata_cache",
     "extract_metadata",
+    "extract_metadata_batch",
+    "get_metadata_cache",
+    "invalidate_cached_metadata",
     "is_supported_audio_file",
     "save_loop_metadata",
     "save_mix_metadata",
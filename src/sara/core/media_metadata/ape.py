@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import os
 import struct
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Mapping, Optional
 
 from sara.core.media_metadata.constants import (
     LOOP_AUTO_ENABLED_TAG,
@@ -14,22 +15,54 @@ from sara.core.media_metadata.constants import (
 )
 
 
-def _read_ape_tags(path: Path) -> dict[str, str]:
-    try:
-        data = path.read_bytes()
-    except OSError:
-        return {}
-    marker = b"APETAGEX"
-    idx = data.rfind(marker)
-    if idx == -1 or idx + 32 > len(data):
-        return {}
-    magic, version, size, count, flags, reserved = struct.unpack("<8sIIIIQ", data[idx : idx + 32])
-    if size <= 32 or count <= 0:
-        return {}
-    start = idx - (size - 32)
-    if start < 0 or start >= len(data):
-        return {}
-    items = data[start:idx]
+_APE_MARKER = b"APETAGEX"
+_APE_FOOTER_SIZE = 32
+_ID3V1_SIZE = 128
+_LYRICS3V2_FOOTER_SIZE = 15
+# Ostatnia deska ratunku: stopka APE przesunięta przez nietypowe dane na końcu pliku.
+_TAIL_SCAN_BYTES = 64 * 1024
+
+
+def _footer_at(handle: BinaryIO, offset: int) -> Optional[bytes]:
+    if offset < 0:
+        return None
+    handle.seek(offset)
+    footer = handle.read(_APE_FOOTER_SIZE)
+    if len(footer) == _APE_FOOTER_SIZE and footer.startswith(_APE_MARKER):
+        return footer
+    return None
+
+
+def _locate_ape_footer(handle: BinaryIO, file_size: int) -> tuple[int, bytes] | None:
+    """Return ``(offset, footer)`` of the trailing APE footer without reading the whole file."""
+
+    candidates = [file_size - _APE_FOOTER_SIZE]
+    if file_size >= _ID3V1_SIZE:
+        handle.seek(file_size - _ID3V1_SIZE)
+        if handle.read(3) == b"TAG":
+            id3_start = file_size - _ID3V1_SIZE
+            candidates.append(id3_start - _APE_FOOTER_SIZE)
+            if id3_start >= _LYRICS3V2_FOOTER_SIZE:
+                handle.seek(id3_start - _LYRICS3V2_FOOTER_SIZE)
+                lyrics_footer = handle.read(_LYRICS3V2_FOOTER_SIZE)
+                if lyrics_footer.endswith(b"LYRICS200") and lyrics_footer[:6].isdigit():
+                    lyrics_size = int(lyrics_footer[:6]) + _LYRICS3V2_FOOTER_SIZE
+                    candidates.append(id3_start - lyrics_size - _APE_FOOTER_SIZE)
+    for offset in candidates:
+        footer = _footer_at(handle, offset)
+        if footer is not None:
+            return offset, footer
+
+    window = min(file_size, _TAIL_SCAN_BYTES)
+    handle.seek(file_size - window)
+    tail = handle.read(window)
+    idx = tail.rfind(_APE_MARKER)
+    if idx == -1 or idx + _APE_FOOTER_SIZE > len(tail):
+        return None
+    return file_size - window + idx, tail[idx : idx + _APE_FOOTER_SIZE]
+
+
+def _parse_ape_items(items: bytes, count: int) -> dict[str, str]:
     pos = 0
     tags: dict[str, str] = {}
     for _ in range(count):
@@ -49,8 +82,32 @@ def _read_ape_tags(path: Path) -> dict[str, str]:
     return tags
 
 
-def _scan_ape_value(path: Path, key: str) -> Optional[str]:
-    tags = _read_ape_tags(path)
+def _read_ape_tags(path: Path) -> dict[str, str]:
+    """Read APEv2 items by seeking to the footer; only the tag region is loaded."""
+
+    try:
+        with open(path, "rb") as handle:
+            file_size = os.fstat(handle.fileno()).st_size
+            if file_size < _APE_FOOTER_SIZE:
+                return {}
+            located = _locate_ape_footer(handle, file_size)
+            if located is None:
+                return {}
+            idx, footer = located
+            magic, version, size, count, flags, reserved = struct.unpack("<8sIIIIQ", footer)
+            if size <= _APE_FOOTER_SIZE or count <= 0:
+                return {}
+            start = idx - (size - _APE_FOOTER_SIZE)
+            if start < 0 or start >= file_size:
+                return {}
+            handle.seek(start)
+            items = handle.read(idx - start)
+    except OSError:
+        return {}
+    return _parse_ape_items(items, count)
+
+
+def _lookup_ape_value(tags: Mapping[str, str], key: str) -> Optional[str]:
     if not tags:
         return None
     for lookup in (key, key.upper(), key.lower()):
@@ -60,9 +117,17 @@ def _scan_ape_value(path: Path, key: str) -> Optional[str]:
     return None
 
 
-def _scan_ape_replay_gain(path: Path) -> Optional[float]:
+def _scan_ape_value(path: Path, key: str, tags: Mapping[str, str] | None = None) -> Optional[str]:
+    if tags is None:
+        tags = _read_ape_tags(path)
+    return _lookup_ape_value(tags, key)
+
+
+def _scan_ape_replay_gain(path: Path, tags: Mapping[str, str] | None = None) -> Optional[float]:
+    if tags is None:
+        tags = _read_ape_tags(path)
     for key in ("REPLAYGAIN_TRACK_GAIN", "replaygain_track_gain"):
-        text = _scan_ape_value(path, key)
+        text = _lookup_ape_value(tags, key)
         if not text:
             continue
         text = text.replace(",", ".")
@@ -76,18 +141,15 @@ def _scan_ape_replay_gain(path: Path) -> Optional[float]:
     return None
 
 
-def _scan_loop_values(path: Path) -> tuple[Optional[float], Optional[float], bool, bool]:
-    tags = _read_ape_tags(path)
+def _scan_loop_values(
+    path: Path,
+    tags: Mapping[str, str] | None = None,
+) -> tuple[Optional[float], Optional[float], bool, bool]:
+    if tags is None:
+        tags = _read_ape_tags(path)
     if not tags:
         return None, None, False, False
 
-    def _lookup(key: str) -> Optional[str]:
-        for variant in (key, key.upper(), key.lower()):
-            if variant in tags:
-                value = tags[variant].strip()
-                return value if value else None
-        return None
-
     def _to_float(value: Optional[str]) -> Optional[float]:
         if not value:
             return None
@@ -96,13 +158,13 @@ def _scan_loop_values(path: Path) -> tuple[Optional[float], Optional[float], boo
         except (ValueError, AttributeError):
             return None
 
-    start = _to_float(_lookup(LOOP_START_TAG))
-    end = _to_float(_lookup(LOOP_END_TAG))
-    enabled_text = _lookup(LOOP_ENABLED_TAG)
+    start = _to_float(_lookup_ape_value(tags, LOOP_START_TAG))
+    end = _to_float(_lookup_ape_value(tags, LOOP_END_TAG))
+    enabled_text = _lookup_ape_value(tags, LOOP_ENABLED_TAG)
     enabled = False
     if enabled_text is not None:
         enabled = enabled_text.strip().lower() in ("1", "true", "yes", "on")
-    auto_text = _lookup(LOOP_AUTO_ENABLED_TAG)
+    auto_text = _lookup_ape_value(tags, LOOP_AUTO_ENABLED_TAG)
     auto_enabled = False
     if auto_text is not None:
         auto_enabled = auto_text.strip().lower() in ("1", "true", "yes", "on")
@@ -111,4 +173,3 @@ def _scan_loop_values(path: Path) -> tuple[Optional[float], Optional[float], boo
         return None, None, False, auto_enabled
 
     return start, end, enabled, auto_enabled
-
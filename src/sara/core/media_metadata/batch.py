@@ -0,0 +1,142 @@
+"""Bulk metadata extraction across a process pool.
+
+Mutagen parsing is mostly GIL-bound, so large imports scale better with
+processes than with threads. Work is sent in chunks of paths to amortise IPC;
+workers answer with plain tuples instead of pickled dataclasses. The persistent
+metadata cache is consulted and filled only in the parent process, with file
+signatures taken before the chunk is submitted.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import astuple
+from pathlib import Path
+from typing import Iterator, Optional, Sequence
+
+from sara.core.media_metadata.cache import file_signature, get_metadata_cache
+from sara.core.media_metadata.extract import _read_metadata
+from sara.core.media_metadata.models import AudioMetadata
+from sara.core.process_pool import process_worker_count
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 64
+# Poniżej tego progu koszt uruchomienia procesów przewyższa zysk.
+MIN_PROCESS_BATCH = 200
+
+# (pola AudioMetadata, czy plik dał się odczytać) albo None
+MetadataRecord = Optional[tuple[tuple, bool]]
+
+
+def _extract_chunk(paths: Sequence[str]) -> list[MetadataRecord]:
+    records: list[MetadataRecord] = []
+    for raw_path in paths:
+        try:
+            metadata, readable = _read_metadata(Path(raw_path))
+        except Exception:  # pylint: disable=broad-except
+            records.append(None)
+        else:
+            records.append((astuple(metadata), readable))
+    return records
+
+
+def iter_extract_metadata_batch(
+    paths: Sequence[Path],
+    *,
+    workers: int = 0,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    cancel_event: threading.Event | None = None,
+) -> Iterator[tuple[int, Optional[AudioMetadata]]]:
+    """Yield ``(index, metadata)`` for `paths` in input order as worker chunks complete.
+
+    Metadata is ``None`` when a file could not be read. Iteration stops early
+    when `cancel_event` is set; queued chunks are then cancelled.
+    """
+
+    cache = get_metadata_cache()
+    ready: dict[int, Optional[AudioMetadata]] = {}
+    pending: list[int] = []
+    signatures: dict[int, tuple[int, int] | None] = {}
+    for index, path in enumerate(paths):
+        cached = None
+        if cache is not None:
+            signatures[index] = signature = file_signature(path)
+            cached = cache.get(path, signature=signature)
+        if cached is not None:
+            ready[index] = cached
+        else:
+            pending.append(index)
+
+    next_index = 0
+
+    def _drain() -> Iterator[tuple[int, Optional[AudioMetadata]]]:
+        nonlocal next_index
+        while next_index in ready:
+            yield next_index, ready.pop(next_index)
+            next_index += 1
+
+    if not pending:
+        yield from _drain()
+        return
+
+    chunk_size = max(1, int(chunk_size))
+    chunks = [pending[start : start + chunk_size] for start in range(0, len(pending), chunk_size)]
+    executor = ProcessPoolExecutor(max_workers=process_worker_count(len(chunks), workers))
+    futures: dict[Future, list[int]] = {}
+    try:
+        for chunk in chunks:
+            future = executor.submit(_extract_chunk, [str(paths[index]) for index in chunk])
+            futures[future] = chunk
+        remaining = set(futures)
+        yield from _drain()
+        while remaining:
+            if cancel_event is not None and cancel_event.is_set():
+                return
+            done, remaining = wait(remaining, timeout=0.1, return_when=FIRST_COMPLETED)
+            for future in done:
+                chunk = futures[future]
+                try:
+                    records = future.result()
+                except Exception as exc:  # pylint: disable=broad-except
+                    logger.warning("Metadata worker failed for %d files: %s", len(chunk), exc)
+                    records = [None] * len(chunk)
+                for index, record in zip(chunk, records):
+                    metadata = None
+                    if record is not None:
+                        values, readable = record
+                        metadata = AudioMetadata(*values)
+                        signature = signatures.get(index)
+                        if readable and signature is not None and cache is not None:
+                            cache.put(paths[index], metadata, signature=signature)
+                    ready[index] = metadata
+            yield from _drain()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def extract_metadata_batch(
+    paths: Sequence[Path],
+    *,
+    workers: int = 0,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    cancel_event: threading.Event | None = None,
+) -> list[Optional[AudioMetadata]]:
+    """Extract metadata for `paths` in worker processes, preserving input order.
+
+    Entries are ``None`` when a file could not be read or when `cancel_event`
+    was set before its chunk finished.
+    """
+
+    results: list[Optional[AudioMetadata]] = [None] * len(paths)
+    for index, metadata in iter_extract_metadata_batch(
+        paths,
+        workers=workers,
+        chunk_size=chunk_size,
+        cancel_event=cancel_event,
+    ):
+        results[index] = metadata
+    return results
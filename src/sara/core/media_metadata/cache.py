@@ -0,0 +1,186 @@
+"""Persistent on-disk cache of extracted audio metadata.
+
+Entries are keyed by the resolved file path and validated against the file
+size and modification time, so a changed file is re-read automatically. The
+tag writers in :mod:`sara.core.media_metadata.save` drop the entry explicitly
+after touching a file (mtime granularity on network shares can be coarse).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from dataclasses import asdict, fields
+from pathlib import Path
+from typing import Iterable, Optional
+
+from sara.core.media_metadata.models import AudioMetadata
+
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA_VERSION = 1
+_METADATA_FIELDS = frozenset(field.name for field in fields(AudioMetadata))
+
+_cache_lock = threading.Lock()
+_active_cache: "MetadataCache | None" = None
+
+
+def _cache_key(path: Path) -> str:
+    try:
+        return str(Path(path).resolve())
+    except OSError:
+        return str(Path(path).absolute())
+
+
+def file_signature(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return int(stat.st_size), int(stat.st_mtime_ns)
+
+
+class MetadataCache:
+    """SQLite-backed store of :class:`AudioMetadata` keyed by path, size and mtime."""
+
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = Path(db_path)
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._open()
+
+    def _open(self) -> None:
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != _SCHEMA_VERSION:
+                conn.execute("DROP TABLE IF EXISTS metadata")
+                conn.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS metadata ("
+                " path TEXT PRIMARY KEY,"
+                " size INTEGER NOT NULL,"
+                " mtime_ns INTEGER NOT NULL,"
+                " payload TEXT NOT NULL)"
+            )
+            conn.commit()
+        except sqlite3.Error as exc:
+            logger.warning("Metadata cache disabled (%s): %s", self.db_path, exc)
+            self._conn = None
+            return
+        self._conn = conn
+
+    @property
+    def enabled(self) -> bool:
+        return self._conn is not None
+
+    def get(self, path: Path, *, signature: tuple[int, int] | None = None) -> Optional[AudioMetadata]:
+        """Return cached metadata if the file still has the recorded size and mtime.
+
+        `signature` is a ``file_signature`` result the caller already took.
+        """
+
+        if self._conn is None:
+            return None
+        if signature is None:
+            signature = file_signature(path)
+        if signature is None:
+            return None
+        key = _cache_key(path)
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT size, mtime_ns, payload FROM metadata WHERE path = ?",
+                    (key,),
+                ).fetchone()
+        except sqlite3.Error as exc:
+            logger.debug("Metadata cache lookup failed for %s: %s", path, exc)
+            return None
+        if row is None or (int(row[0]), int(row[1])) != signature:
+            return None
+        try:
+            payload = json.loads(row[2])
+            return AudioMetadata(**{name: value for name, value in payload.items() if name in _METADATA_FIELDS})
+        except (TypeError, ValueError):
+            return None
+
+    def put(self, path: Path, metadata: AudioMetadata, *, signature: tuple[int, int] | None = None) -> None:
+        """Store `metadata` under `signature`, taken before the file was read when given."""
+
+        if self._conn is None:
+            return
+        if signature is None:
+            signature = file_signature(path)
+        if signature is None:
+            return
+        payload = json.dumps(asdict(metadata), ensure_ascii=False)
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO metadata (path, size, mtime_ns, payload) VALUES (?, ?, ?, ?)",
+                    (_cache_key(path), signature[0], signature[1], payload),
+                )
+                self._conn.commit()
+        except sqlite3.Error as exc:
+            logger.debug("Metadata cache store failed for %s: %s", path, exc)
+
+    def invalidate(self, paths: Iterable[Path]) -> None:
+        if self._conn is None:
+            return
+        keys = [(_cache_key(path),) for path in paths]
+        if not keys:
+            return
+        try:
+            with self._lock:
+                self._conn.executemany("DELETE FROM metadata WHERE path = ?", keys)
+                self._conn.commit()
+        except sqlite3.Error as exc:
+            logger.debug("Metadata cache invalidation failed: %s", exc)
+
+    def clear(self) -> None:
+        if self._conn is None:
+            return
+        try:
+            with self._lock:
+                self._conn.execute("DELETE FROM metadata")
+                self._conn.commit()
+        except sqlite3.Error as exc:
+            logger.debug("Metadata cache clear failed: %s", exc)
+
+    def close(self) -> None:
+        with self._lock:
+            conn, self._conn = self._conn, None
+        if conn is not None:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+
+
+def configure_metadata_cache(db_path: Path | None) -> MetadataCache | None:
+    """Install the process-wide metadata cache (``None`` disables caching)."""
+
+    global _active_cache
+    cache = MetadataCache(db_path) if db_path is not None else None
+    with _cache_lock:
+        previous, _active_cache = _active_cache, cache
+    if previous is not None:
+        previous.close()
+    return cache
+
+
+def get_metadata_cache() -> MetadataCache | None:
+    return _active_cache
+
+
+def invalidate_cached_metadata(path: Path) -> None:
+    cache = _active_cache
+    if cache is not None:
+        cache.invalidate([path])
@@ -10,7 +10,13 @@ from typing import Optional
 
 from mutagen import File as MutagenFile
 
-from sara.core.media_metadata.ape import _scan_ape_replay_gain, _scan_ape_value, _scan_loop_values
+from sara.core.media_metadata.ape import (
+    _lookup_ape_value,
+    _read_ape_tags,
+    _scan_ape_replay_gain,
+    _scan_loop_values,
+)
+from sara.core.media_metadata.cache import file_signature, get_metadata_cache
 from sara.core.media_metadata.constants import (
     CUE_IN_TAG,
     INTRO_TAG,
@@ -73,14 +79,35 @@ def extract_metadata(path: Path) -> AudioMetadata:
     """Return track metadata (title, duration, ReplayGain in dB).
 
     If reading metadata fails, fall back to the file name and duration 0.
+    Results are served from the persistent metadata cache when one is
+    configured and the file has not changed since it was cached. Reads that
+    failed on I/O are not cached; the rest are stored under the file signature
+    taken before reading.
     """
 
+    cache = get_metadata_cache()
+    if cache is None:
+        return _read_metadata(path)[0]
+    signature = file_signature(path)
+    cached = cache.get(path, signature=signature)
+    if cached is not None:
+        return cached
+    metadata, readable = _read_metadata(path)
+    if readable and signature is not None:
+        cache.put(path, metadata, signature=signature)
+    return metadata
+
+
+def _read_metadata(path: Path) -> tuple[AudioMetadata, bool]:
+    """Read metadata from `path`; the flag is False when the file could not be read (I/O error)."""
+
     title = path.stem
     duration = 0.0
     replay_gain: Optional[float] = None
     artist: Optional[str] = None
 
     audio = None
+    readable = True
     try:
         audio = MutagenFile(path)
         if audio.tags:
@@ -140,14 +167,19 @@ def extract_metadata(path: Path) -> AudioMetadata:
             duration = float(audio.info.length)
     except Exception as exc:  # pylint: disable=broad-except
         logger.warning("Failed to read metadata %s: %s", path, exc)
+        # mutagen opakowuje błędy wejścia/wyjścia we własny wyjątek
+        readable = not isinstance(exc, OSError) and not isinstance(exc.__cause__, OSError)
 
     if duration <= 0 and path.suffix.lower() in _FFPROBE_DURATION_EXTENSIONS:
         probed = _probe_duration_seconds(path)
         if probed is not None and probed > 0:
             duration = probed
 
+    # Tagi APE czytamy raz na plik i współdzielimy między wszystkimi wyszukiwaniami poniżej.
+    ape_tags = _read_ape_tags(path)
+
     if replay_gain is None:
-        replay_gain = _scan_ape_replay_gain(path)
+        replay_gain = _scan_ape_replay_gain(path, ape_tags)
 
     cue = None
     segue = None
@@ -210,7 +242,7 @@ def extract_metadata(path: Path) -> AudioMetadata:
                             outro = value
 
     def _read_sara_tag(tag: str) -> Optional[float]:
-        text = _scan_ape_value(path, tag)
+        text = _lookup_ape_value(ape_tags, tag)
         if text:
             return _parse_numeric_tokens([text], assume_ms=False)
         return None
@@ -230,52 +262,52 @@ def extract_metadata(path: Path) -> AudioMetadata:
 
     if cue is None:
         for candidate in ("Cue", "CueDB", "CueIn"):
-            text = _scan_ape_value(path, candidate)
+            text = _lookup_ape_value(ape_tags, candidate)
             if text:
                 cue = _parse_numeric_tokens([text])
                 if cue is not None:
                     break
     if segue is None:
         for candidate in ("Segue", "SegueDB"):
-            text = _scan_ape_value(path, candidate)
+            text = _lookup_ape_value(ape_tags, candidate)
             if text:
                 segue = _parse_numeric_tokens([text])
                 if segue is not None:
                     break
     if segue_fade is None:
         for candidate in ("SegueFade", "SegueFadeDuration"):
-            text = _scan_ape_value(path, candidate)
+            text = _lookup_ape_value(ape_tags, candidate)
             if text:
                 segue_fade = _parse_numeric_tokens([text])
                 if segue_fade is not None:
                     break
     if overlap is None:
         for candidate in ("CueOverlap", "Overlap"):
-            text = _scan_ape_value(path, candidate)
+            text = _lookup_ape_value(ape_tags, candidate)
             if text:
                 overlap = _parse_numeric_tokens([text])
                 if overlap is not None:
                     break
     if intro is None:
         for candidate in ("Intro", "IntroDB"):
-            text = _scan_ape_value(path, candidate)
+            text = _lookup_ape_value(ape_tags, candidate)
             if text:
                 intro = _parse_numeric_tokens([text])
                 if intro is not None:
                     break
     if outro is None:
         for candidate in ("Outro", "OutroDB"):
-            text = _scan_ape_value(path, candidate)
+            text = _lookup_ape_value(ape_tags, candidate)
             if text:
                 outro = _parse_numeric_tokens([text])
                 if outro is not None:
                     break
 
-    loop_start, loop_end, loop_enabled, loop_auto_enabled = _scan_loop_values(path)
+    loop_start, loop_end, loop_enabled, loop_auto_enabled = _scan_loop_values(path, ape_tags)
     # Jeśli flaga automatyczna jest włączona, traktuj pętlę jako aktywną przy wczytaniu.
     loop_enabled = (loop_enabled or loop_auto_enabled)
 
-    return AudioMetadata(
+    metadata = AudioMetadata(
         title=title,
         duration_seconds=duration,
         artist=artist,
@@ -291,3 +323,4 @@ def extract_metadata(path: Path) -> AudioMetadata:
         loop_auto_enabled=loop_auto_enabled,
         loop_enabled=loop_enabled,
     )
+    return metadata, readable
@@ -4,12 +4,13 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Mapping, Optional
 
 from mutagen import File as MutagenFile
 from mutagen.apev2 import APEv2, error as APEv2Error
 
 from sara.core.media_metadata.ape import _read_ape_tags
+from sara.core.media_metadata.cache import invalidate_cached_metadata
 from sara.core.media_metadata.constants import (
     CUE_IN_TAG,
     INTRO_TAG,
@@ -27,73 +28,136 @@ from sara.core.media_metadata.constants import (
 
 logger = logging.getLogger(__name__)
 
+# Aktualizacje tagów: klucz APE -> nowa wartość (None usuwa klucz).
+TagUpdates = Mapping[str, Optional[str]]
 
-def save_loop_metadata(
-    path: Path,
+_LOOP_TAGS = (LOOP_START_TAG, LOOP_END_TAG, LOOP_ENABLED_TAG, LOOP_AUTO_ENABLED_TAG)
+
+
+def _format_seconds(value: Optional[float]) -> Optional[str]:
+    return None if value is None else f"{value:.3f}"
+
+
+def mix_tag_updates(
+    *,
+    cue_in: Optional[float],
+    intro: Optional[float],
+    outro: Optional[float],
+    segue: Optional[float],
+    segue_fade: Optional[float],
+    overlap: Optional[float],
+) -> dict[str, Optional[str]]:
+    return {
+        CUE_IN_TAG: _format_seconds(cue_in),
+        INTRO_TAG: _format_seconds(intro),
+        OUTRO_TAG: _format_seconds(outro),
+        SEGUE_TAG: _format_seconds(segue),
+        SEGUE_FADE_TAG: _format_seconds(segue_fade),
+        OVERLAP_TAG: _format_seconds(overlap),
+    }
+
+
+def loop_tag_updates(
     start: Optional[float],
     end: Optional[float],
     enabled: Optional[bool] = None,
     auto_enabled: Optional[bool] = None,
-) -> bool:
-    """Save or remove loop markers in APEv2 tags.
+) -> dict[str, Optional[str]]:
+    """Loop markers as tag updates; raises ValueError for an empty or inverted loop."""
 
-    Returns True if the operation succeeded, False otherwise.
-    """
+    if start is None or end is None:
+        return {key: None for key in _LOOP_TAGS}
+    if end <= start:
+        raise ValueError(f"invalid loop ({start}, {end})")
+    updates: dict[str, Optional[str]] = {LOOP_START_TAG: f"{start:.3f}", LOOP_END_TAG: f"{end:.3f}"}
+    if enabled is not None:
+        updates[LOOP_ENABLED_TAG] = "1" if enabled else "0"
+    if auto_enabled is not None:
+        updates[LOOP_AUTO_ENABLED_TAG] = "1" if auto_enabled else "0"
+    return updates
 
-    file_path = str(path)
-    tags: APEv2 | None = None
-    existing = False
 
+def replay_gain_tag_updates(gain_db: Optional[float]) -> dict[str, Optional[str]]:
+    return {REPLAYGAIN_TRACK_GAIN_TAG: None if gain_db is None else f"{gain_db:+.2f} dB"}
+
+
+def _load_ape_tags(path: Path, managed_keys: Iterable[str]) -> tuple[APEv2, bool]:
+    file_path = str(path)
     try:
         audio = MutagenFile(file_path)
     except Exception:  # pylint: disable=broad-except
         audio = None
 
     if audio is not None and isinstance(getattr(audio, "tags", None), APEv2):
-        tags = audio.tags  # type: ignore[assignment]
-        existing = True
-
-    if tags is None:
-        try:
-            tags = APEv2(file_path)
-            existing = True
-        except APEv2Error:
-            tags = APEv2()
-            existing_items = _read_ape_tags(path)
-            for key, value in existing_items.items():
-                if key in (LOOP_START_TAG, LOOP_END_TAG, LOOP_ENABLED_TAG, LOOP_AUTO_ENABLED_TAG):
-                    continue
-                tags[key] = value
-
-    if tags is None:
-        logger.warning("Unable to initialise APE tags for %s", path)
-        return False
+        return audio.tags, True  # type: ignore[return-value]
 
     try:
-        if start is None or end is None:
-            removed = False
-            for key in (LOOP_START_TAG, LOOP_END_TAG, LOOP_ENABLED_TAG, LOOP_AUTO_ENABLED_TAG):
-                if key in tags:
-                    removed = True
-                    try:
-                        tags.pop(key)
-                    except KeyError:
-                        pass
-            if removed or existing:
-                tags.save(file_path)
-            return True
-
-        if end <= start:
-            logger.warning("Ignoring loop save – invalid values (%s, %s)", start, end)
-            return False
-
-        tags[LOOP_START_TAG] = f"{start:.3f}"
-        tags[LOOP_END_TAG] = f"{end:.3f}"
-        if enabled is not None:
-            tags[LOOP_ENABLED_TAG] = "1" if enabled else "0"
-        if auto_enabled is not None:
-            tags[LOOP_AUTO_ENABLED_TAG] = "1" if auto_enabled else "0"
-        tags.save(file_path)
+        return APEv2(file_path), True
+    except APEv2Error:
+        pass
+    tags = APEv2()
+    managed = set(managed_keys)
+    for key, value in _read_ape_tags(path).items():
+        if key in managed:
+            continue
+        tags[key] = value
+    return tags, False
+
+
+def _apply_ape_updates(path: Path, updates: TagUpdates) -> bool:
+    """Apply `updates` to the file in place; returns whether the file was saved."""
+
+    tags, existing = _load_ape_tags(path, updates.keys())
+    modified = False
+    for key, value in updates.items():
+        if value is None:
+            if key in tags:
+                try:
+                    tags.pop(key)
+                except KeyError:
+                    pass
+                modified = True
+            continue
+        tags[key] = value
+        modified = True
+    if modified or existing:
+        tags.save(str(path))
+        return True
+    return False
+
+
+def write_ape_updates(path: Path, updates: TagUpdates) -> None:
+    """Write `updates` to the APEv2 tag of `path` in place; raises on failure.
+
+    Only the tag block at the end of the file is rewritten, so the audio is
+    not copied and the file keeps its identity and permissions even while a
+    player has it open.
+    """
+
+    path = Path(path)
+    if _apply_ape_updates(path, updates):
+        invalidate_cached_metadata(path)
+
+
+def save_loop_metadata(
+    path: Path,
+    start: Optional[float],
+    end: Optional[float],
+    enabled: Optional[bool] = None,
+    auto_enabled: Optional[bool] = None,
+) -> bool:
+    """Save or remove loop markers in APEv2 tags.
+
+    Returns True if the operation succeeded, False otherwise.
+    """
+
+    try:
+        updates = loop_tag_updates(start, end, enabled, auto_enabled)
+    except ValueError:
+        logger.warning("Ignoring loop save – invalid values (%s, %s)", start, end)
+        return False
+    try:
+        write_ape_updates(path, updates)
         return True
     except Exception as exc:  # pylint: disable=broad-except
         logger.warning("Failed to update loop tags for %s: %s", path, exc)
@@ -112,68 +176,16 @@ def save_mix_metadata(
 ) -> bool:
     """Persist cue/intro/outro/segue/segue_fade/overlap markers in APEv2 tags."""
 
-    file_path = str(path)
-    tags: APEv2 | None = None
-    existing = False
-
-    try:
-        audio = MutagenFile(file_path)
-    except Exception:  # pylint: disable=broad-except
-        audio = None
-
-    if audio is not None and isinstance(getattr(audio, "tags", None), APEv2):
-        tags = audio.tags  # type: ignore[assignment]
-        existing = True
-
-    mix_keys = {
-        CUE_IN_TAG,
-        INTRO_TAG,
-        OUTRO_TAG,
-        SEGUE_TAG,
-        SEGUE_FADE_TAG,
-        OVERLAP_TAG,
-    }
-
-    if tags is None:
-        try:
-            tags = APEv2(file_path)
-            existing = True
-        except APEv2Error:
-            tags = APEv2()
-            existing_items = _read_ape_tags(path)
-            for key, value in existing_items.items():
-                if key in mix_keys:
-                    continue
-                tags[key] = value
-
-    if tags is None:
-        logger.warning("Unable to initialise APE tags for %s", path)
-        return False
-
-    updates = {
-        CUE_IN_TAG: cue_in,
-        INTRO_TAG: intro,
-        OUTRO_TAG: outro,
-        SEGUE_TAG: segue,
-        SEGUE_FADE_TAG: segue_fade,
-        OVERLAP_TAG: overlap,
-    }
-
+    updates = mix_tag_updates(
+        cue_in=cue_in,
+        intro=intro,
+        outro=outro,
+        segue=segue,
+        segue_fade=segue_fade,
+        overlap=overlap,
+    )
     try:
-        modified = False
-        for key, value in updates.items():
-            if value is None:
-                if key in tags:
-                    try:
-                        tags.pop(key)
-                    except KeyError:
-                        pass
-                    modified = True
-                continue
-            tags[key] = f"{value:.3f}"
-            modified = True
-        if modified or existing:
-            tags.save(file_path)
+        write_ape_updates(path, updates)
         return True
     except Exception as exc:  # pylint: disable=broad-except
         logger.warning("Failed to update mix tags for %s: %s", path, exc)
@@ -183,51 +195,9 @@ def save_mix_metadata(
 def save_replay_gain_metadata(path: Path, gain_db: Optional[float]) -> bool:
     """Persist ReplayGain track gain (compatible with SPL) in APE tags."""
 
-    file_path = str(path)
-    tags: APEv2 | None = None
-    existing = False
-
-    try:
-        audio = MutagenFile(file_path)
-    except Exception:  # pylint: disable=broad-except
-        audio = None
-
-    if audio is not None and isinstance(getattr(audio, "tags", None), APEv2):
-        tags = audio.tags  # type: ignore[assignment]
-        existing = True
-
-    if tags is None:
-        try:
-            tags = APEv2(file_path)
-            existing = True
-        except APEv2Error:
-            tags = APEv2()
-            existing_items = _read_ape_tags(path)
-            for key, value in existing_items.items():
-                if key == REPLAYGAIN_TRACK_GAIN_TAG:
-                    continue
-                tags[key] = value
-
-    if tags is None:
-        logger.warning("Unable to initialise APE tags for %s", path)
-        return False
-
     try:
-        modified = False
-        if gain_db is None:
-            if REPLAYGAIN_TRACK_GAIN_TAG in tags:
-                try:
-                    tags.pop(REPLAYGAIN_TRACK_GAIN_TAG)
-                except KeyError:
-                    pass
-                modified = True
-        else:
-            tags[REPLAYGAIN_TRACK_GAIN_TAG] = f"{gain_db:+.2f} dB"
-            modified = True
-        if modified or existing:
-            tags.save(file_path)
+        write_ape_updates(path, replay_gain_tag_updates(gain_db))
         return True
     except Exception as exc:  # pylint: disable=broad-except
         logger.warning("Failed to update ReplayGain tags for %s: %s", path, exc)
         return False
-
@@ -0,0 +1,251 @@
+"""Write-behind persistence of APE tag changes.
+
+Callers hand over tag updates and return immediately. Updates for the same
+path are merged (the newest value of each key wins), so a marker edited
+several times, or propagated to many playlist items, costs one write. A
+single background thread rewrites each path's tag in place. Failed writes (a
+file locked by the player, a network share that is briefly unreachable) are
+retried with backoff. Only the final failure is reported.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from sara.core.media_metadata.save import (
+    TagUpdates,
+    loop_tag_updates,
+    mix_tag_updates,
+    replay_gain_tag_updates,
+    write_ape_updates,
+)
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ATTEMPTS = 4
+DEFAULT_RETRY_DELAY = 1.0
+MAX_RETRY_DELAY = 30.0
+
+
+@dataclass(frozen=True)
+class TagWriteFailure:
+    path: Path
+    error: str
+    attempts: int
+
+
+FailureCallback = Callable[[TagWriteFailure], None]
+WriteFunction = Callable[[Path, TagUpdates], None]
+# wywoływane z wątku zapisu: True po zapisie, False gdy zmiana przepadła
+DoneCallback = Callable[[bool], None]
+
+
+class TagWriter:
+    """Coalesce tag updates per path and write them on a background thread.
+
+    `on_failure` runs on the writer thread once a path has exhausted its
+    attempts. A submission's own `on_done` runs on the writer thread with the
+    outcome of the write that included it.
+    """
+
+    def __init__(
+        self,
+        on_failure: FailureCallback | None = None,
+        *,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        retry_delay: float = DEFAULT_RETRY_DELAY,
+        write: WriteFunction | None = None,
+    ) -> None:
+        self._on_failure = on_failure
+        self._max_attempts = max(1, int(max_attempts))
+        self._retry_delay = max(0.0, float(retry_delay))
+        self._write = write or write_ape_updates
+        self._condition = threading.Condition()
+        # ścieżka -> scalone zmiany; kolejność wstawienia = kolejność zapisu
+        self._pending: Dict[Path, Dict[str, Optional[str]]] = {}
+        self._done_callbacks: Dict[Path, List[DoneCallback]] = {}
+        self._attempts: Dict[Path, int] = {}
+        self._not_before: Dict[Path, float] = {}
+        self._in_flight: Optional[Path] = None
+        self._closed = False
+        self._thread: threading.Thread | None = None
+
+    def submit(self, path: Path, updates: TagUpdates, *, on_done: DoneCallback | None = None) -> None:
+        if not updates:
+            return
+        path = Path(path)
+        with self._condition:
+            closed = self._closed
+            if not closed:
+                self._pending.setdefault(path, {}).update(updates)
+                if on_done is not None:
+                    self._done_callbacks.setdefault(path, []).append(on_done)
+                self._condition.notify()
+        if closed:
+            logger.warning("Tag writer stopped; dropping update for %s", path)
+            self._notify(on_done, False)
+            return
+        self._ensure_thread()
+
+    def submit_mix(
+        self,
+        path: Path,
+        *,
+        cue_in: Optional[float],
+        intro: Optional[float],
+        outro: Optional[float],
+        segue: Optional[float],
+        segue_fade: Optional[float],
+        overlap: Optional[float],
+    ) -> None:
+        self.submit(
+            path,
+            mix_tag_updates(
+                cue_in=cue_in,
+                intro=intro,
+                outro=outro,
+                segue=segue,
+                segue_fade=segue_fade,
+                overlap=overlap,
+            ),
+        )
+
+    def submit_loop(
+        self,
+        path: Path,
+        start: Optional[float],
+        end: Optional[float],
+        enabled: Optional[bool] = None,
+        auto_enabled: Optional[bool] = None,
+    ) -> None:
+        """Queue loop markers; raises ValueError for an invalid loop, like `save_loop_metadata` rejects it."""
+
+        self.submit(path, loop_tag_updates(start, end, enabled, auto_enabled))
+
+    def submit_replay_gain(
+        self,
+        path: Path,
+        gain_db: Optional[float],
+        *,
+        on_done: DoneCallback | None = None,
+    ) -> None:
+        self.submit(path, replay_gain_tag_updates(gain_db), on_done=on_done)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every queued update was written or given up; returns False on timeout.
+
+        Scheduled retries are brought forward.
+        """
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            self._not_before.clear()
+            self._condition.notify_all()
+            while self._pending or self._in_flight is not None:
+                if self._thread is None or not self._thread.is_alive():
+                    return not self._pending
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+            return True
+
+    def stop(self, timeout: float | None = 5.0) -> bool:
+        """Write what is still queued (within `timeout`), then stop the thread."""
+
+        flushed = self.flush(timeout)
+        with self._condition:
+            self._closed = True
+            dropped = list(self._pending)
+            self._pending.clear()
+            callbacks = [self._done_callbacks.pop(path, []) for path in dropped]
+            self._condition.notify_all()
+            thread = self._thread
+        for path, path_callbacks in zip(dropped, callbacks):
+            logger.warning("Tag update for %s was not written before shutdown", path)
+            for callback in path_callbacks:
+                self._notify(callback, False)
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(1.0)
+        return flushed
+
+    def _ensure_thread(self) -> None:
+        with self._condition:
+            if self._closed or (self._thread is not None and self._thread.is_alive()):
+                return
+            self._thread = threading.Thread(target=self._run, name="sara-tag-writer", daemon=True)
+            self._thread.start()
+
+    def _next_ready(self) -> tuple[Path, Dict[str, Optional[str]]] | None:
+        """Pop the first path whose retry time has come; wait while none is ready."""
+
+        while not self._closed:
+            now = time.monotonic()
+            wait_for: float | None = None
+            for path in self._pending:
+                ready_at = self._not_before.get(path, 0.0)
+                if ready_at <= now:
+                    self._not_before.pop(path, None)
+                    self._in_flight = path
+                    return path, self._pending.pop(path)
+                wait_for = ready_at - now if wait_for is None else min(wait_for, ready_at - now)
+            self._condition.wait(wait_for)
+        return None
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                entry = self._next_ready()
+                if entry is None:
+                    return
+            path, updates = entry
+            error: str | None = None
+            try:
+                self._write(path, updates)
+            except Exception as exc:  # pylint: disable=broad-except
+                error = str(exc) or exc.__class__.__name__
+            failure: TagWriteFailure | None = None
+            finished: List[DoneCallback] = []
+            with self._condition:
+                self._in_flight = None
+                if error is None:
+                    self._attempts.pop(path, None)
+                    # zmiany złożone w trakcie zapisu poczekają na własny zapis
+                    if path not in self._pending:
+                        finished = self._done_callbacks.pop(path, [])
+                else:
+                    attempts = self._attempts.get(path, 0) + 1
+                    if attempts < self._max_attempts and not self._closed:
+                        self._attempts[path] = attempts
+                        # nowsze zmiany złożone w trakcie zapisu mają pierwszeństwo
+                        merged = dict(updates)
+                        merged.update(self._pending.pop(path, {}))
+                        self._pending[path] = merged
+                        delay = min(MAX_RETRY_DELAY, self._retry_delay * (2 ** (attempts - 1)))
+                        self._not_before[path] = time.monotonic() + delay
+                        logger.info("Tag write for %s failed (attempt %d), retrying: %s", path, attempts, error)
+                    else:
+                        self._attempts.pop(path, None)
+                        failure = TagWriteFailure(path=path, error=error, attempts=attempts)
+                        finished = self._done_callbacks.pop(path, [])
+                self._condition.notify_all()
+            if failure is not None:
+                logger.warning("Giving up on tag write for %s after %d attempts: %s", path, failure.attempts, error)
+                self._notify(self._on_failure, failure)
+            for callback in finished:
+                self._notify(callback, error is None)
+
+    @staticmethod
+    def _notify(callback: Callable | None, argument) -> None:
+        if callback is None:
+            return
+        try:
+            callback(argument)
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.warning("Tag writer callback failed: %s", exc)
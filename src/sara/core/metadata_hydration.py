@@ -0,0 +1,218 @@
+"""Background hydration of playlist items created from lightweight hints.
+
+Imported playlists can be shown straight away using the title and duration
+from ``#EXTINF`` lines. Such items are marked ``hydrated=False`` and queued on
+a `MetadataHydrator`, which reads the full tags (cue, segue, loop, ReplayGain)
+on a worker thread in playlist order. Items that playback will need soon are
+moved to the front of the queue; nothing is read on the caller's thread.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from sara.core.job_queue import PRIORITY_URGENT, PriorityJobQueue
+from sara.core.media_metadata import AudioMetadata, extract_metadata
+from sara.core.playlist import PlaylistItem
+
+
+logger = logging.getLogger(__name__)
+
+RESULT_BATCH_SIZE = 50
+RESULT_BATCH_INTERVAL = 0.2
+
+_FULL_METADATA_FIELDS = (
+    "replay_gain_db",
+    "cue_in_seconds",
+    "segue_seconds",
+    "segue_fade_seconds",
+    "overlap_seconds",
+    "intro_seconds",
+    "outro_seconds",
+    "loop_start_seconds",
+    "loop_end_seconds",
+    "loop_auto_enabled",
+    "loop_enabled",
+)
+
+
+@dataclass(frozen=True)
+class HydrationJob:
+    playlist_id: str
+    item_id: str
+    path: Path
+    hints: Optional[Mapping[str, Any]] = None
+
+
+HydrationResult = Tuple[HydrationJob, Optional[AudioMetadata]]
+HydrationCallback = Callable[[List[HydrationResult]], None]
+
+
+def create_unhydrated_item(factory, path: Path, hints: Mapping[str, Any] | None) -> PlaylistItem:
+    """Build a placeholder item from playlist hints without touching the file."""
+
+    hints = hints or {}
+    duration = hints.get("duration")
+    item = factory.create_item(
+        path=path,
+        title=hints.get("title") or path.stem,
+        artist=hints.get("artist"),
+        duration_seconds=float(duration or 0.0),
+    )
+    item.hydrated = False
+    return item
+
+
+def placeholder_hints(item: PlaylistItem) -> Dict[str, Any]:
+    """Hints equivalent to the ones an unhydrated `item` was built from.
+
+    Used when a placeholder is copied: the copy is queued again with these, so
+    it ends up with the same title/artist/duration as the original would.
+    """
+
+    hints: Dict[str, Any] = {}
+    if item.title and item.title != item.path.stem:
+        hints["title"] = item.title
+    if item.artist:
+        hints["artist"] = item.artist
+    if item.duration_seconds:
+        hints["duration"] = item.duration_seconds
+    return hints
+
+
+def apply_hydrated_metadata(
+    item: PlaylistItem,
+    metadata: AudioMetadata,
+    hints: Mapping[str, Any] | None = None,
+) -> None:
+    """Fill `item` from `metadata`; title/artist/duration from `hints` take precedence.
+
+    The precedence matches eager M3U loading, so both import modes produce
+    identical items.
+    """
+
+    hints = hints or {}
+    item.title = hints.get("title") or metadata.title or item.title
+    item.artist = hints.get("artist") or metadata.artist
+    duration = hints.get("duration")
+    item.duration_seconds = float(duration or 0.0) if duration is not None else metadata.duration_seconds
+    for name in _FULL_METADATA_FIELDS:
+        setattr(item, name, getattr(metadata, name))
+    item.hydrated = True
+
+
+class MetadataHydrator:
+    """Resolve metadata for queued items on one background thread.
+
+    `on_hydrated` is called from the worker thread with batches of
+    ``(job, metadata)`` pairs (metadata is ``None`` when the file could not be
+    read); callers apply the results on their own thread. Batches are flushed
+    every `batch_size` results, after `batch_interval` seconds, when the queue
+    runs dry, or straight after an urgent job.
+    """
+
+    def __init__(
+        self,
+        on_hydrated: HydrationCallback,
+        *,
+        extract: Callable[[Path], AudioMetadata] = extract_metadata,
+        batch_size: int = RESULT_BATCH_SIZE,
+        batch_interval: float = RESULT_BATCH_INTERVAL,
+    ) -> None:
+        self._on_hydrated = on_hydrated
+        self._extract = extract
+        self._batch_size = max(1, int(batch_size))
+        self._batch_interval = max(0.0, float(batch_interval))
+        self._queue: PriorityJobQueue[Tuple[str, str], HydrationJob] = PriorityJobQueue()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def submit(self, jobs: Iterable[HydrationJob]) -> None:
+        """Queue jobs behind already queued work, keeping their relative order."""
+
+        for job in jobs:
+            self._queue.push((job.playlist_id, job.item_id), job)
+        self._ensure_thread()
+
+    def prioritise(self, playlist_id: str, item_ids: Sequence[str]) -> None:
+        """Move the given items to the front of the queue, in the given order."""
+
+        self._queue.prioritise([(playlist_id, item_id) for item_id in item_ids])
+
+    def expedite(self, job: HydrationJob) -> None:
+        """Move `job` to the front of the queue, queueing it first when it is not queued.
+
+        A job that is already queued keeps its original hints.
+        """
+
+        key = (job.playlist_id, job.item_id)
+        self._queue.push(key, job)
+        self._queue.prioritise([key])
+        self._ensure_thread()
+
+    def is_pending(self, playlist_id: str, item_id: str) -> bool:
+        return (playlist_id, item_id) in self._queue
+
+    def discard_playlist(self, playlist_id: str) -> None:
+        self._queue.discard(lambda key: key[0] == playlist_id)
+
+    def pending_count(self) -> int:
+        return len(self._queue)
+
+    def stop(self, timeout: float | None = 1.0) -> None:
+        self._queue.close()
+        with self._lock:
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def _ensure_thread(self) -> None:
+        with self._lock:
+            if self._queue.closed or (self._thread is not None and self._thread.is_alive()):
+                return
+            self._thread = threading.Thread(target=self._run, name="sara-metadata-hydrator", daemon=True)
+            self._thread.start()
+
+    def _read(self, job: HydrationJob) -> AudioMetadata | None:
+        try:
+            return self._extract(job.path)
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.debug("Metadata hydration failed for %s: %s", job.path, exc)
+            return None
+
+    def _deliver(self, batch: List[HydrationResult]) -> None:
+        try:
+            self._on_hydrated(batch)
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.warning("Metadata hydration callback failed: %s", exc)
+
+    def _run(self) -> None:
+        batch: List[HydrationResult] = []
+        last_flush = time.monotonic()
+        while not self._queue.closed:
+            timeout = None
+            if batch:
+                timeout = max(0.0, self._batch_interval - (time.monotonic() - last_flush))
+            job, priority = self._queue.pop(timeout)
+            if self._queue.closed:
+                return
+            if job is not None:
+                if not batch:
+                    last_flush = time.monotonic()
+                batch.append((job, self._read(job)))
+            if not batch:
+                continue
+            if (
+                job is None
+                or priority == PRIORITY_URGENT
+                or len(batch) >= self._batch_size
+                or time.monotonic() - last_flush >= self._batch_interval
+            ):
+                self._deliver(batch)
+                batch = []
+                last_flush = time.monotonic()
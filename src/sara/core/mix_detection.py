@@ -0,0 +1,176 @@
+"""Automatic cue-in / outro / segue proposals from a track's RMS envelope.
+
+Detection works on :class:`sara.core.waveform.WaveformPeaks`, so a file is
+decoded once and later runs reuse the `.peaks` cache. From the envelope:
+
+- cue-in is the start of the first window above the silence threshold,
+- the audible end is the end of the last such window,
+- the fade-out tail starts where the smoothed level last sits within
+  `fade_drop_db` of the track's median level.
+
+Proposals map onto the existing mix fields. `outro` is the absolute start of
+the tail. `segue` is relative to cue-in, as in `resolve_mix_timing`, and
+`segue_fade` spans the tail. A track that stops abruptly gets its segue at
+the audible end and no fade.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Iterator, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy instalowane razem z soundfile
+    np = None  # type: ignore[assignment]
+
+from sara.core.playlist import PlaylistItem
+from sara.core.process_pool import iter_process_batch
+from sara.core.waveform import PeakCache, WaveformPeaks, generate_peaks, get_peak_cache, load_peaks
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class MixDetectionSettings:
+    silence_threshold_db: float = -48.0
+    fade_drop_db: float = 8.0
+    smoothing_seconds: float = 0.5
+    min_fade_seconds: float = 1.0
+    # krótsza cisza na początku nie jest warta zapisywania jako cue-in
+    min_cue_seconds: float = 0.05
+
+
+@dataclass(frozen=True)
+class DetectedMixPoints:
+    duration_seconds: float
+    audible_start: float
+    audible_end: float
+    cue_in: Optional[float]
+    outro: Optional[float]
+    segue: Optional[float]
+    segue_fade: Optional[float]
+
+
+def _to_db(values: "np.ndarray") -> "np.ndarray":
+    with np.errstate(divide="ignore"):
+        return 20.0 * np.log10(np.maximum(values, 1e-9))
+
+
+def detect_mix_points(peaks: WaveformPeaks, settings: MixDetectionSettings | None = None) -> DetectedMixPoints | None:
+    """Propose mix points for an envelope; ``None`` when the track is silent."""
+
+    settings = settings or MixDetectionSettings()
+    if not len(peaks):
+        return None
+    window = peaks.window_seconds
+    duration = peaks.duration_seconds
+    level_db = _to_db(peaks.rms)
+    audible = np.flatnonzero(level_db > settings.silence_threshold_db)
+    if not len(audible):
+        return None
+    first, last = int(audible[0]), int(audible[-1])
+    audible_start = first * window
+    audible_end = min(duration, (last + 1) * window)
+
+    span = max(1, int(round(settings.smoothing_seconds / window)))
+    energy = peaks.rms[first : last + 1].astype(np.float64) ** 2
+    smoothed = _to_db(np.sqrt(np.convolve(energy, np.ones(span) / span, mode="same")))
+    body_db = float(np.median(level_db[first : last + 1]))
+    loud = np.flatnonzero(smoothed >= body_db - settings.fade_drop_db)
+    fade_start = audible_end
+    if len(loud):
+        fade_start = min(audible_end, (first + int(loud[-1]) + 1) * window)
+    tail = audible_end - fade_start
+    cue_in = round(audible_start, 3) if audible_start >= settings.min_cue_seconds else None
+    base_cue = cue_in or 0.0
+    if tail >= settings.min_fade_seconds:
+        outro = round(fade_start, 3)
+        segue = round(max(0.0, fade_start - base_cue), 3)
+        segue_fade = round(tail, 3)
+    else:
+        outro = None
+        segue = round(max(0.0, audible_end - base_cue), 3) if duration - audible_end >= window else None
+        segue_fade = None
+    return DetectedMixPoints(
+        duration_seconds=duration,
+        audible_start=audible_start,
+        audible_end=audible_end,
+        cue_in=cue_in,
+        outro=outro,
+        segue=segue,
+        segue_fade=segue_fade,
+    )
+
+
+def detect_file_mix_points(path: Path, settings: MixDetectionSettings | None = None) -> DetectedMixPoints | None:
+    return detect_mix_points(load_peaks(path), settings)
+
+
+def merge_detected_mix_points(
+    current: dict[str, float | None],
+    detected: DetectedMixPoints,
+) -> dict[str, float | None]:
+    """Return `current` mix values (see `current_mix_values`) with detected ones filling the gaps.
+
+    Values set by hand or read from tags are never replaced. Segue (with its
+    fade) is only proposed when there is neither a segue nor an overlap.
+    """
+
+    values = dict(current)
+    if values.get("cue_in") is None:
+        values["cue_in"] = detected.cue_in
+    if values.get("outro") is None:
+        values["outro"] = detected.outro
+    if values.get("segue") is None and values.get("overlap") is None and detected.segue is not None:
+        cue_shift = (detected.cue_in or 0.0) - (values["cue_in"] or 0.0)
+        values["segue"] = round(max(0.0, detected.segue + cue_shift), 3)
+        if values.get("segue_fade") is None:
+            values["segue_fade"] = detected.segue_fade
+    return values
+
+
+def needs_mix_detection(item: PlaylistItem) -> bool:
+    return item.cue_in_seconds is None or (item.segue_seconds is None and item.overlap_seconds is None)
+
+
+def _detect_for_batch(raw_path: str, settings_values: dict, cache_dir: str | None) -> tuple[Optional[dict], Optional[str]]:
+    path = Path(raw_path)
+    try:
+        peaks = PeakCache(Path(cache_dir)).load(path) if cache_dir else generate_peaks(path)
+        detected = detect_mix_points(peaks, MixDetectionSettings(**settings_values))
+    except Exception as exc:  # pylint: disable=broad-except
+        return None, str(exc) or exc.__class__.__name__
+    if detected is None:
+        return None, "silent"
+    return asdict(detected), None
+
+
+def iter_detect_mix_points_batch(
+    paths: Sequence[Path],
+    *,
+    settings: MixDetectionSettings | None = None,
+    workers: int = 0,
+    cancel_event: threading.Event | None = None,
+) -> Iterator[tuple[int, Optional[DetectedMixPoints], Optional[str]]]:
+    """Analyze `paths` across a process pool, yielding ``(index, detected, error)``.
+
+    Results arrive in completion order. Workers share the configured peak
+    cache directory, so envelopes computed here are reused by the editor.
+    """
+
+    settings_values = asdict(settings or MixDetectionSettings())
+    cache = get_peak_cache()
+    cache_dir = str(cache.directory) if cache is not None else None
+    for index, result, error in iter_process_batch(
+        _detect_for_batch,
+        [(str(path), settings_values, cache_dir) for path in paths],
+        workers=workers,
+        cancel_event=cancel_event,
+    ):
+        values, error = result if result is not None else (None, error)
+        yield index, DetectedMixPoints(**values) if values else None, error
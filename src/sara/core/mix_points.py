@@ -16,6 +16,10 @@ _MIX_POINT_ATTRS: tuple[tuple[str, str], ...] = (
 )
 
 
+def current_mix_values(item: PlaylistItem) -> dict[str, float | None]:
+    return {key: getattr(item, attr) for key, attr in _MIX_POINT_ATTRS}
+
+
 def apply_mix_values(item: PlaylistItem, mix_values: dict[str, float | None]) -> bool:
     changed = False
     for key, attr in _MIX_POINT_ATTRS:
@@ -49,6 +49,8 @@ class PlaylistItem:
     loop_enabled: bool = False
     break_after: bool = False
     is_selected: bool = False
+    # False dopóki pełne metadane (cue, segue, pętla, ReplayGain) nie zostaną odczytane z pliku.
+    hydrated: bool = True
 
     @property
     def duration_display(self) -> str:
@@ -0,0 +1,64 @@
+"""Process-pool helpers shared by the batch analysers (metadata, loudness, mix points)."""
+
+from __future__ import annotations
+
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Callable, Iterator, Optional, Sequence, TypeVar
+
+
+T = TypeVar("T")
+
+
+def process_worker_count(total: int, requested: int = 0) -> int:
+    if total <= 0:
+        return 0
+    cpu = os.cpu_count() or 2
+    workers = requested if requested > 0 else max(1, cpu - 1)
+    return max(1, min(workers, cpu, total))
+
+
+def iter_process_batch(
+    func: Callable[..., T],
+    calls: Sequence[tuple],
+    *,
+    workers: int = 0,
+    cancel_event: threading.Event | None = None,
+) -> Iterator[tuple[int, Optional[T], Optional[str]]]:
+    """Run ``func(*calls[index])`` across a process pool, yielding ``(index, result, error)``.
+
+    Results arrive in completion order. `error` is set (and `result` is
+    ``None``) when a call raised. With a single worker the calls run inline.
+    Pending calls are dropped once `cancel_event` is set.
+    """
+
+    if not calls:
+        return
+    worker_count = process_worker_count(len(calls), workers)
+    if worker_count <= 1:
+        for index, args in enumerate(calls):
+            if cancel_event is not None and cancel_event.is_set():
+                return
+            try:
+                yield index, func(*args), None
+            except Exception as exc:  # pylint: disable=broad-except
+                yield index, None, str(exc) or exc.__class__.__name__
+        return
+    executor = ProcessPoolExecutor(max_workers=worker_count)
+    try:
+        futures = {executor.submit(func, *args): index for index, args in enumerate(calls)}
+        remaining = set(futures)
+        while remaining:
+            if cancel_event is not None and cancel_event.is_set():
+                return
+            done, remaining = wait(remaining, timeout=0.2, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    result = future.result()
+                except Exception as exc:  # pylint: disable=broad-except
+                    yield futures[future], None, str(exc) or exc.__class__.__name__
+                else:
+                    yield futures[future], result, None
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
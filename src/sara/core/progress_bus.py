@@ -0,0 +1,113 @@
+"""Coalescing bridge for playback events from audio threads to the UI thread.
+
+Players report progress about 20 times a second each. Posting every report
+separately floods the UI event queue once several players run at the same
+time. `ProgressBus` keeps only the latest position per
+``(playlist_id, item_id)`` and delivers all of them in one batch at most
+`PROGRESS_DRAIN_INTERVAL` apart. Mix triggers and finish events use a
+separate lane that is posted at once. That lane flushes pending progress
+first, so its handlers see current positions.
+
+The bus does not depend on wx: the owner supplies `post` (run on the UI
+thread soon) and `post_later` (run on the UI thread after a delay).
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# ok. 15 Hz - płynny licznik w UI bez zalewania kolejki zdarzeń
+PROGRESS_DRAIN_INTERVAL = 1.0 / 15.0
+
+ProgressUpdate = Tuple[str, str, float]
+
+
+class ProgressBus:
+    """Thread-safe progress coalescer with a separate lane for urgent events."""
+
+    def __init__(
+        self,
+        deliver_progress: Callable[[List[ProgressUpdate]], None],
+        *,
+        post: Callable[[Callable[[], None]], None],
+        post_later: Callable[[float, Callable[[], None]], None],
+        interval: float = PROGRESS_DRAIN_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._deliver_progress = deliver_progress
+        self._post = post
+        self._post_later = post_later
+        self._interval = max(0.0, float(interval))
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._latest: Dict[Tuple[str, str], float] = {}
+        self._events: List[Tuple[Callable[..., None], tuple]] = []
+        self._progress_scheduled = False
+        self._events_scheduled = False
+        self._last_drain = float("-inf")
+
+    def publish_progress(self, playlist_id: str, item_id: str, seconds: float) -> None:
+        """Record a position; callable from any thread."""
+
+        with self._lock:
+            self._latest[(playlist_id, item_id)] = float(seconds)
+            if self._progress_scheduled:
+                return
+            self._progress_scheduled = True
+            delay = self._last_drain + self._interval - self._clock()
+        if delay > 0:
+            self._post_later(delay, self._drain_progress)
+        else:
+            self._post(self._drain_progress)
+
+    def publish_event(self, callback: Callable[..., None], *args) -> None:
+        """Queue an urgent UI callback (mix trigger, finish); callable from any thread."""
+
+        with self._lock:
+            self._events.append((callback, args))
+            if self._events_scheduled:
+                return
+            self._events_scheduled = True
+        self._post(self._drain_events)
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._latest) + len(self._events)
+
+    def _take_progress(self) -> List[ProgressUpdate]:
+        batch = [(playlist_id, item_id, seconds) for (playlist_id, item_id), seconds in self._latest.items()]
+        self._latest.clear()
+        self._last_drain = self._clock()
+        return batch
+
+    def _drain_progress(self) -> None:
+        with self._lock:
+            self._progress_scheduled = False
+            batch = self._take_progress()
+        self._deliver(batch)
+
+    def _drain_events(self) -> None:
+        with self._lock:
+            self._events_scheduled = False
+            events = self._events
+            self._events = []
+            batch = self._take_progress() if self._latest else []
+        self._deliver(batch)
+        for callback, args in events:
+            try:
+                callback(*args)
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.exception("Progress bus: event handler failed: %s", exc)
+
+    def _deliver(self, batch: List[ProgressUpdate]) -> None:
+        if not batch:
+            return
+        try:
+            self._deliver_progress(batch)
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.exception("Progress bus: progress handler failed: %s", exc)
@@ -0,0 +1,417 @@
+"""Waveform peak envelopes and their on-disk `.peaks` cache.
+
+A file is decoded once with soundfile. For every window of `window_frames`
+frames (all channels folded together) the generator keeps the minimum,
+maximum and RMS level, quantised to 16 bits. Any coarser zoom level is
+derived from these base windows without touching the audio again, so the
+editor can jump between a whole-track overview and a few seconds around a
+marker instantly.
+
+The cache stores one ``<sha1>.peaks`` file per source. The name is derived
+from the resolved path, size and mtime, so an edited file gets a new entry.
+The same identity is repeated in the header and checked on load. Entries
+left behind by edited, moved or deleted files are removed by `prune`, which
+drops entries unused for too long and then the least recently used ones
+until the directory fits its size limit.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import struct
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Optional
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy instalowane razem z soundfile
+    np = None  # type: ignore[assignment]
+
+try:
+    import soundfile as sf
+except ImportError:  # pragma: no cover - soundfile opcjonalne
+    sf = None  # type: ignore[assignment]
+
+from sara.core.media_metadata.cache import file_signature
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WINDOW_FRAMES = 256
+DEFAULT_BLOCK_SECONDS = 10.0
+PEAKS_SUFFIX = ".peaks"
+DEFAULT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_CACHE_MAX_AGE_DAYS = 180.0
+
+_MAGIC = b"SARAPEAK"
+_FORMAT_VERSION = 1
+# magic, wersja, sample rate, kanały, ramki, okno, liczba okien, rozmiar i mtime źródła
+_HEADER = struct.Struct("<8sHIHQIQQq")
+_SCALE = 32767.0
+
+_cache_lock = threading.Lock()
+_active_cache: "PeakCache | None" = None
+
+
+def is_available() -> bool:
+    return np is not None and sf is not None
+
+
+@dataclass(frozen=True)
+class PeakSlice:
+    """Envelope resampled for display: one min/max/RMS triple per column."""
+
+    start_seconds: float
+    seconds_per_column: float
+    minimum: "np.ndarray"
+    maximum: "np.ndarray"
+    rms: "np.ndarray"
+
+    def __len__(self) -> int:
+        return len(self.maximum)
+
+
+@dataclass
+class WaveformPeaks:
+    """Base-resolution envelope of a whole file with derived zoom levels."""
+
+    sample_rate: int
+    channels: int
+    frames: int
+    window_frames: int
+    minimum: "np.ndarray"
+    maximum: "np.ndarray"
+    rms: "np.ndarray"
+    _levels: Dict[int, "WaveformPeaks"] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    @property
+    def duration_seconds(self) -> float:
+        return self.frames / float(self.sample_rate) if self.sample_rate else 0.0
+
+    @property
+    def window_seconds(self) -> float:
+        return self.window_frames / float(self.sample_rate)
+
+    def __len__(self) -> int:
+        return len(self.maximum)
+
+    def level(self, factor: int) -> "WaveformPeaks":
+        """Envelope with `factor` base windows merged into one (cached per factor)."""
+
+        factor = max(1, int(factor))
+        if factor == 1:
+            return self
+        cached = self._levels.get(factor)
+        if cached is not None:
+            return cached
+        starts = np.arange(0, len(self), factor)
+        merged = WaveformPeaks(
+            sample_rate=self.sample_rate,
+            channels=self.channels,
+            frames=self.frames,
+            window_frames=self.window_frames * factor,
+            minimum=np.minimum.reduceat(self.minimum, starts) if len(starts) else self.minimum[:0],
+            maximum=np.maximum.reduceat(self.maximum, starts) if len(starts) else self.maximum[:0],
+            rms=_merge_rms(self.rms, starts),
+        )
+        self._levels[factor] = merged
+        return merged
+
+    def slice(self, start_seconds: float, end_seconds: float, columns: int) -> PeakSlice:
+        """Return the envelope of ``[start, end)`` spread over at most `columns` columns.
+
+        When the range holds fewer base windows than columns, one column per
+        window is returned, so callers never see interpolated data.
+        """
+
+        total = len(self)
+        first = min(total, max(0, int(start_seconds / self.window_seconds)))
+        last = min(total, max(first, int(np.ceil(end_seconds / self.window_seconds))))
+        count = last - first
+        columns = max(1, min(int(columns), count)) if count else 0
+        if not columns:
+            empty = self.maximum[:0]
+            return PeakSlice(first * self.window_seconds, self.window_seconds, empty, empty, empty)
+        edges = np.linspace(first, last, columns + 1).astype(np.int64)[:-1]
+        return PeakSlice(
+            start_seconds=first * self.window_seconds,
+            seconds_per_column=count * self.window_seconds / columns,
+            minimum=np.minimum.reduceat(self.minimum[first:last], edges - first),
+            maximum=np.maximum.reduceat(self.maximum[first:last], edges - first),
+            rms=_merge_rms(self.rms[first:last], edges - first),
+        )
+
+
+def _merge_rms(rms: "np.ndarray", starts: "np.ndarray") -> "np.ndarray":
+    if not len(starts):
+        return rms[:0]
+    energy = np.add.reduceat(rms.astype(np.float64) ** 2, starts)
+    counts = np.diff(np.append(starts, len(rms)))
+    return np.sqrt(energy / counts).astype(np.float32)
+
+
+class _EnvelopeBuilder:
+    def __init__(self, window_frames: int) -> None:
+        self._window = window_frames
+        self._carry: Optional["np.ndarray"] = None
+        self._minimum: list["np.ndarray"] = []
+        self._maximum: list["np.ndarray"] = []
+        self._energy: list["np.ndarray"] = []
+        self._counts: list["np.ndarray"] = []
+
+    def add(self, block: "np.ndarray") -> None:
+        if self._carry is not None and len(self._carry):
+            block = np.concatenate((self._carry, block))
+        whole = len(block) // self._window
+        self._carry = block[whole * self._window :].copy()
+        if whole:
+            self._push(block[: whole * self._window].reshape(whole, -1))
+
+    def _push(self, windows: "np.ndarray") -> None:
+        self._minimum.append(windows.min(axis=1))
+        self._maximum.append(windows.max(axis=1))
+        self._energy.append(np.einsum("ij,ij->i", windows, windows, dtype=np.float64))
+        self._counts.append(np.full(len(windows), windows.shape[1], dtype=np.float64))
+
+    def finish(self) -> tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+        if self._carry is not None and len(self._carry):
+            self._push(self._carry.reshape(1, -1))
+            self._carry = None
+        if not self._maximum:
+            empty = np.zeros(0, dtype=np.float32)
+            return empty, empty, empty
+        energy = np.concatenate(self._energy)
+        counts = np.concatenate(self._counts)
+        return (
+            np.concatenate(self._minimum).astype(np.float32),
+            np.concatenate(self._maximum).astype(np.float32),
+            np.sqrt(energy / counts).astype(np.float32),
+        )
+
+
+def generate_peaks(
+    path: Path,
+    *,
+    window_frames: int = DEFAULT_WINDOW_FRAMES,
+    block_seconds: float = DEFAULT_BLOCK_SECONDS,
+) -> WaveformPeaks:
+    """Decode `path` once and compute its envelope; raises on unsupported formats."""
+
+    if not is_available():
+        raise RuntimeError("numpy and soundfile are required for waveform peaks")
+    window_frames = max(1, int(window_frames))
+    with sf.SoundFile(str(path)) as handle:
+        channels = handle.channels
+        # wiele kanałów składamy w jeden ciąg próbek, więc okno obejmuje ramki * kanały
+        builder = _EnvelopeBuilder(window_frames * channels)
+        block_frames = max(window_frames, int(handle.samplerate * block_seconds) // window_frames * window_frames)
+        frames = 0
+        while True:
+            block = handle.read(block_frames, dtype="float32", always_2d=True)
+            if not len(block):
+                break
+            frames += len(block)
+            builder.add(block.reshape(-1))
+        minimum, maximum, rms = builder.finish()
+        return WaveformPeaks(
+            sample_rate=handle.samplerate,
+            channels=channels,
+            frames=frames,
+            window_frames=window_frames,
+            minimum=minimum,
+            maximum=maximum,
+            rms=rms,
+        )
+
+
+def _quantise(values: "np.ndarray") -> bytes:
+    return np.round(np.clip(values, -1.0, 1.0) * _SCALE).astype("<i2").tobytes()
+
+
+def _dequantise(payload: bytes, count: int, offset: int) -> "np.ndarray":
+    values = np.frombuffer(payload, dtype="<i2", count=count, offset=offset)
+    return values.astype(np.float32) / _SCALE
+
+
+def write_peaks_file(target: Path, peaks: WaveformPeaks, signature: tuple[int, int] = (0, 0)) -> None:
+    """Store `peaks` atomically (temporary file + replace)."""
+
+    header = _HEADER.pack(
+        _MAGIC,
+        _FORMAT_VERSION,
+        peaks.sample_rate,
+        peaks.channels,
+        peaks.frames,
+        peaks.window_frames,
+        len(peaks),
+        signature[0],
+        signature[1],
+    )
+    target = Path(target)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    temp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    try:
+        with temp.open("wb") as handle:
+            handle.write(header)
+            handle.write(_quantise(peaks.minimum))
+            handle.write(_quantise(peaks.maximum))
+            handle.write(_quantise(peaks.rms))
+        os.replace(temp, target)
+    finally:
+        if temp.exists():
+            temp.unlink()
+
+
+def read_peaks_file(source: Path, signature: tuple[int, int] | None = None) -> WaveformPeaks | None:
+    """Load a `.peaks` file; ``None`` when it is damaged or does not match `signature`."""
+
+    try:
+        payload = Path(source).read_bytes()
+    except OSError:
+        return None
+    if len(payload) < _HEADER.size:
+        return None
+    magic, version, sample_rate, channels, frames, window, count, size, mtime_ns = _HEADER.unpack_from(payload)
+    if magic != _MAGIC or version != _FORMAT_VERSION or not sample_rate:
+        return None
+    if signature is not None and (size, mtime_ns) != signature:
+        return None
+    if len(payload) != _HEADER.size + 3 * 2 * count:
+        return None
+    offset = _HEADER.size
+    return WaveformPeaks(
+        sample_rate=sample_rate,
+        channels=channels,
+        frames=frames,
+        window_frames=window,
+        minimum=_dequantise(payload, count, offset),
+        maximum=_dequantise(payload, count, offset + 2 * count),
+        rms=_dequantise(payload, count, offset + 4 * count),
+    )
+
+
+class PeakCache:
+    """Directory of `.peaks` files keyed by source path, size and mtime.
+
+    A hit refreshes the entry's mtime, so `prune` evicts the least recently
+    used entries first.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        window_frames: int = DEFAULT_WINDOW_FRAMES,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        max_age_days: float = DEFAULT_CACHE_MAX_AGE_DAYS,
+    ) -> None:
+        self.directory = Path(directory)
+        self.window_frames = window_frames
+        self.max_bytes = max(0, int(max_bytes))
+        self.max_age_days = max(0.0, float(max_age_days))
+
+    def entry_path(self, path: Path, signature: tuple[int, int]) -> Path:
+        try:
+            key = str(Path(path).resolve())
+        except OSError:
+            key = str(Path(path).absolute())
+        digest = hashlib.sha1(f"{key}\0{signature[0]}\0{signature[1]}".encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}{PEAKS_SUFFIX}"
+
+    def get(self, path: Path) -> WaveformPeaks | None:
+        signature = file_signature(path)
+        if signature is None:
+            return None
+        return self._read_entry(self.entry_path(path, signature), signature)
+
+    def load(self, path: Path) -> WaveformPeaks:
+        """Return cached peaks for `path`, generating and storing them on a miss."""
+
+        signature = file_signature(path)
+        if signature is not None:
+            cached = self._read_entry(self.entry_path(path, signature), signature)
+            if cached is not None:
+                return cached
+        peaks = generate_peaks(path, window_frames=self.window_frames)
+        if signature is not None:
+            try:
+                write_peaks_file(self.entry_path(path, signature), peaks, signature)
+            except OSError as exc:
+                logger.debug("Failed to store waveform peaks for %s: %s", path, exc)
+        return peaks
+
+    def prune(self) -> int:
+        """Delete entries unused for `max_age_days`, then the oldest ones above `max_bytes`.
+
+        Returns the number of removed entries.
+        """
+
+        entries: list[tuple[float, int, Path]] = []
+        try:
+            with os.scandir(self.directory) as scan:
+                for entry in scan:
+                    if not entry.name.endswith(PEAKS_SUFFIX):
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, Path(entry.path)))
+        except OSError:
+            return 0
+        entries.sort()
+        cutoff = time.time() - self.max_age_days * 86400.0
+        total = sum(size for _mtime, size, _path in entries)
+        removed = 0
+        for mtime, size, entry_path in entries:
+            if mtime >= cutoff and total <= self.max_bytes:
+                break
+            try:
+                entry_path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as exc:
+                logger.debug("Failed to remove waveform peaks %s: %s", entry_path, exc)
+                continue
+            total -= size
+            removed += 1
+        return removed
+
+    @staticmethod
+    def _read_entry(target: Path, signature: tuple[int, int]) -> WaveformPeaks | None:
+        peaks = read_peaks_file(target, signature)
+        if peaks is not None:
+            try:
+                os.utime(target)
+            except OSError:
+                pass
+        return peaks
+
+
+def configure_peak_cache(directory: Path | None) -> PeakCache | None:
+    """Install the process-wide peak cache (``None`` disables it) and prune it in the background."""
+
+    global _active_cache
+    cache = PeakCache(directory) if directory is not None else None
+    with _cache_lock:
+        _active_cache = cache
+    if cache is not None:
+        threading.Thread(target=cache.prune, name="sara-peaks-prune", daemon=True).start()
+    return cache
+
+
+def get_peak_cache() -> PeakCache | None:
+    return _active_cache
+
+
+def load_peaks(path: Path) -> WaveformPeaks:
+    """Peaks for `path` through the configured cache, or decoded directly without one."""
+
+    cache = _active_cache
+    if cache is not None:
+        return cache.load(path)
+    return generate_peaks(path)
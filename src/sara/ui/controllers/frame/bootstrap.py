@@ -9,6 +9,8 @@ from sara.core.app_state import AppState, PlaylistFactory
 from sara.core.config import SettingsManager
 from sara.core.env import resolve_output_dir
 from sara.core.i18n import gettext as _, set_language
+from sara.core.media_metadata import configure_metadata_cache
+from sara.core.waveform import configure_peak_cache
 from sara.ui.announcement_service import AnnouncementService
 from sara.ui.auto_mix_tracker import AutoMixTracker
 from sara.ui.clipboard_service import PlaylistClipboard
@@ -25,6 +27,8 @@ def init_settings(frame, settings: SettingsManager | None) -> None:
     set_language(frame._settings.get_language())
     if not frame._settings.config_path.exists():
         frame._settings.save()
+    configure_metadata_cache(frame._settings.config_path.parent / "metadata_cache.sqlite3")
+    configure_peak_cache(frame._settings.config_path.parent / "peaks")
 
 
 def init_playlist_state(frame, state: AppState | None) -> None:
@@ -41,6 +45,9 @@ def init_playlist_state(frame, state: AppState | None) -> None:
 def init_audio_controllers(frame) -> None:
     frame._audio_engine = AudioEngine()
     frame._playback = PlaybackController(frame._audio_engine, frame._settings, frame._announce_event)
+    frame._playback.set_preload_playlists(
+        lambda: [panel.model for panel in frame._playlists.values() if getattr(panel, "model", None) is not None]
+    )
     frame._jingles_path = frame._settings.config_path.parent / "jingles.sarajingles"
     frame._jingles = JingleController(
         frame._audio_engine,
@@ -72,6 +79,7 @@ def init_command_ids(frame) -> None:
     frame._redo_id = wx.NewIdRef()
     frame._shortcut_editor_id = wx.NewIdRef()
     frame._jingles_manage_id = wx.NewIdRef()
+    frame._detect_mix_points_id = wx.NewIdRef()
     frame._send_feedback_id = wx.NewIdRef()
 
 
@@ -98,6 +106,15 @@ def init_runtime_state(frame) -> None:
     frame._last_started_item_id = {}
     frame._last_music_playlist_id = None
     frame._active_folder_preview = None
+    frame._folder_snapshots = {}
+    frame._folder_watchers = {}
+    frame._item_loader_cancel_events = set()
+    frame._metadata_hydrator = None
+    frame._loudness_scanner = None
+    frame._loudness_scan_call = None
+    frame._progress_bus = None
+    frame._mix_detection_cancel = None
+    frame._tag_writer = None
     frame._active_break_item = {}
     frame._mix_trigger_points = {}
     frame._mix_plans = {}
@@ -0,0 +1,38 @@
+"""Background tag persistence for the main frame."""
+
+from __future__ import annotations
+
+import logging
+
+import wx
+
+from sara.core.i18n import gettext as _
+from sara.core.media_metadata import TagWriteFailure, TagWriter
+
+
+logger = logging.getLogger(__name__)
+
+# Przy zamykaniu czekamy chwilę na zaległe zapisy (np. udział sieciowy).
+SHUTDOWN_FLUSH_SECONDS = 5.0
+
+
+def ensure_tag_writer(frame) -> TagWriter:
+    writer = frame._tag_writer
+    if writer is None:
+        writer = TagWriter(lambda failure: wx.CallAfter(report_tag_write_failure, frame, failure))
+        frame._tag_writer = writer
+    return writer
+
+
+def report_tag_write_failure(frame, failure: TagWriteFailure) -> None:
+    frame._announce_event(
+        "general",
+        _("Failed to save tags for %s: %s") % (failure.path.name, failure.error),
+    )
+
+
+def stop_tag_writer(frame) -> None:
+    writer = frame._tag_writer
+    frame._tag_writer = None
+    if writer is not None and not writer.stop(SHUTDOWN_FLUSH_SECONDS):
+        logger.warning("Some tag updates were not written before exit")
@@ -1,6 +1,7 @@
 """Compatibility wrapper for MainFrame bootstrap helpers.
 
-Implementation lives in `sara.ui.controllers.frame.bootstrap`.
+Implementation lives in `sara.ui.controllers.frame.bootstrap`; the tag writer
+lifecycle in `sara.ui.controllers.frame.tag_writes`.
 """
 
 from __future__ import annotations
@@ -13,13 +14,16 @@ from sara.ui.controllers.frame.bootstrap import (
     init_settings,
     init_ui,
 )
+from sara.ui.controllers.frame.tag_writes import ensure_tag_writer, stop_tag_writer
 
 __all__ = [
+    "ensure_tag_writer",
     "init_audio_controllers",
     "init_command_ids",
     "init_playlist_state",
     "init_runtime_state",
     "init_settings",
     "init_ui",
+    "stop_tag_writer",
 ]
 
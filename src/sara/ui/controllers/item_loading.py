@@ -1,31 +1,65 @@
 """Compatibility wrapper for item loading helpers.
 
-Implementation lives in `sara.ui.controllers.playlists.item_loading`.
+Implementation lives in `sara.ui.controllers.playlists.item_loading`, with
+background hydration and loudness scanning of loaded items in
+`sara.ui.controllers.playlists.hydration` and
+`sara.ui.controllers.playlists.loudness_scan`.
 """
 
 from __future__ import annotations
 
+from sara.ui.controllers.playlists.hydration import (
+    create_lazy_items_from_m3u_entries,
+    discard_playlist_hydration,
+    expedite_item_hydration,
+    prepare_upcoming_items,
+    queue_copied_item_hydration,
+    queue_item_hydration,
+    stop_metadata_hydrator,
+)
 from sara.ui.controllers.playlists.item_loading import (
     build_playlist_item,
+    cancel_item_loaders,
     collect_files_from_paths,
     create_items_from_m3u_entries,
     create_items_from_paths,
+    iter_items_from_sources,
     load_items_from_sources,
     load_playlist_item,
     logger,
     metadata_worker_count,
     run_item_loader,
+    stream_item_loader,
+)
+from sara.ui.controllers.playlists.loudness_scan import (
+    discard_playlist_loudness_scan,
+    prioritise_loudness_scan,
+    schedule_loudness_scan,
+    stop_loudness_scanner,
 )
 
 __all__ = [
     "build_playlist_item",
+    "cancel_item_loaders",
     "collect_files_from_paths",
     "create_items_from_m3u_entries",
     "create_items_from_paths",
+    "create_lazy_items_from_m3u_entries",
+    "discard_playlist_hydration",
+    "discard_playlist_loudness_scan",
+    "expedite_item_hydration",
+    "iter_items_from_sources",
     "load_items_from_sources",
     "load_playlist_item",
     "logger",
     "metadata_worker_count",
+    "prepare_upcoming_items",
+    "prioritise_loudness_scan",
+    "queue_copied_item_hydration",
+    "queue_item_hydration",
     "run_item_loader",
+    "schedule_loudness_scan",
+    "stop_loudness_scanner",
+    "stop_metadata_hydrator",
+    "stream_item_loader",
 ]
-
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import time
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable
@@ -45,6 +46,9 @@ class JingleController:
         self._max_overlay_players = max(1, int(max_overlay_players))
         self._replay_gain_cache: dict[Path, float | None] = {}
         self._player_tokens: dict[int, str] = {}
+        # jeden wątek odczytuje tagi dżingli; ta sama ścieżka nie jest czytana dwa razy naraz
+        self._gain_executor: ThreadPoolExecutor | None = None
+        self._gain_reads: dict[Path, Future] = {}
 
     @property
     def jingle_set(self) -> JingleSet:
@@ -189,25 +193,36 @@ class JingleController:
     def _schedule_replay_gain(self, player: Player, *, item_id: str, path: Path) -> None:
         key = id(player)
         self._player_tokens[key] = item_id
-        resolved = path.resolve()
 
-        def _worker() -> None:
-            gain = None
-            try:
-                gain = extract_metadata(resolved).replay_gain_db
-            except Exception:
-                gain = None
-            self._replay_gain_cache[resolved] = gain
+        def _apply(future: Future) -> None:
             if self._player_tokens.get(key) != item_id:
                 return
             try:
-                player.set_gain_db(gain)
+                player.set_gain_db(future.result())
             except Exception:
                 return
 
-        import threading
+        self._read_replay_gain(path.resolve()).add_done_callback(_apply)
+
+    def _read_replay_gain(self, resolved: Path) -> Future:
+        pending = self._gain_reads.get(resolved)
+        if pending is not None:
+            return pending
+        if self._gain_executor is None:
+            self._gain_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sara-jingle-gain")
+
+        def _worker() -> float | None:
+            try:
+                gain = extract_metadata(resolved).replay_gain_db
+            except Exception:
+                gain = None
+            self._replay_gain_cache[resolved] = gain
+            return gain
 
-        threading.Thread(target=_worker, daemon=True).start()
+        future = self._gain_executor.submit(_worker)
+        self._gain_reads[resolved] = future
+        future.add_done_callback(lambda _future: self._gain_reads.pop(resolved, None))
+        return future
 
     def stop_all(self) -> None:
         players: list[Player] = []
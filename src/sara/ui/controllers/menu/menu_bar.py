@@ -121,6 +121,8 @@ def create_menu_bar(frame) -> None:
         "track_remaining",
     )
 
+    tools_menu.Append(int(frame._detect_mix_points_id), _("&Detect mix points"))
+    tools_menu.AppendSeparator()
     tools_menu.Append(int(frame._shortcut_editor_id), _("Edit &shortcuts…"))
     tools_menu.Append(int(frame._jingles_manage_id), _("&Jingles…"))
     tools_menu.Append(int(options_id), _("&Options…"))
@@ -145,6 +147,7 @@ def create_menu_bar(frame) -> None:
     frame.Bind(wx.EVT_MENU, frame._on_toggle_loop_playback, id=int(frame._loop_playback_toggle_id))
     frame.Bind(wx.EVT_MENU, frame._on_loop_info, id=int(frame._loop_info_id))
     frame.Bind(wx.EVT_MENU, frame._on_track_remaining, id=int(frame._track_remaining_id))
+    frame.Bind(wx.EVT_MENU, frame._on_detect_mix_points, id=int(frame._detect_mix_points_id))
     frame.Bind(wx.EVT_MENU, frame._on_edit_shortcuts, id=int(frame._shortcut_editor_id))
     frame.Bind(wx.EVT_MENU, frame._on_jingles, id=int(frame._jingles_manage_id))
     frame.Bind(wx.EVT_MENU, frame._on_undo, id=int(frame._undo_id))
@@ -0,0 +1,154 @@
+"""Batch detection of missing mix points for the current playlist."""
+
+from __future__ import annotations
+
+import logging
+import threading
+
+import wx
+
+from sara.core.i18n import gettext as _
+from sara.core.mix_detection import (
+    DetectedMixPoints,
+    MixDetectionSettings,
+    iter_detect_mix_points_batch,
+    merge_detected_mix_points,
+    needs_mix_detection,
+)
+from sara.core.mix_points import apply_mix_values, current_mix_values
+from sara.core.playlist import PlaylistKind
+
+
+logger = logging.getLogger(__name__)
+
+
+def on_detect_mix_points(frame, _event: wx.CommandEvent | None = None) -> None:
+    """Detect mix points for the selected tracks (or the whole playlist) in the background."""
+
+    if frame._mix_detection_cancel is not None:
+        frame._announce_event("mix_points", _("Mix point detection is already running"))
+        return
+    panel = frame._get_audio_panel((PlaylistKind.MUSIC, PlaylistKind.FOLDER))
+    if panel is None:
+        frame._announce_event("playlist", _("Select a playlist first"))
+        return
+    model = panel.model
+    selected = [model.items[index] for index in panel.get_selected_indices() if 0 <= index < len(model.items)]
+    candidates = selected if len(selected) > 1 else list(model.items)
+    # nieuzupełnione pozycje z importu M3U mogą mieć punkty w tagach, których jeszcze nie znamy
+    jobs = [
+        (item.id, item.path)
+        for item in candidates
+        if item.hydrated and needs_mix_detection(item)
+    ]
+    if not jobs:
+        frame._announce_event("mix_points", _("All tracks already have mix points"))
+        return
+
+    settings = frame._settings
+    detection_settings = MixDetectionSettings(
+        silence_threshold_db=settings.get_mix_detection_silence_threshold_db(),
+        fade_drop_db=settings.get_mix_detection_fade_drop_db(),
+    )
+    tag_writer = frame._ensure_tag_writer() if settings.get_mix_detection_write_tags() else None
+    cancel_event = threading.Event()
+    frame._mix_detection_cancel = cancel_event
+    frame._announce_event("mix_points", _("Detecting mix points for %d tracks") % len(jobs))
+
+    applied: list[str] = []
+
+    def _apply(item_id: str, detected: DetectedMixPoints) -> None:
+        if apply_detected_mix_points(frame, model.id, item_id, detected, tag_writer=tag_writer):
+            applied.append(item_id)
+
+    def _worker() -> None:
+        try:
+            for index, detected, error in iter_detect_mix_points_batch(
+                [path for _item_id, path in jobs],
+                settings=detection_settings,
+                workers=settings.get_metadata_process_workers(),
+                cancel_event=cancel_event,
+            ):
+                item_id, path = jobs[index]
+                if detected is None:
+                    logger.info("Mix points not detected for %s: %s", path, error)
+                    continue
+                wx.CallAfter(_apply, item_id, detected)
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.exception("Mix point detection failed: %s", exc)
+        finally:
+            # kolejka CallAfter jest FIFO: podsumowanie widzi wszystkie zastosowane wyniki
+            wx.CallAfter(finish_mix_detection, frame, model.id, cancel_event, applied, len(jobs))
+
+    threading.Thread(target=_worker, name="sara-mix-detection", daemon=True).start()
+
+
+def apply_detected_mix_points(
+    frame,
+    playlist_id: str,
+    item_id: str,
+    detected: DetectedMixPoints,
+    *,
+    tag_writer=None,
+) -> bool:
+    """Merge detected points into the item on the UI thread; returns True when anything changed.
+
+    The merged values are also what `tag_writer` saves, so tags and the
+    playlist always agree.
+    """
+
+    panel = frame._playlists.get(playlist_id)
+    if panel is None:
+        return False
+    item = panel.model.get_item(item_id)
+    if item is None:
+        return False
+    # punkty ustawione ręcznie w trakcie analizy mają pierwszeństwo
+    values = merge_detected_mix_points(current_mix_values(item), detected)
+    if not apply_mix_values(item, values):
+        return False
+    if tag_writer is not None:
+        tag_writer.submit_mix(
+            item.path,
+            cue_in=values.get("cue_in"),
+            intro=values.get("intro"),
+            outro=values.get("outro"),
+            segue=values.get("segue"),
+            segue_fade=values.get("segue_fade"),
+            overlap=values.get("overlap"),
+        )
+    frame._propagate_mix_points_for_path(
+        path=item.path,
+        mix_values=values,
+        source_playlist_id=playlist_id,
+        source_item_id=item_id,
+    )
+    if (playlist_id, item_id) in frame._playback.contexts:
+        frame._apply_mix_trigger_to_playback(playlist_id=playlist_id, item=item, panel=panel)
+    else:
+        frame._clear_mix_plan(playlist_id, item_id)
+    return True
+
+
+def finish_mix_detection(
+    frame,
+    playlist_id: str,
+    cancel_event: threading.Event,
+    applied: list[str],
+    total: int,
+) -> None:
+    if frame._mix_detection_cancel is cancel_event:
+        frame._mix_detection_cancel = None
+    panel = frame._playlists.get(playlist_id)
+    if panel is not None:
+        panel.refresh()
+    if cancel_event.is_set():
+        return
+    frame._announce_event("mix_points", _("Detected mix points for %d of %d tracks") % (len(applied), total))
+
+
+def cancel_mix_detection(frame) -> None:
+    cancel_event = frame._mix_detection_cancel
+    frame._mix_detection_cancel = None
+    if cancel_event is not None:
+        cancel_event.set()
@@ -7,7 +7,6 @@ from pathlib import Path
 import wx
 
 from sara.core.i18n import gettext as _
-from sara.core.media_metadata import save_loop_metadata, save_mix_metadata
 from sara.core.mix_points import propagate_mix_points_for_path as _propagate_mix_points_for_path_impl
 from sara.ui.dialogs.mix_point_dialog import MixPointEditorDialog
 
@@ -19,6 +18,10 @@ def on_mix_points_configure(frame, playlist_id: str, item_id: str) -> None:
     item = next((track for track in panel.model.items if track.id == item_id), None)
     if item is None:
         return
+    # edytor zapisuje punkty do tagów, więc musi zobaczyć wartości z pliku
+    if not frame._expedite_item_hydration(panel.model, item):
+        frame._announce_event("playlist", _("Still reading tags of %s, try again in a moment") % item.title)
+        return
 
     dialog = MixPointEditorDialog(
         frame,
@@ -71,7 +74,8 @@ def on_mix_points_configure(frame, playlist_id: str, item_id: str) -> None:
     item.segue_fade_seconds = mix_values["segue_fade"]
     item.overlap_seconds = mix_values["overlap"]
 
-    if not save_mix_metadata(
+    tag_writer = frame._ensure_tag_writer()
+    tag_writer.submit_mix(
         item.path,
         cue_in=item.cue_in_seconds,
         intro=item.intro_seconds,
@@ -79,16 +83,14 @@ def on_mix_points_configure(frame, playlist_id: str, item_id: str) -> None:
         segue=item.segue_seconds,
         segue_fade=item.segue_fade_seconds,
         overlap=item.overlap_seconds,
-    ):
-        frame._announce_event("pfl", _("Failed to update mix metadata"))
-    else:
-        frame._announce_event("pfl", _("Updated mix points for %s") % item.title)
-        frame._propagate_mix_points_for_path(
-            path=item.path,
-            mix_values=mix_values,
-            source_playlist_id=playlist_id,
-            source_item_id=item.id,
-        )
+    )
+    frame._announce_event("mix_points", _("Updated mix points for %s") % item.title)
+    frame._propagate_mix_points_for_path(
+        path=item.path,
+        mix_values=mix_values,
+        source_playlist_id=playlist_id,
+        source_item_id=item.id,
+    )
 
     panel.refresh()
     frame._apply_mix_trigger_to_playback(playlist_id=playlist_id, item=item, panel=panel)
@@ -106,21 +108,20 @@ def on_mix_points_configure(frame, playlist_id: str, item_id: str) -> None:
         else:
             item.loop_auto_enabled = loop_auto_enabled
             item.loop_enabled = loop_auto_enabled or item.loop_enabled
-            if not save_loop_metadata(
+            tag_writer.submit_loop(
                 item.path,
                 loop_start,
                 loop_end,
                 item.loop_enabled,
                 item.loop_auto_enabled,
-            ):
-                frame._announce_event("loop", _("Failed to update loop metadata"))
+            )
             frame._apply_loop_setting_to_playback(playlist_id=playlist_id, item_id=item.id)
             panel.refresh()
     else:
         if item.has_loop() or item.loop_enabled:
             item.clear_loop()
             item.loop_auto_enabled = False
-            save_loop_metadata(item.path, None, None, auto_enabled=False)
+            tag_writer.submit_loop(item.path, None, None, auto_enabled=False)
             frame._apply_loop_setting_to_playback(playlist_id=playlist_id, item_id=item.id)
             panel.refresh()
 
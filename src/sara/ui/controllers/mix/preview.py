@@ -87,6 +87,8 @@ def preview_mix_with_next(
         frame._announce_event("pfl", _("No next track to mix"))
         return False
     next_item = playlist.items[next_idx]
+    frame._expedite_item_hydration(playlist, item)
+    frame._expedite_item_hydration(playlist, next_item)
 
     overrides = dict(overrides or {})
     preview_pre_seconds = overrides.pop("_preview_pre_seconds", None)
@@ -1,13 +1,17 @@
 """Compatibility wrapper for mix points controller helpers.
 
-Implementation lives in `sara.ui.controllers.mix.points`.
+Implementation lives in `sara.ui.controllers.mix.points` and
+`sara.ui.controllers.mix.detection`.
 """
 
 from __future__ import annotations
 
+from sara.ui.controllers.mix.detection import cancel_mix_detection, on_detect_mix_points
 from sara.ui.controllers.mix.points import on_mix_points_configure, propagate_mix_points_for_path
 
 __all__ = [
+    "cancel_mix_detection",
+    "on_detect_mix_points",
     "on_mix_points_configure",
     "propagate_mix_points_for_path",
 ]
@@ -53,6 +53,7 @@ def set_auto_mix_enabled(frame, enabled: bool, *, reason: str | None = None) ->
             try:
                 playlist = frame._get_playlist_model(pl_id)
                 if playlist:
+                    frame._prepare_upcoming_items(playlist, item_id)
                     frame._playback.schedule_next_preload(playlist, current_item_id=item_id)
             except Exception:
                 pass
@@ -8,8 +8,8 @@ import wx
 
 from sara.core.i18n import gettext as _
 from sara.core.mix_planner import compute_air_duration_seconds
-from sara.core.media_metadata import save_loop_metadata
 from sara.core.playlist import PlaylistItem, PlaylistModel
+from sara.ui.controllers.playback.start import progress_bus
 from sara.ui.playback_controller import PlaybackContext
 from sara.ui.playlist_panel import PlaylistPanel
 
@@ -36,14 +36,13 @@ def on_toggle_loop_playback(frame, _event: wx.CommandEvent) -> None:
         playing_item, playing_model = active
         playing_item.loop_enabled = False
         playing_item.loop_auto_enabled = False
-        if not save_loop_metadata(
+        frame._ensure_tag_writer().submit_loop(
             playing_item.path,
             playing_item.loop_start_seconds,
             playing_item.loop_end_seconds,
             playing_item.loop_enabled,
             playing_item.loop_auto_enabled,
-        ):
-            frame._announce_event("loop", _("Failed to update loop metadata"))
+        )
         frame._apply_loop_setting_to_playback(playlist_id=playing_model.id, item_id=playing_item.id)
         frame._announce_event("loop", _("Track looping disabled"))
         remaining = frame._compute_intro_remaining(playing_item)
@@ -77,14 +76,13 @@ def on_toggle_loop_playback(frame, _event: wx.CommandEvent) -> None:
 
     item.loop_enabled = not item.loop_enabled
     item.loop_auto_enabled = item.loop_enabled
-    if not save_loop_metadata(
+    frame._ensure_tag_writer().submit_loop(
         item.path,
         item.loop_start_seconds,
         item.loop_end_seconds,
         item.loop_enabled,
         item.loop_auto_enabled,
-    ):
-        frame._announce_event("loop", _("Failed to update loop metadata"))
+    )
     frame._apply_loop_setting_to_playback(playlist_id=model.id, item_id=item.id)
     state = _("enabled") if item.loop_enabled else _("disabled")
     frame._announce_event("loop", _("Track looping %s") % state)
@@ -187,7 +185,7 @@ def sync_loop_mix_trigger(
         playlist=playlist,
         item=item,
         context=context,
-        call_after=wx.CallAfter,
+        call_after=progress_bus(frame).publish_event,
     )
 
 
@@ -108,6 +108,42 @@ def on_global_play_next(frame, _event: wx.CommandEvent) -> None:
 
 
 def handle_playback_progress(frame, playlist_id: str, item_id: str, seconds: float) -> None:
+    handle_playback_progress_batch(frame, [(playlist_id, item_id, seconds)])
+
+
+def handle_playback_progress_batch(frame, updates: list[tuple[str, str, float]]) -> None:
+    """Apply coalesced progress reports; one scan of each playlist per batch."""
+
+    by_playlist: dict[str, dict[str, float]] = {}
+    for playlist_id, item_id, seconds in updates:
+        by_playlist.setdefault(playlist_id, {})[item_id] = seconds
+    focused_playlist_id = None
+    focused_getter = getattr(frame, "_focused_playlist_id", None)
+    if callable(focused_getter):
+        try:
+            focused_playlist_id = focused_getter()
+        except Exception:
+            focused_playlist_id = None
+    for playlist_id, positions in by_playlist.items():
+        panel = frame._playlists.get(playlist_id)
+        located: dict[str, tuple[int, PlaylistItem]] = {}
+        if panel:
+            for index, track in enumerate(panel.model.items):
+                if track.id in positions:
+                    located[track.id] = (index, track)
+        for item_id, seconds in positions.items():
+            _apply_progress(frame, panel, playlist_id, item_id, seconds, located.get(item_id), focused_playlist_id)
+
+
+def _apply_progress(
+    frame,
+    panel,
+    playlist_id: str,
+    item_id: str,
+    seconds: float,
+    located: tuple[int, PlaylistItem] | None,
+    focused_playlist_id: str | None,
+) -> None:
     context_entry = frame._playback.contexts.get((playlist_id, item_id))
     if not context_entry:
         return
@@ -117,21 +153,11 @@ def handle_playback_progress(frame, playlist_id: str, item_id: str, seconds: flo
     now_playing_writer = getattr(frame, "_now_playing_writer", None)
     if now_playing_writer:
         now_playing_writer.on_progress(playlist_id, item_id, seconds)
-    panel = frame._playlists.get(playlist_id)
-    if not panel:
-        return
-    item = next((track for track in panel.model.items if track.id == item_id), None)
-    if not item:
+    if not panel or not located:
         return
+    index, item = located
     item.update_progress(seconds)
     update_panel = True
-    focused_playlist_id = None
-    focused_getter = getattr(frame, "_focused_playlist_id", None)
-    if callable(focused_getter):
-        try:
-            focused_playlist_id = focused_getter()
-        except Exception:
-            focused_playlist_id = None
     if focused_playlist_id is not None and focused_playlist_id != playlist_id:
         update_panel = False
     if (
@@ -141,7 +167,7 @@ def handle_playback_progress(frame, playlist_id: str, item_id: str, seconds: flo
     ):
         update_panel = False
     if update_panel:
-        panel.update_progress(item_id)
+        panel.update_progress(item_id, index=index)
         frame._maybe_focus_playing_item(panel, item_id)
     frame._consider_intro_alert(panel, item, context_entry, seconds)
     frame._consider_track_end_alert(panel, item, context_entry)
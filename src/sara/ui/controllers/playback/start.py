@@ -9,6 +9,7 @@ import wx
 
 from sara.core.i18n import gettext as _
 from sara.core.playlist import PlaylistItem, PlaylistItemStatus, PlaylistKind
+from sara.core.progress_bus import ProgressBus
 from sara.ui.playlist_panel import PlaylistPanel
 
 
@@ -23,6 +24,28 @@ def _call_after_if_app(func, *args) -> None:
         func(*args)
 
 
+def _call_later_if_app(delay: float, func) -> None:
+    if wx.GetApp():
+        # wx.CallLater musi powstać w wątku UI
+        wx.CallAfter(wx.CallLater, max(1, int(delay * 1000)), func)
+    else:
+        func()
+
+
+def progress_bus(frame) -> ProgressBus:
+    """Frame-wide bus carrying player progress, mix triggers and finishes to the UI thread."""
+
+    bus = getattr(frame, "_progress_bus", None)
+    if bus is None:
+        bus = ProgressBus(
+            lambda updates: frame._handle_playback_progress_batch(updates),
+            post=_call_after_if_app,
+            post_later=_call_later_if_app,
+        )
+        frame._progress_bus = bus
+    return bus
+
+
 def _prepare_mix_schedule(
     frame,
     *,
@@ -59,7 +82,8 @@ def _prepare_mix_schedule(
         item,
         effective_duration_override=effective_override,
     )
-    on_mix_trigger: Callable[[], None] | None = lambda pl_id=playlist.id, it_id=item.id: _call_after_if_app(
+    bus = progress_bus(frame)
+    on_mix_trigger: Callable[[], None] | None = lambda pl_id=playlist.id, it_id=item.id: bus.publish_event(
         frame._auto_mix_now_from_callback, pl_id, it_id
     )
     return mix_trigger_seconds, fade_seconds, base_cue, effective_duration, on_mix_trigger
@@ -117,6 +141,8 @@ def start_playback(
         frame._announce_event("playback_errors", _("File %s does not exist") % item.path)
         return False
 
+    frame._expedite_item_hydration(playlist, item)
+
     context = frame._playback.contexts.get(key)
     logger.debug(
         "UI: start playback request playlist=%s item=%s existing_context=%s device=%s slot=%s",
@@ -145,11 +171,13 @@ def start_playback(
                 fade_seconds = frame._fade_duration
                 frame._stop_playlist_playback(playlist.id, mark_played=True, fade_duration=fade_seconds)
 
+    bus = progress_bus(frame)
+
     def _on_finished(finished_item_id: str) -> None:
-        _call_after_if_app(frame._handle_playback_finished, playlist.id, finished_item_id)
+        bus.publish_event(frame._handle_playback_finished, playlist.id, finished_item_id)
 
     def _on_progress(progress_item_id: str, seconds: float) -> None:
-        _call_after_if_app(frame._handle_playback_progress, playlist.id, progress_item_id, seconds)
+        bus.publish_progress(playlist.id, progress_item_id, seconds)
 
     start_seconds = item.cue_in_seconds or 0.0
     logger.debug("UI: invoking playback controller for item %s at %.3fs", item.id, start_seconds)
@@ -269,7 +297,11 @@ def start_playback(
         frame._announce_event("loop", _("Loop playing"))
     if frame._auto_mix_enabled and playlist.kind is PlaylistKind.MUSIC:
         try:
-            frame._playback.schedule_next_preload(playlist, current_item_id=item.id)
+            frame._prepare_upcoming_items(playlist, item.id)
         except Exception:
             pass
+    try:
+        frame._playback.schedule_next_preload(playlist, current_item_id=item.id)
+    except Exception:
+        pass
     return True
@@ -9,6 +9,7 @@ from sara.ui.controllers.playback.navigation import (
     adjust_duration_and_mix_trigger,
     derive_next_play_index,
     handle_playback_progress,
+    handle_playback_progress_batch,
     index_of_item,
     logger,
     manual_fade_duration,
@@ -20,6 +21,7 @@ __all__ = [
     "adjust_duration_and_mix_trigger",
     "derive_next_play_index",
     "handle_playback_progress",
+    "handle_playback_progress_batch",
     "index_of_item",
     "logger",
     "manual_fade_duration",
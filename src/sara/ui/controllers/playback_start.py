@@ -5,9 +5,10 @@ Implementation lives in `sara.ui.controllers.playback.start`.
 
 from __future__ import annotations
 
-from sara.ui.controllers.playback.start import start_playback
+from sara.ui.controllers.playback.start import progress_bus, start_playback
 
 __all__ = [
+    "progress_bus",
     "start_playback",
 ]
 
@@ -30,6 +30,7 @@ def serialize_items(items: list[PlaylistItem]) -> list[dict[str, Any]]:
                 "loop_end": item.loop_end_seconds,
                 "loop_auto_enabled": item.loop_auto_enabled,
                 "loop_enabled": item.loop_enabled,
+                "hydrated": item.hydrated,
             }
         )
     return serialized
@@ -56,6 +57,8 @@ def create_item_from_serialized(frame, data: dict[str, Any]) -> PlaylistItem:
         loop_auto_enabled=loop_auto_enabled,
         loop_enabled=loop_enabled,
     )
+    # kopia pozycji z importu, której tagi nie zostały jeszcze odczytane
+    item.hydrated = bool(data.get("hydrated", True))
     item_type_value = data.get("item_type") or data.get("track_type") or data.get("type")
     if item_type_value:
         try:
@@ -152,6 +152,8 @@ def finalize_clipboard_paste(
     frame._announce_event("clipboard", _("Pasted %d %s") % (count, noun))
     operation = InsertOperation(indices=list(insert_indices), items=list(items))
     frame._push_undo_action(model, operation)
+    frame._queue_copied_item_hydration(model.id, items)
+    frame._schedule_loudness_scan()
     if skipped_files:
         noun = _("file") if skipped_files == 1 else _("files")
         frame._announce_event("clipboard", _("Skipped %d unsupported %s") % (skipped_files, noun))
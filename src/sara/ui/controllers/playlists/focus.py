@@ -139,6 +139,11 @@ def on_toggle_selection(frame, playlist_id: str, item_id: str) -> None:
     item = playlist.get_item(item_id)
     if not selected and item is not None:
         frame._announce_event("selection", _("Selection removed from %s") % item.title)
+    try:
+        # kolejka się zmieniła - zaznaczone pozycje mają pierwszeństwo w preloadzie
+        frame._playback.refresh_preloads()
+    except Exception:
+        pass
 
 
 def get_current_playlist_panel(frame):
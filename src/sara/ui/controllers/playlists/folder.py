@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from pathlib import Path
+from threading import Event
 from typing import Sequence
 
 import wx
 
+from sara.core.folder_scan import FolderDiff, FolderSnapshot, apply_folder_diff, diff_snapshots, scan_folder
+from sara.core.folder_watch import FolderWatcher
 from sara.core.i18n import gettext as _
 from sara.core.playlist import PlaylistItem, PlaylistKind, PlaylistModel
+from sara.ui.controllers.playlists.item_loading import sources_from_paths
 from sara.ui.file_selection_dialog import FileSelectionDialog
 from sara.ui.folder_playlist_panel import FolderPlaylistPanel
 from sara.ui.playlist_panel import PlaylistPanel
@@ -61,24 +66,215 @@ def load_folder_playlist(frame, playlist: PlaylistModel, *, announce: bool = Tru
     if not folder_path.exists():
         frame._announce_event("playlist", _("Folder %s does not exist") % folder_path)
         return
+    previous = frame._folder_snapshots.get(playlist.id)
+    if previous is not None and previous.root != folder_path:
+        previous = None
+    cancel_event = Event()
+    if previous is None:
+        stream_folder_playlist(frame, playlist, folder_path, cancel_event=cancel_event, announce=announce)
+        return
     description = _("Loading folder %s…") % folder_path.name
     frame._run_item_loader(
         description=description,
-        worker=lambda folder=folder_path: load_folder_items(frame, folder),
-        on_complete=lambda result, playlist_id=playlist.id, folder=folder_path: finalize_folder_load(
+        worker=lambda folder=folder_path, snapshot=previous: rescan_folder_items(
+            frame,
+            folder,
+            snapshot,
+            cancel_event=cancel_event,
+        ),
+        on_complete=lambda result, playlist_id=playlist.id, folder=folder_path: finalize_folder_rescan(
             frame,
             playlist_id,
             folder,
             result,
             announce=announce,
         ),
+        cancel_event=cancel_event,
+    )
+
+
+def stream_folder_playlist(
+    frame,
+    playlist: PlaylistModel,
+    folder_path: Path,
+    *,
+    cancel_event: Event,
+    announce: bool,
+) -> None:
+    """Full folder load: items appear in chunks while the rest is still being read."""
+
+    panel = frame._playlists.get(playlist.id)
+    if not isinstance(panel, FolderPlaylistPanel):
+        return
+    stop_folder_watch(frame, playlist.id)
+    frame._folder_snapshots.pop(playlist.id, None)
+    panel.model.items = []
+    panel.model.folder_path = folder_path
+    panel.set_folder_path(folder_path)
+    panel.refresh(selected_indices=None, focus=False)
+    scanned: dict[str, FolderSnapshot] = {}
+
+    def produce():
+        snapshot = scan_folder(folder_path)
+        scanned["snapshot"] = snapshot
+        sources = sources_from_paths(snapshot.sorted_paths())
+        return frame._iter_items_from_sources(sources, cancel_event=cancel_event)
+
+    def on_chunk(items: list[PlaylistItem]) -> bool:
+        if frame._playlists.get(playlist.id) is not panel or panel.model.folder_path != folder_path:
+            return False
+        panel.append_items(items)
+        return True
+
+    def on_complete(count: int, cancelled: bool) -> None:
+        if frame._playlists.get(playlist.id) is not panel or panel.model.folder_path != folder_path:
+            return
+        snapshot = scanned.get("snapshot")
+        if cancelled or snapshot is None:
+            frame._announce_event("playlist", _("Loading cancelled after %d tracks") % count)
+            return
+        frame._folder_snapshots[playlist.id] = snapshot
+        frame._schedule_loudness_scan()
+        if announce:
+            frame._announce_event("playlist", _("Loaded %d tracks from %s") % (count, folder_path.name))
+        if snapshot.skipped:
+            noun = _("file") if snapshot.skipped == 1 else _("files")
+            frame._announce_event("playlist", _("Skipped %d unsupported %s") % (snapshot.skipped, noun))
+        ensure_folder_watch(frame, playlist.id, snapshot)
+
+    frame._stream_item_loader(
+        total=None,
+        produce=produce,
+        on_chunk=on_chunk,
+        on_complete=on_complete,
+        cancel_event=cancel_event,
+    )
+
+
+@dataclass
+class FolderRescanResult:
+    snapshot: FolderSnapshot
+    diff: FolderDiff
+    items: dict[Path, PlaylistItem]
+    incremental: bool
+
+
+def rescan_folder_items(
+    frame,
+    folder_path: Path,
+    previous: FolderSnapshot | None,
+    *,
+    cancel_event: Event | None = None,
+) -> FolderRescanResult:
+    """Scan the folder and extract metadata only for files added or changed since `previous`."""
+
+    snapshot = scan_folder(folder_path)
+    diff = diff_snapshots(previous, snapshot)
+    items = frame._create_items_from_paths(diff.paths_to_load(), cancel_event=cancel_event)
+    return FolderRescanResult(
+        snapshot=snapshot,
+        diff=diff,
+        items={item.path: item for item in items},
+        incremental=previous is not None,
+    )
+
+
+def finalize_folder_rescan(
+    frame,
+    playlist_id: str,
+    folder_path: Path,
+    result: FolderRescanResult | list,
+    *,
+    announce: bool,
+) -> None:
+    if not isinstance(result, FolderRescanResult):
+        # run_item_loader zwraca pustą listę, gdy worker rzucił wyjątkiem.
+        return
+    panel = frame._playlists.get(playlist_id)
+    if not isinstance(panel, FolderPlaylistPanel) or panel.model is None:
+        return
+    if not result.incremental or panel.model.folder_path != folder_path:
+        items = [result.items[path] for path in result.diff.paths_to_load() if path in result.items]
+        frame._folder_snapshots[playlist_id] = result.snapshot
+        finalize_folder_load(frame, playlist_id, folder_path, (items, result.snapshot.skipped), announce=announce)
+    else:
+        apply_folder_changes(frame, playlist_id, folder_path, result, announce=announce, announce_unchanged=True)
+    ensure_folder_watch(frame, playlist_id, result.snapshot)
+
+
+def apply_folder_changes(
+    frame,
+    playlist_id: str,
+    folder_path: Path,
+    result: FolderRescanResult,
+    *,
+    announce: bool,
+    announce_unchanged: bool = False,
+) -> None:
+    panel = frame._playlists.get(playlist_id)
+    if not isinstance(panel, FolderPlaylistPanel) or panel.model is None:
+        return
+    if panel.model.folder_path != folder_path:
+        return
+    frame._folder_snapshots[playlist_id] = result.snapshot
+    diff = result.diff
+    if diff.is_empty:
+        if announce and announce_unchanged:
+            frame._announce_event("playlist", _("Folder %s is up to date") % folder_path.name)
+        return
+    inserted = apply_folder_diff(panel.model, diff, result.items)
+    panel.refresh(selected_indices=None, focus=False)
+    frame._schedule_loudness_scan()
+    if announce:
+        frame._announce_event(
+            "playlist",
+            _("Folder %s updated: %d added, %d removed, %d changed")
+            % (folder_path.name, len(inserted), len(diff.removed), len(diff.changed)),
+        )
+
+
+def ensure_folder_watch(frame, playlist_id: str, snapshot: FolderSnapshot) -> None:
+    """Start (or re-baseline) the background watcher for a loaded folder playlist."""
+
+    if not frame._settings.get_folder_watch_enabled():
+        stop_folder_watch(frame, playlist_id)
+        return
+    watcher = frame._folder_watchers.get(playlist_id)
+    if watcher is not None and watcher.root == snapshot.root:
+        watcher.update_snapshot(snapshot)
+        return
+    stop_folder_watch(frame, playlist_id)
+    watcher = FolderWatcher(
+        snapshot,
+        lambda diff, observed, pid=playlist_id: handle_folder_watch_change(frame, pid, diff, observed),
+        poll_interval=frame._settings.get_folder_watch_poll_seconds(),
     )
+    frame._folder_watchers[playlist_id] = watcher
+    watcher.start()
+
+
+def stop_folder_watch(frame, playlist_id: str) -> None:
+    watcher = frame._folder_watchers.pop(playlist_id, None)
+    if watcher is not None:
+        watcher.stop()
 
 
-def load_folder_items(frame, folder_path: Path) -> tuple[list[PlaylistItem], int]:
-    file_paths, skipped = frame._collect_files_from_paths([folder_path])
-    items = frame._create_items_from_paths(file_paths)
-    return items, skipped
+def stop_all_folder_watches(frame) -> None:
+    for playlist_id in list(frame._folder_watchers):
+        stop_folder_watch(frame, playlist_id)
+
+
+def handle_folder_watch_change(frame, playlist_id: str, diff: FolderDiff, snapshot: FolderSnapshot) -> None:
+    """Runs on the watcher thread: read metadata, then patch the model on the UI thread."""
+
+    items = frame._create_items_from_paths(diff.paths_to_load())
+    result = FolderRescanResult(
+        snapshot=snapshot,
+        diff=diff,
+        items={item.path: item for item in items},
+        incremental=True,
+    )
+    wx.CallAfter(apply_folder_changes, frame, playlist_id, snapshot.root, result, announce=True)
 
 
 def finalize_folder_load(
@@ -163,6 +359,7 @@ def send_folder_items_to_music(frame, playlist_id: str, item_ids: Sequence[str])
     )
     operation = InsertOperation(indices=list(insert_indices), items=list(new_items))
     frame._push_undo_action(target_model, operation)
+    frame._queue_copied_item_hydration(target_model.id, new_items)
 
 
 def target_music_playlist(frame) -> tuple[PlaylistPanel, PlaylistModel] | None:
@@ -0,0 +1,171 @@
+"""Background metadata hydration for lazily imported playlist items."""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import Any, Iterable
+
+import wx
+
+from sara.core.metadata_hydration import (
+    HydrationJob,
+    HydrationResult,
+    MetadataHydrator,
+    apply_hydrated_metadata,
+    create_unhydrated_item,
+    placeholder_hints,
+)
+from sara.core.playlist import PlaylistItem, PlaylistItemStatus, PlaylistModel
+
+
+logger = logging.getLogger(__name__)
+
+# Ile kolejnych pozycji przesuwamy na początek kolejki po starcie utworu.
+UPCOMING_PRIORITY_COUNT = 5
+
+
+def ensure_metadata_hydrator(frame) -> MetadataHydrator:
+    hydrator = frame._metadata_hydrator
+    if hydrator is None:
+        hydrator = MetadataHydrator(lambda results: wx.CallAfter(apply_hydration_results, frame, results))
+        frame._metadata_hydrator = hydrator
+    return hydrator
+
+
+def create_lazy_items_from_m3u_entries(frame, entries: list[dict[str, Any]]) -> list[tuple[PlaylistItem, dict]]:
+    return [
+        (create_unhydrated_item(frame._playlist_factory, Path(entry["path"]), entry), entry)
+        for entry in entries
+    ]
+
+
+def queue_item_hydration(
+    frame,
+    playlist_id: str,
+    items: Iterable[tuple[PlaylistItem, dict[str, Any] | None]],
+) -> None:
+    jobs = [
+        HydrationJob(playlist_id=playlist_id, item_id=item.id, path=item.path, hints=hints)
+        for item, hints in items
+        if not item.hydrated
+    ]
+    if jobs:
+        ensure_metadata_hydrator(frame).submit(jobs)
+
+
+def queue_copied_item_hydration(frame, playlist_id: str, items: Iterable[PlaylistItem]) -> None:
+    """Queue pasted or copied placeholders, whose original jobs target other item ids."""
+
+    queue_item_hydration(frame, playlist_id, [(item, placeholder_hints(item)) for item in items if not item.hydrated])
+
+
+def apply_hydration_results(frame, results: list[HydrationResult]) -> None:
+    by_playlist: dict[str, list[HydrationResult]] = {}
+    for job, metadata in results:
+        by_playlist.setdefault(job.playlist_id, []).append((job, metadata))
+    for playlist_id, playlist_results in by_playlist.items():
+        panel = frame._playlists.get(playlist_id)
+        model = getattr(panel, "model", None)
+        if model is None:
+            continue
+        items_by_id = {item.id: item for item in model.items}
+        updated: list[str] = []
+        for job, metadata in playlist_results:
+            item = items_by_id.get(job.item_id)
+            if item is None or item.hydrated:
+                continue
+            if metadata is None:
+                # nie ponawiamy; pozycja zostaje z danymi z playlisty
+                logger.warning("Failed to read metadata from %s", job.path)
+                item.hydrated = True
+                continue
+            apply_hydrated_metadata(item, metadata, job.hints)
+            updated.append(item.id)
+            if (playlist_id, item.id) in frame._playback.contexts:
+                apply_hydration_to_playback(frame, panel, playlist_id, item)
+        update_items = getattr(panel, "update_items_display", None)
+        if updated and callable(update_items):
+            update_items(updated)
+    frame._schedule_loudness_scan()
+
+
+def apply_hydration_to_playback(frame, panel, playlist_id: str, item: PlaylistItem) -> None:
+    """Hand tags read after the item started to its running player.
+
+    The start position stays as it was; ReplayGain, the loop and the mix
+    trigger follow the hydrated values.
+    """
+
+    context = frame._playback.contexts.get((playlist_id, item.id))
+    if context is None:
+        return
+    try:
+        context.player.set_gain_db(item.replay_gain_db)
+    except Exception as exc:  # pylint: disable=broad-except
+        logger.debug("Failed to apply hydrated ReplayGain to playback: %s", exc)
+    frame._apply_loop_setting_to_playback(playlist_id=playlist_id, item_id=item.id)
+    frame._apply_mix_trigger_to_playback(playlist_id=playlist_id, item=item, panel=panel)
+
+
+def expedite_item_hydration(frame, playlist: PlaylistModel, item: PlaylistItem) -> bool:
+    """Move an item that is about to be used to the front of the hydration queue.
+
+    The queued job keeps its M3U hints. Returns True when the item already has
+    its full metadata.
+    """
+
+    if item.hydrated:
+        return True
+    job = HydrationJob(playlist_id=playlist.id, item_id=item.id, path=item.path)
+    ensure_metadata_hydrator(frame).expedite(job)
+    return False
+
+
+def upcoming_item_ids(playlist: PlaylistModel, current_item_id: str | None, *, limit: int) -> list[str]:
+    """Ids of the items playback is likely to reach next, nearest first."""
+
+    upcoming: list[str] = []
+    selected_id = playlist.next_selected_item_id()
+    if selected_id and selected_id != current_item_id:
+        upcoming.append(selected_id)
+    items = playlist.items
+    total = len(items)
+    start_index = playlist.index_of(current_item_id) if current_item_id else -1
+    for offset in range(1, total + 1):
+        if len(upcoming) >= limit:
+            break
+        candidate = items[(start_index + offset) % total]
+        if candidate.id == current_item_id or candidate.id in upcoming:
+            continue
+        if candidate.status in (PlaylistItemStatus.PENDING, PlaylistItemStatus.PAUSED):
+            upcoming.append(candidate.id)
+    return upcoming[:limit]
+
+
+def prepare_upcoming_items(frame, playlist: PlaylistModel, current_item_id: str | None) -> None:
+    """Move the next preload candidates to the front of the hydration and loudness queues.
+
+    Background loudness analysis also backs off while the track is starting.
+    """
+
+    upcoming = upcoming_item_ids(playlist, current_item_id, limit=UPCOMING_PRIORITY_COUNT)
+    frame._prioritise_loudness_scan(playlist.id, upcoming)
+    if not upcoming:
+        return
+    hydrator = frame._metadata_hydrator
+    if hydrator is not None:
+        hydrator.prioritise(playlist.id, upcoming)
+
+
+def discard_playlist_hydration(frame, playlist_id: str) -> None:
+    hydrator = frame._metadata_hydrator
+    if hydrator is not None:
+        hydrator.discard_playlist(playlist_id)
+
+
+def stop_metadata_hydrator(frame) -> None:
+    hydrator = frame._metadata_hydrator
+    frame._metadata_hydrator = None
+    if hydrator is not None:
+        hydrator.stop()
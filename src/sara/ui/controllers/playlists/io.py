@@ -3,13 +3,15 @@
 from __future__ import annotations
 
 from pathlib import Path
+from threading import Event
 from typing import Any
 
 import wx
 
 from sara.core.i18n import gettext as _
 from sara.core.m3u import parse_m3u_lines, serialize_m3u
-from sara.core.playlist import PlaylistKind
+from sara.core.playlist import PlaylistItem, PlaylistKind
+from sara.ui.controllers.playlists.item_loading import sources_from_m3u_entries
 from sara.ui.file_selection_dialog import FileSelectionDialog
 from sara.ui.news_playlist_panel import NewsPlaylistPanel
 from sara.ui.playlist_panel import PlaylistPanel
@@ -68,13 +70,59 @@ def on_import_playlist(frame, _event: wx.CommandEvent) -> None:
         frame._announce_event("import_export", _("Playlist file is empty"))
         return
 
-    description = _("Importing tracks from %s…") % path.name
-    frame._run_item_loader(
-        description=description,
-        worker=lambda entries=entries: frame._create_items_from_m3u_entries(entries),
-        on_complete=lambda items, panel=panel, filename=path.name: frame._finalize_import_playlist(
-            panel, items, filename
+    if frame._settings.get_metadata_lazy_import():
+        import_playlist_lazily(frame, panel, entries, path.name)
+        return
+
+    frame._announce_event("import_export", _("Importing tracks from %s…") % path.name)
+    cancel_event = Event()
+    sources = sources_from_m3u_entries(entries)
+    frame._stream_item_loader(
+        total=len(sources),
+        produce=lambda: frame._iter_items_from_sources(sources, cancel_event=cancel_event),
+        on_chunk=lambda items, panel=panel: append_imported_items(frame, panel, items),
+        on_complete=lambda count, cancelled, panel=panel, filename=path.name: complete_import_playlist(
+            frame,
+            panel,
+            count,
+            filename,
+            cancelled=cancelled,
         ),
+        cancel_event=cancel_event,
+    )
+
+
+def import_playlist_lazily(frame, panel: PlaylistPanel, entries: list[dict[str, Any]], filename: str) -> None:
+    """Show entries at once using the M3U hints; full metadata is read in the background."""
+
+    pairs = frame._create_lazy_items_from_m3u_entries(entries)
+    panel.append_items([item for item, _entry in pairs])
+    frame._queue_item_hydration(panel.model.id, pairs)
+    complete_import_playlist(frame, panel, len(pairs), filename, cancelled=False)
+
+
+def append_imported_items(frame, panel: PlaylistPanel, items: list[PlaylistItem]) -> bool:
+    playlist_id = panel.model.id
+    if playlist_id not in frame._playlists or frame._playlists.get(playlist_id) is not panel:
+        return False
+    panel.append_items(items)
+    return True
+
+
+def complete_import_playlist(frame, panel: PlaylistPanel, count: int, filename: str, *, cancelled: bool) -> None:
+    playlist_id = panel.model.id
+    if playlist_id not in frame._playlists or frame._playlists.get(playlist_id) is not panel:
+        return
+    if not count:
+        frame._announce_event("import_export", _("Playlist file did not contain supported tracks"))
+        return
+    frame._schedule_loudness_scan()
+    if cancelled:
+        frame._announce_event("import_export", _("Import cancelled after %d items") % count)
+        return
+    frame._announce_event(
+        "import_export",
+        _("Imported %d items from %s") % (count, filename),
     )
 
 
@@ -4,18 +4,26 @@ from __future__ import annotations
 
 import logging
 import os
+import time
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from threading import Thread
-from typing import Any, Callable
+from threading import Event, Thread
+from typing import Any, Callable, Iterable, Iterator
 
 import wx
 
+from sara.core.i18n import gettext as _
 from sara.core.media_metadata import AudioMetadata, extract_metadata, is_supported_audio_file
+from sara.core.media_metadata.batch import MIN_PROCESS_BATCH, iter_extract_metadata_batch
+from sara.core.playlist import PlaylistItem
 
 
 logger = logging.getLogger(__name__)
 
+STREAM_CHUNK_SIZE = 200
+STREAM_CHUNK_INTERVAL = 0.25
+STREAM_ANNOUNCE_INTERVAL = 5.0
+
 
 def collect_files_from_paths(paths: list[Path]) -> tuple[list[Path], int]:
     files: list[Path] = []
@@ -78,22 +86,15 @@ def build_playlist_item(
     )
 
 
-def load_playlist_item(frame, path: Path, entry: dict[str, Any] | None = None):
-    if not path.exists():
-        logger.warning("Playlist entry %s does not exist", path)
-        return None
-    try:
-        metadata: AudioMetadata = extract_metadata(path)
-    except Exception as exc:  # pylint: disable=broad-except
-        if entry is None:
-            logger.warning("Failed to read metadata from %s: %s", path, exc)
-            return None
-        logger.warning("Using fallback metadata for %s: %s", path, exc)
-        metadata = AudioMetadata(
-            title=entry.get("title") or path.stem,
-            duration_seconds=float(entry.get("duration") or 0.0),
-            artist=entry.get("artist"),
-        )
+def fallback_metadata(path: Path, entry: dict[str, Any]) -> AudioMetadata:
+    return AudioMetadata(
+        title=entry.get("title") or path.stem,
+        duration_seconds=float(entry.get("duration") or 0.0),
+        artist=entry.get("artist"),
+    )
+
+
+def build_item_for_source(frame, path: Path, entry: dict[str, Any] | None, metadata: AudioMetadata):
     override_title = entry.get("title") if entry else None
     override_artist = entry.get("artist") if entry else None
     override_duration = None
@@ -111,30 +112,120 @@ def load_playlist_item(frame, path: Path, entry: dict[str, Any] | None = None):
     )
 
 
-def load_items_from_sources(frame, sources: list[tuple[Path, dict[str, Any] | None]]):
+def load_playlist_item(frame, path: Path, entry: dict[str, Any] | None = None):
+    if not path.exists():
+        logger.warning("Playlist entry %s does not exist", path)
+        return None
+    try:
+        metadata: AudioMetadata = extract_metadata(path)
+    except Exception as exc:  # pylint: disable=broad-except
+        if entry is None:
+            logger.warning("Failed to read metadata from %s: %s", path, exc)
+            return None
+        logger.warning("Using fallback metadata for %s: %s", path, exc)
+        metadata = fallback_metadata(path, entry)
+    return build_item_for_source(frame, path, entry, metadata)
+
+
+def use_metadata_process_pool(frame, total: int) -> bool:
+    settings = getattr(frame, "_settings", None)
+    if settings is None or total < MIN_PROCESS_BATCH:
+        return False
+    return bool(settings.get_metadata_process_pool())
+
+
+def iter_items_with_process_pool(
+    frame,
+    sources: list[tuple[Path, dict[str, Any] | None]],
+    *,
+    cancel_event: Event | None = None,
+) -> Iterator[PlaylistItem]:
+    existing = []
+    for path, entry in sources:
+        if path.exists():
+            existing.append((path, entry))
+        else:
+            logger.warning("Playlist entry %s does not exist", path)
+    for index, metadata in iter_extract_metadata_batch(
+        [path for path, _entry in existing],
+        workers=frame._settings.get_metadata_process_workers(),
+        cancel_event=cancel_event,
+    ):
+        path, entry = existing[index]
+        if metadata is None:
+            if entry is None:
+                logger.warning("Failed to read metadata from %s", path)
+                continue
+            metadata = fallback_metadata(path, entry)
+        yield build_item_for_source(frame, path, entry, metadata)
+
+
+def iter_items_from_sources(
+    frame,
+    sources: list[tuple[Path, dict[str, Any] | None]],
+    *,
+    cancel_event: Event | None = None,
+) -> Iterator[PlaylistItem]:
+    """Yield playlist items in source order as soon as their metadata is ready."""
+
     if not sources:
-        return []
+        return
+    if use_metadata_process_pool(frame, len(sources)):
+        yield from iter_items_with_process_pool(frame, sources, cancel_event=cancel_event)
+        return
+
+    def _load(path: Path, entry: dict[str, Any] | None):
+        if cancel_event is not None and cancel_event.is_set():
+            return None
+        return frame._load_playlist_item(path, entry)
+
     worker_count = frame._metadata_worker_count(len(sources))
     if worker_count <= 1:
-        items = [frame._load_playlist_item(path, entry) for path, entry in sources]
-    else:
-        paths, entries = zip(*sources)
-        with ThreadPoolExecutor(max_workers=worker_count) as executor:
-            items = list(executor.map(frame._load_playlist_item, paths, entries))
-    return [item for item in items if item is not None]
+        for path, entry in sources:
+            item = _load(path, entry)
+            if item is not None:
+                yield item
+        return
+    paths, entries = zip(*sources)
+    with ThreadPoolExecutor(max_workers=worker_count) as executor:
+        for item in executor.map(_load, paths, entries):
+            if item is not None:
+                yield item
 
 
-def create_items_from_paths(frame, file_paths: list[Path]):
-    sources = [(path, None) for path in file_paths]
-    return frame._load_items_from_sources(sources)
+def load_items_from_sources(
+    frame,
+    sources: list[tuple[Path, dict[str, Any] | None]],
+    *,
+    cancel_event: Event | None = None,
+):
+    return list(iter_items_from_sources(frame, sources, cancel_event=cancel_event))
+
+
+def sources_from_paths(file_paths: list[Path]) -> list[tuple[Path, dict[str, Any] | None]]:
+    return [(path, None) for path in file_paths]
+
+
+def sources_from_m3u_entries(entries: list[dict[str, Any]]) -> list[tuple[Path, dict[str, Any] | None]]:
+    return [(Path(entry["path"]), entry) for entry in entries]
+
+
+def create_items_from_paths(frame, file_paths: list[Path], *, cancel_event: Event | None = None):
+    return frame._load_items_from_sources(sources_from_paths(file_paths), cancel_event=cancel_event)
+
+
+def create_items_from_m3u_entries(
+    frame,
+    entries: list[dict[str, Any]],
+    *,
+    cancel_event: Event | None = None,
+):
+    return frame._load_items_from_sources(sources_from_m3u_entries(entries), cancel_event=cancel_event)
 
 
-def create_items_from_m3u_entries(frame, entries: list[dict[str, Any]]):
-    sources: list[tuple[Path, dict[str, Any] | None]] = []
-    for entry in entries:
-        audio_path = Path(entry["path"])
-        sources.append((audio_path, entry))
-    return frame._load_items_from_sources(sources)
+def cancel_item_loaders(frame) -> None:
+    for cancel_event in list(getattr(frame, "_item_loader_cancel_events", ())):
+        cancel_event.set()
 
 
 def run_item_loader(
@@ -143,9 +234,12 @@ def run_item_loader(
     description: str,
     worker: Callable[[], Any],
     on_complete: Callable[[Any], None],
+    cancel_event: Event | None = None,
 ) -> None:
     busy = wx.BusyInfo(description, parent=frame)
     holder: dict[str, wx.BusyInfo | None] = {"busy": busy}
+    if cancel_event is not None:
+        frame._item_loader_cancel_events.add(cancel_event)
 
     def task() -> None:
         try:
@@ -158,8 +252,80 @@ def run_item_loader(
             busy_obj = holder.pop("busy", None)
             if busy_obj is not None:
                 del busy_obj
+            if cancel_event is not None:
+                frame._item_loader_cancel_events.discard(cancel_event)
+                if cancel_event.is_set():
+                    return
             on_complete(result)
 
         wx.CallAfter(finish)
 
     Thread(target=task, daemon=True).start()
+
+
+def stream_item_loader(
+    frame,
+    *,
+    total: int | None,
+    produce: Callable[[], Iterable[Any]],
+    on_chunk: Callable[[list[Any]], bool | None],
+    on_complete: Callable[[int, bool], None],
+    cancel_event: Event | None = None,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+    chunk_interval: float = STREAM_CHUNK_INTERVAL,
+) -> Event:
+    """Load items in the background and hand them to the UI in ordered chunks.
+
+    A chunk is flushed every `chunk_size` items or `chunk_interval` seconds,
+    whichever comes first. `on_chunk` runs on the UI thread and may return
+    False to cancel the load (e.g. when the target playlist was removed).
+    `on_complete(delivered_count, cancelled)` runs once at the end.
+    """
+
+    cancel_event = cancel_event or Event()
+    frame._item_loader_cancel_events.add(cancel_event)
+    progress = {"delivered": 0, "announced": 0.0}
+
+    def deliver(chunk: list[Any]) -> None:
+        if cancel_event.is_set():
+            return
+        if on_chunk(chunk) is False:
+            cancel_event.set()
+            return
+        progress["delivered"] += len(chunk)
+        delivered = progress["delivered"]
+        if total is None:
+            message = _("Loaded %d tracks") % delivered
+        else:
+            message = _("Loaded %d of %d tracks") % (delivered, total)
+        frame.SetStatusText(message)
+        now = time.monotonic()
+        if (total is None or delivered < total) and now - progress["announced"] >= STREAM_ANNOUNCE_INTERVAL:
+            progress["announced"] = now
+            frame._announce_event("playlist", message)
+
+    def finish() -> None:
+        frame._item_loader_cancel_events.discard(cancel_event)
+        on_complete(progress["delivered"], cancel_event.is_set())
+
+    def task() -> None:
+        chunk: list[Any] = []
+        last_flush = time.monotonic()
+        try:
+            for item in produce():
+                if cancel_event.is_set():
+                    break
+                chunk.append(item)
+                if len(chunk) >= chunk_size or time.monotonic() - last_flush >= chunk_interval:
+                    wx.CallAfter(deliver, chunk)
+                    chunk = []
+                    last_flush = time.monotonic()
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.exception("Failed to load playlist items: %s", exc)
+        if chunk and not cancel_event.is_set():
+            wx.CallAfter(deliver, chunk)
+        wx.CallAfter(finish)
+
+    progress["announced"] = time.monotonic()
+    Thread(target=task, name="sara-item-loader", daemon=True).start()
+    return cancel_event
@@ -0,0 +1,123 @@
+"""Background ReplayGain measurement for items in open playlists."""
+
+from __future__ import annotations
+
+import logging
+from typing import Iterator
+
+import wx
+
+from sara.core.loudness import LoudnessStandard
+from sara.core.loudness_scan import LoudnessScanJob, LoudnessScanner, LoudnessScanResult
+from sara.core.playlist import PlaylistItem, PlaylistKind, PlaylistModel
+
+
+logger = logging.getLogger(__name__)
+
+# Odczekaj chwilę po zmianach playlist, żeby zebrać je w jedno przejście.
+SCAN_DEBOUNCE_MS = 2000
+# Tyle sekund skaner nie dotyka dysku po starcie utworu (otwarcie pliku, bufor, preload).
+PLAYBACK_START_HOLD_SECONDS = 8.0
+_SCANNED_KINDS = (PlaylistKind.MUSIC, PlaylistKind.FOLDER)
+
+
+def ensure_loudness_scanner(frame) -> LoudnessScanner | None:
+    settings = frame._settings
+    if not settings.get_loudness_background_scan():
+        return None
+    scanner = frame._loudness_scanner
+    if scanner is None:
+        scanner = LoudnessScanner(
+            lambda result: wx.CallAfter(apply_loudness_result, frame, result),
+            standard=LoudnessStandard(settings.get_loudness_standard()),
+            write_tags=settings.get_loudness_write_tags(),
+            tag_writer=frame._ensure_tag_writer(),
+        )
+        frame._loudness_scanner = scanner
+    return scanner
+
+
+def iter_items_from_cursor(frame, playlist: PlaylistModel) -> Iterator[PlaylistItem]:
+    """Items in play order starting after the last started one, wrapping around."""
+
+    items = playlist.items
+    last_id = frame._last_started_item_id.get(playlist.id)
+    start = playlist.index_of(last_id) + 1 if last_id else 0
+    for offset in range(len(items)):
+        yield items[(start + offset) % len(items)]
+
+
+def queue_missing_loudness(frame) -> int:
+    """Queue every hydrated item without ReplayGain in the open playlists."""
+
+    frame._loudness_scan_call = None
+    scanner = ensure_loudness_scanner(frame)
+    if scanner is None:
+        return 0
+    jobs: list[LoudnessScanJob] = []
+    for playlist_id, panel in list(frame._playlists.items()):
+        model = getattr(panel, "model", None)
+        if model is None or model.kind not in _SCANNED_KINDS:
+            continue
+        for item in iter_items_from_cursor(frame, model):
+            if item.replay_gain_db is not None or not item.hydrated:
+                continue
+            known, gain = scanner.measured_gain(item.path)
+            if known:
+                item.replay_gain_db = gain
+                continue
+            jobs.append(LoudnessScanJob(playlist_id=playlist_id, item_id=item.id, path=item.path))
+    return scanner.submit(jobs)
+
+
+def schedule_loudness_scan(frame) -> None:
+    """Collect items lacking gain shortly after playlists changed."""
+
+    if not frame._settings.get_loudness_background_scan():
+        return
+    if frame._loudness_scan_call is not None:
+        return
+    frame._loudness_scan_call = wx.CallLater(SCAN_DEBOUNCE_MS, queue_missing_loudness, frame)
+
+
+def prioritise_loudness_scan(frame, playlist_id: str, item_ids: list[str]) -> None:
+    scanner = frame._loudness_scanner
+    if scanner is None:
+        return
+    scanner.hold(PLAYBACK_START_HOLD_SECONDS)
+    scanner.prioritise(playlist_id, item_ids)
+
+
+def apply_loudness_result(frame, result: LoudnessScanResult) -> None:
+    if result.gain_db is None:
+        if result.error:
+            logger.info("Loudness not measured for %s: %s", result.job.path, result.error)
+        return
+    updated = 0
+    for panel in list(frame._playlists.values()):
+        model = getattr(panel, "model", None)
+        if model is None or model.kind not in _SCANNED_KINDS:
+            continue
+        for item in model.items:
+            if item.path == result.job.path and item.replay_gain_db is None:
+                item.replay_gain_db = result.gain_db
+                updated += 1
+    if updated:
+        logger.debug("Measured %s: ReplayGain %+.2f dB (%d items)", result.job.path, result.gain_db, updated)
+
+
+def discard_playlist_loudness_scan(frame, playlist_id: str) -> None:
+    scanner = frame._loudness_scanner
+    if scanner is not None:
+        scanner.discard_playlist(playlist_id)
+
+
+def stop_loudness_scanner(frame) -> None:
+    call = frame._loudness_scan_call
+    frame._loudness_scan_call = None
+    if call is not None:
+        call.Stop()
+    scanner = frame._loudness_scanner
+    frame._loudness_scanner = None
+    if scanner is not None:
+        scanner.stop()
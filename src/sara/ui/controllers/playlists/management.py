@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 from pathlib import Path
+from threading import Event
 from typing import Any
 
 import wx
 
 from sara.core.i18n import gettext as _
 from sara.core.playlist import PlaylistItem, PlaylistKind, PlaylistModel
+from sara.ui.controllers.playlists.item_loading import sources_from_paths
 from sara.ui.dialogs.manage_playlists_dialog import ManagePlaylistsDialog
 from sara.ui.file_selection_dialog import FileSelectionDialog
 from sara.ui.new_playlist_dialog import NewPlaylistDialog
@@ -62,25 +64,42 @@ def on_add_tracks(frame, _event: wx.CommandEvent) -> None:
         frame._announce_event("playlist", _("No tracks were added"))
         return
 
-    description = _("Loading %d selected tracks…") % len(paths)
-    frame._run_item_loader(
-        description=description,
-        worker=lambda paths=paths: frame._create_items_from_paths(paths),
-        on_complete=lambda items, panel=panel: frame._finalize_add_tracks(panel, items),
+    frame._announce_event("playlist", _("Loading %d selected tracks…") % len(paths))
+    cancel_event = Event()
+    sources = sources_from_paths(paths)
+    frame._stream_item_loader(
+        total=len(sources),
+        produce=lambda: frame._iter_items_from_sources(sources, cancel_event=cancel_event),
+        on_chunk=lambda items, panel=panel: frame._append_loaded_tracks(panel, items),
+        on_complete=lambda count, cancelled, panel=panel: frame._complete_add_tracks(panel, count, cancelled),
+        cancel_event=cancel_event,
     )
 
 
-def finalize_add_tracks(frame, panel: PlaylistPanel, new_items: list[PlaylistItem]) -> None:
+def append_loaded_tracks(frame, panel: PlaylistPanel, new_items: list[PlaylistItem]) -> bool:
+    """Append one streamed chunk; returns False when the target playlist is gone."""
+
+    playlist_id = panel.model.id
+    if playlist_id not in frame._playlists or frame._playlists.get(playlist_id) is not panel:
+        return False
+    panel.append_items(new_items)
+    return True
+
+
+def complete_add_tracks(frame, panel: PlaylistPanel, count: int, cancelled: bool) -> None:
     playlist_id = panel.model.id
     if playlist_id not in frame._playlists or frame._playlists.get(playlist_id) is not panel:
         return
-    if not new_items:
+    if not count:
         frame._announce_event("playlist", _("No tracks were added"))
         return
-    panel.append_items(new_items)
+    frame._schedule_loudness_scan()
+    if cancelled:
+        frame._announce_event("playlist", _("Loading cancelled after %d tracks") % count)
+        return
     frame._announce_event(
         "playlist",
-        _("Added %d tracks to playlist %s") % (len(new_items), panel.model.name),
+        _("Added %d tracks to playlist %s") % (count, panel.model.name),
     )
 
 
@@ -97,6 +97,7 @@ def add_playlist(frame, model: PlaylistModel) -> None:
     if model.id not in frame._state.playlists:
         frame._state.add_playlist(model)
     frame._update_active_playlist_styles()
+    frame._schedule_loudness_scan()
     frame._announce_event("playlist", _("Playlist %s added") % model.name)
 
 
@@ -134,6 +135,10 @@ def remove_playlist_by_id(frame, playlist_id: str, *, announce: bool = True) ->
     frame._playlist_container.FitInside()
     frame._playback.clear_playlist_entries(playlist_id)
     frame._last_started_item_id.pop(playlist_id, None)
+    frame._folder_snapshots.pop(playlist_id, None)
+    frame._stop_folder_watch(playlist_id)
+    frame._discard_playlist_hydration(playlist_id)
+    frame._discard_playlist_loudness_scan(playlist_id)
     if frame._active_folder_preview and frame._active_folder_preview[0] == playlist_id:
         frame._stop_preview()
     if frame._last_music_playlist_id == playlist_id:
@@ -6,8 +6,9 @@ Implementation lives in `sara.ui.controllers.playlists.management`.
 from __future__ import annotations
 
 from sara.ui.controllers.playlists.management import (
+    append_loaded_tracks,
+    complete_add_tracks,
     configure_playlist_devices,
-    finalize_add_tracks,
     on_add_tracks,
     on_assign_device,
     on_manage_playlists,
@@ -16,8 +17,9 @@ from sara.ui.controllers.playlists.management import (
 )
 
 __all__ = [
+    "append_loaded_tracks",
+    "complete_add_tracks",
     "configure_playlist_devices",
-    "finalize_add_tracks",
     "on_add_tracks",
     "on_assign_device",
     "on_manage_playlists",
@@ -7,7 +7,7 @@ import logging
 import wx
 
 from sara.core.i18n import gettext as _
-from sara.core.loudness import LoudnessStandard, find_bs1770gain
+from sara.core.loudness import LoudnessStandard, loudness_analyzer_available
 from .loudness import compute_normalization_gain
 from sara.ui.speech import speak_text
 
@@ -33,7 +33,7 @@ class MixPointLoudnessMixin:
     def _handle_normalize(self, _event: wx.CommandEvent) -> None:
         if self._normalizing:
             return
-        if find_bs1770gain() is None:
+        if not loudness_analyzer_available():
             wx.MessageBox(
                 _("bs1770gain is not available. Install it and ensure it is on PATH."),
                 _("Error"),
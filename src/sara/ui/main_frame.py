@@ -8,7 +8,6 @@ from sara.core.app_state import AppState
 from sara.core.config import SettingsManager
 from sara.core.i18n import gettext as _
 from sara.core.hotkeys import HotkeyAction
-from sara.core.media_metadata import save_replay_gain_metadata
 from sara.core.mix_planner import (
     clear_mix_plan as _clear_mix_plan_impl,
     mark_mix_triggered as _mark_mix_triggered_impl,
@@ -33,6 +32,7 @@ from sara.ui.controllers import mix_points_controller as _mix_points_controller
 from sara.ui.controllers import news_audio as _news_audio
 from sara.ui.controllers import playback_flow as _playback_flow
 from sara.ui.controllers import playback_navigation as _playback_navigation
+from sara.ui.controllers import playback_start as _playback_start
 from sara.ui.controllers import playback_state as _playback_state
 from sara.ui.controllers import playlist_focus as _playlist_focus
 from sara.ui.controllers import playlist_hotkeys as _playlist_hotkeys
@@ -77,6 +77,8 @@ class MainFrame(wx.Frame):
     _handle_folder_preview = _folder_playlists.handle_folder_preview
     _stop_preview = _folder_playlists.stop_preview
     _send_folder_items_to_music = _folder_playlists.send_folder_items_to_music
+    _stop_folder_watch = _folder_playlists.stop_folder_watch
+    _stop_all_folder_watches = _folder_playlists.stop_all_folder_watches
 
     _refresh_news_panels = _playlist_focus.refresh_news_panels
     _active_news_panel = _playlist_focus.active_news_panel
@@ -96,7 +98,8 @@ class MainFrame(wx.Frame):
     _get_selected_items = _playlist_selection.get_selected_items
 
     _configure_playlist_devices = _playlists_management.configure_playlist_devices
-    _finalize_add_tracks = _playlists_management.finalize_add_tracks
+    _append_loaded_tracks = _playlists_management.append_loaded_tracks
+    _complete_add_tracks = _playlists_management.complete_add_tracks
     _on_add_tracks = _playlists_management.on_add_tracks
     _on_assign_device = _playlists_management.on_assign_device
     _on_manage_playlists = _playlists_management.on_manage_playlists
@@ -118,6 +121,10 @@ class MainFrame(wx.Frame):
 
     _on_mix_points_configure = _mix_points_controller.on_mix_points_configure
     _propagate_mix_points_for_path = _mix_points_controller.propagate_mix_points_for_path
+    _on_detect_mix_points = _mix_points_controller.on_detect_mix_points
+    _ensure_tag_writer = _frame_bootstrap.ensure_tag_writer
+    _stop_tag_writer = _frame_bootstrap.stop_tag_writer
+    _cancel_mix_detection = _mix_points_controller.cancel_mix_detection
 
     _adjust_duration_and_mix_trigger = _playback_navigation.adjust_duration_and_mix_trigger
     _derive_next_play_index = _playback_navigation.derive_next_play_index
@@ -125,6 +132,7 @@ class MainFrame(wx.Frame):
     _play_next_alternate = _playback_navigation.play_next_alternate
     _on_global_play_next = _playback_navigation.on_global_play_next
     _handle_playback_progress = _playback_navigation.handle_playback_progress
+    _handle_playback_progress_batch = _playback_navigation.handle_playback_progress_batch
     _manual_fade_duration = _playback_navigation.manual_fade_duration
 
     _handle_playback_finished = _playback_flow.handle_playback_finished
@@ -186,6 +194,20 @@ class MainFrame(wx.Frame):
     _load_playlist_item = _item_loading.load_playlist_item
     _metadata_worker_count = staticmethod(_item_loading.metadata_worker_count)
     _run_item_loader = _item_loading.run_item_loader
+    _cancel_item_loaders = _item_loading.cancel_item_loaders
+    _iter_items_from_sources = _item_loading.iter_items_from_sources
+    _stream_item_loader = _item_loading.stream_item_loader
+    _create_lazy_items_from_m3u_entries = _item_loading.create_lazy_items_from_m3u_entries
+    _queue_item_hydration = _item_loading.queue_item_hydration
+    _queue_copied_item_hydration = _item_loading.queue_copied_item_hydration
+    _expedite_item_hydration = _item_loading.expedite_item_hydration
+    _prepare_upcoming_items = _item_loading.prepare_upcoming_items
+    _discard_playlist_hydration = _item_loading.discard_playlist_hydration
+    _stop_metadata_hydrator = _item_loading.stop_metadata_hydrator
+    _schedule_loudness_scan = _item_loading.schedule_loudness_scan
+    _prioritise_loudness_scan = _item_loading.prioritise_loudness_scan
+    _discard_playlist_loudness_scan = _item_loading.discard_playlist_loudness_scan
+    _stop_loudness_scanner = _item_loading.stop_loudness_scanner
 
     _measure_effective_duration = _mix_preview.measure_effective_duration
     _preview_mix_with_next = _mix_preview.preview_mix_with_next
@@ -270,6 +292,15 @@ class MainFrame(wx.Frame):
             self._jingles.stop_all()
         except Exception:
             pass
+        try:
+            self._stop_all_folder_watches()
+            self._cancel_item_loaders()
+            self._stop_metadata_hydrator()
+            self._stop_loudness_scanner()
+            self._cancel_mix_detection()
+            self._stop_tag_writer()
+        except Exception:
+            pass
         event.Skip()
 
     def _on_toggle_auto_mix(self, event: wx.CommandEvent) -> None:
@@ -277,10 +308,14 @@ class MainFrame(wx.Frame):
 
     def _apply_replay_gain(self, item: PlaylistItem, gain_db: float | None) -> None:
         item.replay_gain_db = gain_db
-        if not save_replay_gain_metadata(item.path, gain_db):
-            self._announce_event("pfl", _("Failed to update ReplayGain metadata"))
-        else:
-            self._announce_event("pfl", _("Updated ReplayGain for %s") % item.title)
+        title = item.title
+
+        def _on_done(written: bool) -> None:
+            # błąd zapisu ogłasza report_tag_write_failure
+            if written:
+                wx.CallAfter(self._announce_event, "pfl", _("Updated ReplayGain for %s") % title)
+
+        self._ensure_tag_writer().submit_replay_gain(item.path, gain_db, on_done=_on_done)
 
 
     def _apply_mix_trigger_to_playback(self, *, playlist_id: str, item: PlaylistItem, panel: PlaylistPanel) -> None:
@@ -289,7 +324,7 @@ class MainFrame(wx.Frame):
             playlist_id=playlist_id,
             item=item,
             panel=panel,
-            call_after=wx.CallAfter,
+            call_after=_playback_start.progress_bus(self).publish_event,
         )
 
     def _get_audio_panel(self, kinds: tuple[PlaylistKind, ...]) -> PlaylistPanel | None:
@@ -310,23 +345,6 @@ class MainFrame(wx.Frame):
         panel.focus_list()
 
 
-    def _finalize_import_playlist(self, panel: PlaylistPanel, new_items: list[PlaylistItem], filename: str) -> None:
-        playlist_id = panel.model.id
-        if playlist_id not in self._playlists or self._playlists.get(playlist_id) is not panel:
-            return
-        if not new_items:
-            self._announce_event("import_export", _("Playlist file did not contain supported tracks"))
-            return
-        panel.model.add_items(new_items)
-        panel.refresh()
-        self._announce_event(
-            "import_export",
-            _("Imported %d items from %s") % (len(new_items), filename),
-        )
-
-
-
-
     def _forget_last_started_item(self, playlist_id: str, item_id: str) -> None:
         if self._last_started_item_id.get(playlist_id) == item_id:
             self._last_started_item_id[playlist_id] = None
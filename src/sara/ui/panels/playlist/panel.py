@@ -137,6 +137,17 @@ class PlaylistPanel(wx.Panel):
                 self._list_ctrl.SetItem(index, 3, self._progress_display(item))
                 break
 
+    def update_items_display(self, item_ids: list[str]) -> None:
+        pending = set(item_ids)
+        for index, item in enumerate(self.model.items):
+            if not pending:
+                break
+            if item.id not in pending:
+                continue
+            pending.discard(item.id)
+            self._list_ctrl.SetItem(index, 0, self._display_title(item))
+            self._list_ctrl.SetItem(index, 1, self._duration_display(item))
+
     def append_items(self, items: list[PlaylistItem]) -> None:
         self.model.add_items(items)
         current_count = self._list_ctrl.GetItemCount()
@@ -148,8 +159,13 @@ class PlaylistPanel(wx.Panel):
             self._list_ctrl.SetItem(index, 3, self._progress_display(item))
             current_count += 1
 
-    def update_progress(self, item_id: str) -> None:
-        for index, item in enumerate(self.model.items):
+    def update_progress(self, item_id: str, *, index: int | None = None) -> None:
+        items = self.model.items
+        if index is not None and 0 <= index < len(items) and items[index].id == item_id:
+            candidates = ((index, items[index]),)
+        else:
+            candidates = enumerate(items)
+        for index, item in candidates:
             if item.id == item_id:
                 progress_text = self._progress_display(item)
                 try:
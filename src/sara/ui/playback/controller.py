@@ -7,16 +7,24 @@ import os
 import threading
 import time
 from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import replace
 from pathlib import Path
-from typing import Callable, Dict, TYPE_CHECKING
+from typing import Callable, Dict, Iterable, TYPE_CHECKING
 
 from sara.audio.engine import AudioDevice, AudioEngine, Player
 from sara.core.config import SettingsManager
+from sara.core.env import preload_max_bytes, preload_max_streams, preload_memory_max_bytes
 from sara.core.file_prefetch import warm_file
-from sara.core.playlist import PlaylistItem, PlaylistItemStatus, PlaylistModel
+from sara.core.playlist import PlaylistItem, PlaylistItemStatus, PlaylistKind, PlaylistModel
 from sara.ui.playback.context import PlaybackContext
 from sara.ui.playback.device_selection import ensure_player as _ensure_player_impl
 from sara.ui.playback.mixer_support import PlaybackMixerSupportMixin
+from sara.ui.playback.preload_pool import (
+    IDLE_PLAYLIST_ETA_SECONDS,
+    PRELOAD_QUEUE_DEPTH,
+    PreloadCandidate,
+    select_preloads,
+)
 from sara.ui.playback.preview import PreviewContext
 from sara.ui.playback import start_item as _playback_start_item
 from sara.ui.playback import preview as _playback_preview
@@ -50,7 +58,19 @@ class PlaybackController(PlaybackMixerSupportMixin):
         self._preload_enabled = os.environ.get("SARA_ENABLE_PRELOAD", "1") not in {"0", "false", "False"}
         self._preload_warm_bytes = int(os.environ.get("SARA_PRELOAD_WARM_BYTES", str(32 * 1024 * 1024)))
         self._preload_refetch_seconds = float(os.environ.get("SARA_PRELOAD_REFETCH_SECONDS", "60"))
+        self._preload_max_items = preload_max_streams()
+        self._preload_max_bytes = preload_max_bytes()
+        self._preload_workers = max(1, int(os.environ.get("SARA_PRELOAD_WORKERS", "2")))
+        self._preload_memory_bytes = preload_memory_max_bytes()
         self._preload_executor: ThreadPoolExecutor | None = None
+        self._preload_playlists: Callable[[], Iterable[PlaylistModel]] | None = None
+        self._preload_hints: dict[str, tuple[PlaylistModel, str | None]] = {}
+        self._preload_players: dict[str, Player] = {}
+        self._preloaded_keys: dict[str, set[tuple[str, float, bool]]] = {}
+        # najnowsze kandydatury czekające na ranking w tle (poprzednie są zastępowane)
+        self._pending_preload_candidates: list[PreloadCandidate] | None = None
+        self._preload_ranking = False
+        self._mix_trigger_at: Dict[tuple[str, str], float | None] = {}
         self._preload_lock = threading.RLock()
         self._warm_inflight: dict[Path, Future[int]] = {}
         self._warm_last: dict[Path, float] = {}
@@ -98,6 +118,7 @@ class PlaybackController(PlaybackMixerSupportMixin):
         removed: list[tuple[tuple[str, str], PlaybackContext]] = []
         for key in keys_to_remove:
             self._auto_mix_state.pop(key, None)
+            self._mix_trigger_at.pop(key, None)
             context = self._playback_contexts.pop(key)
             try:
                 if fade_duration > 0.0:
@@ -128,7 +149,7 @@ class PlaybackController(PlaybackMixerSupportMixin):
         on_mix_trigger: Callable[[], None] | None = None,
     ) -> PlaybackContext | None:
         try:
-            return self._start_item_impl(
+            context = self._start_item_impl(
                 playlist,
                 item,
                 start_seconds=start_seconds,
@@ -138,6 +159,9 @@ class PlaybackController(PlaybackMixerSupportMixin):
                 mix_trigger_seconds=mix_trigger_seconds,
                 on_mix_trigger=on_mix_trigger,
             )
+            if context is not None:
+                self._mix_trigger_at[(playlist.id, item.id)] = mix_trigger_seconds
+            return context
         except Exception:  # pylint: disable=broad-except
             logger.exception(
                 "PlaybackController: unhandled error starting item playlist=%s item_id=%s",
@@ -173,6 +197,7 @@ class PlaybackController(PlaybackMixerSupportMixin):
                 exc,
             )
             return False
+        self._mix_trigger_at[(playlist_id, item_id)] = mix_trigger_seconds
         return True
 
     # Wydzielona implementacja pozwala zalogować traceback bez rozwijania głównej sygnatury.
@@ -220,54 +245,195 @@ class PlaybackController(PlaybackMixerSupportMixin):
             self._auto_mix_state.pop(key, None)
         self._cleanup_unused_mixers()
 
+    def set_preload_playlists(self, provider: Callable[[], Iterable[PlaylistModel]] | None) -> None:
+        """Source of all playlists considered by `refresh_preloads`."""
+
+        self._preload_playlists = provider
+
     def schedule_next_preload(self, playlist: PlaylistModel, *, current_item_id: str | None) -> None:
-        """Best-effort preload of the most likely next track in a playlist.
+        """Note the item just started in `playlist` and refresh the preload pool."""
+
+        self._preload_hints[playlist.id] = (playlist, current_item_id)
+        self.refresh_preloads()
 
-        This is intended to reduce start latency around mix points on slower storage.
+    def refresh_preloads(self) -> None:
+        """Best-effort: keep the most likely next tracks across playlists ready to start.
+
+        Candidates are gathered here from the playlists, then checked on disk and
+        ranked on a preload worker by how soon they should start (see
+        `preload_pool`), within ``SARA_PRELOAD_MAX_STREAMS`` /
+        ``SARA_PRELOAD_MAX_BYTES``. Streams prepared earlier that fell out of
+        the ranking are released.
         """
         if not self._preload_enabled:
             return
-        next_item = self._resolve_next_preload_item(playlist, current_item_id=current_item_id)
-        if next_item is None:
-            return
-        if not next_item.path.exists():
-            return
-
-        start_seconds = float(getattr(next_item, "cue_in_seconds", 0.0) or 0.0)
-        allow_loop = bool(getattr(next_item, "loop_enabled", False) and getattr(next_item, "has_loop", lambda: False)())
-        device_id = self._resolve_preload_device_id(playlist)
+        playlists: dict[str, PlaylistModel] = {}
+        if self._preload_playlists is not None:
+            try:
+                playlists = {playlist.id: playlist for playlist in self._preload_playlists()}
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.debug("Preload: playlist provider failed: %s", exc)
+        for playlist_id, (playlist, _current) in self._preload_hints.items():
+            playlists.setdefault(playlist_id, playlist)
+        for key in [key for key in self._mix_trigger_at if key not in self._playback_contexts]:
+            self._mix_trigger_at.pop(key, None)
 
-        if device_id:
+        candidates = self._collect_preload_candidates(playlists.values())
+        with self._preload_lock:
+            self._pending_preload_candidates = candidates
+            if self._preload_ranking:
+                return
+            self._preload_ranking = True
+        self._ensure_preload_executor().submit(self._rank_pending_preloads)
+
+    def _rank_pending_preloads(self) -> None:
+        """Rank the latest candidates on a preload worker; refreshes during a pass are coalesced."""
+
+        while True:
+            with self._preload_lock:
+                candidates = self._pending_preload_candidates
+                self._pending_preload_candidates = None
+                if candidates is None:
+                    self._preload_ranking = False
+                    return
             try:
-                player = self._audio_engine.create_player(device_id)
-            except Exception:
-                player = None
-            if player is not None:
-                preloader = getattr(player, "preload", None)
-                if callable(preloader):
-                    self._ensure_preload_executor().submit(
-                        self._safe_preload_call,
-                        preloader,
-                        str(next_item.path),
-                        start_seconds=start_seconds,
-                        allow_loop=allow_loop,
+                self._apply_preload_ranking(candidates)
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.debug("Preload: ranking failed: %s", exc)
+
+    def _apply_preload_ranking(self, candidates: list[PreloadCandidate]) -> None:
+        # istnienie i rozmiar plików sprawdzamy tutaj - udział sieciowy potrafi odpowiadać długo
+        sized: list[PreloadCandidate] = []
+        for candidate in candidates:
+            size = self._preload_cost(candidate.path)
+            if size is not None:
+                sized.append(replace(candidate, size_bytes=size))
+        chosen = select_preloads(
+            sized,
+            max_items=max(0, self._preload_max_items),
+            max_bytes=max(0, self._preload_max_bytes),
+        )
+        wanted: dict[str, set[tuple[str, float, bool]]] = {}
+        for candidate in chosen:
+            if candidate.device_id:
+                wanted.setdefault(candidate.device_id, set()).add(
+                    (str(candidate.path), candidate.start_seconds, candidate.allow_loop)
+                )
+        with self._preload_lock:
+            previous, self._preloaded_keys = self._preloaded_keys, wanted
+        for device_id in set(previous) - set(wanted):
+            self._retain_device_preloads(device_id, set())
+        for device_id, keys in wanted.items():
+            if previous.get(device_id, set()) - keys:
+                self._retain_device_preloads(device_id, keys)
+        executor = self._ensure_preload_executor()
+        for candidate in chosen:
+            executor.submit(self._preload_candidate, candidate)
+
+    def _collect_preload_candidates(self, playlists: Iterable[PlaylistModel]) -> list[PreloadCandidate]:
+        busy = self.get_busy_device_ids()
+        candidates: list[PreloadCandidate] = []
+        for playlist in playlists:
+            playing = self.get_context(playlist.id)
+            hint = self._preload_hints.get(playlist.id)
+            if playing is not None:
+                (_playlist_id, current_id), _context = playing
+                current = playlist.get_item(current_id)
+                eta = self._seconds_to_mix(playlist.id, current) if current is not None else 0.0
+            else:
+                if playlist.kind is not PlaylistKind.MUSIC and hint is None:
+                    continue
+                current_id = hint[1] if hint else None
+                eta = IDLE_PLAYLIST_ETA_SECONDS
+            device_id = self._resolve_preload_device_id(playlist)
+            if playing is None and device_id is not None and device_id in busy:
+                # playlista bez wolnego urządzenia i tak nie wystartuje od razu
+                continue
+            for item in self._next_preload_items(playlist, current_item_id=current_id):
+                candidates.append(
+                    PreloadCandidate(
+                        playlist_id=playlist.id,
+                        item_id=item.id,
+                        path=item.path,
+                        start_seconds=float(getattr(item, "cue_in_seconds", 0.0) or 0.0),
+                        allow_loop=bool(item.loop_enabled and item.has_loop()),
+                        device_id=device_id,
+                        eta_seconds=eta,
                     )
-                    return
+                )
+                eta += max(0.0, float(item.effective_duration_seconds or 0.0))
+        return candidates
 
-        self._schedule_file_warmup(next_item.path)
+    def _seconds_to_mix(self, playlist_id: str, item: PlaylistItem) -> float:
+        position = max(0.0, float(item.current_position or 0.0))
+        mix_at = self._mix_trigger_at.get((playlist_id, item.id))
+        if mix_at is None:
+            return max(0.0, float(item.effective_duration_seconds or 0.0) - position)
+        # punkt miksu liczony jest od początku pliku, pozycja - od cue-in
+        return max(0.0, float(mix_at) - float(item.cue_in_seconds or 0.0) - position)
+
+    def _preload_cost(self, path: Path) -> int | None:
+        """Bytes a preload of `path` would hold; ``None`` when the file is missing."""
+
+        try:
+            size = int(path.stat().st_size)
+        except OSError:
+            return None
+        if size <= self._preload_memory_bytes:
+            # backend BASS trzyma taki plik w całości w pamięci
+            return size
+        return min(size, max(0, int(self._preload_warm_bytes)))
+
+    def _preload_player(self, device_id: str) -> Player | None:
+        with self._preload_lock:
+            player = self._preload_players.get(device_id)
+        if player is not None:
+            return player
+        # osobna instancja - nie podmieniamy playera z cache silnika
+        factory = getattr(self._audio_engine, "create_player_instance", None) or self._audio_engine.create_player
+        try:
+            player = factory(device_id)
+        except Exception:
+            return None
+        with self._preload_lock:
+            return self._preload_players.setdefault(device_id, player)
+
+    def _preload_candidate(self, candidate: PreloadCandidate) -> None:
+        if candidate.device_id:
+            player = self._preload_player(candidate.device_id)
+            preloader = getattr(player, "preload", None)
+            if callable(preloader):
+                try:
+                    if preloader(
+                        str(candidate.path),
+                        start_seconds=candidate.start_seconds,
+                        allow_loop=candidate.allow_loop,
+                    ):
+                        return
+                except Exception as exc:  # pylint: disable=broad-except
+                    logger.debug("Preload failed for %s: %s", candidate.path, exc)
+        self._schedule_file_warmup(candidate.path)
+
+    def _retain_device_preloads(self, device_id: str, keys: set[tuple[str, float, bool]]) -> None:
+        with self._preload_lock:
+            player = self._preload_players.get(device_id)
+        retain = getattr(player, "retain_preloaded", None)
+        if not callable(retain):
+            return
+        try:
+            retain(keys)
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.debug("Preload: releasing streams on %s failed: %s", device_id, exc)
 
     def _ensure_preload_executor(self) -> ThreadPoolExecutor:
         with self._preload_lock:
             if self._preload_executor is None:
-                self._preload_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sara-preload")
+                self._preload_executor = ThreadPoolExecutor(
+                    max_workers=self._preload_workers,
+                    thread_name_prefix="sara-preload",
+                )
             return self._preload_executor
 
-    def _safe_preload_call(self, preloader, source_path: str, *, start_seconds: float, allow_loop: bool) -> None:
-        try:
-            preloader(source_path, start_seconds=start_seconds, allow_loop=allow_loop)
-        except Exception as exc:  # pylint: disable=broad-except
-            logger.debug("Preload failed for %s: %s", source_path, exc)
-
     def _schedule_file_warmup(self, path: Path) -> None:
         max_bytes = int(self._preload_warm_bytes)
         if max_bytes <= 0:
@@ -290,33 +456,40 @@ class PlaybackController(PlaybackMixerSupportMixin):
         with self._preload_lock:
             self._warm_inflight.pop(path, None)
 
-    def _resolve_next_preload_item(
+    def _next_preload_items(
         self,
         playlist: PlaylistModel,
         *,
         current_item_id: str | None,
-    ) -> PlaylistItem | None:
-        selected_id = playlist.next_selected_item_id()
-        if selected_id and selected_id != current_item_id:
-            item = playlist.get_item(selected_id)
-            if item is not None:
-                return item
+        limit: int = PRELOAD_QUEUE_DEPTH,
+    ) -> list[PlaylistItem]:
+        """Selected (queued) items first, then the sequential next ones after `current_item_id`."""
+
+        upcoming: list[PlaylistItem] = []
+        seen: set[str] = set()
+
+        def _add(candidate: PlaylistItem) -> None:
+            if candidate.id in seen or (current_item_id and candidate.id == current_item_id):
+                return
+            if candidate.status not in (PlaylistItemStatus.PENDING, PlaylistItemStatus.PAUSED):
+                return
+            seen.add(candidate.id)
+            upcoming.append(candidate)
+
+        for item in playlist.items:
+            if len(upcoming) >= limit:
+                return upcoming
+            if item.is_selected:
+                _add(item)
 
         items = playlist.items
         total = len(items)
-        if total == 0:
-            return None
         start_index = playlist.index_of(current_item_id) if current_item_id else -1
         for offset in range(1, total + 1):
-            idx = (start_index + offset) % total
-            candidate = items[idx]
-            if current_item_id and candidate.id == current_item_id:
-                continue
-            if candidate.status is PlaylistItemStatus.PLAYING:
-                continue
-            if candidate.status in (PlaylistItemStatus.PENDING, PlaylistItemStatus.PAUSED):
-                return candidate
-        return None
+            if len(upcoming) >= limit:
+                break
+            _add(items[(start_index + offset) % total])
+        return upcoming
 
     def _resolve_preload_device_id(self, playlist: PlaylistModel) -> str | None:
         configured = [slot for slot in playlist.get_configured_slots() if slot]
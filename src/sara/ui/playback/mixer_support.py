@@ -23,7 +23,11 @@ class PlaybackMixerSupportMixin:
 
     def _default_mixer_factory(self, device: AudioDevice):
         DeviceMixer, _ = self._get_mixer_classes()
-        return DeviceMixer(device)
+        return DeviceMixer(
+            device,
+            resampler_quality=self._settings.get_resampler_quality(),
+            output_mode=self._settings.get_device_output_mode(device.id),
+        )
 
     def _get_or_create_mixer(self, device: AudioDevice):
         mixer = self._mixers.get(device.id)
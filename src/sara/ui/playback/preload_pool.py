@@ -0,0 +1,76 @@
+"""Ranking of likely-next tracks to keep ready ahead of playback.
+
+`PlaybackController.refresh_preloads` gathers candidates from every playlist:
+
+- the selected queue;
+- the sequential next item after the one playing;
+- the next item of idle playlists bound to a free device.
+
+Each candidate carries an ETA, the seconds until it is expected to start.
+For a playlist that is playing, this is the time to the current item's mix
+point, plus the length of any queued items ahead of it. `select_preloads`
+keeps the nearest candidates within the stream and byte budgets.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+# bezczynna playlista może wystartować w każdej chwili, ale po najbliższych miksach
+IDLE_PLAYLIST_ETA_SECONDS = 60.0
+# ile kolejnych pozycji jednej playlisty rozważamy
+PRELOAD_QUEUE_DEPTH = 3
+
+
+@dataclass(frozen=True)
+class PreloadCandidate:
+    playlist_id: str
+    item_id: str
+    path: Path
+    start_seconds: float
+    allow_loop: bool
+    device_id: str | None
+    eta_seconds: float
+    size_bytes: int = 0
+
+    @property
+    def key(self) -> tuple[str | None, Path, float, bool]:
+        return (self.device_id, self.path, round(self.start_seconds, 3), self.allow_loop)
+
+
+def select_preloads(
+    candidates: Iterable[PreloadCandidate],
+    *,
+    max_items: int,
+    max_bytes: int,
+) -> list[PreloadCandidate]:
+    """Nearest-first candidates within `max_items` and `max_bytes` (duplicates keep the earliest ETA)."""
+
+    best: dict[tuple[str | None, Path, float, bool], tuple[PreloadCandidate, int]] = {}
+    for order, candidate in enumerate(candidates):
+        previous = best.get(candidate.key)
+        if previous is None or candidate.eta_seconds < previous[0].eta_seconds:
+            best[candidate.key] = (candidate, order)
+    ranked = sorted(best.values(), key=lambda entry: (entry[0].eta_seconds, entry[1]))
+
+    chosen: list[PreloadCandidate] = []
+    used_bytes = 0
+    for candidate, _order in ranked:
+        if len(chosen) >= max_items:
+            break
+        # za duży kandydat nie blokuje mniejszych za nim
+        if used_bytes + candidate.size_bytes > max_bytes:
+            continue
+        chosen.append(candidate)
+        used_bytes += candidate.size_bytes
+    return chosen
+
+
+__all__ = [
+    "IDLE_PLAYLIST_ETA_SECONDS",
+    "PRELOAD_QUEUE_DEPTH",
+    "PreloadCandidate",
+    "select_preloads",
+]
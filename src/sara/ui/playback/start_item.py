@@ -117,8 +117,28 @@ def start_item_impl(
     except Exception:
         item.current_position = 0.0
 
+    # start wywołany wyzwalaczem miksu poprzedniego utworu tej playlisty: mikser ustawi go w punkcie miksu
+    mix_from = next(
+        (
+            other_id
+            for (playlist_id, other_id), state in controller._auto_mix_state.items()
+            if playlist_id == playlist.id
+            and other_id != item.id
+            and state is True
+            and (playlist_id, other_id) in controller._playback_contexts
+        ),
+        None,
+    )
+
     def _do_play(p: Player) -> None:
         supports_mix_trigger = controller.supports_mix_trigger(p)
+        set_mix_anchor = getattr(p, "set_mix_anchor", None)
+        if set_mix_anchor is not None:
+            set_mix_anchor(mix_from)
+        # krzywa wygaszania z ustawień dla backendów, które ją obsługują
+        set_fade_curve = getattr(p, "set_fade_curve", None)
+        if set_fade_curve is not None:
+            set_fade_curve(controller._settings.get_fade_curve())
         # wyzeruj ewentualne poprzednie ustawienia pętli zanim wystartujemy nowy utwór
         if hasattr(p, "set_loop") and not (item.loop_enabled and item.has_loop()):
             try:
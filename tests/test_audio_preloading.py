@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+import ctypes
+import threading
 from pathlib import Path
-from threading import Event
+from types import SimpleNamespace
 
+from sara.audio.bass._manager import streams as bass_streams
+from sara.audio.bass.native import _BassConstants
 from sara.audio.bass.player import flow as bass_flow
+from sara.audio.bass.player.base import BassPlayer
+from sara.audio.bass.preload_cache import preload_cache
+from sara.core.file_prefetch import read_file
 
 
 class _DummyContext:
@@ -56,8 +63,6 @@ class _DummyPlayer:
         self._loop_start = None
         self._loop_end = None
         self._loop_active = False
-        self._monitor_stop = Event()
-        self._monitor_thread = None
         self._fade_thread = None
         self._loop_sync_handle = 0
         self._loop_sync_proc = None
@@ -88,6 +93,9 @@ class _DummyPlayer:
     def _start_monitor(self) -> None:
         return
 
+    def _stop_monitor(self) -> None:
+        return
+
     def _drop_preloaded(self) -> None:
         self.drop_called += 1
 
@@ -153,3 +161,73 @@ def test_bass_flow_stop_drops_preloaded_only_on_manual_stop():
 
     bass_flow.stop(player, _from_fade=True)
     assert player.drop_called == 1
+
+
+def test_read_file_loads_whole_file_within_limit(tmp_path):
+    path = tmp_path / "song.mp3"
+    path.write_bytes(b"abc" * 1000)
+
+    data = read_file(path, max_bytes=10_000, chunk_bytes=7)
+    assert data is not None and bytes(data) == b"abc" * 1000
+    assert read_file(path, max_bytes=100) is None
+    assert read_file(tmp_path / "missing.mp3", max_bytes=10_000) is None
+
+
+class _MemoryStreamManager:
+    def __init__(self) -> None:
+        self._global_lock = threading.Lock()
+        self._memory_streams: dict[int, object] = {}
+        self.calls: list[tuple] = []
+        self.freed: list[int] = []
+        self._lib = SimpleNamespace(BASS_ErrorGetCode=lambda: 41, BASS_StreamFree=self.freed.append)
+
+    def _set_device(self, _index: int) -> None:
+        return
+
+    def _stream_create_file(self, mem, address, offset, length, flags):
+        self.calls.append((mem, address, offset, length, flags))
+        return 77
+
+
+def test_memory_stream_keeps_buffer_until_stream_free():
+    manager = _MemoryStreamManager()
+    data = bytearray(b"RIFF" + b"\0" * 60)
+
+    stream = bass_streams.stream_create_memory(manager, 1, data, allow_loop=True)
+
+    assert stream == 77
+    mem, address, offset, length, flags = manager.calls[0]
+    assert mem is True and offset == 0 and length == len(data)
+    assert ctypes.string_at(address, 4) == b"RIFF"
+    assert flags & _BassConstants.SAMPLE_LOOP
+    assert not flags & _BassConstants.ASYNCFILE
+    assert 77 in manager._memory_streams
+
+    bass_streams.stream_free(manager, stream)
+    assert manager.freed == [77]
+    assert manager._memory_streams == {}
+
+
+def test_bass_preload_reads_small_files_into_memory(tmp_path):
+    class _Manager(_DummyManager):
+        def __init__(self) -> None:
+            super().__init__()
+            self.memory: list[bytes] = []
+
+        def stream_create_memory(self, _index: int, data: bytearray, *, allow_loop: bool = False) -> int:
+            self.memory.append(bytes(data))
+            return 5000
+
+        def channel_set_volume(self, _stream: int, _volume: float) -> None:
+            return
+
+    manager = _Manager()
+    path = tmp_path / "next.mp3"
+    path.write_bytes(b"x" * 2048)
+    player = BassPlayer(manager, 0)
+
+    assert player.preload(str(path), start_seconds=2.0)
+    assert manager.memory == [b"x" * 2048]
+    assert manager.created == []
+    assert manager.positions == [(5000, 2.0)]
+    assert preload_cache(manager).usage() == (1, 2048)
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+
+from sara.audio.bass.player_monitor import ACTIVE_CHECK_INTERVAL, BassMonitor
+
+
+class _FakeManager:
+    def __init__(self) -> None:
+        self.position_calls = 0
+        self.active_calls = 0
+        self.end_procs: dict[int, object] = {}
+        self.end_mix_time: list[bool] = []
+        self.removed: list[tuple[int, int]] = []
+
+    def make_sync_proc(self, func):
+        return func
+
+    def channel_set_sync_end(self, stream: int, proc, *, mix_time: bool = True) -> int:
+        self.end_procs[stream] = proc
+        self.end_mix_time.append(mix_time)
+        return 900 + stream
+
+    def channel_remove_sync(self, stream: int, handle: int) -> None:
+        self.removed.append((stream, handle))
+
+    def channel_set_position_bytes(self, _stream: int, _position: int) -> None:
+        return
+
+    def channel_play(self, _stream: int, _restart: bool) -> None:
+        return
+
+
+class _FakePlayer:
+    def __init__(self, manager: _FakeManager, stream: int) -> None:
+        self._manager = manager
+        self._stream = stream
+        self._current_item_id = f"item-{stream}"
+        self._progress_callback = None
+        self._progress_interval = 0.02
+        self._finished_callback = None
+        self._loop_guard_enabled = True
+        self._loop_active = False
+        self._loop_start = None
+        self._loop_end = None
+        self._loop_start_bytes = 0
+        self._loop_guard_armed = False
+        self._last_loop_jump_ts = 0.0
+        self._last_loop_debug_log = 0.0
+        self._debug_loop = False
+        self.active = True
+        self.jumps: list[str] = []
+        self.stopped = threading.Event()
+        self._t0 = time.monotonic()
+        self._base = 0.0
+        manager.channel_get_seconds = self._position  # type: ignore[attr-defined]
+
+    def _position(self, _stream: int) -> float:
+        self._manager.position_calls += 1
+        return self._base + (time.monotonic() - self._t0)
+
+    def _is_active(self) -> bool:
+        self._manager.active_calls += 1
+        return self.active
+
+    def _jump_to_loop_start(self, reason: str, pos=None) -> None:
+        self.jumps.append(reason)
+        self._last_loop_jump_ts = time.time()
+        self._base = self._loop_start
+        self._t0 = time.monotonic()
+
+    def stop(self, *, _from_fade: bool = False) -> None:
+        self._stream = 0
+        self.stopped.set()
+
+
+def _register(monitor: BassMonitor, player: _FakePlayer) -> None:
+    monitor.register(
+        player,
+        loop_guard_base_slack=0.001,
+        loop_guard_fallback_slack=0.001,
+        logger=logging.getLogger("test"),
+    )
+
+
+def test_monitor_serves_many_players_from_one_thread():
+    monitor = BassMonitor()
+    manager = _FakeManager()
+    players = [_FakePlayer(manager, stream) for stream in range(1, 7)]
+    for player in players:
+        _register(monitor, player)
+
+    try:
+        threads = [thread for thread in threading.enumerate() if thread is monitor._thread]
+        assert len(threads) == 1
+        assert monitor.subscription_count() == 6
+        assert manager.end_mix_time == [False] * 6
+        time.sleep(0.1)
+        # bez callbacku postępu i bez pętli nikt nie pyta o pozycję
+        assert manager.position_calls == 0
+        assert manager.active_calls == 0
+    finally:
+        for player in players:
+            monitor.unregister(player)
+    assert monitor.subscription_count() == 0
+    assert sorted(manager.removed) == [(stream, 900 + stream) for stream in range(1, 7)]
+
+
+def test_monitor_reports_progress_at_player_rate():
+    monitor = BassMonitor()
+    manager = _FakeManager()
+    player = _FakePlayer(manager, 1)
+    reports: list[float] = []
+    player._progress_callback = lambda _item_id, seconds: reports.append(seconds)
+    _register(monitor, player)
+    try:
+        time.sleep(0.2)
+    finally:
+        monitor.unregister(player)
+
+    # 0.2 s przy 20 ms: ok. 10 raportów, a nie setki jak przy odpytywaniu co 1 ms
+    assert 4 <= len(reports) <= 14
+    assert reports == sorted(reports)
+
+
+def test_monitor_finishes_player_on_end_sync_without_waiting_for_poll():
+    monitor = BassMonitor()
+    manager = _FakeManager()
+    player = _FakePlayer(manager, 3)
+    finished: list[str] = []
+    player._finished_callback = finished.append
+    _register(monitor, player)
+
+    started = time.monotonic()
+    player.active = False
+    manager.end_procs[3](0, 3, 0, None)
+    assert player.stopped.wait(1.0)
+    assert time.monotonic() - started < ACTIVE_CHECK_INTERVAL
+    assert finished == ["item-3"]
+    assert monitor.subscription_count() == 0
+
+
+def test_monitor_loop_guard_wakes_near_loop_end():
+    monitor = BassMonitor()
+    manager = _FakeManager()
+    player = _FakePlayer(manager, 4)
+    player._loop_start = 0.0
+    player._loop_end = 0.06
+    player._loop_active = True
+    _register(monitor, player)
+    try:
+        time.sleep(0.2)
+    finally:
+        monitor.unregister(player)
+
+    # sync BASS nie istnieje w teście, więc pętlę zawija strażnik
+    assert len(player.jumps) >= 2
+    assert set(player.jumps) == {"guard"}
+    # strażnik budzi się według przewidywanego końca pętli, nie co 1 ms
+    assert manager.position_calls < 60
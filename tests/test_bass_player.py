@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import math
+import threading
+
 import pytest
 
 
@@ -10,6 +13,9 @@ class _StubManager:
     def __init__(self) -> None:
         self.sync_calls: list[float] = []
         self.sync_end_calls: int = 0
+        self.slides: list[tuple[int, float, float]] = []
+        self.volumes: list[float] = []
+        self.freed: list[int] = []
 
     def channel_get_length_seconds(self, _stream: int) -> float:
         return 600.0
@@ -26,7 +32,7 @@ class _StubManager:
         self.last_mix_time = mix_time
         return 123
 
-    def channel_set_sync_end(self, _stream: int, proc):
+    def channel_set_sync_end(self, _stream: int, proc, *, mix_time: bool = True):
         self.sync_end_calls += 1
         self.last_end_proc = proc
         return 456
@@ -37,6 +43,22 @@ class _StubManager:
     def make_sync_proc(self, func):
         return func
 
+    def channel_set_sync_slide(self, _stream: int, proc) -> int:
+        self.last_slide_proc = proc
+        return 789
+
+    def channel_slide_volume(self, stream: int, volume: float, seconds: float) -> None:
+        self.slides.append((stream, volume, seconds))
+
+    def channel_set_volume(self, _stream: int, volume: float) -> None:
+        self.volumes.append(volume)
+
+    def channel_stop(self, _stream: int) -> None:
+        return None
+
+    def stream_free(self, stream: int) -> None:
+        self.freed.append(stream)
+
 
 def _player_with_stream(offset: float) -> tuple[bass.BassPlayer, _StubManager]:
     manager = _StubManager()
@@ -76,3 +98,76 @@ def test_bass_mix_trigger_fires_once_for_pos_and_end():
     manager.last_pos_proc(0, player._stream, 0, None)
     manager.last_end_proc(0, player._stream, 0, None)
     assert fired["count"] == 1
+
+
+def test_bass_fade_out_slides_to_silence_and_finishes_from_sync():
+    player, manager = _player_with_stream(0.0)
+    player._current_item_id = "item-1"
+    finished = threading.Event()
+    finished_ids: list[str] = []
+
+    def _on_finished(item_id: str) -> None:
+        finished_ids.append(item_id)
+        finished.set()
+
+    player.set_finished_callback(_on_finished)
+    player.fade_out(1.6)
+
+    assert manager.slides == [(1, 0.0, pytest.approx(1.6))]
+    # set_gain_db podczas slide'u nie może go przerwać
+    player.set_gain_db(-3.0)
+    assert manager.volumes == []
+    assert not finished.is_set()
+
+    manager.last_slide_proc(789, 1, 2, None)
+    assert finished.wait(1.0)
+    assert finished_ids == ["item-1"]
+    assert manager.freed == [1]
+    assert player._stream == 0
+
+
+def test_fade_segments_curves():
+    flow = pytest.importorskip("sara.audio.bass.player.flow")
+    assert flow.fade_segments(0.8, 2.0) == [(0.0, 2.0)]
+    equal_power = flow.fade_segments(1.0, 2.0, flow.FADE_EQUAL_POWER)
+    assert sum(seconds for _target, seconds in equal_power) == pytest.approx(2.0)
+    assert equal_power[3][0] == pytest.approx(math.cos(math.pi / 4))
+    assert equal_power[-1][0] == pytest.approx(0.0, abs=1e-9)
+    with pytest.raises(ValueError):
+        flow.fade_segments(1.0, 1.0, "sigmoid")
+
+
+def test_bass_fade_out_chains_equal_power_slides():
+    flow = pytest.importorskip("sara.audio.bass.player.flow")
+    player, manager = _player_with_stream(0.0)
+    player._current_item_id = "item-3"
+    finished = threading.Event()
+    player.set_finished_callback(lambda _item_id: finished.set())
+    player.set_fade_curve(flow.FADE_EQUAL_POWER)
+    player.fade_out(1.6)
+
+    assert len(manager.slides) == 1
+    for _ in range(7):
+        manager.last_slide_proc(789, 1, 2, None)
+    assert len(manager.slides) == 8
+    assert [seconds for _stream, _target, seconds in manager.slides] == [pytest.approx(0.2)] * 8
+    assert not finished.is_set()
+
+    manager.last_slide_proc(789, 1, 2, None)
+    assert finished.wait(1.0)
+    with pytest.raises(ValueError):
+        player.set_fade_curve("sigmoid")
+
+
+def test_bass_fade_out_ignores_slide_sync_after_stop():
+    player, manager = _player_with_stream(0.0)
+    player._current_item_id = "item-2"
+    finished: list[str] = []
+    player.set_finished_callback(finished.append)
+    player.fade_out(1.0)
+    proc = manager.last_slide_proc
+
+    player.stop()
+    proc(789, 1, 2, None)
+    assert player._fade_stream == 0
+    assert finished == []
@@ -8,6 +8,7 @@ import numpy as np
 from sara.audio.engine import AudioDevice, BackendType
 import sara.audio.mixer.device_mixer as mixer_mod
 from sara.audio.mixer import DeviceMixer, NullOutputStream
+from sara.audio.mixer.thread import dispatch_mixer_events
 
 
 class FakeSoundFile:
@@ -89,3 +90,278 @@ def test_device_mixer_soft_mix_and_callbacks(monkeypatch, tmp_path):
     assert {"one", "two"} == set(finished)
     assert writes, "Mixer should have emitted mixed buffers"
     assert any(entry[0] == "one" for entry in progress)
+
+
+class FakeCallbackStream:
+    """Pull stream that calls the mixer callback from its own thread, like PortAudio."""
+
+    def __init__(self, samplerate, channels, callback, *, frames=32):
+        self.channels = channels
+        self.callback = callback
+        self.frames = frames
+        self.latency = 0.004
+        self.blocks = []
+        self.thread_names: set[str] = set()
+        self._stop = Event()
+        self._thread = None
+
+    def _run(self):
+        import threading
+
+        self.thread_names.add(threading.current_thread().name)
+        while not self._stop.is_set():
+            outdata = np.full((self.frames, self.channels), np.nan, dtype=np.float32)
+            self.callback(outdata, self.frames, None, None)
+            self.blocks.append(outdata)
+            time.sleep(0.001)
+
+    def __enter__(self):
+        from threading import Thread
+
+        self._thread = Thread(target=self._run, name="fake-portaudio", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join(1.0)
+        return False
+
+
+def test_device_mixer_pull_mode_mixes_in_the_device_callback(monkeypatch):
+    import threading
+
+    data = np.linspace(0.1, 0.9, 100, dtype="float32")
+    monkeypatch.setattr(mixer_mod, "sf", DummySF({"one": FakeSoundFile(data)}))
+    monkeypatch.setattr(mixer_mod, "sd", None)
+
+    streams: list[FakeCallbackStream] = []
+
+    def factory(samplerate, channels, callback=None):
+        # bloki urządzenia celowo różne od bloku miksera
+        streams.append(FakeCallbackStream(samplerate, channels, callback, frames=24))
+        return streams[-1]
+
+    device = AudioDevice(id="dev-1", name="Test", backend=BackendType.WASAPI, raw_index=None)
+    mixer = DeviceMixer(device, block_size=32, stream_factory=factory, output_mode="pull", read_ahead_seconds=0)
+    finished_threads: list[str] = []
+
+    event = mixer.start_source(
+        "one",
+        "one",
+        on_finished=lambda source_id: finished_threads.append(threading.current_thread().name),
+    )
+    try:
+        assert event.wait(timeout=1.0)
+        assert mixer.output_mode == "pull"
+        assert mixer.output_latency == 0.004
+    finally:
+        mixer.close()
+
+    stream = streams[0]
+    rendered = np.concatenate(stream.blocks)
+    assert not np.isnan(rendered).any()
+    audible = np.flatnonzero(rendered[:, 0])
+    # 100 ramek źródła w całości w mikro-fadzie startu; pierwsza ma wzmocnienie 0
+    assert len(audible) == 99
+    assert np.all(np.diff(rendered[audible, 0]) > 0)
+    assert audible[-1] - audible[0] < 100
+    assert finished_threads and finished_threads[0] not in stream.thread_names
+
+
+def _offline_mixer(monkeypatch, files, *, block_size=64):
+    monkeypatch.setattr(mixer_mod, "sf", DummySF(files))
+    monkeypatch.setattr(mixer_mod, "sd", None)
+    device = AudioDevice(id="dev-1", name="Test", backend=BackendType.WASAPI, raw_index=None)
+    mixer = DeviceMixer(device, block_size=block_size, stream_factory=lambda sr, ch: NullOutputStream(sr, ch))
+    # bloki renderuje test - bez wątku miksera i bez wyprzedzającego dekodowania
+    monkeypatch.setattr(mixer, "_ensure_thread", lambda: None)
+    mixer._read_ahead_seconds = 0.0
+    return mixer
+
+
+def _render(mixer, blocks):
+    rendered = []
+    events = []
+    for _ in range(blocks):
+        block, progresses, finished_ids = mixer._mix_once()
+        if block is None:
+            break
+        rendered.append(block[:, 0].copy())
+        events.append((progresses, finished_ids))
+        dispatch_mixer_events(progresses, [], lambda _source_id: None, mixer_mod.logger)
+    return np.concatenate(rendered), events
+
+
+def test_mix_trigger_starts_next_source_on_the_exact_frame(monkeypatch):
+    files = {
+        "a": FakeSoundFile(np.full(1000, 0.5, dtype="float32")),
+        "b": FakeSoundFile(np.full(1000, 0.25, dtype="float32")),
+    }
+    mixer = _offline_mixer(monkeypatch, files)
+    fired: list[float | None] = []
+
+    def on_trigger():
+        # tak jak UI: start kolejnego utworu i fade bieżącego dopiero po callbacku
+        fired.append(mixer.pending_mix_point("a") * 48000)
+        mixer.start_source("b", "b", start_after=mixer.claim_mix_point("a"))
+
+    mixer.start_source("a", "a")
+    mixer.set_mix_trigger("a", 300 / 48000, on_trigger, lead_seconds=100 / 48000)
+
+    mixed, _events = _render(mixer, 10)
+
+    assert fired == [300]
+    # pierwsze 192 ramki każdego źródła to mikro-fade startu
+    assert np.allclose(mixed[192:301], 0.5)
+    assert 0.5 < mixed[301] < 0.75
+    assert np.allclose(mixed[492:640], 0.75)
+    assert mixer.pending_mix_point("a") is None
+
+
+def test_scheduled_fade_out_begins_at_the_requested_frame(monkeypatch):
+    mixer = _offline_mixer(monkeypatch, {"a": FakeSoundFile(np.full(1000, 0.5, dtype="float32"))})
+    mixer.start_source("a", "a")
+    mixer.fade_out_source("a", 48 / 48000, at_seconds=200 / 48000)
+
+    mixed, events = _render(mixer, 6)
+
+    assert np.allclose(mixed[192:201], 0.5)
+    assert np.all(np.diff(mixed[200:248]) < 0)
+    assert not mixed[248:].any()
+    assert ["a"] in [finished for _progresses, finished in events]
+
+
+def test_mixer_player_trigger_lands_start_and_fade_on_the_mix_point(monkeypatch):
+    from sara.audio.mixer import MixerPlayer
+
+    files = {
+        "a": FakeSoundFile(np.full(1000, 0.5, dtype="float32")),
+        "b": FakeSoundFile(np.full(1000, 0.25, dtype="float32")),
+    }
+    mixer = _offline_mixer(monkeypatch, files)
+    current, following = MixerPlayer(mixer), MixerPlayer(mixer)
+    assert current.supports_mix_trigger()
+
+    def auto_mix_now():
+        following.set_mix_anchor("a")
+        following.play("b", "b")
+        current.fade_out(48 / 48000)
+
+    current.play("a", "a", allow_loop=False, mix_trigger_seconds=300 / 48000, on_mix_trigger=auto_mix_now)
+
+    mixed, _events = _render(mixer, 10)
+
+    assert np.allclose(mixed[192:301], 0.5)
+    # od ramki 300 A wygasa (48 ramek), a B narasta mikro-fadem
+    assert mixed[301] != 0.5
+    assert np.all(mixed[348:492] <= 0.25)
+    assert np.allclose(mixed[492:640], 0.25)
+
+
+def test_mix_point_is_only_claimed_by_the_handoff_start(monkeypatch):
+    from sara.audio.mixer import MixerPlayer
+
+    files = {
+        "a": FakeSoundFile(np.full(1000, 0.5, dtype="float32")),
+        "b": FakeSoundFile(np.full(1000, 0.25, dtype="float32")),
+        "jingle": FakeSoundFile(np.full(1000, 0.125, dtype="float32")),
+    }
+    mixer = _offline_mixer(monkeypatch, files)
+    current, following, jingle = MixerPlayer(mixer), MixerPlayer(mixer), MixerPlayer(mixer)
+    claims: list[tuple[str, float] | None] = []
+
+    def on_trigger():
+        # niezwiązany start w oknie wyprzedzenia nie może zająć punktu miksu
+        jingle.play("jingle", "jingle")
+        following.set_mix_anchor("a")
+        following.play("b", "b")
+        claims.append(mixer.claim_mix_point("a"))
+
+    current.play("a", "a", allow_loop=False, mix_trigger_seconds=300 / 48000, on_mix_trigger=on_trigger)
+
+    mixed, _events = _render(mixer, 10)
+
+    assert claims == [None]
+    # jingiel gra od razu (w pełni od ramki 256, po mikro-fadzie), B dopiero od punktu miksu
+    assert np.allclose(mixed[256:301], 0.625)
+    assert np.allclose(mixed[492:640], 0.875)
+
+
+class StallingSoundFile(FakeSoundFile):
+    """Reads past `stall_at` block until `gate` is set, like a share that hangs."""
+
+    def __init__(self, data: np.ndarray, *, stall_at: int, gate: Event):
+        super().__init__(data)
+        self._stall_at = stall_at
+        self._gate = gate
+
+    def read(self, frames: int, dtype="float32", always_2d=True):
+        if self._pos >= self._stall_at:
+            self._gate.wait(5)
+        return super().read(frames, dtype=dtype, always_2d=always_2d)
+
+
+def test_stalled_read_resumes_playback_once_data_arrives(monkeypatch):
+    gate = Event()
+    data = np.full(4800, 0.5, dtype="float32")
+    monkeypatch.setattr(mixer_mod, "sf", DummySF({"one": StallingSoundFile(data, stall_at=2400, gate=gate)}))
+    monkeypatch.setattr(mixer_mod, "sd", None)
+    device = AudioDevice(id="dev-1", name="Test", backend=BackendType.WASAPI, raw_index=None)
+    mixer = DeviceMixer(device, block_size=64, stream_factory=lambda sr, ch: NullOutputStream(sr, ch))
+
+    finished = mixer.start_source("one", "one")
+    try:
+        deadline = time.monotonic() + 2.0
+        while mixer.underrun_count == 0:
+            assert time.monotonic() < deadline
+            time.sleep(0.005)
+        time.sleep(0.1)
+        assert not finished.is_set()
+
+        gate.set()
+        assert finished.wait(timeout=2.0)
+    finally:
+        gate.set()
+        mixer.close()
+
+
+class UnderflowingStream(NullOutputStream):
+    def write(self, data):
+        super().write(data)
+        return True
+
+
+def test_timing_report_counts_blocks_writes_and_xruns(monkeypatch):
+    data = np.full(320, 0.5, dtype="float32")
+    monkeypatch.setattr(mixer_mod, "sf", DummySF({"one": FakeSoundFile(data)}))
+    monkeypatch.setattr(mixer_mod, "sd", None)
+    device = AudioDevice(id="dev-1", name="Test", backend=BackendType.WASAPI, raw_index=None)
+    mixer = DeviceMixer(device, block_size=32, stream_factory=lambda sr, ch: UnderflowingStream(sr, ch))
+
+    event = mixer.start_source("one", "one")
+    try:
+        assert event.wait(timeout=1.0)
+        time.sleep(0.05)
+    finally:
+        mixer.close()
+
+    report = mixer.timing_report()
+    assert report.blocks >= 10
+    assert sum(count for _edge, count in report.render_histogram) == report.blocks
+    assert report.writes == report.xruns >= 10
+    assert "xruns=" in report.format()
+
+    mixer.reset_timing_stats()
+    assert mixer.timing_report().blocks == 0
+
+
+def test_timing_report_lists_source_reads(monkeypatch):
+    mixer = _offline_mixer(monkeypatch, {"a": FakeSoundFile(np.full(1000, 0.5, dtype="float32"))})
+    mixer.start_source("a", "a")
+    _render(mixer, 2)
+
+    (source,) = mixer.timing_report().sources
+    assert source.source_id == "a"
+    assert source.reads >= 1 and source.read_seconds >= 0.0
+    assert source.fill == 1.0
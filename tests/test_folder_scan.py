@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from sara.core.folder_scan import FolderDiff, apply_folder_diff, diff_snapshots, scan_folder
+from sara.core.playlist import PlaylistItem, PlaylistItemStatus, PlaylistKind, PlaylistModel
+
+
+def _item(path: Path, item_id: str, title: str | None = None) -> PlaylistItem:
+    return PlaylistItem(id=item_id, path=path, title=title or path.stem, duration_seconds=1.0)
+
+
+def test_scan_folder_records_supported_files_recursively(tmp_path: Path) -> None:
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "a.mp3").write_bytes(b"a")
+    (tmp_path / "sub" / "b.wav").write_bytes(b"bb")
+    (tmp_path / "notes.txt").write_text("x")
+
+    snapshot = scan_folder(tmp_path)
+
+    assert snapshot.sorted_paths() == [tmp_path / "a.mp3", tmp_path / "sub" / "b.wav"]
+    assert snapshot.entries[tmp_path / "sub" / "b.wav"][0] == 2
+    assert snapshot.skipped == 1
+
+
+def test_diff_snapshots_detects_added_removed_and_changed(tmp_path: Path) -> None:
+    keep = tmp_path / "keep.mp3"
+    gone = tmp_path / "gone.mp3"
+    edit = tmp_path / "edit.mp3"
+    for path in (keep, gone, edit):
+        path.write_bytes(b"x")
+    before = scan_folder(tmp_path)
+
+    gone.unlink()
+    edit.write_bytes(b"xyz")
+    stat = edit.stat()
+    os.utime(edit, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    new = tmp_path / "new.mp3"
+    new.write_bytes(b"n")
+
+    diff = diff_snapshots(before, scan_folder(tmp_path))
+
+    assert diff.added == [new]
+    assert diff.removed == [gone]
+    assert diff.changed == [edit]
+    assert diff.paths_to_load() == [edit, new]
+    assert diff_snapshots(None, before).added == before.sorted_paths()
+
+
+def test_apply_folder_diff_keeps_ids_and_statuses(tmp_path: Path) -> None:
+    a, b, c, d = (tmp_path / f"{name}.mp3" for name in "abcd")
+    playlist = PlaylistModel(id="folder", name="Folder", kind=PlaylistKind.FOLDER)
+    playlist.add_items([_item(a, "id-a"), _item(c, "id-c"), _item(d, "id-d")])
+    playlist.items[1].status = PlaylistItemStatus.PLAYING
+    items_list = playlist.items
+
+    assert diff_snapshots(scan_folder(tmp_path), scan_folder(tmp_path)).is_empty
+
+    patched = FolderDiff(added=[b], removed=[d], changed=[c])
+    fresh = {b: _item(b, "new-b"), c: _item(c, "new-c", title="Retitled")}
+    inserted = apply_folder_diff(playlist, patched, fresh)
+
+    assert playlist.items is items_list
+    assert [item.id for item in playlist.items] == ["id-a", "new-b", "id-c"]
+    assert inserted == [1]
+    assert playlist.items[2].title == "Retitled"
+    assert playlist.items[2].status is PlaylistItemStatus.PLAYING
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from sara.core.folder_scan import scan_folder
+from sara.core.folder_watch import FolderWatcher, rescan_directories
+
+
+def test_polling_pass_reports_files_once_they_settle(tmp_path: Path) -> None:
+    existing = tmp_path / "old.mp3"
+    existing.write_bytes(b"x")
+    changes = []
+    watcher = FolderWatcher(scan_folder(tmp_path), lambda diff, snapshot: changes.append(diff), use_native=False)
+
+    clip = tmp_path / "clip.mp3"
+    clip.write_bytes(b"partial")
+    watcher.check_now()
+    assert changes == []
+
+    watcher.check_now()
+    assert [diff.added for diff in changes] == [[clip]]
+
+    existing.unlink()
+    watcher.check_now()
+    assert changes[-1].removed == [existing]
+
+
+def test_rescan_directories_tracks_new_and_removed_subfolders(tmp_path: Path) -> None:
+    (tmp_path / "a.mp3").write_bytes(b"a")
+    snapshot = scan_folder(tmp_path)
+
+    nested = tmp_path / "news" / "today"
+    nested.mkdir(parents=True)
+    (nested / "bulletin.mp3").write_bytes(b"b")
+    updated = rescan_directories(snapshot, [tmp_path])
+    assert nested / "bulletin.mp3" in updated.entries
+    assert nested in updated.directories
+
+    (nested / "bulletin.mp3").unlink()
+    nested.rmdir()
+    (tmp_path / "news").rmdir()
+    pruned = rescan_directories(updated, [tmp_path])
+    assert sorted(pruned.entries) == [tmp_path / "a.mp3"]
+    assert pruned.directories == frozenset({tmp_path})
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+def test_inotify_watcher_batches_events(tmp_path: Path) -> None:
+    received = threading.Event()
+    added = []
+
+    def _on_change(diff, _snapshot):
+        added.extend(diff.added)
+        if len(added) >= 2:
+            received.set()
+
+    watcher = FolderWatcher(scan_folder(tmp_path), _on_change, settle_seconds=0.05)
+    watcher.start()
+    try:
+        assert watcher.mode == "inotify"
+        (tmp_path / "first.mp3").write_bytes(b"1")
+        (tmp_path / "second.mp3").write_bytes(b"2")
+        assert received.wait(5.0)
+    finally:
+        watcher.stop()
+    assert sorted(added) == [tmp_path / "first.mp3", tmp_path / "second.mp3"]
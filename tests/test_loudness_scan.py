@@ -0,0 +1,137 @@
+import threading
+from pathlib import Path
+
+from sara.core import loudness_scan as loudness_scan_module
+from sara.core.job_queue import PRIORITY_NORMAL, PRIORITY_URGENT, PriorityJobQueue
+from sara.core.loudness import LoudnessMeasurement, LoudnessStandard
+from sara.core.loudness_scan import LoudnessScanJob, LoudnessScanner
+from sara.core.media_metadata.tag_writer import TagWriter
+
+
+def test_priority_queue_prefers_latest_prioritised_batch():
+    queue: PriorityJobQueue[str, str] = PriorityJobQueue()
+    for key in "abcde":
+        assert queue.push(key, key.upper())
+    assert not queue.push("a", "duplicate")
+
+    queue.prioritise(["d"])
+    queue.prioritise(["c", "e"])
+    queue.discard(lambda key: key == "b")
+
+    order = [queue.pop(timeout=0) for _ in range(4)]
+    assert order == [
+        ("C", PRIORITY_URGENT),
+        ("E", PRIORITY_URGENT),
+        ("D", PRIORITY_URGENT),
+        ("A", PRIORITY_NORMAL),
+    ]
+    assert queue.pop(timeout=0) == (None, PRIORITY_NORMAL)
+    queue.close()
+    assert not queue.push("f", "F")
+
+
+def _collect(expected: int):
+    results = []
+    done = threading.Event()
+
+    def on_result(result) -> None:
+        results.append(result)
+        if len(results) >= expected:
+            done.set()
+
+    return results, done, on_result
+
+
+def test_scanner_measures_prioritised_items_first_and_reuses_paths():
+    gate = threading.Event()
+    analyzed: list[str] = []
+
+    def analyze(path: Path, standard: LoudnessStandard) -> LoudnessMeasurement:
+        gate.wait(5)
+        analyzed.append(path.stem)
+        return LoudnessMeasurement(integrated_lufs=-20.0, true_peak_dbtp=-1.0)
+
+    results, done, on_result = _collect(5)
+    scanner = LoudnessScanner(on_result, standard=LoudnessStandard.EBU, idle_factor=0.0, analyze=analyze)
+    scanner.hold(0.2)
+    try:
+        jobs = [LoudnessScanJob("pl", f"id-{index}", Path(f"/music/{index}.mp3")) for index in range(4)]
+        jobs.append(LoudnessScanJob("other", "copy", Path("/music/0.mp3")))
+        assert scanner.submit(jobs) == 5
+        assert scanner.submit(jobs[:1]) == 0
+        scanner.prioritise("pl", ["id-3"])
+        gate.set()
+        assert done.wait(10)
+    finally:
+        scanner.stop()
+
+    assert analyzed[0] == "3"
+    assert sorted(analyzed) == ["0", "1", "2", "3"]
+    assert all(result.gain_db == -3.0 for result in results)
+    assert scanner.measured_gain(Path("/music/2.mp3")) == (True, -3.0)
+    assert scanner.measured_gain(Path("/music/9.mp3")) == (False, None)
+
+
+def test_scanner_reports_failures_and_writes_tags_when_enabled(monkeypatch):
+    written: list[tuple[Path, float]] = []
+    monkeypatch.setattr(
+        loudness_scan_module,
+        "save_replay_gain_metadata",
+        lambda path, gain: written.append((path, gain)) or True,
+    )
+
+    def analyze(path: Path, standard: LoudnessStandard) -> LoudnessMeasurement:
+        if path.stem == "broken":
+            raise RuntimeError("cannot decode")
+        return LoudnessMeasurement(integrated_lufs=-30.0)
+
+    results, done, on_result = _collect(2)
+    scanner = LoudnessScanner(
+        on_result, standard=LoudnessStandard.ATSC, write_tags=True, idle_factor=0.0, analyze=analyze
+    )
+    try:
+        scanner.submit(
+            [
+                LoudnessScanJob("pl", "bad", Path("/music/broken.mp3")),
+                LoudnessScanJob("pl", "good", Path("/music/good.mp3")),
+            ]
+        )
+        assert done.wait(10)
+    finally:
+        scanner.stop()
+
+    by_item = {result.job.item_id: result for result in results}
+    assert by_item["bad"].gain_db is None
+    assert by_item["bad"].error == "cannot decode"
+    assert by_item["good"].gain_db == 6.0
+    assert by_item["good"].tags_written is True
+    assert written == [(Path("/music/good.mp3"), 6.0)]
+
+
+def test_scanner_reports_tags_written_once_the_tag_writer_finished():
+    def write(path: Path, updates) -> None:
+        if path.stem == "locked":
+            raise PermissionError("file in use")
+
+    writer = TagWriter(max_attempts=1, write=write)
+    results, done, on_result = _collect(2)
+    scanner = LoudnessScanner(
+        on_result,
+        write_tags=True,
+        idle_factor=0.0,
+        analyze=lambda path, standard: LoudnessMeasurement(integrated_lufs=-20.0),
+        tag_writer=writer,
+    )
+    try:
+        scanner.submit(
+            [
+                LoudnessScanJob("pl", "ok", Path("/music/ok.mp3")),
+                LoudnessScanJob("pl", "locked", Path("/music/locked.mp3")),
+            ]
+        )
+        assert done.wait(10)
+    finally:
+        scanner.stop()
+        writer.stop()
+
+    assert {result.job.item_id: result.tags_written for result in results} == {"ok": True, "locked": False}
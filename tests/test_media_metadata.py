@@ -1,13 +1,21 @@
+import threading
 from pathlib import Path
 
+from mutagen.apev2 import APEv2
 from pytest import approx
 
 from sara.core.media_metadata import (
+    AudioMetadata,
+    MetadataCache,
+    configure_metadata_cache,
     extract_metadata,
+    extract_metadata_batch,
     is_supported_audio_file,
     save_mix_metadata,
     save_replay_gain_metadata,
 )
+from sara.core.media_metadata import extract as extract_module
+from sara.core.media_metadata.ape import _read_ape_tags
 
 
 def test_supported_audio_extensions_case_insensitive() -> None:
@@ -92,3 +100,128 @@ def test_clear_replay_gain_metadata(tmp_path) -> None:
     assert save_replay_gain_metadata(target, None)
     metadata = extract_metadata(target)
     assert metadata.replay_gain_db is None
+
+
+def test_read_ape_tags_seeks_past_id3v1_footer(tmp_path) -> None:
+    target = tmp_path / "tail.mp3"
+    target.write_bytes(b"\xff" * 200_000)
+    tags = APEv2()
+    tags["SARA_CUE_IN"] = "1.250"
+    tags.save(str(target))
+    with target.open("ab") as handle:
+        handle.write(b"TAG" + b"\x00" * 125)
+
+    assert _read_ape_tags(target) == {"SARA_CUE_IN": "1.250"}
+    assert extract_metadata(target).cue_in_seconds == 1.25
+
+
+def test_extract_metadata_reads_ape_tags_once(tmp_path, monkeypatch) -> None:
+    target = tmp_path / "once.mp3"
+    target.write_bytes(b"\x00")
+    save_mix_metadata(target, cue_in=None, intro=None, outro=None, segue=None, segue_fade=None, overlap=None)
+
+    calls = []
+    original = extract_module._read_ape_tags
+
+    def _counting(path):
+        calls.append(path)
+        return original(path)
+
+    monkeypatch.setattr(extract_module, "_read_ape_tags", _counting)
+    extract_metadata(target)
+    assert calls == [target]
+
+
+def test_metadata_cache_serves_unchanged_files(tmp_path, monkeypatch) -> None:
+    target = tmp_path / "cached.mp3"
+    target.write_bytes(b"\x00")
+    configure_metadata_cache(tmp_path / "cache.sqlite3")
+    try:
+        first = extract_metadata(target)
+
+        def _unexpected_read(_path):
+            raise AssertionError("cached metadata should be reused")
+
+        monkeypatch.setattr(extract_module, "_read_metadata", _unexpected_read)
+        assert extract_metadata(target) == first
+
+        monkeypatch.undo()
+        assert save_mix_metadata(target, cue_in=2.0, intro=None, outro=None, segue=None, segue_fade=None, overlap=None)
+        assert extract_metadata(target).cue_in_seconds == 2.0
+    finally:
+        configure_metadata_cache(None)
+
+
+def test_metadata_cache_skips_failed_reads(tmp_path, monkeypatch) -> None:
+    target = tmp_path / "flaky.mp3"
+    target.write_bytes(b"\x00")
+    save_mix_metadata(target, cue_in=1.5, intro=None, outro=None, segue=None, segue_fade=None, overlap=None)
+    cache = configure_metadata_cache(tmp_path / "cache.sqlite3")
+    try:
+        def _failing_open(_path):
+            raise OSError("share went away")
+
+        monkeypatch.setattr(extract_module, "MutagenFile", _failing_open)
+        assert extract_metadata(target).title == "flaky"
+        assert cache.get(target) is None
+
+        monkeypatch.undo()
+        assert extract_metadata(target).cue_in_seconds == 1.5
+        assert cache.get(target) is not None
+    finally:
+        configure_metadata_cache(None)
+
+
+def test_metadata_cache_keeps_signature_taken_before_the_read(tmp_path, monkeypatch) -> None:
+    target = tmp_path / "edited.mp3"
+    target.write_bytes(b"\x00")
+    cache = configure_metadata_cache(tmp_path / "cache.sqlite3")
+    original = extract_module._read_metadata
+
+    def _read_while_edited(path):
+        result = original(path)
+        target.write_bytes(b"\x00\x01")
+        return result
+
+    try:
+        monkeypatch.setattr(extract_module, "_read_metadata", _read_while_edited)
+        extract_metadata(target)
+        assert cache.get(target) is None
+    finally:
+        configure_metadata_cache(None)
+
+
+def test_metadata_cache_rejects_changed_signature(tmp_path) -> None:
+    target = tmp_path / "changed.mp3"
+    target.write_bytes(b"\x00")
+    cache = MetadataCache(tmp_path / "cache.sqlite3")
+    cache.put(target, AudioMetadata(title="Old", duration_seconds=1.0))
+    assert cache.get(target).title == "Old"
+
+    target.write_bytes(b"\x00\x01")
+    assert cache.get(target) is None
+    cache.close()
+
+
+def test_extract_metadata_batch_preserves_order_and_fills_cache(tmp_path) -> None:
+    paths = []
+    for index in range(5):
+        target = tmp_path / f"batch{index}.mp3"
+        target.write_bytes(b"\x00")
+        save_mix_metadata(target, cue_in=float(index), intro=None, outro=None, segue=None, segue_fade=None, overlap=None)
+        paths.append(target)
+    cache = configure_metadata_cache(tmp_path / "cache.sqlite3")
+    try:
+        results = extract_metadata_batch(paths, workers=2, chunk_size=2)
+        assert [metadata.cue_in_seconds for metadata in results] == [0.0, 1.0, 2.0, 3.0, 4.0]
+        assert cache.get(paths[3]).cue_in_seconds == 3.0
+    finally:
+        configure_metadata_cache(None)
+
+
+def test_extract_metadata_batch_honours_cancellation(tmp_path) -> None:
+    target = tmp_path / "cancelled.mp3"
+    target.write_bytes(b"\x00")
+    cancelled = threading.Event()
+    cancelled.set()
+    assert extract_metadata_batch([target], cancel_event=cancelled) == [None]
@@ -0,0 +1,143 @@
+import threading
+from pathlib import Path
+
+import pytest
+
+from sara.core.app_state import PlaylistFactory
+from sara.core.media_metadata import AudioMetadata
+from sara.core.metadata_hydration import (
+    HydrationJob,
+    MetadataHydrator,
+    apply_hydrated_metadata,
+    create_unhydrated_item,
+)
+
+
+def _metadata(path: Path) -> AudioMetadata:
+    return AudioMetadata(
+        title=f"tag-{path.stem}",
+        duration_seconds=180.0,
+        artist="Tag Artist",
+        replay_gain_db=-6.5,
+        cue_in_seconds=0.4,
+        segue_seconds=170.0,
+    )
+
+
+def test_unhydrated_item_keeps_m3u_hints_after_hydration():
+    factory = PlaylistFactory()
+    entry = {"path": "/music/a.mp3", "title": "From EXTINF", "duration": 200.0}
+    item = create_unhydrated_item(factory, Path(entry["path"]), entry)
+
+    assert item.hydrated is False
+    assert item.title == "From EXTINF"
+    assert item.duration_seconds == 200.0
+    assert item.cue_in_seconds is None
+
+    apply_hydrated_metadata(item, _metadata(item.path), entry)
+
+    assert item.hydrated is True
+    assert item.title == "From EXTINF"
+    assert item.artist == "Tag Artist"
+    assert item.duration_seconds == 200.0
+    assert item.cue_in_seconds == 0.4
+    assert item.segue_seconds == 170.0
+    assert item.replay_gain_db == -6.5
+
+
+def test_unhydrated_item_without_hints_takes_tag_values():
+    item = create_unhydrated_item(PlaylistFactory(), Path("/music/b.mp3"), {"path": "/music/b.mp3"})
+    assert item.title == "b"
+
+    apply_hydrated_metadata(item, _metadata(item.path), None)
+
+    assert item.title == "tag-b"
+    assert item.duration_seconds == 180.0
+
+
+def test_hydrator_processes_in_order_with_prioritised_items_first():
+    gate = threading.Event()
+    seen: list[str] = []
+    delivered: list[str] = []
+    done = threading.Event()
+
+    def extract(path: Path) -> AudioMetadata:
+        gate.wait(5)
+        seen.append(path.stem)
+        return _metadata(path)
+
+    def on_hydrated(results) -> None:
+        delivered.extend(job.item_id for job, _metadata in results)
+        if len(delivered) >= 6:
+            done.set()
+
+    hydrator = MetadataHydrator(on_hydrated, extract=extract, batch_interval=0.01)
+    try:
+        jobs = [HydrationJob("pl", f"id-{index}", Path(f"/music/{index}.mp3")) for index in range(6)]
+        hydrator.submit(jobs)
+        # pierwsze zadanie może już czekać w wątku; reszta jest jeszcze w kolejce
+        hydrator.prioritise("pl", ["id-4", "id-3"])
+        hydrator.expedite(HydrationJob("pl", "id-5", Path("/music/other.mp3")))
+        gate.set()
+        assert done.wait(5)
+    finally:
+        hydrator.stop()
+
+    remaining = [stem for stem in seen if stem != "0"]
+    # już zakolejkowane zadanie zachowuje swoją ścieżkę i podpowiedzi
+    assert remaining == ["5", "4", "3", "1", "2"]
+    assert hydrator.pending_count() == 0
+
+
+def test_hydrator_reports_unreadable_files_as_none():
+    results = []
+    done = threading.Event()
+
+    def extract(path: Path) -> AudioMetadata:
+        raise OSError("gone")
+
+    def on_hydrated(batch) -> None:
+        results.extend(batch)
+        done.set()
+
+    hydrator = MetadataHydrator(on_hydrated, extract=extract)
+    try:
+        hydrator.submit([HydrationJob("pl", "x", Path("/missing.mp3"))])
+        assert done.wait(5)
+    finally:
+        hydrator.stop()
+
+    assert results[0][0].item_id == "x"
+    assert results[0][1] is None
+
+
+def test_hydration_results_reach_an_item_that_is_already_playing():
+    pytest.importorskip("wx")
+    from types import SimpleNamespace
+
+    from sara.core.playlist import PlaylistKind, PlaylistModel
+    from sara.ui.controllers.playlists.hydration import apply_hydration_results
+
+    factory = PlaylistFactory()
+    playing = create_unhydrated_item(factory, Path("/music/a.mp3"), {"path": "/music/a.mp3"})
+    waiting = create_unhydrated_item(factory, Path("/music/b.mp3"), {"path": "/music/b.mp3"})
+    model = PlaylistModel(id="pl", name="Music", kind=PlaylistKind.MUSIC, items=[playing, waiting])
+    gains: list[float | None] = []
+    calls: list[tuple] = []
+    player = SimpleNamespace(set_gain_db=gains.append)
+    frame = SimpleNamespace(
+        _playlists={"pl": SimpleNamespace(model=model)},
+        _playback=SimpleNamespace(contexts={("pl", playing.id): SimpleNamespace(player=player)}),
+        _apply_loop_setting_to_playback=lambda **kwargs: calls.append(("loop", kwargs["item_id"])),
+        _apply_mix_trigger_to_playback=lambda **kwargs: calls.append(("mix", kwargs["item"].id)),
+        _schedule_loudness_scan=lambda: None,
+    )
+
+    apply_hydration_results(
+        frame,
+        [(HydrationJob("pl", item.id, item.path), _metadata(item.path)) for item in (playing, waiting)],
+    )
+
+    assert playing.cue_in_seconds == 0.4 and waiting.hydrated
+    assert gains == [-6.5]
+    assert calls == [("loop", playing.id), ("mix", playing.id)]
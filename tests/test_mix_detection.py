@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+import soundfile as sf
+
+from sara.core.mix_detection import (
+    DetectedMixPoints,
+    detect_mix_points,
+    iter_detect_mix_points_batch,
+    merge_detected_mix_points,
+)
+from sara.core.waveform import generate_peaks
+
+RATE = 8000
+
+
+def _track(tmp_path, name: str, *, lead: float, body: float, fade: float, tail: float):
+    t = np.arange(int(RATE * body)) / RATE
+    tone = 0.5 * np.sin(2 * np.pi * 220 * t)
+    ramp = np.arange(int(RATE * fade)) / RATE
+    fading = 0.5 * np.sin(2 * np.pi * 220 * ramp) * np.linspace(1.0, 0.0, len(ramp)) ** 3
+    signal = np.concatenate([np.zeros(int(RATE * lead)), tone, fading, np.zeros(int(RATE * tail))])
+    path = tmp_path / f"{name}.wav"
+    sf.write(path, signal, RATE)
+    return path
+
+
+def test_detects_cue_in_fade_tail_and_trailing_silence(tmp_path):
+    path = _track(tmp_path, "faded", lead=1.5, body=20.0, fade=6.0, tail=2.0)
+    detected = detect_mix_points(generate_peaks(path))
+
+    assert detected.cue_in == pytest.approx(1.5, abs=0.05)
+    assert 21.5 < detected.outro < 24.0
+    assert detected.segue == pytest.approx(detected.outro - detected.cue_in, abs=1e-3)
+    assert detected.segue_fade >= 1.0
+    assert detected.audible_end < 29.0
+
+
+def test_abrupt_ending_uses_audible_end_as_segue(tmp_path):
+    path = _track(tmp_path, "abrupt", lead=0.0, body=10.0, fade=0.0, tail=1.0)
+    detected = detect_mix_points(generate_peaks(path))
+
+    assert detected.cue_in is None
+    assert detected.outro is None
+    assert detected.segue == pytest.approx(10.0, abs=0.05)
+    assert detected.segue_fade is None
+
+
+def test_merge_keeps_existing_values_and_rebases_segue():
+    detected = DetectedMixPoints(
+        duration_seconds=200.0,
+        audible_start=1.0,
+        audible_end=195.0,
+        cue_in=1.0,
+        outro=188.0,
+        segue=187.0,
+        segue_fade=7.0,
+    )
+    current = {"cue_in": 2.0, "intro": 15.0, "outro": None, "segue": None, "segue_fade": None, "overlap": None}
+
+    merged = merge_detected_mix_points(current, detected)
+
+    assert merged["cue_in"] == 2.0
+    assert merged["intro"] == 15.0
+    assert merged["outro"] == 188.0
+    assert merged["segue"] == pytest.approx(186.0)
+    assert merged["segue_fade"] == 7.0
+
+    with_overlap = merge_detected_mix_points(dict(current, overlap=5.0), detected)
+    assert with_overlap["segue"] is None
+    assert with_overlap["segue_fade"] is None
+
+
+def test_batch_reports_failures_per_file(tmp_path):
+    good = _track(tmp_path, "good", lead=0.5, body=5.0, fade=0.0, tail=0.5)
+    broken = tmp_path / "broken.mp3"
+    broken.write_bytes(b"not-audio")
+
+    results = {index: (detected, error) for index, detected, error in iter_detect_mix_points_batch([good, broken], workers=1)}
+
+    assert results[0][0].cue_in == pytest.approx(0.5, abs=0.05)
+    assert results[1][0] is None
+    assert results[1][1]
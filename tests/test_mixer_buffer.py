@@ -0,0 +1,92 @@
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+
+from sara.audio.mixer.buffer import SourceRingBuffer, read_frames
+from sara.audio.mixer.decoder import SourceDecoder
+from sara.audio.mixer.render import render_source
+from sara.audio.mixer.types import MixerSource
+
+
+def _source(sound_file, *, channels: int, output_channels: int = 2) -> MixerSource:
+    source = MixerSource(
+        source_id="src",
+        path=Path("track.wav"),
+        sound_file=sound_file,
+        samplerate=sound_file.samplerate,
+        channels=channels,
+        resample_ratio=1.0,
+    )
+    source.decoder = SourceDecoder(source, output_channels=output_channels, read_ahead_frames=0, chunk_frames=256)
+    return source
+
+
+def test_ring_buffer_wraps_and_maps_channels():
+    ring = SourceRingBuffer(2, capacity=8)
+    ring.write(np.arange(6, dtype=np.float32)[:, None])
+    out = np.zeros((4, 2), dtype=np.float32)
+    assert ring.read_into(out) == 4
+    assert out[:, 0].tolist() == [0, 1, 2, 3]
+    assert out[:, 1].tolist() == [0, 1, 2, 3]
+
+    # zapis przechodzi przez koniec tablicy
+    ring.write(np.stack([np.arange(6, 12), -np.arange(6, 12)], axis=1).astype(np.float32))
+    assert len(ring) == 8
+    assert ring.capacity == 8
+    out = np.zeros((8, 2), dtype=np.float32)
+    assert ring.read_into(out) == 8
+    assert out[:, 0].tolist() == list(range(4, 12))
+    assert out[2:, 1].tolist() == [-value for value in range(6, 12)]
+    assert len(ring) == 0
+
+
+def test_ring_buffer_grows_keeping_content():
+    ring = SourceRingBuffer(1, capacity=4)
+    ring.write(np.array([[1.0], [2.0], [3.0]], dtype=np.float32))
+    out = np.zeros((2, 1), dtype=np.float32)
+    ring.read_into(out)
+    ring.write(np.array([[4.0], [5.0], [6.0], [7.0], [8.0]], dtype=np.float32))
+    assert ring.capacity >= 6
+    out = np.zeros((6, 1), dtype=np.float32)
+    assert ring.read_into(out) == 6
+    assert out[:, 0].tolist() == [3, 4, 5, 6, 7, 8]
+
+
+def test_render_source_reuses_buffers_in_steady_state(tmp_path):
+    path = tmp_path / "tone.wav"
+    signal = (0.5 * np.sin(np.arange(4000) / 10.0)).astype(np.float32)
+    sf.write(path, signal, 8000, subtype="FLOAT")
+
+    with sf.SoundFile(path) as sound_file:
+        source = _source(sound_file, channels=1)
+        out = np.zeros((256, 2), dtype=np.float32)
+        frames_out, finished = render_source(source, out, micro_fade_frames=16)
+        assert (frames_out, finished) == (256, False)
+        scratch = source.read_scratch
+        assert source.read_into_supported
+
+        rendered = [out.copy()]
+        while True:
+            frames_out, finished = render_source(source, out, micro_fade_frames=16)
+            rendered.append(out[:frames_out].copy())
+            assert source.read_scratch is scratch
+            if finished:
+                break
+
+    mixed = np.concatenate(rendered)
+    assert len(mixed) == len(signal)
+    np.testing.assert_allclose(mixed[:, 0], signal, atol=1e-6)
+    np.testing.assert_allclose(mixed[:, 1], signal, atol=1e-6)
+
+
+def test_read_frames_returns_short_view_at_end_of_file(tmp_path):
+    path = tmp_path / "short.wav"
+    sf.write(path, np.zeros((100, 2), dtype=np.float32), 8000)
+
+    with sf.SoundFile(path) as sound_file:
+        source = _source(sound_file, channels=2)
+        assert len(read_frames(source, 64)) == 64
+        tail = read_frames(source, 64)
+        assert len(tail) == 36
+        assert np.shares_memory(tail, source.read_scratch)
@@ -0,0 +1,140 @@
+import time
+from pathlib import Path
+from threading import Event
+
+import numpy as np
+
+from sara.audio.mixer.decoder import SourceDecoder
+from sara.audio.mixer.render import render_source
+from sara.audio.mixer.types import MixerSource
+
+
+class RampFile:
+    """Mono file whose sample n has the value n / 10000, optionally gated."""
+
+    samplerate = 10000
+    channels = 1
+
+    def __init__(self, frames: int, gate: Event | None = None):
+        self._data = (np.arange(frames, dtype=np.float32) / 10000.0)[:, None]
+        self._pos = 0
+        self._gate = gate
+        self.closed = False
+
+    def read(self, frames, dtype="float32", always_2d=True, out=None):
+        if self._gate is not None:
+            self._gate.wait(5)
+        chunk = self._data[self._pos : self._pos + frames]
+        self._pos += len(chunk)
+        if out is None:
+            return chunk.copy()
+        out[: len(chunk)] = chunk
+        return out[: len(chunk)]
+
+    def seek(self, frame):
+        self._pos = frame
+
+    def close(self):
+        self.closed = True
+
+
+def _source(sound_file, *, read_ahead: int, loop=None) -> MixerSource:
+    source = MixerSource(
+        source_id="ramp",
+        path=Path("ramp.wav"),
+        sound_file=sound_file,
+        samplerate=sound_file.samplerate,
+        channels=1,
+        resample_ratio=1.0,
+        loop_range=loop,
+    )
+    source.decoder = SourceDecoder(
+        source,
+        output_channels=1,
+        read_ahead_frames=read_ahead,
+        chunk_frames=64,
+        on_release=sound_file.close,
+    )
+    return source
+
+
+def _frames(block, count):
+    return [int(round(value * 10000)) for value in block[:count, 0]]
+
+
+def _wait_for(predicate):
+    deadline = time.monotonic() + 5
+    while not predicate():
+        assert time.monotonic() < deadline
+        time.sleep(0.005)
+
+
+def test_late_decoder_counts_underrun_without_finishing():
+    gate = Event()
+    sound_file = RampFile(500, gate)
+    source = _source(sound_file, read_ahead=256)
+    source.decoder.start()
+    out = np.ones((100, 1), dtype=np.float32)
+    try:
+        assert render_source(source, out, micro_fade_frames=1) == (0, False)
+        assert source.decoder.underruns == 1
+        assert not out.any()
+
+        gate.set()
+        played: list[int] = []
+        while True:
+            _wait_for(lambda: source.decoder.available >= 100 or source.decoder.exhausted)
+            frames_out, finished = render_source(source, out, micro_fade_frames=1)
+            played.extend(_frames(out, frames_out))
+            if finished:
+                break
+    finally:
+        source.decoder.close(timeout=1.0)
+
+    assert played == list(range(500))
+    assert source.position_frames == 500
+    assert source.decoder.underruns == 1
+    assert sound_file.closed
+
+
+def test_loop_restart_is_reported_at_the_exact_frame():
+    source = _source(RampFile(1000), read_ahead=0, loop=(100, 300))
+    out = np.zeros((128, 1), dtype=np.float32)
+
+    played: list[int] = []
+    for _ in range(4):
+        frames_out, finished = render_source(source, out, micro_fade_frames=1)
+        assert not finished
+        played.extend(_frames(out, frames_out))
+
+    expected = list(range(300)) + list(range(100, 300)) + list(range(100, 112))
+    expected[300] = 0
+    expected[500] = 0
+    assert played == expected
+    assert source.position_frames == 112
+
+
+def test_loop_set_after_read_ahead_drops_frames_past_the_new_end():
+    sound_file = RampFile(5000)
+    source = _source(sound_file, read_ahead=1000)
+    source.decoder.start(prime_frames=1000)
+    out = np.zeros((128, 1), dtype=np.float32)
+    try:
+        _wait_for(lambda: source.decoder.available >= 1000)
+        assert render_source(source, out, micro_fade_frames=1) == (128, False)
+
+        source.loop_range = (100, 300)
+        source.decoder.loop_changed()
+
+        played = _frames(out, 128)
+        while len(played) < 512:
+            _wait_for(lambda: source.decoder.available >= 128)
+            frames_out, _finished = render_source(source, out, micro_fade_frames=1)
+            played.extend(_frames(out, frames_out))
+    finally:
+        source.decoder.close(timeout=1.0)
+
+    assert played[:300] == list(range(300))
+    assert played[300] == 0
+    assert played[301:500] == list(range(101, 300))
+    assert played[500:512] == [0] + list(range(101, 112))
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from sara.audio.mixer.kernels import (
+    FADE_EQUAL_POWER,
+    FADE_LINEAR,
+    apply_gain,
+    fade_gains,
+    map_channels,
+    nearest_zero_crossing,
+)
+
+
+def _reference_crossing(values, desired):
+    crossings = [idx for idx in range(1, len(values)) if values[idx - 1] == 0 or values[idx - 1] * values[idx] <= 0]
+    return min(crossings, key=lambda i: abs(i - desired)) if crossings else None
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_zero_crossing_matches_elementwise_search(seed):
+    values = np.random.default_rng(seed).normal(size=480).astype(np.float32) + 0.8
+    for desired in (0, 100, 240, 479):
+        assert nearest_zero_crossing(values, desired) == _reference_crossing(values, desired)
+    assert nearest_zero_crossing(np.ones(64, dtype=np.float32), 32) is None
+
+
+def _gains(frames, *, done, length, curve, rising):
+    out = np.zeros(frames, dtype=np.float32)
+    return fade_gains(out, np.zeros(frames, dtype=np.intp), done=done, length=length, curve=curve, rising=rising)
+
+
+@pytest.mark.parametrize("curve", [FADE_LINEAR, FADE_EQUAL_POWER])
+@pytest.mark.parametrize("rising", [True, False])
+def test_fade_continues_across_blocks(curve, rising):
+    whole = _gains(1000, done=0, length=1000, curve=curve, rising=rising).copy()
+    pieces = [_gains(n, done=done, length=1000, curve=curve, rising=rising).copy() for done, n in ((0, 300), (300, 700))]
+
+    np.testing.assert_array_equal(np.concatenate(pieces), whole)
+    assert np.all(np.diff(whole) > 0) if rising else np.all(np.diff(whole) < 0)
+
+
+def test_equal_power_crossfade_keeps_power():
+    fade_in = _gains(1000, done=0, length=1000, curve=FADE_EQUAL_POWER, rising=True).copy()
+    fade_out = _gains(1000, done=0, length=1000, curve=FADE_EQUAL_POWER, rising=False)
+    np.testing.assert_allclose(fade_in**2 + fade_out**2, 1.0, atol=1e-3)
+
+
+def test_map_channels_and_gain_work_in_place():
+    mono = np.arange(4, dtype=np.float32)[:, None]
+    stereo = np.zeros((4, 2), dtype=np.float32)
+    map_channels(stereo, mono)
+    assert stereo.tolist() == [[0, 0], [1, 1], [2, 2], [3, 3]]
+
+    apply_gain(stereo, 0.5)
+    assert stereo[3].tolist() == [1.5, 1.5]
+    narrow = np.zeros((4, 1), dtype=np.float32)
+    map_channels(narrow, stereo)
+    assert narrow[:, 0].tolist() == [0.0, 0.5, 1.0, 1.5]
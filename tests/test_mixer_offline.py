@@ -0,0 +1,58 @@
+import numpy as np
+import soundfile as sf
+
+from sara.audio.mixer import MixerPlayer, OfflineMixer
+
+
+def _write(path, value: float, seconds: float, samplerate: int = 48000):
+    sf.write(str(path), np.full((int(seconds * samplerate), 2), value, dtype=np.float32), samplerate, subtype="FLOAT")
+    return str(path)
+
+
+def test_cues_run_at_their_exact_output_frame(tmp_path):
+    first = _write(tmp_path / "first.wav", 0.5, 0.1)
+    second = _write(tmp_path / "second.wav", 0.25, 0.1)
+    mixer = OfflineMixer(block_size=1000)
+
+    mixed = mixer.render(
+        [
+            (0.0, lambda m: m.start_source("first", first)),
+            (0.05, lambda m: m.start_source("second", second)),
+            (0.075, lambda m: m.fade_out_source("first", 0.0)),
+        ]
+    )
+
+    # 0.05 s = ramka 2400, 0.075 s = 3600; drugi plik kończy się w 2400 + 4800, w bloku 6600-7600
+    assert mixed.shape == (7600, 2)
+    assert np.allclose(mixed[192:2400], 0.5)
+    assert np.allclose(mixed[2592:3600], 0.75)
+    assert np.allclose(mixed[3600:7200], 0.25)
+    assert not mixed[7200:].any()
+    stats = mixer.last_stats
+    assert stats.frames == 7600 and stats.source_blocks > 0
+    assert stats.realtime_factor > 1.0
+
+
+def test_scripted_automix_renders_to_flac(tmp_path):
+    first = _write(tmp_path / "first.wav", 0.5, 0.2)
+    second = _write(tmp_path / "second.wav", 0.25, 0.2)
+    mixer = OfflineMixer(channels=1)
+    current, following = MixerPlayer(mixer), MixerPlayer(mixer)
+
+    def auto_mix_now():
+        following.set_mix_anchor("first")
+        following.play("second", second)
+        current.fade_out(0.01)
+
+    stats = mixer.render_to_file(
+        tmp_path / "aircheck.flac",
+        [(0.0, lambda _m: current.play("first", first, mix_trigger_seconds=0.15, on_mix_trigger=auto_mix_now))],
+        duration=0.3,
+    )
+
+    rendered, samplerate = sf.read(str(tmp_path / "aircheck.flac"), dtype="float32", always_2d=True)
+    assert samplerate == 48000 and rendered.shape == (14400, 1)
+    assert stats.frames == 14400
+    mix_frame = int(0.15 * 48000)
+    assert np.allclose(rendered[192:mix_frame, 0], 0.5, atol=1e-4)
+    assert np.allclose(rendered[mix_frame + 480 :, 0], 0.25, atol=1e-4)
@@ -5,6 +5,8 @@ from pathlib import Path
 from threading import Event
 from typing import Callable, List, Optional
 
+import pytest
+
 from sara.core.config import SettingsManager
 from sara.core.playlist import PlaylistItem, PlaylistModel, PlaylistKind
 from sara.ui.playback_controller import PlaybackController
@@ -190,6 +192,35 @@ def test_start_item_acquires_player_and_registers_context(tmp_path):
     assert controller.contexts[(playlist.id, item.id)].device_id == "dev-1"
 
 
+def test_start_item_applies_configured_fade_curve(tmp_path):
+    playlist, item = _playlist_with_item(tmp_path, slots=("dev-1",))
+    audio = DummyAudioEngine()
+    settings = SettingsManager(config_path=tmp_path / "settings.yaml")
+    assert settings.get_fade_curve() == "linear"
+    settings.set_fade_curve("equal_power")
+    controller = PlaybackController(audio, settings, lambda *_args: None)
+    curves: list[str] = []
+    original_create = audio.create_player
+
+    def _create_player(device_id):
+        player = original_create(device_id)
+        player.set_fade_curve = curves.append
+        return player
+
+    audio.create_player = _create_player
+    controller.start_item(
+        playlist,
+        item,
+        start_seconds=0.0,
+        on_finished=lambda _item_id: None,
+        on_progress=lambda _item_id, _seconds: None,
+    )
+
+    assert curves == ["equal_power"]
+    with pytest.raises(ValueError):
+        settings.set_fade_curve("sigmoid")
+
+
 def test_stop_playlist_fades_out_and_clears_context(tmp_path):
     playlist, item = _playlist_with_item(tmp_path, slots=("dev-1", "dev-2"))
     audio = DummyAudioEngine()
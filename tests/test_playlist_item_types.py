@@ -2,8 +2,11 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+
 from sara.core.app_state import PlaylistFactory
 from sara.core.config import SettingsManager
+from sara.core.metadata_hydration import create_unhydrated_item, placeholder_hints
 from sara.core.playlist import PlaylistItem, PlaylistItemType, PlaylistKind, PlaylistModel
 from sara.ui.controllers.playlists.clipboard import create_item_from_serialized, serialize_items
 from sara.ui.controllers.playlists.item_types import apply_item_type_to_selection
@@ -31,6 +34,46 @@ def test_clipboard_serialization_round_trip_preserves_item_type() -> None:
     assert restored.item_type is PlaylistItemType.SPOT
 
 
+def test_copied_unhydrated_item_stays_unhydrated_with_its_hints() -> None:
+    factory = PlaylistFactory()
+    entry = {"path": "/music/a.mp3", "title": "From EXTINF", "duration": 200.0}
+    item = create_unhydrated_item(factory, Path(entry["path"]), entry)
+
+    class _Frame:
+        _playlist_factory = factory
+
+    copy = create_item_from_serialized(_Frame(), serialize_items([item])[0])
+
+    assert copy.id != item.id
+    assert copy.hydrated is False
+    assert placeholder_hints(copy) == {"title": "From EXTINF", "duration": 200.0}
+    hydrated = PlaylistItem(id="two", path=Path("b.mp3"), title="B", duration_seconds=1.0)
+    assert create_item_from_serialized(_Frame(), serialize_items([hydrated])[0]).hydrated
+
+
+def test_pasted_unhydrated_items_are_queued_under_their_new_ids() -> None:
+    pytest.importorskip("wx")
+    from sara.ui.controllers.playlists.hydration import queue_copied_item_hydration
+
+    factory = PlaylistFactory()
+    placeholder = create_unhydrated_item(factory, Path("/music/a.mp3"), {"title": "From EXTINF"})
+    ready = factory.create_item(path=Path("/music/b.mp3"), title="B", duration_seconds=1.0)
+    submitted = []
+
+    class _Hydrator:
+        def submit(self, jobs) -> None:
+            submitted.extend(jobs)
+
+    class _Frame:
+        _metadata_hydrator = _Hydrator()
+
+    queue_copied_item_hydration(_Frame(), "pl", [placeholder, ready])
+
+    assert [(job.playlist_id, job.item_id, job.hints) for job in submitted] == [
+        ("pl", placeholder.id, {"title": "From EXTINF"})
+    ]
+
+
 def test_settings_default_shortcuts_include_item_type_actions(tmp_path: Path) -> None:
     manager = SettingsManager(config_path=tmp_path / "settings.yaml")
     assert manager.get_shortcut("edit", "mark_as_song") == "CTRL+SHIFT+G"
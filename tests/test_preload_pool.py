@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from sara.audio.bass.preload_cache import BassPreloadCache, PreloadedStream
+from sara.core.config import SettingsManager
+from sara.core.playlist import PlaylistItem, PlaylistKind, PlaylistModel
+from sara.ui.playback.preload_pool import IDLE_PLAYLIST_ETA_SECONDS, PreloadCandidate, select_preloads
+from sara.ui.playback_controller import PlaybackController
+
+
+def _candidate(item_id: str, eta: float, *, size: int = 10, device: str = "dev-1") -> PreloadCandidate:
+    return PreloadCandidate(
+        playlist_id="pl-1",
+        item_id=item_id,
+        path=Path(f"/music/{item_id}.mp3"),
+        start_seconds=0.0,
+        allow_loop=False,
+        device_id=device,
+        eta_seconds=eta,
+        size_bytes=size,
+    )
+
+
+def test_select_preloads_ranks_by_eta_and_respects_budgets():
+    chosen = select_preloads(
+        [_candidate("late", 90.0), _candidate("big", 5.0, size=500), _candidate("soon", 10.0), _candidate("mid", 30.0)],
+        max_items=2,
+        max_bytes=100,
+    )
+    # duży plik nie mieści się w budżecie, ale nie blokuje mniejszych
+    assert [candidate.item_id for candidate in chosen] == ["soon", "mid"]
+
+
+def test_select_preloads_keeps_earliest_duplicate():
+    chosen = select_preloads(
+        [_candidate("a", 50.0), _candidate("a", 5.0), _candidate("b", 20.0)],
+        max_items=5,
+        max_bytes=1000,
+    )
+    assert [(candidate.item_id, candidate.eta_seconds) for candidate in chosen] == [("a", 5.0), ("b", 20.0)]
+
+
+@dataclass
+class _Device:
+    id: str
+    name: str = "Device"
+    backend: str | None = None
+
+
+class _Player:
+    def __init__(self, device_id: str) -> None:
+        self.device_id = device_id
+        self.preloaded: list[tuple[str, float, bool]] = []
+        self.retained: list[set] = []
+
+    def play(self, *_args, **_kwargs) -> None:
+        return None
+
+    def set_finished_callback(self, _callback) -> None:
+        return None
+
+    def set_progress_callback(self, _callback) -> None:
+        return None
+
+    def set_gain_db(self, _gain) -> None:
+        return None
+
+    def set_loop(self, _start, _end) -> None:
+        return None
+
+    def stop(self) -> None:
+        return None
+
+    def preload(self, path: str, *, start_seconds: float = 0.0, allow_loop: bool = False) -> bool:
+        self.preloaded.append((path, start_seconds, allow_loop))
+        return True
+
+    def retain_preloaded(self, keep) -> None:
+        self.retained.append(set(keep))
+
+
+class _Engine:
+    def __init__(self) -> None:
+        self.players: list[_Player] = []
+
+    def get_devices(self):
+        return [_Device("dev-1"), _Device("dev-2")]
+
+    def refresh_devices(self) -> None:
+        return None
+
+    def stop_all(self) -> None:
+        return None
+
+    def create_player(self, device_id: str) -> _Player:
+        player = _Player(device_id)
+        self.players.append(player)
+        return player
+
+
+def _playlist(tmp_path: Path, playlist_id: str, device_id: str, item_ids: list[str]) -> PlaylistModel:
+    playlist = PlaylistModel(id=playlist_id, name=playlist_id, kind=PlaylistKind.MUSIC)
+    playlist.set_output_slots([device_id])
+    for item_id in item_ids:
+        path = tmp_path / f"{item_id}.mp3"
+        path.write_bytes(b"x" * 100)
+        playlist.add_items([PlaylistItem(id=item_id, path=path, title=item_id, duration_seconds=10.0)])
+    return playlist
+
+
+def _drain(controller: PlaybackController) -> None:
+    # ranking w tle sam zleca wczytywanie, więc executor zamykamy dopiero po nim
+    deadline = time.monotonic() + 5
+    while controller._preload_ranking:
+        assert time.monotonic() < deadline
+        time.sleep(0.005)
+    executor = controller._preload_executor
+    if executor is not None:
+        executor.shutdown(wait=True)
+        controller._preload_executor = None
+
+
+def test_refresh_preloads_prefers_nearest_items_across_playlists(monkeypatch, tmp_path):
+    monkeypatch.setenv("SARA_PRELOAD_MAX_STREAMS", "3")
+    engine = _Engine()
+    controller = PlaybackController(engine, SettingsManager(config_path=tmp_path / "settings.yaml"), lambda *_a: None)
+    playing = _playlist(tmp_path, "pl-1", "dev-1", ["a", "b", "c"])
+    idle = _playlist(tmp_path, "pl-2", "dev-2", ["x"])
+    controller.set_preload_playlists(lambda: [playing, idle])
+
+    context = controller.start_item(
+        playing,
+        playing.items[0],
+        start_seconds=0.0,
+        on_finished=lambda _item_id: None,
+        on_progress=lambda _item_id, _seconds: None,
+    )
+    assert context is not None
+    playing.items[0].current_position = 4.0
+
+    candidates = controller._collect_preload_candidates([playing, idle])
+    etas = {candidate.item_id: candidate.eta_seconds for candidate in candidates}
+    assert etas["b"] == 6.0
+    assert etas["c"] == 16.0
+    assert etas["x"] == IDLE_PLAYLIST_ETA_SECONDS
+
+    controller.schedule_next_preload(playing, current_item_id="a")
+    _drain(controller)
+
+    preloaded = {
+        Path(path).stem: player.device_id for player in engine.players for path, _start, _loop in player.preloaded
+    }
+    assert preloaded == {"b": "dev-1", "c": "dev-1", "x": "dev-2"}
+
+
+def test_refresh_preloads_releases_streams_that_fell_out_of_ranking(monkeypatch, tmp_path):
+    monkeypatch.setenv("SARA_PRELOAD_MAX_STREAMS", "1")
+    engine = _Engine()
+    controller = PlaybackController(engine, SettingsManager(config_path=tmp_path / "settings.yaml"), lambda *_a: None)
+    playlist = _playlist(tmp_path, "pl-1", "dev-1", ["a", "b", "c"])
+    controller.set_preload_playlists(lambda: [playlist])
+
+    controller.refresh_preloads()
+    _drain(controller)
+    playlist.items[2].is_selected = True
+    controller.refresh_preloads()
+    _drain(controller)
+
+    player = engine.players[0]
+    assert [Path(path).stem for path, _start, _loop in player.preloaded] == ["a", "c"]
+    assert player.retained == [{(str(playlist.items[2].path), 0.0, False)}]
+
+
+def test_refresh_preloads_checks_files_off_the_calling_thread(tmp_path):
+    engine = _Engine()
+    controller = PlaybackController(engine, SettingsManager(config_path=tmp_path / "settings.yaml"), lambda *_a: None)
+    playlist = _playlist(tmp_path, "pl-1", "dev-1", ["a", "b"])
+    playlist.items[1].path.unlink()
+    controller.set_preload_playlists(lambda: [playlist])
+    checked_on: list[threading.Thread] = []
+    original_cost = controller._preload_cost
+
+    def _cost(path):
+        checked_on.append(threading.current_thread())
+        return original_cost(path)
+
+    controller._preload_cost = _cost
+    controller.refresh_preloads()
+    _drain(controller)
+
+    assert checked_on and threading.current_thread() not in checked_on
+    # brakujący plik nie trafia do puli
+    assert [Path(path).stem for path, _start, _loop in engine.players[0].preloaded] == ["a"]
+
+
+class _Manager:
+    def __init__(self) -> None:
+        self.freed: list[int] = []
+
+    def stream_free(self, stream: int) -> None:
+        self.freed.append(stream)
+
+
+def _entry(stream: int, name: str, size: int = 10) -> PreloadedStream:
+    return PreloadedStream(
+        device_index=1,
+        path=Path(f"/music/{name}.mp3"),
+        start_seconds=0.0,
+        allow_loop=False,
+        stream=stream,
+        size_bytes=size,
+    )
+
+
+def test_preload_cache_take_hands_over_ownership():
+    manager = _Manager()
+    cache = BassPreloadCache(manager)
+    assert cache.put(_entry(11, "a"))
+
+    taken = cache.take(1, Path("/music/a.mp3"), start_seconds=0.0, allow_loop=False)
+    assert taken is not None and taken.stream == 11
+    assert cache.take(1, Path("/music/a.mp3"), start_seconds=0.0, allow_loop=False) is None
+    cache.clear()
+    assert manager.freed == []
+
+
+def test_preload_cache_evicts_oldest_over_limits_and_retains_selection():
+    manager = _Manager()
+    cache = BassPreloadCache(manager, max_streams=2, max_bytes=25)
+    cache.put(_entry(1, "a"))
+    cache.put(_entry(2, "b"))
+    cache.put(_entry(3, "c"))
+    assert manager.freed == [1]
+    # za duży wpis wylatuje od razu
+    assert cache.put(_entry(4, "huge", size=100)) is False
+    assert cache.usage() == (0, 0)
+
+    cache.put(_entry(5, "d"))
+    cache.put(_entry(6, "e"))
+    assert cache.retain(lambda entry: entry.path.stem == "e") == 1
+    assert cache.usage() == (1, 10)
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from sara.core.progress_bus import ProgressBus
+
+
+class _Loop:
+    """Manual stand-in for the UI event loop."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.ready: list = []
+        self.later: list[tuple[float, object]] = []
+
+    def post(self, func) -> None:
+        self.ready.append(func)
+
+    def post_later(self, delay: float, func) -> None:
+        self.later.append((self.now + delay, func))
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+        due = [func for at, func in self.later if at <= self.now + 1e-9]
+        self.later = [(at, func) for at, func in self.later if at > self.now + 1e-9]
+        self.ready.extend(due)
+
+    def run(self) -> None:
+        while self.ready:
+            self.ready.pop(0)()
+
+
+def _bus(loop: _Loop, batches: list) -> ProgressBus:
+    return ProgressBus(
+        batches.append,
+        post=loop.post,
+        post_later=loop.post_later,
+        interval=0.1,
+        clock=lambda: loop.now,
+    )
+
+
+def test_progress_bus_coalesces_latest_position_per_item():
+    loop = _Loop()
+    batches: list = []
+    bus = _bus(loop, batches)
+
+    for step in range(10):
+        bus.publish_progress("pl-1", "a", step * 0.05)
+        bus.publish_progress("pl-2", "b", 100 + step * 0.05)
+    assert len(loop.ready) == 1
+    loop.run()
+
+    assert batches == [[("pl-1", "a", 0.45), ("pl-2", "b", 100.45)]]
+    assert bus.pending() == 0
+
+
+def test_progress_bus_limits_drain_rate():
+    loop = _Loop()
+    batches: list = []
+    bus = _bus(loop, batches)
+
+    bus.publish_progress("pl-1", "a", 1.0)
+    loop.run()
+    loop.advance(0.02)
+    bus.publish_progress("pl-1", "a", 1.02)
+    bus.publish_progress("pl-1", "a", 1.04)
+    loop.run()
+    assert len(batches) == 1
+    assert len(loop.later) == 1
+
+    loop.advance(0.05)
+    loop.run()
+    assert len(batches) == 1
+    loop.advance(0.03)
+    loop.run()
+    assert batches[-1] == [("pl-1", "a", 1.04)]
+
+
+def test_progress_bus_events_skip_the_queue_and_flush_progress_first():
+    loop = _Loop()
+    order: list = []
+    bus = ProgressBus(
+        lambda batch: order.append(("progress", batch)),
+        post=loop.post,
+        post_later=loop.post_later,
+        interval=0.1,
+        clock=lambda: loop.now,
+    )
+
+    bus.publish_progress("pl-1", "a", 1.0)
+    loop.run()
+    loop.advance(0.01)
+    bus.publish_progress("pl-1", "a", 4.5)
+    bus.publish_event(lambda *args: order.append(("mix",) + args), "pl-1", "a")
+    bus.publish_event(lambda *args: order.append(("finished",) + args), "pl-1", "a")
+    # zdarzenie nie czeka na okno 100 ms postępu
+    assert len(loop.ready) == 1
+    loop.run()
+
+    assert order == [
+        ("progress", [("pl-1", "a", 1.0)]),
+        ("progress", [("pl-1", "a", 4.5)]),
+        ("mix", "pl-1", "a"),
+        ("finished", "pl-1", "a"),
+    ]
+    # zaplanowany później drenaż postępu nie ma już nic do dostarczenia
+    loop.advance(0.1)
+    loop.run()
+    assert len(order) == 4
+
+
+def test_progress_bus_survives_failing_handlers():
+    loop = _Loop()
+    calls: list = []
+
+    def _fail(_batch):
+        raise RuntimeError("boom")
+
+    bus = ProgressBus(_fail, post=loop.post, post_later=loop.post_later, clock=lambda: loop.now)
+    bus.publish_progress("pl-1", "a", 1.0)
+    bus.publish_event(lambda: (_ for _ in ()).throw(RuntimeError("boom")))
+    bus.publish_event(lambda: calls.append("after"))
+    loop.run()
+
+    assert calls == ["after"]
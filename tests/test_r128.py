@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+import soundfile as sf
+
+from sara.core import loudness as loudness_module
+from sara.core.loudness import LoudnessStandard, analyze_loudness, analyze_loudness_batch
+from sara.core.r128 import measure_file, measure_samples
+
+
+def _stereo_sine(level_dbfs: float, seconds: float, *, rate: int = 48000, freq: float = 1000.0) -> np.ndarray:
+    t = np.arange(int(rate * seconds)) / rate
+    tone = 10 ** (level_dbfs / 20) * np.sin(2 * np.pi * freq * t)
+    return np.stack([tone, tone], axis=1)
+
+
+@pytest.mark.parametrize("rate", [44100, 48000])
+def test_reference_sine_measures_minus_23_lufs(rate):
+    result = measure_samples(_stereo_sine(-23.0, 10.0, rate=rate), rate)
+    assert result.integrated_lufs == pytest.approx(-23.0, abs=0.1)
+
+
+def test_relative_gate_ignores_quiet_passages():
+    # EBU Tech 3341, przypadek 3: -36 / -23 / -36 dBFS daje -23 LUFS
+    signal = np.concatenate(
+        [_stereo_sine(-36.0, 10.0), _stereo_sine(-23.0, 60.0), _stereo_sine(-36.0, 10.0)]
+    )
+    assert measure_samples(signal, 48000).integrated_lufs == pytest.approx(-23.0, abs=0.1)
+
+
+def test_true_peak_detects_intersample_peak():
+    rate = 48000
+    t = np.arange(rate) / rate
+    signal = 0.5 * np.sin(2 * np.pi * (rate / 4) * t + np.pi / 4)
+    result = measure_samples(signal, rate)
+    assert 20 * np.log10(result.sample_peak) == pytest.approx(-9.03, abs=0.05)
+    assert result.true_peak_dbtp == pytest.approx(-6.02, abs=0.5)
+
+
+def test_measure_file_streams_blocks(tmp_path):
+    path = tmp_path / "tone.wav"
+    sf.write(path, _stereo_sine(-18.0, 12.0), 48000)
+    result = measure_file(path, block_seconds=1.0)
+    assert result.integrated_lufs == pytest.approx(-18.0, abs=0.1)
+    assert result.duration_seconds == pytest.approx(12.0)
+
+
+def test_analyze_loudness_prefers_native_meter(tmp_path, monkeypatch):
+    path = tmp_path / "tone.flac"
+    sf.write(path, _stereo_sine(-20.0, 5.0), 48000)
+
+    def fail_bs1770gain(*_args, **_kwargs):
+        raise AssertionError("bs1770gain should not be used")
+
+    monkeypatch.setattr(loudness_module, "_run_bs1770gain", fail_bs1770gain)
+    measurement = analyze_loudness(path, standard=LoudnessStandard.ATSC)
+    assert measurement.integrated_lufs == pytest.approx(-20.0, abs=0.1)
+    assert measurement.true_peak_dbtp is not None
+
+
+def test_analyze_loudness_batch_keeps_input_order(tmp_path, monkeypatch):
+    paths = []
+    for index, level in enumerate((-14.0, -30.0, -22.0)):
+        path = tmp_path / f"track-{index}.wav"
+        sf.write(path, _stereo_sine(level, 2.0), 48000)
+        paths.append(path)
+    broken = tmp_path / "broken.mp3"
+    broken.write_bytes(b"not-audio")
+    paths.append(broken)
+    monkeypatch.setattr(loudness_module, "find_bs1770gain", lambda: None)
+
+    results = analyze_loudness_batch(paths, standard=LoudnessStandard.EBU, workers=2)
+
+    assert [round(result.integrated_lufs) for result in results[:3]] == [-14, -30, -22]
+    assert results[3] is None
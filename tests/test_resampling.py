@@ -0,0 +1,96 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from sara.audio.mixer.decoder import SourceDecoder
+from sara.audio.mixer.render import render_source
+from sara.audio.mixer.types import MixerSource
+from sara.audio.resampling import StreamingResampler, resampling_fraction
+
+
+def _tone(rate: int, seconds: float, frequency: float = 1000.0):
+    t = np.arange(int(rate * seconds)) / rate
+    return np.stack([np.sin(2 * np.pi * frequency * t), 0.5 * np.cos(2 * np.pi * frequency * t)], axis=1).astype(
+        np.float32
+    )
+
+
+def _resample(resampler: StreamingResampler, data, block: int):
+    chunks = [resampler.process(data[i : i + block]).copy() for i in range(0, len(data), block)]
+    chunks.append(resampler.flush().copy())
+    return np.concatenate(chunks)
+
+
+def test_fraction_for_common_rates():
+    assert resampling_fraction(44100, 48000) == (160, 147)
+    assert resampling_fraction(48000, 44100) == (147, 160)
+    assert resampling_fraction(32000, 48000) == (3, 2)
+
+
+@pytest.mark.parametrize("quality", ["low", "medium", "high"])
+def test_streaming_output_is_independent_of_block_size(quality):
+    data = _tone(44100, 1.0)
+    whole = _resample(StreamingResampler(44100, 48000, 2, quality=quality), data, len(data))
+    blocks = _resample(StreamingResampler(44100, 48000, 2, quality=quality), data, 1001)
+
+    assert len(whole) == len(blocks) == StreamingResampler(44100, 48000, 2).expected_output(len(data))
+    np.testing.assert_allclose(blocks, whole, atol=1e-6)
+
+
+def test_resampled_tone_matches_the_analytic_signal():
+    data = _tone(44100, 0.5)
+    result = _resample(StreamingResampler(44100, 48000, 2), data, 2205)
+
+    expected = _tone(48000, len(result) / 48000)[: len(result)]
+    np.testing.assert_allclose(result[100:-100], expected[100:-100], atol=1e-3)
+
+
+def test_kernels_are_shared_between_streams():
+    first = StreamingResampler(44100, 48000, 2)
+    second = StreamingResampler(44100, 48000, 1)
+    assert first._kernels is second._kernels
+
+
+class _ToneFile:
+    samplerate = 44100
+    channels = 2
+
+    def __init__(self, data):
+        self._data = data
+        self._pos = 0
+
+    def read(self, frames, dtype="float32", always_2d=True, out=None):
+        chunk = self._data[self._pos : self._pos + frames]
+        self._pos += len(chunk)
+        return chunk.copy()
+
+    def seek(self, frame):
+        self._pos = frame
+
+
+def test_mixer_source_is_resampled_continuously():
+    data = _tone(44100, 0.3)
+    source = MixerSource(
+        source_id="tone",
+        path=Path("tone.wav"),
+        sound_file=_ToneFile(data),
+        samplerate=44100,
+        channels=2,
+        resample_ratio=48000 / 44100,
+    )
+    source.decoder = SourceDecoder(source, output_channels=2, read_ahead_frames=0, chunk_frames=1000)
+    out = np.zeros((512, 2), dtype=np.float32)
+
+    rendered = []
+    while True:
+        frames_out, finished = render_source(source, out, micro_fade_frames=1)
+        rendered.append(out[:frames_out].copy())
+        if finished:
+            break
+
+    mixed = np.concatenate(rendered)
+    reference = _resample(StreamingResampler(44100, 48000, 2), data, len(data))
+    assert len(mixed) == len(reference)
+    np.testing.assert_allclose(mixed, reference, atol=1e-6)
+    assert source.position_frames == len(data)
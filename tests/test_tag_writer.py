@@ -0,0 +1,81 @@
+import threading
+from pathlib import Path
+
+from sara.core.media_metadata.constants import CUE_IN_TAG, LOOP_START_TAG, REPLAYGAIN_TRACK_GAIN_TAG
+from sara.core.media_metadata.extract import extract_metadata
+from sara.core.media_metadata.save import save_mix_metadata, write_ape_updates
+from sara.core.media_metadata.tag_writer import TagWriter
+
+
+def test_updates_for_one_path_are_coalesced_while_a_write_is_running():
+    gate = threading.Event()
+    writes: list[tuple[Path, dict]] = []
+
+    def write(path: Path, updates) -> None:
+        gate.wait(5)
+        writes.append((path, dict(updates)))
+
+    writer = TagWriter(write=write)
+    first = Path("/music/first.mp3")
+    second = Path("/music/second.mp3")
+    try:
+        writer.submit_replay_gain(first, -3.0)
+        writer.submit_mix(second, cue_in=1.0, intro=None, outro=None, segue=None, segue_fade=None, overlap=None)
+        writer.submit_mix(second, cue_in=2.0, intro=None, outro=None, segue=None, segue_fade=None, overlap=None)
+        writer.submit_loop(second, 10.0, 20.0, True)
+        gate.set()
+        assert writer.flush(5)
+    finally:
+        writer.stop()
+
+    assert [path for path, _updates in writes] == [first, second]
+    second_updates = writes[1][1]
+    assert second_updates[CUE_IN_TAG] == "2.000"
+    assert second_updates[LOOP_START_TAG] == "10.000"
+
+
+def test_failed_writes_are_retried_and_finally_reported():
+    attempts: dict[str, int] = {}
+    failures = []
+
+    def write(path: Path, updates) -> None:
+        attempts[path.name] = attempts.get(path.name, 0) + 1
+        if path.name == "locked.mp3" or attempts[path.name] < 2:
+            raise PermissionError("file in use")
+
+    outcomes: dict[str, bool] = {}
+    writer = TagWriter(failures.append, max_attempts=3, retry_delay=0.01, write=write)
+    try:
+        for name in ("flaky.mp3", "locked.mp3"):
+            writer.submit_replay_gain(
+                Path("/music") / name,
+                1.0,
+                on_done=lambda written, name=name: outcomes.__setitem__(name, written),
+            )
+        assert writer.flush(5)
+    finally:
+        writer.stop()
+
+    assert attempts == {"flaky.mp3": 2, "locked.mp3": 3}
+    assert len(failures) == 1
+    assert failures[0].path.name == "locked.mp3"
+    assert failures[0].attempts == 3
+    assert failures[0].error == "file in use"
+    assert outcomes == {"flaky.mp3": True, "locked.mp3": False}
+
+
+def test_write_updates_tags_in_place_and_keeps_other_tags(tmp_path):
+    target = tmp_path / "track.mp3"
+    target.write_bytes(b"\x00")
+    assert save_mix_metadata(target, cue_in=1.5, intro=8.0, outro=None, segue=None, segue_fade=None, overlap=None)
+
+    inode = target.stat().st_ino
+
+    write_ape_updates(target, {REPLAYGAIN_TRACK_GAIN_TAG: "-4.00 dB", CUE_IN_TAG: None})
+
+    metadata = extract_metadata(target)
+    assert metadata.replay_gain_db == -4.0
+    assert metadata.cue_in_seconds is None
+    assert metadata.intro_seconds == 8.0
+    assert [path.name for path in tmp_path.iterdir()] == ["track.mp3"]
+    assert target.stat().st_ino == inode
@@ -0,0 +1,110 @@
+import os
+import time
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from sara.core import waveform as waveform_module
+from sara.core.waveform import PeakCache, generate_peaks, read_peaks_file, write_peaks_file
+
+
+def _write_tone(path, *, seconds: float = 2.0, rate: int = 8000) -> np.ndarray:
+    t = np.arange(int(rate * seconds)) / rate
+    # pierwsza sekunda cicho, druga głośno
+    level = np.where(t < 1.0, 0.1, 0.8)
+    left = level * np.sin(2 * np.pi * 200 * t)
+    data = np.stack([left, -left], axis=1)
+    sf.write(path, data, rate, subtype="FLOAT")
+    return data
+
+
+def test_generate_peaks_tracks_min_max_and_rms(tmp_path):
+    path = tmp_path / "tone.wav"
+    _write_tone(path)
+
+    peaks = generate_peaks(path, window_frames=400)
+
+    assert peaks.sample_rate == 8000
+    assert peaks.frames == 16000
+    assert len(peaks) == 40
+    assert peaks.duration_seconds == pytest.approx(2.0)
+    assert peaks.maximum[:20].max() == pytest.approx(0.1, abs=1e-3)
+    assert peaks.minimum[30] == pytest.approx(-0.8, abs=1e-3)
+    assert peaks.rms[35] == pytest.approx(0.8 / np.sqrt(2), abs=1e-3)
+
+
+def test_zoom_levels_and_slices_reuse_base_windows(tmp_path, monkeypatch):
+    path = tmp_path / "tone.wav"
+    _write_tone(path)
+    peaks = generate_peaks(path, window_frames=400)
+    monkeypatch.setattr(waveform_module, "sf", None)
+
+    overview = peaks.level(20)
+    assert len(overview) == 2
+    assert overview.window_seconds == pytest.approx(1.0)
+    assert overview.maximum.tolist() == pytest.approx([0.1, 0.8], abs=1e-3)
+    assert peaks.level(20) is overview
+
+    detail = peaks.slice(0.5, 1.5, columns=4)
+    assert len(detail) == 4
+    assert detail.start_seconds == pytest.approx(0.5)
+    assert detail.seconds_per_column == pytest.approx(0.25)
+    assert detail.maximum.tolist() == pytest.approx([0.1, 0.1, 0.8, 0.8], abs=1e-3)
+
+    assert len(peaks.slice(0.0, 0.1, columns=100)) == 2
+
+
+def test_peak_cache_round_trips_and_invalidates_on_change(tmp_path, monkeypatch):
+    path = tmp_path / "tone.wav"
+    _write_tone(path)
+    cache = PeakCache(tmp_path / "peaks", window_frames=400)
+
+    first = cache.load(path)
+    assert cache.get(path) is not None
+    entries = list((tmp_path / "peaks").glob("*.peaks"))
+    assert len(entries) == 1
+
+    os.utime(entries[0], (0, 0))
+    calls = []
+    monkeypatch.setattr(waveform_module, "generate_peaks", lambda *args, **kwargs: calls.append(args))
+    cached = cache.load(path)
+    assert not calls
+    # trafienie odświeża wpis dla usuwania najdawniej używanych
+    assert entries[0].stat().st_mtime > 0
+    assert cached.frames == first.frames
+    assert np.allclose(cached.rms, first.rms, atol=1e-4)
+
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert cache.get(path) is None
+
+
+def test_peak_cache_prune_drops_old_entries_then_least_recently_used(tmp_path):
+    directory = tmp_path / "peaks"
+    directory.mkdir()
+    now = time.time()
+    ages = {"stale": 400, "old": 30, "recent": 2, "fresh": 0}
+    for name, days in ages.items():
+        entry = directory / f"{name}.peaks"
+        entry.write_bytes(b"\x00" * 100)
+        stamp = now - days * 86400
+        os.utime(entry, (stamp, stamp))
+    (directory / "notes.txt").write_bytes(b"\x00" * 1000)
+
+    cache = PeakCache(directory, max_bytes=250, max_age_days=180)
+
+    assert cache.prune() == 2
+    assert sorted(path.name for path in directory.iterdir()) == ["fresh.peaks", "notes.txt", "recent.peaks"]
+
+
+def test_read_peaks_file_rejects_damaged_or_mismatched_files(tmp_path):
+    path = tmp_path / "tone.wav"
+    _write_tone(path, seconds=0.5)
+    target = tmp_path / "tone.peaks"
+    write_peaks_file(target, generate_peaks(path), (10, 20))
+
+    assert read_peaks_file(target, (10, 20)) is not None
+    assert read_peaks_file(target, (10, 21)) is None
+    target.write_bytes(target.read_bytes()[:-2])
+    assert read_peaks_file(target) is None